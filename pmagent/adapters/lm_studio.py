@@ -10,7 +10,6 @@ from __future__ import annotations
 
 from typing import Any, Literal
 
-import requests
 from requests.exceptions import ConnectionError, HTTPError, RequestException, Timeout
 
 from scripts.config.env import (
@@ -20,6 +19,9 @@ from scripts.config.env import (
     openai_cfg,
 )
 
+from src.infra.embedding_cache import cached_embed
+from src.infra.http_pool import get_http_session
+
 # Phase-7E: Import Ollama adapter for provider routing
 try:
     from pmagent.adapters import ollama as ollama_adapter
@@ -125,7 +127,7 @@ def lm_studio_chat(
         if api_key:
             headers["Authorization"] = f"Bearer {api_key}"
 
-        resp = requests.post(
+        resp = get_http_session().post(
             url,
             json=payload,
             headers=headers if headers else None,
@@ -293,8 +295,6 @@ def embed(texts: str | list[str], *, model_slot: str | None = None) -> list[list
     if not cfg.get("lm_studio_enabled", True):
         raise RuntimeError("LM Studio is disabled (LM_STUDIO_ENABLED=false)")
 
-    import requests
-
     base_url = cfg.get("base_url", "http://127.0.0.1:9994/v1")
     model = cfg.get("embedding_model")
     if not model:
@@ -306,8 +306,6 @@ def embed(texts: str | list[str], *, model_slot: str | None = None) -> list[list
     # Normalize texts to list
     text_list = [texts] if isinstance(texts, str) else texts
 
-    # Call embeddings endpoint for each text (simple loop, can batch later)
-    embeddings = []
     base_url = base_url.rstrip("/")
     if not base_url.endswith("/v1"):
         base_url = f"{base_url}/v1"
@@ -317,18 +315,18 @@ def embed(texts: str | list[str], *, model_slot: str | None = None) -> list[list
     if api_key:
         headers["Authorization"] = f"Bearer {api_key}"
 
-    # Batch all texts in a single request for efficiency
-    payload = {"model": model, "input": text_list}
-    resp = requests.post(url, json=payload, headers=headers, timeout=120.0)
-    resp.raise_for_status()
-    data = resp.json()
+    def _fetch(batch: list[str]) -> list[list[float]]:
+        # Batch all texts in a single request for efficiency
+        payload = {"model": model, "input": batch}
+        resp = get_http_session().post(url, json=payload, headers=headers, timeout=120.0)
+        resp.raise_for_status()
+        data = resp.json()
 
-    # Extract embeddings from response (OpenAI-compatible format)
-    embeddings = []
-    for item in data.get("data", []):
-        embeddings.append(item.get("embedding", []))
+        # Extract embeddings from response (OpenAI-compatible format)
+        return [item.get("embedding", []) for item in data.get("data", [])]
 
-    return embeddings
+    # Only unique texts missing from the shared cache reach the server
+    return cached_embed(model, text_list, _fetch, provider=base_url)
 
 
 def rerank(
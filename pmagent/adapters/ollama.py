@@ -3,7 +3,7 @@
 This module provides minimal chat + embedding helpers around the Ollama HTTP API:
 
   POST /api/chat
-  POST /api/embeddings
+  POST /api/embed  (batched input list; /api/embeddings on older servers)
 
 It is intentionally narrow: it only supports the features we need for AgentPM.
 """
@@ -12,13 +12,16 @@ from __future__ import annotations
 
 import json
 import logging
-import math
 import os
 from typing import List, Sequence
-from urllib.error import HTTPError, URLError
-from urllib.request import Request, urlopen
+
+import numpy as np
+import requests
 
 from scripts.config.env import get_lm_model_config
+from src.infra.embedding_cache import cached_embed
+from src.infra.http_pool import get_http_session
+from src.infra.rate_limit import get_limiter, run_ordered
 from src.utils.json_sanitize import coerce_json_one_line
 
 
@@ -27,6 +30,8 @@ TextLike = str | Sequence[str]
 # Granite rerank configuration
 GRANITE_RERANK_NUM_PREDICT = int(os.getenv("GRANITE_RERANK_NUM_PREDICT", "4096"))
 MAX_DOC_CHARS = 1024  # Truncate documents to stay within ~8K token envelope
+# Texts per /api/embed request; chunks are dispatched concurrently up to the model's in-flight limit
+OLLAMA_EMBED_BATCH_SIZE = int(os.getenv("OLLAMA_EMBED_BATCH_SIZE", "32"))
 
 
 class OllamaAPIError(Exception):
@@ -38,37 +43,41 @@ class OllamaAPIError(Exception):
         self.error_type = error_type  # "http_error", "timeout", "connection_error", "unknown"
 
 
-def _post_json(base_url: str, path: str, payload: dict) -> dict:
-    """POST JSON to Ollama and return the parsed response.
+def _request_json(method: str, url: str, timeout: float, payload: dict | None = None, allow_raw: bool = False) -> dict:
+    """Send a request over the shared keep-alive session and decode the JSON body.
 
     Raises:
         OllamaAPIError: If HTTP error (4xx/5xx), timeout, or connection error occurs.
     """
-    url = base_url.rstrip("/") + path
-    data = json.dumps(payload).encode("utf-8")
-    req = Request(url, data=data, headers={"Content-Type": "application/json"})
     try:
-        with urlopen(req, timeout=60) as resp:  # noqa: S310
-            raw = resp.read().decode("utf-8")
+        resp = get_http_session().request(method, url, json=payload, timeout=timeout)
+        resp.raise_for_status()
+        raw = resp.text
+        if not allow_raw:
+            return json.loads(raw)
         try:
             return json.loads(raw)
         except json.JSONDecodeError:
             return {"raw": raw}
-    except HTTPError as e:
+    except requests.HTTPError as e:
         # HTTP 4xx/5xx errors
-        status_code = e.code if hasattr(e, "code") else None
+        status_code = e.response.status_code if e.response is not None else None
+        reason = e.response.reason if e.response is not None else None
         raise OllamaAPIError(
-            f"Ollama API HTTP error: {e.reason or 'Unknown error'}",
+            f"Ollama API HTTP error: {reason or 'Unknown error'}",
             status_code=status_code,
             error_type="http_error",
         ) from e
-    except URLError as e:
-        # Connection errors, timeouts, DNS failures
-        error_msg = str(e.reason) if hasattr(e, "reason") else str(e)
-        error_type = "timeout" if "timed out" in error_msg.lower() else "connection_error"
+    except requests.Timeout as e:
         raise OllamaAPIError(
-            f"Ollama API connection error: {error_msg}",
-            error_type=error_type,
+            f"Ollama API connection error: {e!s}",
+            error_type="timeout",
+        ) from e
+    except requests.ConnectionError as e:
+        # Connection refused, DNS failures
+        raise OllamaAPIError(
+            f"Ollama API connection error: {e!s}",
+            error_type="connection_error",
         ) from e
     except Exception as e:
         # Catch-all for other unexpected errors
@@ -78,37 +87,22 @@ def _post_json(base_url: str, path: str, payload: dict) -> dict:
         ) from e
 
 
+def _post_json(base_url: str, path: str, payload: dict) -> dict:
+    """POST JSON to Ollama and return the parsed response.
+
+    Raises:
+        OllamaAPIError: If HTTP error (4xx/5xx), timeout, or connection error occurs.
+    """
+    return _request_json("POST", base_url.rstrip("/") + path, timeout=60, payload=payload, allow_raw=True)
+
+
 def _get_json(base_url: str, path: str) -> dict:
     """GET JSON from Ollama API.
 
     Raises:
         OllamaAPIError: If HTTP error (4xx/5xx), timeout, or connection error occurs.
     """
-    url = base_url.rstrip("/") + path
-    req = Request(url, headers={"Content-Type": "application/json"})
-    try:
-        with urlopen(req, timeout=10) as resp:  # noqa: S310
-            raw = resp.read().decode("utf-8")
-            return json.loads(raw)
-    except HTTPError as e:
-        status_code = e.code if hasattr(e, "code") else None
-        raise OllamaAPIError(
-            f"Ollama API HTTP error: {e.reason or 'Unknown error'}",
-            status_code=status_code,
-            error_type="http_error",
-        ) from e
-    except URLError as e:
-        error_msg = str(e.reason) if hasattr(e, "reason") else str(e)
-        error_type = "timeout" if "timed out" in error_msg.lower() else "connection_error"
-        raise OllamaAPIError(
-            f"Ollama API connection error: {error_msg}",
-            error_type=error_type,
-        ) from e
-    except Exception as e:
-        raise OllamaAPIError(
-            f"Ollama API unexpected error: {e!s}",
-            error_type="unknown",
-        ) from e
+    return _request_json("GET", base_url.rstrip("/") + path, timeout=10)
 
 
 def list_installed_models(base_url: str | None = None) -> list[str]:
@@ -148,11 +142,52 @@ def _resolve_model_from_slot(cfg: dict, model: str | None, model_slot: str | Non
     return cfg.get("local_agent_model") or ""
 
 
+def _embed_chunk(base_url: str, model: str, texts: list[str]) -> List[List[float]]:
+    """Embed one chunk with a single /api/embed call (input list).
+
+    Servers without /api/embed (404) fall back to one /api/embeddings call per text.
+
+    Raises:
+        OllamaAPIError: If the API call fails.
+        RuntimeError: If the response does not hold one embedding per text.
+    """
+    try:
+        data = _post_json(base_url, "/api/embed", {"model": model, "input": texts})
+    except OllamaAPIError as e:
+        if e.status_code != 404:
+            raise
+        embeddings = []
+        for text in texts:
+            data = _post_json(base_url, "/api/embeddings", {"model": model, "prompt": text})
+            if "embedding" not in data:
+                raise RuntimeError(f"Ollama embeddings response missing 'embedding': {data!r}") from e
+            embeddings.append(data["embedding"])
+        return embeddings
+
+    embeddings = data.get("embeddings")
+    if not isinstance(embeddings, list) or len(embeddings) != len(texts):
+        raise RuntimeError(f"Ollama embed response missing 'embeddings' for {len(texts)} inputs: {data!r}")
+    return embeddings
+
+
+def _embed_texts(base_url: str, model: str, texts: list[str], batch_size: int | None = None) -> List[List[float]]:
+    """Embed texts in chunks of batch_size, dispatching chunks concurrently. Order is preserved."""
+    size = max(1, batch_size or OLLAMA_EMBED_BATCH_SIZE)
+    chunks = [texts[i : i + size] for i in range(0, len(texts), size)]
+    limiter = get_limiter("ollama", model)
+
+    def _one(_idx: int, chunk: list[str]) -> List[List[float]]:
+        with limiter.slot():
+            return _embed_chunk(base_url, model, chunk)
+
+    return [vec for chunk in run_ordered(_one, chunks, max_workers=limiter.max_inflight) for vec in chunk]
+
+
 def embed(texts: TextLike) -> List[List[float]]:
-    """Generate embeddings via Ollama's /api/embeddings endpoint.
+    """Generate embeddings via Ollama's batched /api/embed endpoint.
 
-    NOTE: we currently call the single-text API in a loop for multiple texts.
-    This is simple and robust; we can batch later if needed.
+    Texts already in the shared embedding cache (or repeated in the batch)
+    are only embedded once; the rest go out in OLLAMA_EMBED_BATCH_SIZE chunks.
     """
     cfg = get_lm_model_config()
     model = cfg.get("embedding_model")
@@ -160,20 +195,11 @@ def embed(texts: TextLike) -> List[List[float]]:
     if not model:
         raise RuntimeError("No EMBEDDING_MODEL configured for Ollama")
 
-    def _embed_one(text: str) -> List[float]:
-        payload = {"model": model, "prompt": text}
-        data = _post_json(base_url, "/api/embeddings", payload)
-        if "embedding" not in data:
-            raise RuntimeError(f"Ollama embeddings response missing 'embedding': {data!r}")
-        return data["embedding"]
-
-    if isinstance(texts, str):
-        return [_embed_one(texts)]
+    def _embed_many(batch: list[str]) -> List[List[float]]:
+        return _embed_texts(base_url, model, batch)
 
-    out: List[List[float]] = []
-    for t in texts:
-        out.append(_embed_one(str(t)))
-    return out
+    text_list = [texts] if isinstance(texts, str) else [str(t) for t in texts]
+    return cached_embed(model, text_list, _embed_many, provider=base_url)
 
 
 def chat(
@@ -265,73 +291,36 @@ def _rerank_embedding_only(
         logger.warning("HINT: No EMBEDDING_MODEL configured for embedding_only rerank strategy; returning equal scores")
         return [(doc, 0.5) for doc in docs]
 
-    try:
-        # Embed query
-        query_embed_payload = {"model": embedding_model, "prompt": query}
-        query_embed_data = _post_json(base_url, "/api/embeddings", query_embed_payload)
-        if "embedding" not in query_embed_data:
-            logger.warning(
-                f"HINT: Query embedding response missing 'embedding': {query_embed_data!r}; returning equal scores"
-            )
-            return [(doc, 0.5) for doc in docs]
-        query_embedding = query_embed_data["embedding"]
-        if not isinstance(query_embedding, list) or not query_embedding:
-            logger.warning(f"HINT: Invalid query embedding format: {type(query_embedding)}; returning equal scores")
-            return [(doc, 0.5) for doc in docs]
-
-        # Embed documents
-        doc_embeddings: list[list[float]] = []
-        for doc in docs:
-            try:
-                doc_embed_payload = {"model": embedding_model, "prompt": doc}
-                doc_embed_data = _post_json(base_url, "/api/embeddings", doc_embed_payload)
-                if "embedding" not in doc_embed_data:
-                    logger.warning(
-                        f"HINT: Doc embedding response missing 'embedding' for doc {doc[:50]!r}; skipping this doc"
-                    )
-                    continue
-                doc_embedding = doc_embed_data["embedding"]
-                if not isinstance(doc_embedding, list) or not doc_embedding:
-                    logger.warning(f"HINT: Invalid doc embedding format for doc {doc[:50]!r}; skipping this doc")
-                    continue
-                doc_embeddings.append(doc_embedding)
-            except OllamaAPIError as e:
-                logger.warning(
-                    f"HINT: Ollama API error while embedding doc {doc[:50]!r} "
-                    f"({e.error_type}, status={e.status_code}): {e!s}; skipping this doc"
-                )
-                continue
+    if not docs:
+        return []
 
-        if not doc_embeddings or len(doc_embeddings) != len(docs):
-            logger.warning(
-                f"HINT: Failed to embed all documents ({len(doc_embeddings)}/{len(docs)} succeeded); "
-                "returning equal scores"
-            )
+    try:
+        # Query and documents go out together: one or two /api/embed calls in total
+        vectors = _embed_texts(base_url, embedding_model, [query, *docs])
+        try:
+            matrix = np.asarray(vectors, dtype=np.float64)
+        except (TypeError, ValueError):
+            matrix = None
+        if matrix is None or matrix.ndim != 2 or matrix.shape[1] == 0:
+            logger.warning("HINT: Invalid embedding format in embed response; returning equal scores")
             return [(doc, 0.5) for doc in docs]
 
-        # Compute cosine similarity scores
-        scores: list[tuple[str, float]] = []
-        for doc, doc_emb in zip(docs, doc_embeddings, strict=True):
-            # Cosine similarity: dot product / (norm(query) * norm(doc))
-            dot_product = sum(
-                q * d
-                for q, d in zip(query_embedding, doc_emb, strict=True)
-                if isinstance(q, (int, float)) and isinstance(d, (int, float))
-            )
-            query_norm = math.sqrt(sum(x * x for x in query_embedding if isinstance(x, (int, float))))
-            doc_norm = math.sqrt(sum(x * x for x in doc_emb if isinstance(x, (int, float))))
-            if query_norm > 0 and doc_norm > 0:
-                similarity = dot_product / (query_norm * doc_norm)
-            else:
-                similarity = 0.0
-            # Normalize to [0.0, 1.0] (cosine similarity is already in [-1, 1], shift to [0, 1])
-            normalized_score = (similarity + 1.0) / 2.0
-            scores.append((doc, normalized_score))
+        # Cosine similarity of every doc against the query (one matrix-vector product)
+        query_vec, doc_mat = matrix[0], matrix[1:]
+        norms = np.linalg.norm(doc_mat, axis=1) * np.linalg.norm(query_vec)
+        dots = doc_mat @ query_vec
+        similarity = np.divide(dots, norms, out=np.zeros_like(dots), where=norms > 0)
+        # Normalize to [0.0, 1.0] (cosine similarity is already in [-1, 1], shift to [0, 1])
+        normalized = (similarity + 1.0) / 2.0
 
         # Sort by score (highest first)
+        scores = [(doc, float(score)) for doc, score in zip(docs, normalized, strict=True)]
         scores.sort(key=lambda x: x[1], reverse=True)
         return scores
 
+    except RuntimeError as e:
+        logger.warning(f"HINT: Malformed embed response during embedding_only rerank: {e!s}; returning equal scores")
+        return [(doc, 0.5) for doc in docs]
     except OllamaAPIError as e:
         logger.warning(
             f"HINT: Ollama API error during embedding_only rerank "
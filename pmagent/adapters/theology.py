@@ -12,10 +12,10 @@ No fallbacks to internet-based providers.
 from __future__ import annotations
 
 
-import requests
 from requests.exceptions import ConnectionError, HTTPError, RequestException, Timeout
 
 from scripts.config.env import get_lm_model_config
+from src.infra.http_pool import get_http_session
 
 
 def chat(
@@ -86,7 +86,7 @@ def chat(
 
         try:
             # Increased timeout to 300s to allow for model loading
-            response = requests.post(url, json=payload, headers=headers, timeout=300.0)
+            response = get_http_session().post(url, json=payload, headers=headers, timeout=300.0)
             response.raise_for_status()
             data = response.json()
 
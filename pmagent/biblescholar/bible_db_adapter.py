@@ -16,6 +16,7 @@ from typing import Literal
 from sqlalchemy import text
 from sqlalchemy.exc import OperationalError, ProgrammingError
 
+from pmagent.biblescholar.verse_index import get_verse_index
 from pmagent.db.loader import DbUnavailableError, get_bible_engine
 
 
@@ -96,6 +97,12 @@ class BibleDbAdapter:
         if not self._ensure_engine():
             return None
 
+        # Resident index: unknown references never reach the DB, known ones are a primary-key fetch
+        index = get_verse_index()
+        if index is not None:
+            verse_id = index.verse_id(book_name, chapter_num, verse_num, translation_source)
+            return None if verse_id is None else self.get_verses_batch([verse_id]).get(verse_id)
+
         try:
             query = text(
                 """
@@ -136,6 +143,46 @@ class BibleDbAdapter:
             self._db_status = "unavailable"
             return None
 
+    def get_verses_batch(self, verse_ids: list[int]) -> dict[int, VerseRecord]:
+        """Get multiple verses by primary key (batch query).
+
+        Args:
+            verse_ids: verse_id values from bible.verses (e.g., vector search hits).
+
+        Returns:
+            Dictionary mapping verse_id to VerseRecord. Missing ids are omitted;
+            empty dict if DB unavailable.
+        """
+        if not verse_ids or not self._ensure_engine():
+            return {}
+
+        try:
+            query = text(
+                """
+                SELECT verse_id, book_name, chapter_num, verse_num, text, translation_source
+                FROM bible.verses
+                WHERE verse_id = ANY(:verse_ids)
+                """
+            )
+
+            with self._engine.connect() as conn:
+                result = conn.execute(query, {"verse_ids": sorted({int(v) for v in verse_ids})})
+
+                return {
+                    row[0]: VerseRecord(
+                        verse_id=row[0],
+                        book_name=row[1],
+                        chapter_num=row[2],
+                        verse_num=row[3],
+                        text=row[4],
+                        translation_source=row[5],
+                    )
+                    for row in result
+                }
+        except (OperationalError, ProgrammingError):
+            self._db_status = "unavailable"
+            return {}
+
     def get_passage(
         self,
         book_name: str,
@@ -14,7 +14,7 @@ See:
 
 from typing import Any
 
-from pmagent.biblescholar.cross_language_flow import resolve_cross_language_lemma
+from pmagent.biblescholar.cross_language_flow import resolve_cross_language_lemmas
 from pmagent.biblescholar.lexicon_adapter import LexiconAdapter
 from pmagent.biblescholar.reference_parser import parse_reference
 from pmagent.biblescholar.relationship_adapter import RelationshipAdapter
@@ -75,13 +75,14 @@ def build_contextual_chunks(verse_ref: str) -> list[dict[str, Any]]:
         if greek_words:
             chunk["greek_words"] = greek_words
 
-            # Resolve cross-language hints for Greek words
-            for word in greek_words:
-                strongs_id = word.get("strongs_id")
-                if strongs_id and strongs_id.startswith("G"):
-                    hint = resolve_cross_language_lemma(strongs_id)
-                    if hint:
-                        chunk["cross_language_hints"].append(hint)
+            # Resolve cross-language hints for all Greek words of the verse at once
+            greek_ids = [
+                strongs_id
+                for word in greek_words
+                if (strongs_id := word.get("strongs_id")) and strongs_id.startswith("G")
+            ]
+            hints = resolve_cross_language_lemmas(greek_ids)
+            chunk["cross_language_hints"] = [dict(hints[g]) for g in greek_ids if g in hints]
 
     # Get proper names
     proper_names = relationship_adapter.get_proper_names_for_verse(verse_id, limit=10)
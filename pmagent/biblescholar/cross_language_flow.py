@@ -10,16 +10,16 @@ See:
 
 from __future__ import annotations
 
-import json
-import os
 from collections import Counter
 from dataclasses import dataclass
-from typing import Any, Dict, Literal
+from typing import Any, Dict, Iterable, Literal
 
 from pmagent.biblescholar.bible_passage_flow import parse_reference
+from pmagent.biblescholar.lemma_resolver import get_lemma_resolver
 from pmagent.biblescholar.lexicon_adapter import LexiconAdapter
 from pmagent.biblescholar.lexicon_flow import fetch_lexicon_entry, fetch_word_study
 from pmagent.biblescholar.vector_flow import similar_verses_for_reference
+from pmagent.biblescholar.verse_index import get_verse_index
 
 
 @dataclass
@@ -69,7 +69,8 @@ def resolve_cross_language_lemma(greek_strongs: str) -> Dict[str, Any] | None:
 
     Phase 14 PR 14.3: Track 3 - Cross-Language Lemma Resolution.
     Uses a static JSON mapping file to link Greek terms to Hebrew equivalents,
-    then queries the Hebrew lexicon for the lemma.
+    then queries the Hebrew lexicon for the lemma. Both are held by the
+    resident resolver (see resolve_cross_language_lemmas).
 
     Args:
         greek_strongs: Greek Strong's number (e.g., "G2316").
@@ -84,52 +85,23 @@ def resolve_cross_language_lemma(greek_strongs: str) -> Dict[str, Any] | None:
             "mapping_source": "static_map"
         }
     """
-    if not os.path.exists(MAPPING_FILE):
-        return None
-
-    try:
-        with open(MAPPING_FILE, encoding="utf-8") as f:
-            data = json.load(f)
-            mappings = data.get("mappings", {})
-    except (json.JSONDecodeError, OSError):
-        return None
-
-    hebrew_strongs = mappings.get(greek_strongs)
-    if not hebrew_strongs:
-        return None
+    return resolve_cross_language_lemmas([greek_strongs]).get(greek_strongs)
 
-    # Fetch Hebrew lemma from DB using LexiconAdapter
-    adapter = LexiconAdapter()
-    # We need to find the entry with this Strong's ID
-    # Since LexiconAdapter is read-only and doesn't have a direct "get_by_strongs" method exposed publicly in the interface shown,
-    # we might need to add one or use a direct query here if the adapter allows.
-    # Looking at LexiconAdapter, it seems to lack a direct "get_entry_by_strongs" method in the snippet.
-    # However, fetch_lexicon_entry in lexicon_flow might be useful, or we can add a helper here.
-
-    # Let's use a direct DB query via the adapter's engine for now to ensure we get the lemma
-    # This keeps it contained within the flow logic using the adapter's connection
-    if not adapter._ensure_engine():
-        return None
 
-    try:
-        from sqlalchemy import text
+def resolve_cross_language_lemmas(greek_strongs_ids: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+    """Resolve many Greek Strong's numbers (e.g., a verse or chapter) at once.
 
-        query = text("SELECT lemma FROM bible.hebrew_entries WHERE strongs_id = :strongs_id LIMIT 1")
-        with adapter._engine.connect() as conn:
-            result = conn.execute(query, {"strongs_id": hebrew_strongs}).fetchone()
-            hebrew_lemma = result[0] if result else None
-    except Exception:
-        hebrew_lemma = None
+    The mapping file is parsed once per change and Hebrew lemmas not yet cached
+    are fetched with a single query, so a whole verse costs at most one lookup.
 
-    if not hebrew_lemma:
-        return None
+    Args:
+        greek_strongs_ids: Greek Strong's numbers (duplicates allowed).
 
-    return {
-        "greek_strongs": greek_strongs,
-        "hebrew_strongs": hebrew_strongs,
-        "hebrew_lemma": hebrew_lemma,
-        "mapping_source": "static_map",
-    }
+    Returns:
+        Dictionary mapping each resolvable Greek Strong's number to its hint
+        dictionary (same format as resolve_cross_language_lemma).
+    """
+    return get_lemma_resolver(MAPPING_FILE, LexiconAdapter).resolve_many(greek_strongs_ids)
 
 
 def analyze_word_in_context(ref: str, strongs_id: str) -> WordAnalysis | None:
@@ -315,6 +287,7 @@ def find_cross_language_connections(
     from sqlalchemy import text
 
     target_word_table = "bible.greek_nt_words" if is_hebrew else "bible.hebrew_ot_words"
+    index = get_verse_index()
 
     for similar_verse in similar_verses:
         verse_ref = f"{similar_verse.book_name} {similar_verse.chapter_num}:{similar_verse.verse_num}"
@@ -333,20 +306,24 @@ def find_cross_language_connections(
 
         try:
             with adapter._engine.connect() as conn:
-                verse_result = conn.execute(
-                    verse_query,
-                    {
-                        "book_name": similar_verse.book_name,
-                        "chapter_num": similar_verse.chapter_num,
-                        "verse_num": similar_verse.verse_num,
-                    },
-                )
-                verse_row = verse_result.fetchone()
-                if not verse_row:
+                if index is not None:
+                    verse_id = index.verse_id(
+                        similar_verse.book_name, similar_verse.chapter_num, similar_verse.verse_num, None
+                    )
+                else:
+                    verse_result = conn.execute(
+                        verse_query,
+                        {
+                            "book_name": similar_verse.book_name,
+                            "chapter_num": similar_verse.chapter_num,
+                            "verse_num": similar_verse.verse_num,
+                        },
+                    )
+                    verse_row = verse_result.fetchone()
+                    verse_id = verse_row[0] if verse_row else None
+                if verse_id is None:
                     continue
 
-                verse_id = verse_row[0]
-
                 # Get Strong's numbers from target language
                 strongs_query = text(
                     f"""
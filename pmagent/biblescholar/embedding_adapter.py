@@ -11,6 +11,7 @@ See: docs/SSOT/PHASE15_WAVE2_SPEC.md
 
 from __future__ import annotations
 
+import os
 from typing import Literal
 
 import numpy as np
@@ -19,6 +20,57 @@ from sqlalchemy.exc import OperationalError, ProgrammingError
 
 from pmagent.db.loader import DbUnavailableError, get_bible_engine
 
+# Opt-in local ANN index over bible.verse_embeddings (see src/infra/ann_index.py)
+VERSE_INDEX_NAME = "verse_embeddings"
+USE_VERSE_ANN_INDEX = os.getenv("BIBLESCHOLAR_ANN_INDEX", "0") in ("1", "true", "True")
+
+
+def load_verse_vectors(engine) -> tuple[list[int], np.ndarray]:
+    """Fetch all verse embeddings as (verse_ids, matrix) for building the verse index."""
+    query = text("SELECT verse_id, embedding FROM bible.verse_embeddings WHERE embedding IS NOT NULL")
+    with engine.connect() as conn:
+        rows = conn.execute(query).fetchall()
+    if not rows:
+        return [], np.zeros((0, 1024), dtype=np.float32)
+    return [int(r[0]) for r in rows], np.asarray([np.asarray(r[1], dtype=np.float32) for r in rows])
+
+
+def verse_vectors_signature(engine) -> str:
+    """Cheap fingerprint of bible.verse_embeddings (rows, max ids, created_at, dim) plus the embedding model."""
+    from scripts.config.env import get_lm_model_config
+
+    query = text(
+        """
+        SELECT count(*), max(id), max(verse_id), max(created_at),
+               (SELECT vector_dims(embedding) FROM bible.verse_embeddings LIMIT 1)
+        FROM bible.verse_embeddings
+        WHERE embedding IS NOT NULL
+        """
+    )
+    with engine.connect() as conn:
+        row = conn.execute(query).fetchone()
+    model = get_lm_model_config().get("embedding_model")
+    return "|".join(str(v) for v in (*row, model))
+
+
+def get_verse_index(engine):
+    """Return the shared verse ANN index (loaded from disk or built from the DB), or None.
+
+    The index is rebuilt when its snapshot no longer matches verse_vectors_signature().
+    """
+    from src.infra.ann_index import get_index
+
+    return get_index(
+        VERSE_INDEX_NAME,
+        loader=lambda: load_verse_vectors(engine),
+        signature=lambda: verse_vectors_signature(engine),
+    )
+
+
+def cosine_to_l2_score(cosine: float) -> float:
+    """Map cosine on unit vectors to the ``1 - (embedding <-> q)`` score the pgvector path reports."""
+    return 1.0 - float(np.sqrt(max(0.0, 2.0 - 2.0 * cosine)))
+
 
 class EmbeddingAdapter:
     """Adapter for 1024-D embeddings (DB-First, Rule 069).
@@ -31,10 +83,17 @@ class EmbeddingAdapter:
         _db_status: Current database status ("available", "unavailable", "db_off").
     """
 
-    def __init__(self) -> None:
-        """Initialize embedding adapter (lazy engine initialization)."""
+    def __init__(self, ann_index=None) -> None:
+        """Initialize embedding adapter (lazy engine initialization).
+
+        Args:
+            ann_index: Optional in-process verse index (src.infra.ann_index) used
+                instead of pgvector for vector_search. When omitted, the shared
+                index is used if BIBLESCHOLAR_ANN_INDEX=1.
+        """
         self._engine = None
         self._db_status: Literal["available", "unavailable", "db_off"] = "db_off"
+        self._ann_index = ann_index
 
     def _ensure_engine(self) -> bool:
         """Ensure database engine is available.
@@ -135,6 +194,19 @@ class EmbeddingAdapter:
                 f"Wave-3 requires LM to be available. Error: {e!s}"
             ) from e
 
+    def _get_ann_index(self):
+        """Resolve the local ANN index, if one was injected or is enabled."""
+        if self._ann_index is not None:
+            return self._ann_index
+        if not USE_VERSE_ANN_INDEX or not self._ensure_engine():
+            return None
+        # Not memoized here: the shared index revalidates against the DB and may be rebuilt
+        try:
+            return get_verse_index(self._engine)
+        except (OperationalError, ProgrammingError):
+            self._db_status = "unavailable"
+            return None
+
     def vector_search(self, query_embedding: np.ndarray, top_k: int = 5) -> list[tuple[int, float]]:
         """Perform pgvector cosine similarity search.
 
@@ -146,6 +218,9 @@ class EmbeddingAdapter:
             List of (verse_id, cosine_similarity) tuples, sorted by similarity desc.
             Empty list if DB unavailable.
         """
+        if self._get_ann_index() is not None:
+            return self.vector_search_batch([query_embedding], top_k=top_k)[0]
+
         if not self._ensure_engine():
             return []
 
@@ -180,6 +255,28 @@ class EmbeddingAdapter:
             self._db_status = "unavailable"
             return []
 
+    def vector_search_batch(self, query_embeddings, top_k: int = 5) -> list[list[tuple[int, float]]]:
+        """Vector search for several queries at once.
+
+        Uses one batched search against the local ANN index when available,
+        otherwise falls back to one pgvector query per embedding.
+
+        Args:
+            query_embeddings: Sequence (or 2-D array) of 1024-D query vectors
+            top_k: Number of results per query
+
+        Returns:
+            One list of (verse_id, similarity) tuples per query, in input order.
+        """
+        index = self._get_ann_index()
+        if index is None:
+            return [self.vector_search(np.asarray(q, dtype=np.float32), top_k=top_k) for q in query_embeddings]
+
+        return [
+            [(int(verse_id), cosine_to_l2_score(cos)) for verse_id, cos in hits]
+            for hits in index.search(np.asarray(query_embeddings, dtype=np.float32), top_k)
+        ]
+
     @property
     def db_status(self) -> Literal["available", "unavailable", "db_off"]:
         """Get current database status.
@@ -20,11 +20,9 @@ See:
 from dataclasses import dataclass
 from typing import Iterable, Mapping
 
-from pmagent.biblescholar.gematria_adapter import (
-    GematriaPhraseResult,
-    compute_phrase_gematria,
-)
-from pmagent.modules.gematria import core
+from pmagent.biblescholar.gematria_adapter import GematriaPhraseResult
+from pmagent.modules.gematria import core, hebrew, kernel
+from pmagent.modules.gematria.kernel import VerseGematriaTable
 
 
 @dataclass
@@ -96,20 +94,64 @@ def compute_verse_gematria(
         >>> "mispar_gadol" in summary.systems
         True
     """
-    if systems is None:
-        systems = supported_gematria_systems()
-
-    results: dict[str, GematriaPhraseResult] = {}
+    valid_systems = supported_gematria_systems()
+    systems = valid_systems if systems is None else list(systems)
     for system in systems:
-        phrase_result = compute_phrase_gematria(
-            text=text,
+        if system not in valid_systems:
+            raise ValueError(f"Invalid system '{system}'. Must be one of: {', '.join(valid_systems)}")
+
+    # Normalize once; all systems come from a single kernel lookup
+    normalized = hebrew.normalize_hebrew(text) if text else ""
+    letters = list(normalized)
+    values = kernel.values_matrix([normalized], systems)[0].tolist() if systems else []
+
+    results: dict[str, GematriaPhraseResult] = {
+        system: GematriaPhraseResult(
+            text=text or "",
+            normalized=normalized,
+            letters=list(letters),
             system=system,
+            value=value,
             osis_ref=osis_ref,
         )
-        results[system] = phrase_result
+        for system, value in zip(systems, values, strict=True)
+    }
 
     return VerseGematriaSummary(
         osis_ref=osis_ref,
         text=text,
         systems=results,
     )
+
+
+def compute_book_gematria(
+    book: str,
+    verses: Iterable[tuple[str, str]],
+    systems: Iterable[str] | None = None,
+) -> VerseGematriaTable:
+    """Compute Gematria for every verse of a book across one or more systems.
+
+    Values for all verses and systems are computed in one vectorized pass and
+    the resulting per-verse table is cached (in memory and under
+    GEMATRIA_TABLE_DIR) keyed by the verse texts, so repeated book-wide
+    statistics reuse it.
+
+    Args:
+        book: Book name (e.g., "Genesis"); used for the cache key.
+        verses: (osis_ref, text) pairs in book order.
+        systems: Optional list of system names. If None, uses all supported systems.
+
+    Returns:
+        VerseGematriaTable with one row per verse and one column per system.
+
+    Raises:
+        ValueError: If any system name in `systems` is not supported.
+
+    Examples:
+        >>> table = compute_book_gematria("Gen", [("Gen.2.7", "אדם"), ("Gen.4.2", "הבל")])
+        >>> table.value("Gen.4.2", "mispar_hechrachi")
+        37
+        >>> table.stats("mispar_hechrachi")["total"]
+        82
+    """
+    return kernel.get_book_table(book, verses, systems)
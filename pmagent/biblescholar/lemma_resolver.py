@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+"""Resident Greek-to-Hebrew lemma resolver (read-only).
+
+Holds the static Greek→Hebrew Strong's mapping and the Hebrew lemmas looked
+up so far for the life of the process:
+
+- the mapping file is parsed once and re-read only when its mtime/size changes,
+- Hebrew lemmas missing from the cache are fetched with one
+  ``strongs_id = ANY(...)`` query per batch (found and not-found ids are both
+  remembered),
+- ``resolve_many`` resolves a whole verse or chapter of Strong's ids at once.
+
+See:
+- pmagent/biblescholar/cross_language_flow.py
+- pmagent/biblescholar/AGENTS.md
+"""
+
+import json
+import os
+import threading
+from typing import Any, Callable, Iterable
+
+from pmagent.biblescholar.lexicon_adapter import LexiconAdapter
+
+MAPPING_SOURCE = "static_map"
+
+
+class LemmaResolver:
+    """Greek Strong's id -> Hebrew equivalent + lemma, with resident caches.
+
+    Attributes:
+        mapping_file: Path of the Greek→Hebrew mapping JSON.
+        adapter_factory: Callable returning a LexiconAdapter (used once per batch
+            that has uncached Hebrew ids).
+    """
+
+    def __init__(self, mapping_file: str, adapter_factory: Callable[[], LexiconAdapter] = LexiconAdapter) -> None:
+        self.mapping_file = mapping_file
+        self.adapter_factory = adapter_factory
+        self._mapping: dict[str, str] = {}
+        self._mapping_sig: tuple[int, int] | None = None
+        self._lemmas: dict[str, str | None] = {}
+        self._lock = threading.Lock()
+
+    def mapping(self) -> dict[str, str]:
+        """Greek→Hebrew Strong's mapping (empty if the file is missing or invalid)."""
+        try:
+            st = os.stat(self.mapping_file)
+        except OSError:
+            return {}
+        sig = (st.st_mtime_ns, st.st_size)
+        with self._lock:
+            if sig == self._mapping_sig:
+                return self._mapping
+        try:
+            with open(self.mapping_file, encoding="utf-8") as f:
+                mappings = json.load(f).get("mappings", {})
+        except (json.JSONDecodeError, OSError, AttributeError):
+            mappings = {}
+        with self._lock:
+            self._mapping, self._mapping_sig = dict(mappings), sig
+        return self._mapping
+
+    def hebrew_lemmas(self, hebrew_ids: Iterable[str]) -> dict[str, str]:
+        """Lemmas for Hebrew Strong's ids; uncached ids cost one batched query."""
+        wanted = list(dict.fromkeys(hebrew_ids))
+        with self._lock:
+            missing = [h for h in wanted if h not in self._lemmas]
+        if missing:
+            fetched = self.adapter_factory().get_hebrew_lemmas_batch(missing)
+            # None = DB unavailable: answer from the cache and retry next call
+            if fetched is not None:
+                with self._lock:
+                    for hebrew_id in missing:
+                        self._lemmas[hebrew_id] = fetched.get(hebrew_id)
+        with self._lock:
+            return {h: lemma for h in wanted if (lemma := self._lemmas.get(h))}
+
+    def resolve_many(self, greek_ids: Iterable[str]) -> dict[str, dict[str, Any]]:
+        """Resolve Greek Strong's ids to hint dicts; unresolvable ids are absent."""
+        mapping = self.mapping()
+        pairs = {g: mapping[g] for g in dict.fromkeys(greek_ids) if mapping.get(g)}
+        if not pairs:
+            return {}
+        lemmas = self.hebrew_lemmas(pairs.values())
+        return {
+            greek: {
+                "greek_strongs": greek,
+                "hebrew_strongs": hebrew,
+                "hebrew_lemma": lemmas[hebrew],
+                "mapping_source": MAPPING_SOURCE,
+            }
+            for greek, hebrew in pairs.items()
+            if hebrew in lemmas
+        }
+
+    def preload(self) -> int:
+        """Fetch lemmas for every mapped Hebrew id in one query. Returns the number resolved."""
+        return len(self.hebrew_lemmas(self.mapping().values()))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._mapping, self._mapping_sig = {}, None
+            self._lemmas.clear()
+
+
+_RESOLVERS: dict[str, LemmaResolver] = {}
+_RESOLVERS_LOCK = threading.Lock()
+
+
+def get_lemma_resolver(
+    mapping_file: str, adapter_factory: Callable[[], LexiconAdapter] = LexiconAdapter
+) -> LemmaResolver:
+    """Process-wide resolver for mapping_file (created on first use)."""
+    with _RESOLVERS_LOCK:
+        resolver = _RESOLVERS.get(mapping_file)
+        if resolver is None:
+            resolver = _RESOLVERS[mapping_file] = LemmaResolver(mapping_file, adapter_factory)
+        resolver.adapter_factory = adapter_factory
+        return resolver
+
+
+def clear_lemma_resolvers() -> None:
+    with _RESOLVERS_LOCK:
+        _RESOLVERS.clear()
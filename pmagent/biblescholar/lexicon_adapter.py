@@ -16,6 +16,7 @@ from typing import Literal
 from sqlalchemy import text
 from sqlalchemy.exc import OperationalError, ProgrammingError
 
+from pmagent.biblescholar.verse_index import get_verse_index
 from pmagent.db.loader import DbUnavailableError, get_bible_engine
 
 
@@ -103,6 +104,11 @@ class LexiconAdapter:
 
             parsed = parse_reference(verse_ref)
 
+            # Resident index first: no DB round-trip per reference
+            index = get_verse_index()
+            if index is not None:
+                return index.verse_id(parsed.book, parsed.chapter, parsed.verse, "KJV")
+
             # Query the DB for the verse_id using the parsed components
             # We prioritize the KJV translation as the anchor for Greek words
             query = text("""
@@ -169,6 +175,37 @@ class LexiconAdapter:
             self._db_status = "unavailable"
             return None
 
+    def get_hebrew_lemmas_batch(self, strongs_ids: list[str]) -> dict[str, str] | None:
+        """Get Hebrew lemmas for many Strong's numbers in a single query.
+
+        Args:
+            strongs_ids: Strong's numbers (e.g., ["H430", "H3068"]).
+
+        Returns:
+            Dictionary mapping strongs_id to lemma (ids without an entry are
+            absent), or None if the DB is unavailable.
+        """
+        if not strongs_ids:
+            return {}
+        if not self._ensure_engine():
+            return None
+
+        try:
+            query = text(
+                """
+                SELECT DISTINCT ON (strongs_id) strongs_id, lemma
+                FROM bible.hebrew_entries
+                WHERE strongs_id = ANY(:strongs_ids)
+                ORDER BY strongs_id, entry_id
+                """
+            )
+            with self._engine.connect() as conn:
+                result = conn.execute(query, {"strongs_ids": list(strongs_ids)})
+                return {row[0]: row[1] for row in result if row[1]}
+        except (OperationalError, ProgrammingError):
+            self._db_status = "unavailable"
+            return None
+
     def get_greek_entry(self, strongs_id: str) -> LexiconEntry | None:
         """Get a Greek lexicon entry by Strong's number.
 
@@ -284,7 +321,12 @@ class LexiconAdapter:
             return []
 
         try:
-            # First, get the verse_id
+            # First, get the verse_id (resident index when loaded, any translation)
+            index = get_verse_index()
+            verse_id = index.verse_id(book_name, chapter_num, verse_num, None) if index is not None else None
+            if index is not None and verse_id is None:
+                return []
+
             verse_query = text(
                 """
                 SELECT verse_id
@@ -296,15 +338,16 @@ class LexiconAdapter:
                 """
             )
             with self._engine.connect() as conn:
-                verse_result = conn.execute(
-                    verse_query,
-                    {"book_name": book_name, "chapter_num": chapter_num, "verse_num": verse_num},
-                )
-                verse_row = verse_result.fetchone()
-                if verse_row is None:
-                    return []
+                if verse_id is None:
+                    verse_result = conn.execute(
+                        verse_query,
+                        {"book_name": book_name, "chapter_num": chapter_num, "verse_num": verse_num},
+                    )
+                    verse_row = verse_result.fetchone()
+                    if verse_row is None:
+                        return []
 
-                verse_id = verse_row[0]
+                    verse_id = verse_row[0]
 
                 # Get Hebrew words with Strong's numbers
                 hebrew_query = text(
@@ -364,12 +407,29 @@ class LexiconAdapter:
             return {}
 
         try:
-            # Convert verse_refs to verse_ids
+            # Convert verse_refs to verse_ids (one vectorized index lookup when available)
             verse_id_map: dict[int, str] = {}
-            for verse_ref in verse_refs:
-                verse_id = self._verse_ref_to_id(verse_ref)
-                if verse_id:
-                    verse_id_map[verse_id] = verse_ref
+            index = get_verse_index()
+            if index is not None:
+                from pmagent.biblescholar.reference_parser import parse_reference
+
+                parsed_refs: list[tuple[str, tuple[str, int, int]]] = []
+                for verse_ref in verse_refs:
+                    try:
+                        parsed = parse_reference(verse_ref)
+                    except (ValueError, AttributeError):
+                        continue
+                    if parsed.verse is not None:
+                        parsed_refs.append((verse_ref, (parsed.book, parsed.chapter, parsed.verse)))
+                ids = index.verse_ids([ref for _, ref in parsed_refs], "KJV")
+                for (verse_ref, _), verse_id in zip(parsed_refs, ids, strict=True):
+                    if verse_id:
+                        verse_id_map[verse_id] = verse_ref
+            else:
+                for verse_ref in verse_refs:
+                    verse_id = self._verse_ref_to_id(verse_ref)
+                    if verse_id:
+                        verse_id_map[verse_id] = verse_ref
 
             if not verse_id_map:
                 return {}
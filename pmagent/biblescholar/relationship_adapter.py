@@ -16,6 +16,7 @@ from typing import Literal
 from sqlalchemy import text
 from sqlalchemy.exc import OperationalError, ProgrammingError
 
+from pmagent.biblescholar.verse_index import get_verse_index
 from pmagent.db.loader import DbUnavailableError, get_bible_engine
 
 
@@ -263,13 +264,18 @@ class RelationshipAdapter:
             return None
 
         try:
+            # Verify verse exists (resident index when loaded)
+            index = get_verse_index()
+            if index is not None and verse_id not in index:
+                return None
+
             engine = get_bible_engine()
             with engine.connect() as conn:
-                # Verify verse exists
-                verse_check = text("SELECT verse_id FROM bible.verses WHERE verse_id = :verse_id")
-                verse_result = conn.execute(verse_check, {"verse_id": verse_id})
-                if verse_result.fetchone() is None:
-                    return None
+                if index is None:
+                    verse_check = text("SELECT verse_id FROM bible.verses WHERE verse_id = :verse_id")
+                    verse_result = conn.execute(verse_check, {"verse_id": verse_id})
+                    if verse_result.fetchone() is None:
+                        return None
 
                 # Get proper names
                 proper_names = self.get_proper_names_for_verse(verse_id)
@@ -12,9 +12,61 @@ See: docs/SSOT/PHASE15_WAVE2_SPEC.md
 
 from __future__ import annotations
 
+import hashlib
 import os
+import threading
+from collections import OrderedDict
 from typing import Any, Literal
 
+from pmagent.biblescholar.bible_db_adapter import BibleDbAdapter
+
+# Max (query, scored text) scores kept in the process-wide rerank cache (0 disables)
+RERANK_CACHE_SIZE = int(os.getenv("RERANK_CACHE_SIZE", "4096"))
+
+_SCORE_CACHE: OrderedDict[tuple[str, str], float] = OrderedDict()
+_SCORE_CACHE_LOCK = threading.Lock()
+
+
+def _query_hash(query: str) -> str:
+    """Cache key for a query under the configured reranker model."""
+    from pmagent.adapters.lm_studio import get_lm_model_config
+
+    model = get_lm_model_config().get("reranker_model") or ""
+    return hashlib.sha256(f"{model}\x00{query}".encode()).hexdigest()
+
+
+def _text_key(text: str) -> str:
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def _verse_key(verse_id) -> str:
+    """Stands in for the canonical bible.verses text of verse_id, so cache hits skip the lookup."""
+    return f"verse:{int(verse_id)}"
+
+
+def _cache_get(key: tuple[str, str]) -> float | None:
+    with _SCORE_CACHE_LOCK:
+        score = _SCORE_CACHE.get(key)
+        if score is not None:
+            _SCORE_CACHE.move_to_end(key)
+        return score
+
+
+def _cache_put(key: tuple[str, str], score: float) -> None:
+    if RERANK_CACHE_SIZE <= 0:
+        return
+    with _SCORE_CACHE_LOCK:
+        _SCORE_CACHE[key] = score
+        _SCORE_CACHE.move_to_end(key)
+        while len(_SCORE_CACHE) > RERANK_CACHE_SIZE:
+            _SCORE_CACHE.popitem(last=False)
+
+
+def clear_rerank_cache() -> None:
+    """Drop all cached (query, scored text) rerank scores."""
+    with _SCORE_CACHE_LOCK:
+        _SCORE_CACHE.clear()
+
 
 class RerankerAdapter:
     """Reranker adapter (non-negotiable per Option B).
@@ -26,9 +78,15 @@ class RerankerAdapter:
         _lm_status: Current LM service status (\"available\", \"unavailable\", \"lm_off\").
     """
 
-    def __init__(self) -> None:
-        """Initialize reranker adapter (lazy LM initialization)."""
+    def __init__(self, bible_db: BibleDbAdapter | None = None) -> None:
+        """Initialize reranker adapter (lazy LM initialization).
+
+        Args:
+            bible_db: Adapter used to look up verse text for chunks that only
+                carry a verse_id (default: a new BibleDbAdapter).
+        """
         self._lm_status: Literal["available", "unavailable", "lm_off"] = "lm_off"
+        self._bible_db = bible_db or BibleDbAdapter()
 
     def _ensure_lm(self) -> bool:
         """Ensure LM service is available for reranking.
@@ -84,15 +142,32 @@ class RerankerAdapter:
     def _compute_rerank_score(self, chunk: dict[str, Any], query: str) -> float:
         """Compute reranking score for a chunk using cross-encoder.
 
+        Single-chunk form of _compute_rerank_scores().
+
+        Args:
+            chunk: Chunk dict with 'text' field (or 'verse_id'/'verse_ref' for lookup)
+            query: Query string
+
+        Returns:
+            Reranking score (0.0-1.0)
+
+        Raises:
+            RuntimeError: If LM service is unavailable (Wave-3 requires LM).
+        """
+        return self._compute_rerank_scores([chunk], query)[0]
+
+    def _compute_rerank_scores(self, chunks: list[dict[str, Any]], query: str) -> list[float]:
+        """Compute reranking scores for all chunks with one reranker call.
+
         Phase 15 Wave-3: Wired to real reranker service.
         LM-off during Wave-3 = LOUD FAIL (RuntimeError).
 
         Args:
-            chunk: Chunk dict with 'text' field (or 'verse_ref' for verse text lookup)
+            chunks: Chunk dicts with 'text', or 'verse_id'/'verse_ref' for verse text lookup
             query: Query string
 
         Returns:
-            Reranking score (0.0-1.0)
+            Reranking scores (0.0-1.0), in chunk order.
 
         Raises:
             RuntimeError: If LM service is unavailable (Wave-3 requires LM).
@@ -102,38 +177,75 @@ class RerankerAdapter:
             raise RuntimeError(
                 "LOUD FAIL: Reranker service unavailable. Wave-3 requires LM to be available for reranking."
             )
+        return self._score_chunks(chunks, query)
+
+    def _chunk_texts(self, chunks: list[dict[str, Any]]) -> list[tuple[str | None, str | None]]:
+        """(text to score, cache key) per chunk; verse texts for bare verse_ids come from one batch query."""
+        missing_ids = [c["verse_id"] for c in chunks if not c.get("text") and c.get("verse_id") is not None]
+        verses = self._bible_db.get_verses_batch(missing_ids) if missing_ids else {}
 
+        texts: list[tuple[str | None, str | None]] = []
+        for chunk in chunks:
+            chunk_text = chunk.get("text")
+            if not chunk_text and chunk.get("verse_id") is not None:
+                verse = verses.get(int(chunk["verse_id"]))
+                if verse and verse.text:
+                    texts.append((verse.text, _verse_key(chunk["verse_id"])))
+                    continue
+            # Fallback: use verse_ref as text when no verse text is available
+            chunk_text = chunk_text or chunk.get("verse_ref")
+            texts.append((chunk_text, _text_key(chunk_text) if chunk_text else None))
+        return texts
+
+    def _score_chunks(self, chunks: list[dict[str, Any]], query: str) -> list[float]:
+        """Score chunks against query: cache lookups by (query hash, scored text), then one rerank call.
+
+        A chunk's own text is keyed by its hash; a bare verse_id by the verse, since it is
+        scored on the canonical verse text. Fallback verse_ref text never fills a verse entry.
+        """
         from pmagent.adapters.lm_studio import rerank
 
-        # Extract text from chunk
-        chunk_text = chunk.get("text")
-        if not chunk_text:
-            # Fallback: try to get verse text from verse_ref
-            verse_ref = chunk.get("verse_ref")
-            if verse_ref:
-                # For now, use verse_ref as text (can enhance later with verse lookup)
-                chunk_text = verse_ref
+        qhash = _query_hash(query)
+        scores: list[float | None] = [None] * len(chunks)
+        pending: list[int] = []
+        for i, chunk in enumerate(chunks):
+            if chunk.get("text"):
+                key = _text_key(chunk["text"])
+            elif chunk.get("verse_id") is not None:
+                key = _verse_key(chunk["verse_id"])
             else:
-                # No text available, return neutral score
-                return 0.5
-
-        try:
-            # Call reranker with query and chunk text
-            # rerank() returns list[tuple[doc, score]] for each doc
-            results = rerank(query, [chunk_text], model_slot="reranker")
-            if not results or len(results) == 0:
-                return 0.5
-
-            # Extract score from first (doc, score) tuple
-            _, score = results[0]
-            # Clamp to [0.0, 1.0] if needed
-            return max(0.0, min(1.0, float(score)))
-        except RuntimeError as e:
-            # Wave-3: LM-off = LOUD FAIL
-            raise RuntimeError(
-                f"LOUD FAIL: Reranker service error during score computation. "
-                f"Wave-3 requires LM to be available. Error: {e!s}"
-            ) from e
+                key = _text_key(chunk["verse_ref"]) if chunk.get("verse_ref") else None
+            cached = _cache_get((qhash, key)) if key else None
+            if cached is not None:
+                scores[i] = cached
+            else:
+                pending.append(i)
+
+        if pending:
+            texts = self._chunk_texts([chunks[i] for i in pending])
+            docs = list(dict.fromkeys(t for t, _ in texts if t))
+            by_doc: dict[str, float] = {}
+            if docs:
+                try:
+                    # rerank() returns list[tuple[doc, score]] sorted by score
+                    results = rerank(query, docs, model_slot="reranker")
+                except RuntimeError as e:
+                    # Wave-3: LM-off = LOUD FAIL
+                    raise RuntimeError(
+                        f"LOUD FAIL: Reranker service error during score computation. "
+                        f"Wave-3 requires LM to be available. Error: {e!s}"
+                    ) from e
+                # Clamp to [0.0, 1.0] if needed
+                by_doc = {doc: max(0.0, min(1.0, float(score))) for doc, score in results or []}
+
+            for i, (chunk_text, key) in zip(pending, texts, strict=True):
+                # No text or no score returned: neutral score
+                score = by_doc.get(chunk_text, 0.5) if chunk_text else 0.5
+                scores[i] = score
+                if key and chunk_text in by_doc:
+                    _cache_put((qhash, key), score)
+
+        return [float(s) for s in scores]
 
     def rerank_chunks(self, chunks: list[dict[str, Any]], query: str) -> list[dict[str, Any]]:
         """Rerank chunks by relevance to query.
@@ -166,9 +278,8 @@ class RerankerAdapter:
         # Get EDGE_ALPHA from environment (Rule 045 default: 0.5)
         edge_alpha = float(os.getenv("EDGE_ALPHA", "0.5"))
 
-        # Compute reranker scores for each chunk
-        for chunk in chunks:
-            reranker_score = self._compute_rerank_score(chunk, query)
+        # Compute reranker scores for all chunks in one batched call
+        for chunk, reranker_score in zip(chunks, self._score_chunks(chunks, query), strict=True):
             chunk["rerank_score"] = reranker_score
 
         # Compute edge_strength using Rule 045 blend for each chunk
@@ -1,16 +1,27 @@
 """Tests for Cross-Language Lemma Resolution (Phase 14 PR 14.3)."""
 
 import json
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import pytest
 
-from pmagent.biblescholar.cross_language_flow import resolve_cross_language_lemma
+from pmagent.biblescholar.cross_language_flow import (
+    resolve_cross_language_lemma,
+    resolve_cross_language_lemmas,
+)
+from pmagent.biblescholar.lemma_resolver import clear_lemma_resolvers
 
 
 class TestCrossLanguageResolution:
     """Test Greek-to-Hebrew lemma resolution logic."""
 
+    @pytest.fixture(autouse=True)
+    def fresh_resolver(self):
+        """Resolvers are process-wide; start every test with empty caches."""
+        clear_lemma_resolvers()
+        yield
+        clear_lemma_resolvers()
+
     @pytest.fixture
     def mock_mapping_file(self, tmp_path):
         """Create a temporary mapping file."""
@@ -31,22 +42,9 @@ class TestCrossLanguageResolution:
     @patch("pmagent.biblescholar.cross_language_flow.LexiconAdapter")
     def test_resolve_successful_mapping(self, MockAdapter, mock_mapping_file):
         """Test successful resolution of a mapped Greek term."""
-        # Setup mock adapter with engine and connection chain
+        # Setup mock adapter: one batched lemma lookup
         mock_instance = MockAdapter.return_value
-        mock_instance._ensure_engine.return_value = True
-
-        # Mock the engine connection chain
-        mock_conn = MagicMock()
-        mock_result = MagicMock()
-        mock_row = ("אֱלֹהִים",)  # Hebrew lemma
-        mock_result.fetchone.return_value = mock_row
-        mock_conn.execute.return_value = mock_result
-        mock_conn.__enter__ = MagicMock(return_value=mock_conn)
-        mock_conn.__exit__ = MagicMock(return_value=None)
-
-        mock_engine = MagicMock()
-        mock_engine.connect.return_value = mock_conn
-        mock_instance._engine = mock_engine
+        mock_instance.get_hebrew_lemmas_batch.return_value = {"H430": "אֱלֹהִים"}  # Hebrew lemma
 
         # Patch the mapping file path
         with patch("pmagent.biblescholar.cross_language_flow.MAPPING_FILE", mock_mapping_file):
@@ -68,21 +66,9 @@ class TestCrossLanguageResolution:
     @patch("pmagent.biblescholar.cross_language_flow.LexiconAdapter")
     def test_resolve_mapped_but_no_hebrew_entry(self, MockAdapter, mock_mapping_file):
         """Test mapped term where Hebrew DB entry is missing."""
-        # Setup mock adapter with engine but no result
+        # Setup mock adapter: lookup succeeds but finds no entry
         mock_instance = MockAdapter.return_value
-        mock_instance._ensure_engine.return_value = True
-
-        # Mock the engine connection chain with no result
-        mock_conn = MagicMock()
-        mock_result = MagicMock()
-        mock_result.fetchone.return_value = None  # No DB entry found
-        mock_conn.execute.return_value = mock_result
-        mock_conn.__enter__ = MagicMock(return_value=mock_conn)
-        mock_conn.__exit__ = MagicMock(return_value=None)
-
-        mock_engine = MagicMock()
-        mock_engine.connect.return_value = mock_conn
-        mock_instance._engine = mock_engine
+        mock_instance.get_hebrew_lemmas_batch.return_value = {}  # No DB entry found
 
         with patch("pmagent.biblescholar.cross_language_flow.MAPPING_FILE", mock_mapping_file):
             result = resolve_cross_language_lemma("G9999")
@@ -96,3 +82,33 @@ class TestCrossLanguageResolution:
             result = resolve_cross_language_lemma("G2316")
 
         assert result is None
+
+    @patch("pmagent.biblescholar.cross_language_flow.LexiconAdapter")
+    def test_batch_resolution_uses_one_query(self, MockAdapter, mock_mapping_file):
+        """A verse worth of Strong's ids costs one lemma query; repeats hit the cache."""
+        mock_instance = MockAdapter.return_value
+        mock_instance.get_hebrew_lemmas_batch.return_value = {"H430": "אֱלֹהִים"}
+
+        with patch("pmagent.biblescholar.cross_language_flow.MAPPING_FILE", mock_mapping_file):
+            hints = resolve_cross_language_lemmas(["G2316", "G1234", "G9999", "G2316"])
+            again = resolve_cross_language_lemma("G2316")
+            missing = resolve_cross_language_lemma("G9999")
+
+        assert list(hints) == ["G2316"]
+        assert hints["G2316"]["hebrew_lemma"] == "אֱלֹהִים"
+        assert again == hints["G2316"]
+        assert missing is None
+        mock_instance.get_hebrew_lemmas_batch.assert_called_once_with(["H430", "H9999"])
+
+    @patch("pmagent.biblescholar.cross_language_flow.LexiconAdapter")
+    def test_db_unavailable_is_not_cached(self, MockAdapter, mock_mapping_file):
+        """A failed lookup (DB off) is retried on the next call."""
+        mock_instance = MockAdapter.return_value
+        mock_instance.get_hebrew_lemmas_batch.return_value = None
+
+        with patch("pmagent.biblescholar.cross_language_flow.MAPPING_FILE", mock_mapping_file):
+            assert resolve_cross_language_lemma("G2316") is None
+            mock_instance.get_hebrew_lemmas_batch.return_value = {"H430": "אֱלֹהִים"}
+            assert resolve_cross_language_lemma("G2316")["hebrew_strongs"] == "H430"
+
+        assert mock_instance.get_hebrew_lemmas_batch.call_count == 2
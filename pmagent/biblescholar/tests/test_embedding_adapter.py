@@ -11,6 +11,7 @@ See: docs/SSOT/PHASE15_WAVE2_SPEC.md
 from unittest.mock import MagicMock, patch
 
 import numpy as np
+import pytest
 
 from pmagent.biblescholar.embedding_adapter import EmbeddingAdapter
 from pmagent.db.loader import DbUnavailableError
@@ -142,3 +143,23 @@ class TestEmbeddingAdapter:
         except RuntimeError as e:
             # Wave-3: LM-off = LOUD FAIL (expected behavior)
             assert "LOUD FAIL" in str(e) or "unavailable" in str(e).lower()
+
+    @patch("pmagent.biblescholar.embedding_adapter.get_bible_engine")
+    def test_vector_search_uses_ann_index(self, mock_get_engine):
+        """Test batched vector search is answered from an injected local index without DB."""
+        from src.infra.ann_index import FlatIndex
+
+        rng = np.random.default_rng(0)
+        vecs = rng.normal(size=(10, 1024)).astype(np.float32)
+        vecs /= np.linalg.norm(vecs, axis=1, keepdims=True)
+        index = FlatIndex()
+        index.upsert(list(range(1, 11)), vecs)
+
+        adapter = EmbeddingAdapter(ann_index=index)
+        batch = adapter.vector_search_batch(vecs[[2, 7]], top_k=3)
+
+        assert [hits[0][0] for hits in batch] == [3, 8]
+        # Exact match keeps the pgvector "1 - L2 distance" score convention
+        assert batch[0][0][1] == pytest.approx(1.0, abs=1e-3)
+        assert adapter.vector_search(vecs[4], top_k=1)[0][0] == 5
+        mock_get_engine.assert_not_called()
@@ -9,9 +9,9 @@ Test coverage:
 """
 
 import pytest
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
-from pmagent.biblescholar.reranker_adapter import RerankerAdapter
+from pmagent.biblescholar.reranker_adapter import RerankerAdapter, clear_rerank_cache
 
 
 class TestRerankerAdapterInit:
@@ -52,14 +52,14 @@ class TestRerankerAdapterReranking:
             adapter.rerank_chunks(chunks, query)
 
     @patch("pmagent.biblescholar.reranker_adapter.RerankerAdapter._ensure_lm")
-    @patch("pmagent.biblescholar.reranker_adapter.RerankerAdapter._compute_rerank_score")
-    def test_rerank_chunks_with_scores(self, mock_compute_score, mock_ensure_lm):
+    @patch("pmagent.biblescholar.reranker_adapter.RerankerAdapter._score_chunks")
+    def test_rerank_chunks_with_scores(self, mock_score_chunks, mock_ensure_lm):
         """Test reranking with cross-encoder scores."""
         # Mock LM as available
         mock_ensure_lm.return_value = True
 
         # Mock reranker scores (higher score = more relevant)
-        mock_compute_score.side_effect = [0.95, 0.70, 0.88]  # Mark 1:1, 1:2, 1:3
+        mock_score_chunks.return_value = [0.95, 0.70, 0.88]  # Mark 1:1, 1:2, 1:3
 
         adapter = RerankerAdapter()
         adapter._lm_status = "available"  # Simulate LM available
@@ -124,6 +124,69 @@ class TestRerankerAdapterComputeScore:
         assert 0.0 <= score <= 1.0
 
 
+class TestRerankerAdapterBatching:
+    """Test batched scoring: one verse lookup, one rerank call, cached scores."""
+
+    def setup_method(self):
+        clear_rerank_cache()
+
+    def teardown_method(self):
+        clear_rerank_cache()
+
+    @patch("pmagent.biblescholar.reranker_adapter._query_hash", return_value="qh")
+    @patch("pmagent.adapters.lm_studio.rerank")
+    def test_one_lookup_and_one_rerank_call_for_all_chunks(self, mock_rerank, _mock_hash):
+        bible_db = MagicMock()
+        bible_db.get_verses_batch.return_value = {
+            1: MagicMock(text="In the beginning"),
+            2: MagicMock(text="And the earth"),
+        }
+        mock_rerank.side_effect = lambda query, docs, **kw: sorted(
+            [(d, 0.9 if "beginning" in d else 0.2) for d in docs], key=lambda r: r[1], reverse=True
+        )
+        adapter = RerankerAdapter(bible_db=bible_db)
+
+        chunks = [{"verse_id": 2}, {"verse_id": 1}, {"verse_id": 3}, {"verse_ref": "Gen 1:3", "text": "light"}]
+        scores = adapter._score_chunks(chunks, "creation")
+
+        assert scores == [0.2, 0.9, 0.5, 0.2]
+        bible_db.get_verses_batch.assert_called_once_with([2, 1, 3])
+        mock_rerank.assert_called_once()
+        assert mock_rerank.call_args.args[1] == ["And the earth", "In the beginning", "light"]
+
+        # Same query again: verse_id scores come from the cache
+        mock_rerank.reset_mock()
+        bible_db.get_verses_batch.reset_mock()
+        assert adapter._score_chunks(chunks[:2], "creation") == [0.2, 0.9]
+        mock_rerank.assert_not_called()
+        bible_db.get_verses_batch.assert_not_called()
+
+    @patch("pmagent.biblescholar.reranker_adapter._query_hash", return_value="qh")
+    @patch("pmagent.adapters.lm_studio.rerank")
+    def test_cache_is_keyed_by_scored_text(self, mock_rerank, _mock_hash):
+        bible_db = MagicMock()
+        bible_db.get_verses_batch.return_value = {1: MagicMock(text="In the beginning")}
+        mock_rerank.side_effect = lambda query, docs, **kw: [(d, 0.9 if "beginning" in d else 0.3) for d in docs]
+        adapter = RerankerAdapter(bible_db=bible_db)
+
+        # Verse 3 has no text in the DB, so it is scored on its verse_ref
+        assert adapter._score_chunks([{"verse_id": 1}, {"verse_id": 3, "verse_ref": "Gen 1:3"}], "creation") == [
+            0.9,
+            0.3,
+        ]
+
+        # The same verse_id with different text is rescored, not served the verse's cached score
+        mock_rerank.reset_mock()
+        assert adapter._score_chunks([{"verse_id": 1, "text": "a paraphrase"}], "creation") == [0.3]
+        assert mock_rerank.call_args.args[1] == ["a paraphrase"]
+
+        # The verse_ref fallback score was not cached as verse 3's score
+        mock_rerank.reset_mock()
+        bible_db.get_verses_batch.return_value = {3: MagicMock(text="And God said, Let there be light")}
+        assert adapter._score_chunks([{"verse_id": 3, "verse_ref": "Gen 1:3"}], "creation") == [0.3]
+        assert mock_rerank.call_args.args[1] == ["And God said, Let there be light"]
+
+
 class TestRerankerAdapterLMStatus:
     """Test LM status detection for reranker availability."""
 
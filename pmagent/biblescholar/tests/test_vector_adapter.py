@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from unittest.mock import MagicMock, patch
 
+import numpy as np
 from sqlalchemy import Engine
 from sqlalchemy.exc import OperationalError
 
@@ -195,3 +196,35 @@ class TestBibleVectorAdapter:
 
         adapter = BibleVectorAdapter()
         assert adapter.db_status == "db_off"
+
+    @patch("pmagent.biblescholar.vector_adapter.get_bible_engine")
+    def test_find_similar_by_embeddings_refetches_until_filter_is_satisfied(self, mock_get_engine):
+        """Test the ANN path widens k until `limit` hits survive the translation filter."""
+        from src.infra.ann_index import FlatIndex
+
+        rng = np.random.default_rng(0)
+        query = rng.normal(size=16).astype(np.float32)
+        # Verses 1..40 get steadily less similar to the query; only the last three are KJV
+        vecs = np.stack([query + 0.1 * i * rng.normal(size=16) for i in range(1, 41)])
+        index = FlatIndex()
+        index.upsert(list(range(1, 41)), vecs)
+
+        def execute(_query, params):
+            return [
+                (vid, "Genesis", 1, vid, f"text {vid}", "KJV" if vid > 37 else "ESV") for vid in params["verse_ids"]
+            ]
+
+        mock_conn = MagicMock()
+        mock_conn.execute.side_effect = execute
+        mock_engine = MagicMock(spec=Engine)
+        mock_engine.connect.return_value.__enter__.return_value = mock_conn
+        mock_get_engine.return_value = mock_engine
+
+        adapter = BibleVectorAdapter(ann_index=index)
+        results = adapter.find_similar_by_embeddings([query.tolist()], limit=3, translation_source="KJV")[0]
+
+        assert sorted(r.verse_id for r in results) == [38, 39, 40]
+        assert all(r.translation_source == "KJV" for r in results)
+        # Metadata is only fetched for verse_ids not seen in an earlier round
+        fetched = [vid for call in mock_conn.execute.call_args_list for vid in call.args[1]["verse_ids"]]
+        assert len(fetched) == len(set(fetched)) == 40
@@ -0,0 +1,102 @@
+"""Tests for the resident verse reference <-> verse_id index."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy import Engine
+
+from pmagent.biblescholar import verse_index
+from pmagent.biblescholar.lexicon_adapter import LexiconAdapter
+from pmagent.biblescholar.verse_index import VerseIndex, clear_verse_index, get_verse_index, set_verse_index
+
+ROWS = [
+    (10, "Mrk", 1, 1, "KJV"),
+    (11, "Mrk", 1, 2, "KJV"),
+    (12, "Mrk", 1, 3, "KJV"),
+    (5, "Gen", 1, 1, "KJV"),
+    (900, "Gen", 1, 1, "ESV"),
+    (901, "Gen", 150, 176, "ESV"),
+    (999, None, 1, 1, "KJV"),  # incomplete rows are skipped
+]
+
+
+@pytest.fixture
+def index():
+    return VerseIndex.from_rows(ROWS)
+
+
+@pytest.fixture(autouse=True)
+def fresh_index():
+    clear_verse_index()
+    yield
+    clear_verse_index()
+
+
+def test_forward_and_reverse_lookup(index):
+    assert len(index) == 6
+    assert index.verse_id("Mrk", 1, 2) == 11
+    assert index.verse_id("Gen", 1, 1, "ESV") == 900
+    assert index.verse_id("Gen", 1, 1, None) == 5  # any translation, lowest id
+    assert index.verse_id("Gen", 150, 176, "ESV") == 901
+    assert index.verse_id("Mrk", 1, 4) is None
+    assert index.verse_id("Xyz", 1, 1) is None
+    assert index.verse_id("Mrk", 1, 1, "NIV") is None
+
+    assert index.reference(901) == ("Gen", 150, 176, "ESV")
+    assert index.reference(999) is None
+    assert 12 in index and 13 not in index
+
+
+def test_vectorized_lookup(index):
+    refs = [("Mrk", 1, 3), ("Mrk", 9, 9), ("Gen", 1, 1), ("Nope", 1, 1)]
+    assert index.verse_ids(refs) == [12, None, 5, None]
+    assert index.verse_ids(refs, "NIV") == [None] * 4
+    assert index.verse_ids([]) == []
+
+
+def test_snapshot_round_trip_and_warm_start(index, tmp_path, monkeypatch):
+    path = tmp_path / "verse_index.npz"
+    index.save(path)
+    loaded = VerseIndex.load(path)
+    assert loaded is not None
+    assert loaded.verse_id("Mrk", 1, 2) == 11 and loaded.reference(900) == ("Gen", 1, 1, "ESV")
+
+    # A fresh snapshot is used without touching the database
+    monkeypatch.setattr(verse_index, "VERSE_INDEX_PATH", str(path))
+    build = MagicMock(side_effect=AssertionError("DB scan not expected"))
+    monkeypatch.setattr(verse_index, "build_verse_index", build)
+    assert get_verse_index().verse_id("Gen", 1, 1) == 5
+
+
+def test_unavailable_db_backs_off(tmp_path, monkeypatch):
+    from pmagent.db.loader import DbUnavailableError
+
+    monkeypatch.setattr(verse_index, "VERSE_INDEX_PATH", str(tmp_path / "missing.npz"))
+    build = MagicMock(side_effect=DbUnavailableError("db off"))
+    monkeypatch.setattr(verse_index, "build_verse_index", build)
+    assert get_verse_index() is None
+    assert get_verse_index() is None
+    assert build.call_count == 1
+
+
+@patch("pmagent.biblescholar.lexicon_adapter.get_bible_engine")
+def test_lexicon_adapter_resolves_refs_without_db(mock_get_engine, index):
+    """With the index loaded, reference resolution issues no verse_id queries."""
+    mock_engine = MagicMock(spec=Engine)
+    mock_conn = MagicMock()
+    mock_conn.execute.return_value = iter([(11, 1, "ἀρχὴ", "G746", "N-NSF", "ἀρχή", "beginning")])
+    mock_engine.connect.return_value.__enter__.return_value = mock_conn
+    mock_get_engine.return_value = mock_engine
+    set_verse_index(index)
+
+    adapter = LexiconAdapter()
+    assert adapter._verse_ref_to_id("Mark 1:2") == 11
+    assert adapter._verse_ref_to_id("Mark 1:9") is None
+    mock_engine.connect.assert_not_called()
+
+    words = adapter.get_greek_words_batch(["Mark.1.2", "Mark.1.3", "Mark.1.9"])
+    assert [w["strongs_id"] for w in words["Mark.1.2"]] == ["G746"]
+    assert words["Mark.1.3"] == []
+    assert mock_conn.execute.call_count == 1  # the words query only
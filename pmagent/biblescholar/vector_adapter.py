@@ -19,8 +19,12 @@ from typing import Literal
 from sqlalchemy import text
 from sqlalchemy.exc import OperationalError, ProgrammingError
 
+from pmagent.biblescholar.embedding_adapter import USE_VERSE_ANN_INDEX, cosine_to_l2_score, get_verse_index
 from pmagent.db.loader import DbUnavailableError, get_bible_engine
 
+# Initial over-fetch factor for ANN hits when a translation filter is applied after the search
+ANN_FILTER_OVERFETCH = 4
+
 
 @dataclass
 class VerseSimilarityResult:
@@ -59,10 +63,16 @@ class BibleVectorAdapter:
         _db_status: Current database status ("available", "unavailable", "db_off").
     """
 
-    def __init__(self) -> None:
-        """Initialize the adapter (lazy engine initialization)."""
+    def __init__(self, ann_index=None) -> None:
+        """Initialize the adapter (lazy engine initialization).
+
+        Args:
+            ann_index: Optional in-process verse index used by find_similar_by_embedding(s).
+                When omitted, the shared index is used if BIBLESCHOLAR_ANN_INDEX=1.
+        """
         self._engine = None
         self._db_status: Literal["available", "unavailable", "db_off"] = "db_off"
+        self._ann_index = ann_index
 
     def _ensure_engine(self) -> bool:
         """Ensure database engine is available.
@@ -309,6 +319,105 @@ class BibleVectorAdapter:
             self._db_status = "unavailable"
             return []
 
+    def _get_ann_index(self):
+        """Resolve the local ANN index, if one was injected or is enabled."""
+        if self._ann_index is not None:
+            return self._ann_index
+        if not USE_VERSE_ANN_INDEX or not self._ensure_engine():
+            return None
+        # Not memoized here: the shared index revalidates against the DB and may be rebuilt
+        try:
+            return get_verse_index(self._engine)
+        except (OperationalError, ProgrammingError):
+            self._db_status = "unavailable"
+            return None
+
+    def find_similar_by_embeddings(
+        self,
+        query_embeddings: list[list[float]],
+        limit: int = 10,
+        translation_source: str | None = None,
+    ) -> list[list[VerseSimilarityResult]]:
+        """Batched find_similar_by_embedding.
+
+        With a local ANN index this is one index search plus one metadata query
+        for all hits; otherwise it issues one pgvector query per embedding.
+
+        Args:
+            query_embeddings: Query embedding vectors (1024-dim from BGE-M3).
+            limit: Maximum number of results per query (default: 10).
+            translation_source: Optional translation filter (e.g., "KJV").
+
+        Returns:
+            One list of VerseSimilarityResult objects per query, in input order.
+        """
+        index = self._get_ann_index()
+        if index is None:
+            return [self.find_similar_by_embedding(q, limit, translation_source) for q in query_embeddings]
+        if not self._ensure_engine():
+            return [[] for _ in query_embeddings]
+
+        # A translation filter can drop most hits, so keep doubling k for the queries
+        # that are still short until they fill up or the index has nothing more to give
+        fetch = limit * ANN_FILTER_OVERFETCH if translation_source else limit
+        results: list[list[VerseSimilarityResult]] = [[] for _ in query_embeddings]
+        meta: dict[int, tuple] = {}
+        pending = list(range(len(query_embeddings)))
+        while pending:
+            hits = index.search([query_embeddings[i] for i in pending], fetch)
+            missing = sorted({int(verse_id) for per_query in hits for verse_id, _ in per_query} - meta.keys())
+            if missing:
+                try:
+                    meta_query = text(
+                        """
+                        SELECT verse_id, book_name, chapter_num, verse_num, text, translation_source
+                        FROM bible.verses
+                        WHERE verse_id = ANY(:verse_ids)
+                        """
+                    )
+                    with self._engine.connect() as conn:
+                        meta.update((row[0], row) for row in conn.execute(meta_query, {"verse_ids": missing}))
+                except (OperationalError, ProgrammingError):
+                    self._db_status = "unavailable"
+                    return [[] for _ in query_embeddings]
+
+            short = []
+            for i, per_query in zip(pending, hits, strict=True):
+                results[i] = self._ann_results(per_query, meta, limit, translation_source)
+                if len(results[i]) < limit and len(per_query) >= fetch and fetch < len(index):
+                    short.append(i)
+            pending = short
+            fetch *= 2
+        return results
+
+    @staticmethod
+    def _ann_results(
+        hits: list[tuple[str, float]],
+        meta: dict[int, tuple],
+        limit: int,
+        translation_source: str | None,
+    ) -> list[VerseSimilarityResult]:
+        """Turn ANN (verse_id, cosine) hits into results, applying the translation filter."""
+        similar_verses = []
+        for verse_id, cosine in hits:
+            row = meta.get(int(verse_id))
+            if row is None or (translation_source and row[5] != translation_source):
+                continue
+            similar_verses.append(
+                VerseSimilarityResult(
+                    verse_id=row[0],
+                    book_name=row[1],
+                    chapter_num=row[2],
+                    verse_num=row[3],
+                    text=row[4],
+                    translation_source=row[5],
+                    similarity_score=cosine_to_l2_score(cosine),
+                )
+            )
+            if len(similar_verses) >= limit:
+                break
+        return similar_verses
+
     def find_similar_by_embedding(
         self,
         query_embedding: list[float],
@@ -326,6 +435,9 @@ class BibleVectorAdapter:
             List of VerseSimilarityResult objects, ordered by similarity (highest first).
             Empty list if DB unavailable.
         """
+        if self._get_ann_index() is not None:
+            return self.find_similar_by_embeddings([query_embedding], limit, translation_source)[0]
+
         if not self._ensure_engine():
             return []
 
@@ -0,0 +1,280 @@
+from __future__ import annotations
+
+"""Resident verse reference <-> verse_id index (read-only).
+
+All rows of bible.verses are loaded once into compact NumPy arrays:
+
+- forward: packed (translation, book, chapter, verse) keys sorted for binary
+  search -> verse_id,
+- reverse: sorted verse_ids -> (book, chapter, verse, translation).
+
+The index is shared by every biblescholar adapter, so resolving a reference
+is an in-process lookup instead of a ``SELECT verse_id FROM bible.verses``.
+It is snapshotted to VERSE_INDEX_PATH (``.npz``) for instant warm starts; a
+snapshot older than VERSE_INDEX_MAX_AGE_S is rebuilt from the database.
+
+When neither the snapshot nor the database is available, ``get_verse_index``
+returns None and callers fall back to their SQL lookups; the load is retried
+after VERSE_INDEX_RETRY_S.
+
+See:
+- pmagent/biblescholar/AGENTS.md
+"""
+
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Iterable, Sequence
+
+import numpy as np
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+
+from pmagent.db.loader import DbDriverMissingError, DbUnavailableError, get_bible_engine
+
+VERSE_INDEX_PATH = os.getenv("VERSE_INDEX_PATH", "var/cache/verse_index.npz")  # "" = no snapshot
+VERSE_INDEX_MAX_AGE_S = float(os.getenv("VERSE_INDEX_MAX_AGE_S", str(7 * 24 * 3600)))
+VERSE_INDEX_RETRY_S = float(os.getenv("VERSE_INDEX_RETRY_S", "60"))
+VERSE_INDEX_VERSION = 1
+
+# Slots per packed key component (chapters, verses and books all stay well below this)
+_SLOTS = 1024
+
+# (book_name, chapter_num, verse_num, translation_source)
+VerseRef = tuple[str, int, int, str]
+
+
+def _pack(trans, book, chapter, verse):
+    return ((trans * _SLOTS + book) * _SLOTS + chapter) * _SLOTS + verse
+
+
+class VerseIndex:
+    """Compact two-way mapping between verse references and verse_ids.
+
+    Attributes:
+        books: Book names (book_idx -> name).
+        translations: Translation sources (trans_idx -> name).
+    """
+
+    def __init__(
+        self,
+        books: Sequence[str],
+        translations: Sequence[str],
+        verse_ids: np.ndarray,
+        book_idx: np.ndarray,
+        chapters: np.ndarray,
+        verses: np.ndarray,
+        trans_idx: np.ndarray,
+    ) -> None:
+        self.books = list(books)
+        self.translations = list(translations)
+        self._book_pos = {name: i for i, name in enumerate(self.books)}
+        self._trans_pos = {name: i for i, name in enumerate(self.translations)}
+
+        self._verse_ids = np.asarray(verse_ids, dtype=np.int64)
+        self._book_idx = np.asarray(book_idx, dtype=np.int16)
+        self._chapters = np.asarray(chapters, dtype=np.int16)
+        self._verses = np.asarray(verses, dtype=np.int16)
+        self._trans_idx = np.asarray(trans_idx, dtype=np.int16)
+
+        keys = _pack(
+            self._trans_idx.astype(np.int64),
+            self._book_idx.astype(np.int64),
+            self._chapters.astype(np.int64),
+            self._verses.astype(np.int64),
+        )
+        # Duplicate references keep their lowest verse_id first
+        order = np.lexsort((self._verse_ids, keys))
+        self._keys = keys[order]
+        self._key_ids = self._verse_ids[order]
+        id_order = np.argsort(self._verse_ids, kind="stable")
+        self._ids_sorted = self._verse_ids[id_order]
+        self._id_rows = id_order
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Sequence]) -> VerseIndex:
+        """Build from (verse_id, book_name, chapter_num, verse_num, translation_source) rows."""
+        books: dict[str, int] = {}
+        translations: dict[str, int] = {}
+        columns: tuple[list[int], ...] = ([], [], [], [], [])
+        for verse_id, book, chapter, verse, translation in rows:
+            if book is None or chapter is None or verse is None:
+                continue
+            columns[0].append(int(verse_id))
+            columns[1].append(books.setdefault(book, len(books)))
+            columns[2].append(int(chapter))
+            columns[3].append(int(verse))
+            columns[4].append(translations.setdefault(translation or "", len(translations)))
+        return cls(list(books), list(translations), *(np.array(c, dtype=np.int64) for c in columns))
+
+    def __len__(self) -> int:
+        return len(self._verse_ids)
+
+    def __contains__(self, verse_id: object) -> bool:
+        return self._row_for_id(verse_id) is not None
+
+    def _row_for_id(self, verse_id: object) -> int | None:
+        try:
+            vid = int(verse_id)  # type: ignore[call-overload]
+        except (TypeError, ValueError):
+            return None
+        pos = int(np.searchsorted(self._ids_sorted, vid))
+        if pos < len(self._ids_sorted) and self._ids_sorted[pos] == vid:
+            return int(self._id_rows[pos])
+        return None
+
+    def _lookup_key(self, key: int) -> int | None:
+        pos = int(np.searchsorted(self._keys, key))
+        if pos < len(self._keys) and self._keys[pos] == key:
+            return int(self._key_ids[pos])
+        return None
+
+    def verse_id(self, book_name: str, chapter_num: int, verse_num: int, translation: str | None = "KJV") -> int | None:
+        """verse_id for a reference, or None if the verse does not exist.
+
+        translation=None matches any translation (lowest verse_id wins).
+        """
+        book = self._book_pos.get(book_name)
+        if book is None or not (0 <= chapter_num < _SLOTS and 0 <= verse_num < _SLOTS):
+            return None
+        if translation is not None:
+            trans = self._trans_pos.get(translation)
+            return None if trans is None else self._lookup_key(_pack(trans, book, chapter_num, verse_num))
+        found = [self._lookup_key(_pack(t, book, chapter_num, verse_num)) for t in range(len(self.translations))]
+        hits = [vid for vid in found if vid is not None]
+        return min(hits) if hits else None
+
+    def verse_ids(self, refs: Iterable[tuple[str, int, int]], translation: str = "KJV") -> list[int | None]:
+        """Vectorized verse_id lookup for many (book_name, chapter_num, verse_num) refs."""
+        refs = list(refs)
+        trans = self._trans_pos.get(translation)
+        if trans is None or not refs or not len(self._keys):
+            return [None] * len(refs)
+        keys = np.array(
+            [
+                _pack(trans, self._book_pos[b], c, v)
+                if b in self._book_pos and 0 <= c < _SLOTS and 0 <= v < _SLOTS
+                else -1
+                for b, c, v in refs
+            ],
+            dtype=np.int64,
+        )
+        pos = np.minimum(np.searchsorted(self._keys, keys), len(self._keys) - 1)
+        hit = self._keys[pos] == keys
+        ids = self._key_ids[pos]
+        return [int(vid) if ok else None for vid, ok in zip(ids.tolist(), hit.tolist(), strict=True)]
+
+    def reference(self, verse_id: int) -> VerseRef | None:
+        """(book_name, chapter_num, verse_num, translation_source) for a verse_id."""
+        row = self._row_for_id(verse_id)
+        if row is None:
+            return None
+        return (
+            self.books[self._book_idx[row]],
+            int(self._chapters[row]),
+            int(self._verses[row]),
+            self.translations[self._trans_idx[row]],
+        )
+
+    def save(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + ".tmp")
+        with open(tmp, "wb") as f:
+            np.savez(
+                f,
+                version=np.int64(VERSE_INDEX_VERSION),
+                books=np.array(self.books, dtype=np.str_),
+                translations=np.array(self.translations, dtype=np.str_),
+                verse_ids=self._verse_ids,
+                book_idx=self._book_idx,
+                chapters=self._chapters,
+                verses=self._verses,
+                trans_idx=self._trans_idx,
+            )
+        tmp.replace(path)
+
+    @classmethod
+    def load(cls, path: Path) -> VerseIndex | None:
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                if int(data["version"]) != VERSE_INDEX_VERSION:
+                    return None
+                return cls(
+                    data["books"].tolist(),
+                    data["translations"].tolist(),
+                    data["verse_ids"],
+                    data["book_idx"],
+                    data["chapters"],
+                    data["verses"],
+                    data["trans_idx"],
+                )
+        except (OSError, ValueError, KeyError):
+            return None
+
+
+def build_verse_index(engine=None) -> VerseIndex:
+    """Load every bible.verses reference in one query."""
+    engine = engine or get_bible_engine()
+    query = text(
+        """
+        SELECT verse_id, book_name, chapter_num, verse_num, translation_source
+        FROM bible.verses
+        """
+    )
+    with engine.connect() as conn:
+        return VerseIndex.from_rows(conn.execute(query))
+
+
+_INDEX: VerseIndex | None = None
+_INDEX_FAILED_AT: float | None = None
+_INDEX_LOCK = threading.Lock()
+
+
+def _fresh_snapshot(path: Path) -> VerseIndex | None:
+    try:
+        age = time.time() - path.stat().st_mtime
+    except OSError:
+        return None
+    return VerseIndex.load(path) if age <= VERSE_INDEX_MAX_AGE_S else None
+
+
+def get_verse_index() -> VerseIndex | None:
+    """Process-wide verse index: memory, then snapshot, then one DB scan. None if unavailable."""
+    global _INDEX, _INDEX_FAILED_AT
+    with _INDEX_LOCK:
+        if _INDEX is not None:
+            return _INDEX
+        if _INDEX_FAILED_AT is not None and time.monotonic() - _INDEX_FAILED_AT < VERSE_INDEX_RETRY_S:
+            return None
+
+        path = Path(VERSE_INDEX_PATH) if VERSE_INDEX_PATH else None
+        index = _fresh_snapshot(path) if path else None
+        if index is None:
+            try:
+                index = build_verse_index()
+            except (DbUnavailableError, DbDriverMissingError, SQLAlchemyError):
+                index = None
+            except Exception:  # noqa: BLE001 - the index is an accelerator; callers fall back to SQL
+                index = None
+            if index is None or not len(index):
+                _INDEX_FAILED_AT = time.monotonic()
+                return None
+            if path:
+                try:
+                    index.save(path)
+                except OSError:
+                    pass
+        _INDEX, _INDEX_FAILED_AT = index, None
+        return _INDEX
+
+
+def set_verse_index(index: VerseIndex | None) -> None:
+    """Install an index (e.g., prebuilt or for tests); None forces a reload on next use."""
+    global _INDEX, _INDEX_FAILED_AT
+    with _INDEX_LOCK:
+        _INDEX, _INDEX_FAILED_AT = index, None
+
+
+def clear_verse_index() -> None:
+    set_verse_index(None)
@@ -11,7 +11,7 @@ import json
 import os
 import sys
 from pathlib import Path
-from typing import Any
+from typing import Any, ClassVar
 
 import typer
 
@@ -19,77 +19,82 @@ import typer
 ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(ROOT))
 
-# Import health check functions (E402: imports after sys.path modification)
-from scripts.guards.guard_db_health import check_db_health  # noqa: E402
-from scripts.guards.guard_lm_health import check_lm_health  # noqa: E402
-from scripts.graph.graph_overview import compute_graph_overview  # noqa: E402
-from scripts.system.system_health import print_human_summary  # noqa: E402
-from scripts.db_import_graph_stats import import_graph_stats  # noqa: E402
-from scripts.control.control_status import (  # noqa: E402
-    compute_control_status,
-    print_human_summary as print_control_summary,
+from pmagent.lazy import LazyImport, LazyTyperGroup  # noqa: E402
+
+# Command implementations are bound lazily: each module is imported the first
+# time one of its functions is called, so `pmagent health db` does not pay for
+# the KB registry, planning adapters, docs scripts, etc.
+check_db_health = LazyImport("scripts.guards.guard_db_health", "check_db_health")
+check_lm_health = LazyImport("scripts.guards.guard_lm_health", "check_lm_health")
+compute_graph_overview = LazyImport("scripts.graph.graph_overview", "compute_graph_overview")
+print_human_summary = LazyImport("scripts.system.system_health", "print_human_summary")
+import_graph_stats = LazyImport("scripts.db_import_graph_stats", "import_graph_stats")
+compute_control_status = LazyImport("scripts.control.control_status", "compute_control_status")
+print_control_summary = LazyImport("scripts.control.control_status", "print_human_summary")
+compute_control_tables = LazyImport("scripts.control.control_tables", "compute_control_tables")
+print_tables_summary = LazyImport("scripts.control.control_tables", "print_human_summary")
+compute_control_schema = LazyImport("scripts.control.control_schema", "compute_control_schema")
+print_schema_summary = LazyImport("scripts.control.control_schema", "print_human_summary")
+compute_control_pipeline_status = LazyImport(
+    "scripts.control.control_pipeline_status", "compute_control_pipeline_status"
 )
-from scripts.control.control_tables import (  # noqa: E402
-    compute_control_tables,
-    print_human_summary as print_tables_summary,
-)
-from scripts.control.control_schema import (  # noqa: E402
-    compute_control_schema,
-    print_human_summary as print_schema_summary,
-)
-from scripts.control.control_pipeline_status import (  # noqa: E402
-    compute_control_pipeline_status,
-    print_human_summary as print_pipeline_summary,
-)
-from scripts.control.control_summary import (  # noqa: E402
-    print_human_summary as print_summary_summary,
-)
-from pmagent.knowledge.qa_docs import answer_doc_question  # noqa: E402
-from pmagent.lm.lm_status import compute_lm_status, print_lm_status_table  # noqa: E402
-from pmagent.status.explain import explain_system_status  # noqa: E402
-from pmagent.status.snapshot import get_kb_status_view  # noqa: E402
-from pmagent.docs.search import search_docs  # noqa: E402
-from pmagent.ai_docs.reality_check_ai_notes import main as reality_check_ai_notes_main  # noqa: E402
-from scripts.config.env import get_retrieval_lane_models, get_lm_model_config  # noqa: E402
-from pmagent.scripts.docs_inventory import run_inventory  # noqa: E402
-from pmagent.scripts.docs_duplicates_report import generate_duplicates_report  # noqa: E402
-from pmagent.scripts.docs_dm002_preview import main as docs_dm002_preview_main  # noqa: E402
-from pmagent.scripts.docs_dm002_sync import main as docs_dm002_sync_main  # noqa: E402
-from pmagent.scripts.docs_dm002_summary import main as docs_dm002_summary_main  # noqa: E402
-from pmagent.scripts.docs_archive_dryrun import main as docs_archive_dryrun_main  # noqa: E402
-from pmagent.scripts.docs_dashboard_refresh import main as docs_dashboard_refresh_main  # noqa: E402
-from pmagent.scripts.state.ledger_sync import sync_ledger  # noqa: E402
-from pmagent.control_plane import create_agent_run, mark_agent_run_success, mark_agent_run_error  # noqa: E402
-from pmagent.tools import (  # noqa: E402
-    health as tool_health,
-    control_summary as tool_control_summary,
-    ledger_verify as tool_ledger_verify,
-    retrieve_bible_passages,
-    rerank_passages,
-    extract_concepts,
-    generate_embeddings as tool_embed,
-)
-from pmagent.adapters import planning as planning_adapter  # noqa: E402
-from pmagent.adapters import gemini_cli as gemini_cli_adapter  # noqa: E402
-from pmagent.adapters import codex_cli as codex_cli_adapter  # noqa: E402
-from pmagent.kb.registry import (  # noqa: E402
-    load_registry,
-    query_registry,
-    validate_registry,
-    REGISTRY_PATH,
-)
-from pmagent.plan.kb import build_kb_doc_worklist  # noqa: E402
-from pmagent.plan.fix import build_fix_actions, apply_actions  # noqa: E402
-from pmagent.plan.next import (  # noqa: E402
-    build_capability_session,
-    build_next_plan,
-    list_capability_sessions,
-    run_reality_loop,
-)
-from pmagent.status.kb_metrics import compute_kb_doc_health_metrics  # noqa: E402
-from pmagent.kb.registry import REPO_ROOT  # noqa: E402
-
-app = typer.Typer(add_completion=False, no_args_is_help=True)
+print_pipeline_summary = LazyImport("scripts.control.control_pipeline_status", "print_human_summary")
+print_summary_summary = LazyImport("scripts.control.control_summary", "print_human_summary")
+answer_doc_question = LazyImport("pmagent.knowledge.qa_docs", "answer_doc_question")
+compute_lm_status = LazyImport("pmagent.lm.lm_status", "compute_lm_status")
+print_lm_status_table = LazyImport("pmagent.lm.lm_status", "print_lm_status_table")
+explain_system_status = LazyImport("pmagent.status.explain", "explain_system_status")
+get_kb_status_view = LazyImport("pmagent.status.snapshot", "get_kb_status_view")
+search_docs = LazyImport("pmagent.docs.search", "search_docs")
+reality_check_ai_notes_main = LazyImport("pmagent.ai_docs.reality_check_ai_notes", "main")
+get_retrieval_lane_models = LazyImport("scripts.config.env", "get_retrieval_lane_models")
+get_lm_model_config = LazyImport("scripts.config.env", "get_lm_model_config")
+run_inventory = LazyImport("pmagent.scripts.docs_inventory", "run_inventory")
+generate_duplicates_report = LazyImport("pmagent.scripts.docs_duplicates_report", "generate_duplicates_report")
+docs_dm002_preview_main = LazyImport("pmagent.scripts.docs_dm002_preview", "main")
+docs_dm002_sync_main = LazyImport("pmagent.scripts.docs_dm002_sync", "main")
+docs_dm002_summary_main = LazyImport("pmagent.scripts.docs_dm002_summary", "main")
+docs_archive_dryrun_main = LazyImport("pmagent.scripts.docs_archive_dryrun", "main")
+docs_dashboard_refresh_main = LazyImport("pmagent.scripts.docs_dashboard_refresh", "main")
+sync_ledger = LazyImport("pmagent.scripts.state.ledger_sync", "sync_ledger")
+create_agent_run = LazyImport("pmagent.control_plane", "create_agent_run")
+mark_agent_run_success = LazyImport("pmagent.control_plane", "mark_agent_run_success")
+mark_agent_run_error = LazyImport("pmagent.control_plane", "mark_agent_run_error")
+tool_health = LazyImport("pmagent.tools", "health")
+tool_control_summary = LazyImport("pmagent.tools", "control_summary")
+tool_ledger_verify = LazyImport("pmagent.tools", "ledger_verify")
+retrieve_bible_passages = LazyImport("pmagent.tools", "retrieve_bible_passages")
+rerank_passages = LazyImport("pmagent.tools", "rerank_passages")
+extract_concepts = LazyImport("pmagent.tools", "extract_concepts")
+tool_embed = LazyImport("pmagent.tools", "generate_embeddings")
+planning_adapter = LazyImport("pmagent.adapters.planning")
+gemini_cli_adapter = LazyImport("pmagent.adapters.gemini_cli")
+codex_cli_adapter = LazyImport("pmagent.adapters.codex_cli")
+kb_registry = LazyImport("pmagent.kb.registry")  # REPO_ROOT / REGISTRY_PATH, resolved on use
+load_registry = LazyImport("pmagent.kb.registry", "load_registry")
+query_registry = LazyImport("pmagent.kb.registry", "query_registry")
+validate_registry = LazyImport("pmagent.kb.registry", "validate_registry")
+build_kb_doc_worklist = LazyImport("pmagent.plan.kb", "build_kb_doc_worklist")
+build_fix_actions = LazyImport("pmagent.plan.fix", "build_fix_actions")
+apply_actions = LazyImport("pmagent.plan.fix", "apply_actions")
+build_capability_session = LazyImport("pmagent.plan.next", "build_capability_session")
+build_next_plan = LazyImport("pmagent.plan.next", "build_next_plan")
+list_capability_sessions = LazyImport("pmagent.plan.next", "list_capability_sessions")
+run_reality_loop = LazyImport("pmagent.plan.next", "run_reality_loop")
+compute_kb_doc_health_metrics = LazyImport("pmagent.status.kb_metrics", "compute_kb_doc_health_metrics")
+
+
+class PmagentGroup(LazyTyperGroup):
+    """Root command group; sub-apps defined in other modules are imported on invocation."""
+
+    lazy_subcommands: ClassVar[dict[str, str]] = {
+        "repo": "pmagent.repo.commands:app",
+        "handoff": "pmagent.handoff.commands:app",
+        "hints": "pmagent.hints:app",
+    }
+
+
+app = typer.Typer(cls=PmagentGroup, add_completion=False, no_args_is_help=True)
 health_app = typer.Typer(help="Health check commands")
 app.add_typer(health_app, name="health")
 graph_app = typer.Typer(help="Graph operations")
@@ -134,21 +139,7 @@ app.add_typer(tools_app, name="tools")
 autopilot_app = typer.Typer(help="Autopilot backend operations")
 app.add_typer(autopilot_app, name="autopilot")
 
-# Import and register repo commands
-from pmagent.repo.commands import app as repo_app  # noqa: E402
-
-app.add_typer(repo_app, name="repo")
-
-# Import and register handoff commands
-from pmagent.handoff.commands import app as handoff_app  # noqa: E402
-
-app.add_typer(handoff_app, name="handoff")
-
-# Import and register hint management commands
-from pmagent.hints import app as hints_app  # noqa: E402
-
-app.add_typer(hints_app, name="hints")
-
+# repo, handoff and hints sub-apps are registered lazily on PmagentGroup
 
 dms_app = typer.Typer(help="DMS governance operations")
 app.add_typer(dms_app, name="dms")
@@ -955,7 +946,7 @@ def plan_kb_fix(
         apply_result = apply_actions(
             actions,
             dry_run=dry_run,
-            repo_root=REPO_ROOT,
+            repo_root=kb_registry.REPO_ROOT,
             allow_stubs_for_low_coverage=allow_stubs_for_low_coverage,
         )
 
@@ -992,7 +983,7 @@ def plan_kb_fix(
 
         # Log manifest if apply mode
         if not dry_run and (apply_result.get("files_created") or apply_result.get("files_modified")):
-            manifest_dir = REPO_ROOT / "evidence" / "plan_kb_fix"
+            manifest_dir = kb_registry.REPO_ROOT / "evidence" / "plan_kb_fix"
             manifest_dir.mkdir(parents=True, exist_ok=True)
             manifest_path = manifest_dir / f"run-{now.strftime('%Y%m%d-%H%M%S')}.json"
             manifest_path.write_text(json.dumps(output, indent=2) + "\n")
@@ -2084,7 +2075,7 @@ def kb_registry_list(
 ) -> None:
     """List all registered KB documents."""
     try:
-        path = Path(registry_path) if registry_path else REGISTRY_PATH
+        path = Path(registry_path) if registry_path else kb_registry.REGISTRY_PATH
         registry = load_registry(path)
 
         if json_only:
@@ -2111,7 +2102,7 @@ def kb_registry_show(
 ) -> None:
     """Show details for a single KB document."""
     try:
-        path = Path(registry_path) if registry_path else REGISTRY_PATH
+        path = Path(registry_path) if registry_path else kb_registry.REGISTRY_PATH
         registry = load_registry(path)
         doc = registry.get_by_id(doc_id)
 
@@ -2146,7 +2137,7 @@ def kb_registry_by_subsystem(
 ) -> None:
     """List KB documents filtered by owning subsystem."""
     try:
-        path = Path(registry_path) if registry_path else REGISTRY_PATH
+        path = Path(registry_path) if registry_path else kb_registry.REGISTRY_PATH
         registry = load_registry(path)
         results = query_registry(registry, owning_subsystem=owning_subsystem)
 
@@ -2175,7 +2166,7 @@ def kb_registry_by_tag(
 ) -> None:
     """List KB documents filtered by tag."""
     try:
-        path = Path(registry_path) if registry_path else REGISTRY_PATH
+        path = Path(registry_path) if registry_path else kb_registry.REGISTRY_PATH
         registry = load_registry(path)
         results = query_registry(registry, tags=[tag])
 
@@ -2259,7 +2250,7 @@ def kb_registry_validate(
 ) -> None:
     """Validate registry entries (check file existence, duplicates, etc.)."""
     try:
-        path = Path(registry_path) if registry_path else REGISTRY_PATH
+        path = Path(registry_path) if registry_path else kb_registry.REGISTRY_PATH
         registry = load_registry(path)
         validation = validate_registry(registry)
 
@@ -41,6 +41,35 @@ _control_engine: Engine | None = None
 _bible_engine: Engine | None = None
 
 
+def _engine_pool_kwargs() -> dict[str, Any]:
+    """QueuePool sizing shared with the psycopg pools in src.infra.db_pool (DB_POOL_* env)."""
+    from src.infra.db_pool import DB_POOL_MAX_IDLE, DB_POOL_MAX_SIZE, DB_POOL_TIMEOUT
+
+    return {
+        "pool_pre_ping": True,  # health check before checkout
+        "pool_size": max(1, DB_POOL_MAX_SIZE),
+        "max_overflow": 0,
+        "pool_timeout": DB_POOL_TIMEOUT,
+        "pool_recycle": int(DB_POOL_MAX_IDLE),
+    }
+
+
+def engine_pool_stats() -> dict[str, dict[str, int]]:
+    """Checked-out/idle/overflow counts for the cached SQLAlchemy engines."""
+    stats = {}
+    for name, engine in (("control", _control_engine), ("bible", _bible_engine)):
+        if engine is None:
+            continue
+        pool = engine.pool
+        stats[name] = {
+            "size": pool.size(),
+            "checked_in": pool.checkedin(),
+            "checked_out": pool.checkedout(),
+            "overflow": pool.overflow(),
+        }
+    return stats
+
+
 def get_control_engine() -> Engine:
     """
     Get SQLAlchemy engine for GEMATRIA_DSN (control/gematria schema).
@@ -62,7 +91,7 @@ def get_control_engine() -> Engine:
         if not dsn:
             raise DbUnavailableError("GEMATRIA_DSN not set; cannot create control engine")
         try:
-            _control_engine = create_engine(dsn, pool_pre_ping=True, echo=False)
+            _control_engine = create_engine(dsn, echo=False, **_engine_pool_kwargs())
         except (ImportError, ModuleNotFoundError) as e:
             raise DbDriverMissingError("Postgres database driver not available") from e
 
@@ -90,7 +119,7 @@ def get_bible_engine() -> Engine:
         if not dsn:
             raise DbUnavailableError("BIBLE_DB_DSN not set; cannot create bible engine")
         try:
-            _bible_engine = create_engine(dsn, pool_pre_ping=True, echo=False)
+            _bible_engine = create_engine(dsn, echo=False, **_engine_pool_kwargs())
         except (ImportError, ModuleNotFoundError) as e:
             raise DbDriverMissingError("Postgres database driver not available") from e
 
@@ -0,0 +1,72 @@
+"""
+Lazy import helpers for the pmagent CLI.
+
+`pmagent <group> <command>` should only pay the import cost of the code that
+command actually runs. LazyImport stands in for a module or module attribute
+and imports it on first use; LazyTyperGroup registers sub-apps that live in
+other modules by "module:attr" and imports them only when they are invoked
+(or when --help needs their summaries).
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import Any, ClassVar
+
+import typer
+from typer.core import TyperGroup
+
+
+class LazyImport:
+    """Proxy for `module` (attr=None) or `module.attr`, resolved on first use.
+
+    Attribute access and calls are forwarded, so the proxy can be bound to the
+    same module-level name the eager import used (and patched the same way).
+    """
+
+    def __init__(self, module: str, attr: str | None = None):
+        self._lazy_module = module
+        self._lazy_attr = attr
+        self._lazy_target: Any = None
+
+    def _resolve(self) -> Any:
+        if self._lazy_target is None:
+            target = importlib.import_module(self._lazy_module)
+            self._lazy_target = getattr(target, self._lazy_attr) if self._lazy_attr else target
+        return self._lazy_target
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_lazy_"):
+            raise AttributeError(name)
+        return getattr(self._resolve(), name)
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self._resolve()(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        target = f"{self._lazy_module}.{self._lazy_attr}" if self._lazy_attr else self._lazy_module
+        state = "loaded" if self._lazy_target is not None else "pending"
+        return f"<LazyImport {target} ({state})>"
+
+
+class LazyTyperGroup(TyperGroup):
+    """TyperGroup that also serves sub-apps registered as "module:attr" strings.
+
+    Subclass and fill `lazy_subcommands` ({name: "package.module:app"}); the
+    Typer app is imported and converted to a click group on first lookup.
+    """
+
+    lazy_subcommands: ClassVar[dict[str, str]] = {}
+
+    def list_commands(self, ctx: typer.Context) -> list[str]:
+        eager = super().list_commands(ctx)
+        return eager + [name for name in self.lazy_subcommands if name not in eager]
+
+    def get_command(self, ctx: typer.Context, cmd_name: str) -> Any:
+        if cmd_name not in self.commands and cmd_name in self.lazy_subcommands:
+            module_name, attr = self.lazy_subcommands[cmd_name].split(":", 1)
+            sub_app = getattr(importlib.import_module(module_name), attr)
+            command = typer.main.get_group(sub_app) if isinstance(sub_app, typer.Typer) else sub_app
+            command.name = cmd_name
+            self.add_command(command, cmd_name)
+        return super().get_command(ctx, cmd_name)
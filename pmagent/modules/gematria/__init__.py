@@ -11,4 +11,4 @@ See:
 - docs/SSOT/GEMATRIA_NUMERICS_INTAKE.md
 """
 
-__all__ = ["core", "hebrew", "nouns", "osis", "verification"]
+__all__ = ["core", "hebrew", "kernel", "nouns", "osis", "verification"]
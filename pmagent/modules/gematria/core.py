@@ -122,24 +122,15 @@ def gematria_value(letters: Iterable[str], system: str = DEFAULT_SYSTEM_NAME) ->
         supported = ", ".join(sorted(_SYSTEM_MAPS.keys()))
         raise ValueError(f"Unsupported gematria system: {system}. Supported: {supported}")
 
-    letter_map = _SYSTEM_MAPS[system]
-
     # Handle empty input gracefully
     if not letters:
         return 0
 
-    # Sum values, ignoring unknown characters (they return 0 from .get())
-    total = 0
-    for letter in letters:
-        # Handle None or empty strings gracefully
-        if not letter:
-            continue
-        # Only process single-character strings (Hebrew letters)
-        if len(letter) == 1:
-            total += letter_map.get(letter, 0)
-        # Multi-character strings are ignored (not valid Hebrew letters)
-
-    return total
+    from . import kernel
+
+    # Only single-character strings (Hebrew letters) count; None, empty and
+    # multi-character strings are ignored, unknown characters are 0
+    return kernel.text_value("".join(letter for letter in letters if letter and len(letter) == 1), system)
 
 
 def system_names() -> list[str]:
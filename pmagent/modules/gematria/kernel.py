@@ -0,0 +1,269 @@
+from __future__ import annotations
+
+"""Vectorized Gematria kernel.
+
+Every supported system is compiled once into a NumPy codepoint lookup table
+(one row per system). Text is encoded to UTF-32 and looked up in a single
+vector operation, so values for a word, a list of words or every verse of a
+book are computed without a per-character Python loop. Batch results are
+segment sums over one cumulative sum.
+
+Values match ``core.gematria_value(hebrew.letters_from_text(text))``: the
+table already folds in ADR-002 normalization (niqqud, punctuation and
+non-Hebrew characters are 0; compatibility forms such as presentation-form
+letters count as the letters they decompose to).
+
+Per-verse tables for a book are cached in memory and as ``.npz`` files under
+GEMATRIA_TABLE_DIR, keyed by book and the sha256 of the verse texts.
+"""
+
+import hashlib
+import os
+import re
+import threading
+import unicodedata
+from dataclasses import dataclass
+from functools import cache
+from pathlib import Path
+from typing import Iterable, Sequence
+
+import numpy as np
+
+from . import core
+
+GEMATRIA_TABLE_DIR = os.getenv("GEMATRIA_TABLE_DIR", "var/cache/gematria")  # "" = memory only
+GEMATRIA_TABLE_VERSION = 1
+
+# Codepoints whose NFKD decomposition contains Hebrew letters: the Hebrew
+# block, the letterlike alef..dalet symbols and the presentation forms.
+_VALUED_RANGES = ((0x0590, 0x0600), (0x2135, 0x2139), (0xFB1D, 0xFB50))
+# Codepoints past the table are clamped onto its last slot, which stays 0.
+_TABLE_SIZE = _VALUED_RANGES[-1][1] + 1
+
+
+def _resolve(systems: str | Iterable[str] | None) -> list[str]:
+    if systems is None:
+        return core.system_names()
+    names = [systems] if isinstance(systems, str) else list(systems)
+    supported = core.system_names()
+    for name in names:
+        if name not in supported:
+            raise ValueError(f"Unsupported gematria system: {name}. Supported: {', '.join(supported)}")
+    return names
+
+
+@cache
+def _system_table(system: str) -> np.ndarray:
+    letter_map = core._SYSTEM_MAPS[system]
+    table = np.zeros(_TABLE_SIZE, dtype=np.int64)
+    for start, stop in _VALUED_RANGES:
+        for cp in range(start, stop):
+            table[cp] = sum(letter_map.get(ch, 0) for ch in unicodedata.normalize("NFKD", chr(cp)))
+    table.setflags(write=False)
+    return table
+
+
+def _tables(systems: Sequence[str]) -> np.ndarray:
+    """(len(systems), _TABLE_SIZE) lookup matrix."""
+    return np.stack([_system_table(s) for s in systems])
+
+
+def _codepoints(text: str) -> np.ndarray:
+    cps = np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32)
+    return np.minimum(cps, _TABLE_SIZE - 1)
+
+
+def letter_values(text: str, system: str = core.DEFAULT_SYSTEM_NAME) -> list[int]:
+    """Per-character values of text (0 for characters that carry no value)."""
+    (system,) = _resolve(system)
+    return _system_table(system)[_codepoints(text or "")].tolist()
+
+
+def text_value(text: str, system: str = core.DEFAULT_SYSTEM_NAME) -> int:
+    """Gematria value of a word or phrase.
+
+    Examples:
+        >>> text_value("אדם")
+        45
+        >>> text_value("הֶבֶל")
+        37
+        >>> text_value("אדם", system="mispar_gadol")
+        605
+    """
+    (system,) = _resolve(system)
+    if not text:
+        return 0
+    return int(_system_table(system)[_codepoints(text)].sum())
+
+
+def values_matrix(texts: Sequence[str], systems: str | Iterable[str] | None = None) -> np.ndarray:
+    """Values of many texts at once: int64 array of shape (len(texts), len(systems)).
+
+    Systems default to ``core.system_names()`` (column order).
+    """
+    names = _resolve(systems)
+    texts = [t or "" for t in texts]
+    lengths = np.fromiter((len(t) for t in texts), dtype=np.int64, count=len(texts))
+    ends = np.cumsum(lengths)
+    per_char = _tables(names)[:, _codepoints("".join(texts))]
+    running = np.zeros((len(names), per_char.shape[1] + 1), dtype=np.int64)
+    np.cumsum(per_char, axis=1, out=running[:, 1:])
+    return (running[:, ends] - running[:, ends - lengths]).T
+
+
+def word_values(words: Sequence[str], system: str = core.DEFAULT_SYSTEM_NAME) -> list[int]:
+    """Values of a list of words in one system."""
+    return values_matrix(words, [system])[:, 0].tolist()
+
+
+def text_hash(verses: Sequence[tuple[str, str]]) -> str:
+    h = hashlib.sha256()
+    for ref, text in verses:
+        h.update(f"{ref}\t{text}\n".encode())
+    return h.hexdigest()
+
+
+@dataclass
+class VerseGematriaTable:
+    """Precomputed per-verse values for one book.
+
+    Attributes:
+        book: Book name the table was built for.
+        refs: Verse references in book order (e.g., "Gen.1.1").
+        systems: Column order of ``values``.
+        values: int64 array of shape (len(refs), len(systems)).
+        text_hash: sha256 of the verse texts the table was built from.
+    """
+
+    book: str
+    refs: list[str]
+    systems: list[str]
+    values: np.ndarray
+    text_hash: str
+
+    @classmethod
+    def build(
+        cls,
+        book: str,
+        verses: Sequence[tuple[str, str]],
+        systems: Iterable[str] | None = None,
+        digest: str | None = None,
+    ) -> VerseGematriaTable:
+        names = _resolve(systems)
+        values = values_matrix([text for _, text in verses], names)
+        return cls(book, [ref for ref, _ in verses], names, values, digest or text_hash(verses))
+
+    def __len__(self) -> int:
+        return len(self.refs)
+
+    def column(self, system: str = core.DEFAULT_SYSTEM_NAME) -> np.ndarray:
+        if system not in self.systems:
+            raise ValueError(f"System {system} not in table (has: {', '.join(self.systems)})")
+        return self.values[:, self.systems.index(system)]
+
+    def value(self, ref: str, system: str = core.DEFAULT_SYSTEM_NAME) -> int:
+        return int(self.column(system)[self.refs.index(ref)])
+
+    def stats(self, system: str = core.DEFAULT_SYSTEM_NAME) -> dict[str, float | int]:
+        """Book-wide summary for one system."""
+        col = self.column(system)
+        if not len(col):
+            return {"verses": 0, "total": 0, "mean": 0.0, "min": 0, "max": 0}
+        return {
+            "verses": len(col),
+            "total": int(col.sum()),
+            "mean": float(col.mean()),
+            "min": int(col.min()),
+            "max": int(col.max()),
+        }
+
+    def chapter_totals(self, system: str = core.DEFAULT_SYSTEM_NAME) -> dict[str, int]:
+        """Sum per chapter, keyed by the ref minus its verse number ("Gen.1.1" -> "Gen.1")."""
+        chapters = [ref.rsplit(".", 1)[0] for ref in self.refs]
+        keys, inverse = np.unique(chapters, return_inverse=True)
+        sums = np.bincount(inverse, weights=self.column(system), minlength=len(keys))
+        order = dict.fromkeys(chapters)
+        totals = dict(zip(keys.tolist(), sums.astype(np.int64).tolist(), strict=True))
+        return {chapter: totals[chapter] for chapter in order}
+
+    def save(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + ".tmp")
+        with open(tmp, "wb") as f:
+            np.savez(
+                f,
+                version=np.int64(GEMATRIA_TABLE_VERSION),
+                book=np.str_(self.book),
+                text_hash=np.str_(self.text_hash),
+                refs=np.array(self.refs, dtype=np.str_),
+                systems=np.array(self.systems, dtype=np.str_),
+                values=self.values,
+            )
+        tmp.replace(path)
+
+    @classmethod
+    def load(cls, path: Path) -> VerseGematriaTable | None:
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                if int(data["version"]) != GEMATRIA_TABLE_VERSION:
+                    return None
+                return cls(
+                    book=str(data["book"]),
+                    refs=data["refs"].tolist(),
+                    systems=data["systems"].tolist(),
+                    values=data["values"],
+                    text_hash=str(data["text_hash"]),
+                )
+        except (OSError, ValueError, KeyError):
+            return None
+
+
+_TABLES: dict[tuple[str, str, tuple[str, ...]], VerseGematriaTable] = {}
+_TABLES_LOCK = threading.Lock()
+
+
+def _table_path(base: Path, book: str, digest: str, systems: Sequence[str]) -> Path:
+    safe_book = re.sub(r"[^A-Za-z0-9_-]+", "_", book) or "book"
+    systems_tag = hashlib.sha256(",".join(systems).encode()).hexdigest()[:8]
+    return base / f"{safe_book}-{digest[:16]}-{systems_tag}.npz"
+
+
+def get_book_table(
+    book: str,
+    verses: Iterable[tuple[str, str]],
+    systems: Iterable[str] | None = None,
+    cache_dir: str | Path | None = None,
+) -> VerseGematriaTable:
+    """Per-verse table for book's (ref, text) verses: memory, then disk, then one vectorized build.
+
+    cache_dir defaults to GEMATRIA_TABLE_DIR; "" keeps the table in memory only.
+    """
+    if cache_dir is None:
+        cache_dir = GEMATRIA_TABLE_DIR
+    verses = list(verses)
+    names = _resolve(systems)
+    digest = text_hash(verses)
+    key = (book, digest, tuple(names))
+    with _TABLES_LOCK:
+        table = _TABLES.get(key)
+    if table is not None:
+        return table
+
+    path = _table_path(Path(cache_dir), book, digest, names) if cache_dir else None
+    table = VerseGematriaTable.load(path) if path and path.exists() else None
+    if table is None or table.text_hash != digest or table.systems != names:
+        table = VerseGematriaTable.build(book, verses, names, digest)
+        if path:
+            try:
+                table.save(path)
+            except OSError:
+                pass
+
+    with _TABLES_LOCK:
+        _TABLES[key] = table
+    return table
+
+
+def clear_book_tables() -> None:
+    with _TABLES_LOCK:
+        _TABLES.clear()
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import pytest
+
+from pmagent.modules.gematria import core, hebrew, kernel
+
+SAMPLES = [
+    "בְּרֵאשִׁית בָּרָא אֱלֹהִים",
+    "אדם",
+    "הֶבֶל",
+    "ארץ־כנען׃",  # noqa: RUF001
+    "Hello 123",
+    "",
+    "שָׁלוֹם ﬡ ℵ",  # presentation form / letterlike symbol
+]
+
+
+def _reference(text: str, system: str) -> int:
+    return core.gematria_value(hebrew.letters_from_text(text), system=system)
+
+
+@pytest.mark.parametrize("system", core.system_names())
+def test_kernel_matches_normalize_then_sum(system: str) -> None:
+    """Kernel values equal the ADR-002 normalize -> letters -> sum path."""
+    for text in SAMPLES:
+        assert kernel.text_value(text, system) == _reference(text, system), text
+
+
+def test_values_matrix_batches_all_systems() -> None:
+    matrix = kernel.values_matrix(SAMPLES)
+    assert matrix.shape == (len(SAMPLES), len(core.system_names()))
+    for row, text in zip(matrix.tolist(), SAMPLES, strict=True):
+        assert row == [_reference(text, s) for s in core.system_names()]
+    assert kernel.word_values(["אדם", "", "הבל"]) == [45, 0, 37]
+    assert kernel.values_matrix([]).shape == (0, 2)
+
+
+def test_unknown_system_rejected() -> None:
+    with pytest.raises(ValueError, match="Unsupported gematria system"):
+        kernel.values_matrix(["אדם"], ["mispar_katan"])
+
+
+def test_book_table_stats_and_persistence(tmp_path) -> None:
+    verses = [("Gen.1.1", "אדם"), ("Gen.1.2", "הבל"), ("Gen.2.1", "אדם הבל")]
+    kernel.clear_book_tables()
+    table = kernel.get_book_table("Gen", verses, cache_dir=tmp_path)
+    assert table.value("Gen.1.2") == 37
+    assert table.value("Gen.1.1", "mispar_gadol") == 605
+    assert table.stats() == {"verses": 3, "total": 164, "mean": 164 / 3, "min": 37, "max": 82}
+    assert table.chapter_totals() == {"Gen.1": 82, "Gen.2": 82}
+    assert kernel.get_book_table("Gen", verses, cache_dir=tmp_path) is table
+
+    kernel.clear_book_tables()
+    (path,) = tmp_path.glob("Gen-*.npz")
+    loaded = kernel.VerseGematriaTable.load(path)
+    assert loaded is not None
+    assert loaded.refs == table.refs and loaded.values.tolist() == table.values.tolist()
+
+    # Changed text -> new hash, rebuilt table
+    changed = kernel.get_book_table("Gen", [*verses[:2], ("Gen.2.1", "אדם")], cache_dir=tmp_path)
+    assert changed.stats()["total"] == 127
+    kernel.clear_book_tables()
@@ -9,6 +9,7 @@ Checks env/DSN, DB/control plane, LM/models, exports, and eval smokes with HINT/
 from __future__ import annotations
 
 import json
+import os
 import subprocess
 import sys
 from datetime import datetime, UTC
@@ -24,6 +25,7 @@ from scripts.config.env import get_rw_dsn, get_ro_dsn, get_bible_db_dsn
 from scripts.guards.guard_lm_health import check_lm_health
 from scripts.control.control_summary import compute_control_summary
 from pmagent.lm.lm_status import compute_lm_status
+from pmagent.status.probes import run_probes, shared_probe
 
 # Import hint registry (graceful degradation if unavailable)
 try:
@@ -33,6 +35,9 @@ try:
 except ImportError:
     HAS_HINT_REGISTRY = False
 
+# `make` smoke targets can legitimately run longer than the default probe timeout
+EVAL_SMOKE_TIMEOUT_S = float(os.getenv("PMAGENT_EVAL_SMOKE_TIMEOUT_S", "600"))
+
 
 # Hermetic JSON loader pattern from existing code
 def load_json_file(path: Path) -> dict[str, Any] | None:
@@ -94,7 +99,7 @@ def check_db_and_control() -> dict[str, Any]:
 
     # Use existing control summary helper
     try:
-        summary = compute_control_summary()
+        summary = shared_probe(compute_control_summary)
         result.update(summary)
         result["ok"] = summary.get("ok", False)
     except Exception as e:
@@ -117,11 +122,11 @@ def check_lm_health_status() -> dict[str, Any]:
 
     try:
         # Get LM health
-        health = check_lm_health()
+        health = shared_probe(check_lm_health)
         result.update(health)
 
         # Get detailed LM status
-        status = compute_lm_status()
+        status = shared_probe(compute_lm_status)
         result["slots"] = status.get("slots", {})
 
     except Exception as e:
@@ -214,12 +219,26 @@ def reality_check(mode: str = "HINT", skip_dashboards: bool = False) -> dict[str
     """
     timestamp = datetime.now(UTC).isoformat()
 
-    # Run all checks
-    env_result = check_env_and_dsn()
-    db_result = check_db_and_control()
-    lm_result = check_lm_health_status()
-    exports_result = check_control_plane_exports() if not skip_dashboards else {"ok": True, "skipped": True}
-    eval_result = run_eval_smoke() if not skip_dashboards else {"ok": True, "skipped": True}
+    # Run all checks (independent, so concurrently); a check that raises or
+    # times out is reported as failed
+    checks = {
+        "env": check_env_and_dsn,
+        "db": check_db_and_control,
+        "lm": check_lm_health_status,
+    }
+    if not skip_dashboards:
+        checks["exports"] = check_control_plane_exports
+        checks["eval_smoke"] = run_eval_smoke
+    results = run_probes(
+        checks,
+        lambda name, e: {"ok": False, "details": {"error": str(e)}},
+        timeouts={"eval_smoke": EVAL_SMOKE_TIMEOUT_S},
+    )
+    env_result = results["env"]
+    db_result = results["db"]
+    lm_result = results["lm"]
+    exports_result = results.get("exports", {"ok": True, "skipped": True})
+    eval_result = results.get("eval_smoke", {"ok": True, "skipped": True})
 
     # Build hints based on results
     hints: list[str] = []
@@ -259,7 +278,7 @@ def reality_check(mode: str = "HINT", skip_dashboards: bool = False) -> dict[str
         # Import here to avoid circular import (snapshot imports reality_check)
         from pmagent.status.snapshot import get_kb_status_view, get_kb_hints
 
-        kb_status_view = get_kb_status_view()
+        kb_status_view = shared_probe(get_kb_status_view)
         kb_hints = get_kb_hints(kb_status_view)
         # Convert structured KB hints to simple hint strings for backward compatibility
         for kb_hint in kb_hints:
@@ -12,6 +12,7 @@ import json
 from pathlib import Path
 from typing import Any
 
+from pmagent.status.probes import shared_probe
 from pmagent.status.system import get_system_status
 
 
@@ -177,7 +178,7 @@ def _add_kb_documentation_section(explanation: dict[str, Any]) -> dict[str, Any]
     try:
         from pmagent.status.snapshot import get_kb_status_view, get_kb_hints
 
-        kb_status_view = get_kb_status_view()
+        kb_status_view = shared_probe(get_kb_status_view)
         kb_hints = get_kb_hints(kb_status_view)
 
         # Get freshness summary (KB-Reg:M6)
@@ -292,7 +293,7 @@ def explain_system_status(use_lm: bool = True) -> dict[str, Any]:
     """
     try:
         # Get current system status
-        status = get_system_status()
+        status = shared_probe(get_system_status)
     except Exception:
         # If status check fails, return a safe fallback explanation
         return {
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Probe Scheduler
+
+Runs the independent health/status probes behind a system snapshot
+concurrently, with a per-probe timeout, and deduplicates shared sub-probes
+(DB health, LM health/status, control summary, KB status view, ...) so each
+runs at most once per snapshot. A short-TTL cache lets the status API and
+dashboards reuse a recent snapshot instead of re-running the probe set.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import copy
+import os
+import threading
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from contextlib import contextmanager
+from typing import Any
+
+PROBE_TIMEOUT_S = float(os.getenv("PMAGENT_PROBE_TIMEOUT_S", "30"))
+PROBE_MAX_WORKERS = int(os.getenv("PMAGENT_PROBE_WORKERS", "16"))
+SNAPSHOT_CACHE_TTL_S = float(os.getenv("PMAGENT_SNAPSHOT_TTL_S", "15"))
+
+
+class ProbeTimeoutError(TimeoutError):
+    """Raised (and passed to the fallback) when a probe exceeds its timeout."""
+
+
+class _ProbeScope:
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.results: dict[Any, Future] = {}
+
+
+_SCOPE: contextvars.ContextVar[_ProbeScope | None] = contextvars.ContextVar("pmagent_probe_scope", default=None)
+
+
+@contextmanager
+def probe_scope() -> Iterator[None]:
+    """Share sub-probe results for the duration of one snapshot (nested scopes reuse the outer one)."""
+    if _SCOPE.get() is not None:
+        yield
+        return
+    token = _SCOPE.set(_ProbeScope())
+    try:
+        yield
+    finally:
+        _SCOPE.reset(token)
+
+
+def shared_probe(fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Call fn(*args, **kwargs) at most once per probe scope; concurrent callers wait for the first.
+
+    Outside a probe_scope() this is a plain call. Each caller gets its own copy
+    of the result, so callers can mutate it freely.
+    """
+    scope = _SCOPE.get()
+    if scope is None:
+        return fn(*args, **kwargs)
+
+    key = (fn, args, tuple(sorted(kwargs.items())))
+    with scope.lock:
+        future = scope.results.get(key)
+        owner = future is None
+        if owner:
+            future = scope.results[key] = Future()
+    if owner:
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+    return copy.deepcopy(future.result())
+
+
+def run_probes(
+    probes: dict[str, Callable[[], Any]],
+    fallback: Callable[[str, Exception], Any],
+    timeout: float | None = None,
+    timeouts: dict[str, float] | None = None,
+    max_workers: int | None = None,
+) -> dict[str, Any]:
+    """Run independent probes concurrently and return {name: result}.
+
+    A probe that raises, or does not finish within its timeout (timeouts[name],
+    else timeout, else PROBE_TIMEOUT_S; counted from the start of the run), is
+    replaced by fallback(name, error). Timed-out probes are left to finish in
+    the background; their results are discarded.
+    """
+    if not probes:
+        return {}
+    default_timeout = PROBE_TIMEOUT_S if timeout is None else timeout
+    timeouts = timeouts or {}
+    workers = max(1, min(max_workers or PROBE_MAX_WORKERS, len(probes)))
+
+    pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="pmagent-probe")
+    try:
+        # Each probe runs in a copy of the caller's context so it sees the same probe scope
+        futures = {name: pool.submit(contextvars.copy_context().run, fn) for name, fn in probes.items()}
+        started = time.monotonic()
+        results: dict[str, Any] = {}
+        for name, future in futures.items():
+            limit = timeouts.get(name, default_timeout)
+            try:
+                results[name] = future.result(timeout=max(0.0, started + limit - time.monotonic()))
+            except FutureTimeoutError:
+                results[name] = fallback(name, ProbeTimeoutError(f"probe {name!r} timed out after {limit:g}s"))
+            except Exception as e:
+                results[name] = fallback(name, e)
+        return results
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+_CACHE: dict[Any, tuple[float, Any]] = {}
+_CACHE_LOCK = threading.Lock()
+_KEY_LOCKS: dict[Any, threading.Lock] = {}
+
+
+def cached_probe(key: Any, fn: Callable[[], Any], ttl: float = SNAPSHOT_CACHE_TTL_S) -> Any:
+    """Return fn() cached for ttl seconds under key; concurrent misses compute it once."""
+    if ttl <= 0:
+        return fn()
+    with _CACHE_LOCK:
+        key_lock = _KEY_LOCKS.setdefault(key, threading.Lock())
+    with key_lock:
+        with _CACHE_LOCK:
+            entry = _CACHE.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return copy.deepcopy(entry[1])
+        value = fn()
+        with _CACHE_LOCK:
+            _CACHE[key] = (time.monotonic() + ttl, value)
+        return copy.deepcopy(value)
+
+
+def clear_probe_cache() -> None:
+    with _CACHE_LOCK:
+        _CACHE.clear()
@@ -13,10 +13,12 @@ from pathlib import Path
 from typing import Any
 
 from pmagent.kb.registry import analyze_freshness, load_registry, validate_registry
+from pmagent.reality.check import EVAL_SMOKE_TIMEOUT_S
 from pmagent.reality.check import reality_check as check_reality
 from pmagent.status.eval_exports import get_eval_insights_summary
 from pmagent.status.explain import explain_system_status
 from pmagent.status.kb_metrics import compute_kb_doc_health_metrics
+from pmagent.status.probes import PROBE_TIMEOUT_S, cached_probe, probe_scope, run_probes, shared_probe
 from pmagent.tools.system import health as tool_health
 from scripts.config.env import get_rw_dsn
 from scripts.guards.guard_db_health import check_db_health
@@ -291,7 +293,7 @@ def get_kb_hints(kb_status_view: dict[str, Any] | None = None) -> list[dict[str,
         Empty list if no issues found.
     """
     if kb_status_view is None:
-        kb_status_view = get_kb_status_view()
+        kb_status_view = shared_probe(get_kb_status_view)
 
     hints: list[dict[str, Any]] = []
 
@@ -454,9 +456,14 @@ def get_system_snapshot(
     include_mcp_catalog: bool = True,
     reality_check_mode: str = "HINT",
     use_lm_for_explain: bool = False,
+    max_age_s: float = 0.0,
 ) -> dict[str, Any]:
     """Get unified system snapshot (pm.snapshot + API contract).
 
+    Independent probes run concurrently with a per-probe timeout (see
+    pmagent.status.probes); a probe that fails or times out contributes its
+    error payload instead. Shared sub-probes run once per snapshot.
+
     Args:
         include_reality_check: Whether to include reality-check verdict
         include_ai_tracking: Whether to include AI tracking summary
@@ -467,6 +474,8 @@ def get_system_snapshot(
         include_mcp_catalog: Whether to include MCP catalog summary (advisory-only)
         reality_check_mode: Mode for reality-check ("HINT" or "STRICT")
         use_lm_for_explain: Whether to use LM for status explanation
+        max_age_s: Reuse a snapshot built with the same arguments within the
+            last max_age_s seconds (0 = always build a fresh one)
 
     Returns:
         Dictionary with complete system snapshot:
@@ -485,86 +494,125 @@ def get_system_snapshot(
             "mcp_catalog": {...} (if included) - optional, advisory-only, MCP tool catalog
         }
     """
-    from datetime import datetime
+    if max_age_s > 0:
+        key = (
+            "system_snapshot",
+            include_reality_check,
+            include_ai_tracking,
+            include_share_manifest,
+            include_eval_insights,
+            include_kb_registry,
+            include_kb_doc_health,
+            include_mcp_catalog,
+            reality_check_mode,
+            use_lm_for_explain,
+        )
+        return cached_probe(
+            key,
+            lambda: get_system_snapshot(*key[1:]),
+            ttl=max_age_s,
+        )
 
-    # Gather DB health
-    db_health_json = {}
-    try:
-        db_health_json = check_db_health()
-    except Exception as e:
-        db_health_json = {
-            "ok": False,
-            "mode": "error",
-            "error": f"guard_db_health failed: {e}",
-        }
+    with probe_scope():
+        return _build_system_snapshot(
+            include_reality_check=include_reality_check,
+            include_ai_tracking=include_ai_tracking,
+            include_share_manifest=include_share_manifest,
+            include_eval_insights=include_eval_insights,
+            include_kb_registry=include_kb_registry,
+            include_kb_doc_health=include_kb_doc_health,
+            include_mcp_catalog=include_mcp_catalog,
+            reality_check_mode=reality_check_mode,
+            use_lm_for_explain=use_lm_for_explain,
+        )
 
-    # Gather system health (DB + LM + Graph)
-    system_health_json = {}
-    try:
-        system_health_json = tool_health()
-    except Exception as e:
-        system_health_json = {
-            "ok": False,
-            "error": f"system_health failed: {e}",
-            "db": db_health_json,
-            "lm": {"ok": False, "mode": "error"},
-            "graph": {"ok": False, "mode": "error"},
-        }
 
-    # Gather status explanation
-    status_explain_json = {}
-    try:
-        status_explain_json = explain_system_status(use_lm=use_lm_for_explain)
-    except Exception as e:
-        status_explain_json = {
-            "level": "ERROR",
-            "headline": "Status explanation unavailable",
-            "details": f"Failed to generate explanation: {e}",
-        }
+def _get_kb_hints_probe() -> list[dict[str, Any]]:
+    return get_kb_hints(shared_probe(get_kb_status_view))
 
-    # Gather reality-check verdict (if requested)
-    reality_check_json = {}
-    if include_reality_check:
-        try:
-            reality_check_json = check_reality(mode=reality_check_mode, skip_dashboards=False)
-        except Exception as e:
-            reality_check_json = {
+
+def _get_mcp_catalog_summary() -> dict[str, Any]:
+    from pmagent.adapters.mcp_db import catalog_read_ro
+
+    mcp_catalog_result = catalog_read_ro()
+    return {
+        "available": mcp_catalog_result.get("ok", False),
+        "tools_count": len(mcp_catalog_result.get("tools", [])),
+        "error": mcp_catalog_result.get("error") if not mcp_catalog_result.get("ok", False) else None,
+    }
+
+
+def _get_control_widgets_summary() -> dict[str, Any]:
+    # Phase-6D: downstream app read-only wiring
+    from pmagent.control_widgets.adapter import (
+        load_biblescholar_reference_widget_props,
+        load_graph_compliance_widget_props,
+    )
+
+    graph_compliance_props = load_graph_compliance_widget_props()
+    biblescholar_reference_props = load_biblescholar_reference_widget_props()
+
+    return {
+        "graph_compliance": {
+            "status": graph_compliance_props["status"],
+            "label": graph_compliance_props["label"],
+            "metrics": {
+                "totalRunsWithViolations": graph_compliance_props["metrics"]["totalRunsWithViolations"],
+                "windowDays": graph_compliance_props["metrics"]["windowDays"],
+            },
+        },
+        "biblescholar_reference": {
+            "status": biblescholar_reference_props["status"],
+            "label": biblescholar_reference_props["label"],
+            "metrics": {
+                "totalQuestions": biblescholar_reference_props["metrics"]["totalQuestions"],
+                "windowDays": biblescholar_reference_props["metrics"]["windowDays"],
+            },
+        },
+    }
+
+
+def _snapshot_probe_fallback(reality_check_mode: str):
+    """Per-probe error payloads used when a probe raises or times out."""
+
+    def fallback(name: str, e: Exception) -> Any:
+        if name == "db_health":
+            return {"ok": False, "mode": "error", "error": f"guard_db_health failed: {e}"}
+        if name == "system_health":
+            # "db" is filled in from the db_health probe once all probes are in
+            return {
+                "ok": False,
+                "error": f"system_health failed: {e}",
+                "db": None,
+                "lm": {"ok": False, "mode": "error"},
+                "graph": {"ok": False, "mode": "error"},
+            }
+        if name == "status_explain":
+            return {
+                "level": "ERROR",
+                "headline": "Status explanation unavailable",
+                "details": f"Failed to generate explanation: {e}",
+            }
+        if name == "reality_check":
+            return {
                 "command": "reality.check",
                 "mode": reality_check_mode,
                 "overall_ok": False,
                 "error": f"reality_check failed: {e}",
             }
-
-    # Gather AI tracking summary (if requested)
-    ai_tracking_summary = {}
-    if include_ai_tracking:
-        ai_tracking_summary = get_ai_tracking_summary()
-
-    # Gather share manifest summary (if requested)
-    share_manifest_summary = {}
-    if include_share_manifest:
-        share_manifest_summary = get_share_manifest_summary()
-
-    # Gather eval insights summary (if requested) - export-driven, advisory only
-    eval_insights_summary = {}
-    if include_eval_insights:
-        try:
-            eval_insights_summary = get_eval_insights_summary()
-        except Exception as e:
-            eval_insights_summary = {
+        if name == "ai_tracking":
+            return {"ok": False, "mode": "error", "error": f"AI tracking unavailable: {e}"}
+        if name == "share_manifest":
+            return {"ok": False, "count": 0, "error": f"Failed to read manifest: {e}"}
+        if name == "eval_insights":
+            return {
                 "note": f"Eval insights unavailable: {e}",
                 "lm_indicator": {"available": False, "note": "Error loading eval insights"},
                 "db_health": {"available": False, "note": "Error loading eval insights"},
                 "edge_class_counts": {"available": False, "note": "Error loading eval insights"},
             }
-
-    # Gather KB registry summary (if requested) - advisory only, non-gating
-    kb_registry_summary = {}
-    if include_kb_registry:
-        try:
-            kb_registry_summary = get_kb_registry_summary()
-        except Exception as e:
-            kb_registry_summary = {
+        if name == "kb_registry":
+            return {
                 "available": False,
                 "total": 0,
                 "valid": False,
@@ -572,18 +620,77 @@ def get_system_snapshot(
                 "warnings_count": 0,
                 "note": f"KB registry unavailable: {e}",
             }
+        if name == "kb_hints":
+            return [{"level": "WARN", "code": "KB_HINTS_ERROR", "message": f"Failed to generate KB hints: {e}"}]
+        if name == "kb_doc_health":
+            return {"available": False, "metrics": {}, "error": f"KB doc-health metrics unavailable: {e}"}
+        if name == "mcp_catalog":
+            return {"available": False, "tools_count": 0, "error": f"Failed to read MCP catalog: {e}"}
+        if name == "control_widgets":
+            return {
+                "error": f"Failed to load control-plane widgets: {e}",
+                "graph_compliance": {"status": "unknown"},
+                "biblescholar_reference": {"status": "unknown"},
+            }
+        return {"ok": False, "error": f"{name} failed: {e}"}
+
+    return fallback
+
+
+def _build_system_snapshot(
+    include_reality_check: bool,
+    include_ai_tracking: bool,
+    include_share_manifest: bool,
+    include_eval_insights: bool,
+    include_kb_registry: bool,
+    include_kb_doc_health: bool,
+    include_mcp_catalog: bool,
+    reality_check_mode: str,
+    use_lm_for_explain: bool,
+) -> dict[str, Any]:
+    """Run the snapshot probes concurrently (inside the caller's probe scope) and assemble the snapshot."""
+    from datetime import datetime
 
-    # Gather KB doc-health metrics (if requested) - advisory only, non-gating (AgentPM-Next:M3)
-    kb_doc_health_summary = {}
+    # Independent probes; shared sub-probes (DB/LM health, KB status view, ...)
+    # are deduplicated through shared_probe() within this snapshot.
+    probes: dict[str, Any] = {
+        "db_health": lambda: shared_probe(check_db_health),
+        "system_health": lambda: tool_health(),
+        "status_explain": lambda: explain_system_status(use_lm=use_lm_for_explain),
+    }
+    if include_reality_check:
+        probes["reality_check"] = lambda: check_reality(mode=reality_check_mode, skip_dashboards=False)
+    if include_ai_tracking:
+        probes["ai_tracking"] = get_ai_tracking_summary
+    if include_share_manifest:
+        probes["share_manifest"] = get_share_manifest_summary
+    if include_eval_insights:
+        # Export-driven, advisory only
+        probes["eval_insights"] = get_eval_insights_summary
+    if include_kb_registry:
+        # Advisory only, non-gating; KB hints come from registry status (KB-Reg:M4)
+        probes["kb_registry"] = get_kb_registry_summary
+        probes["kb_hints"] = _get_kb_hints_probe
     if include_kb_doc_health:
-        try:
-            kb_doc_health_summary = compute_kb_doc_health_metrics()
-        except Exception as e:
-            kb_doc_health_summary = {
-                "available": False,
-                "metrics": {},
-                "error": f"KB doc-health metrics unavailable: {e}",
-            }
+        # Advisory only, non-gating (AgentPM-Next:M3)
+        probes["kb_doc_health"] = compute_kb_doc_health_metrics
+    if include_mcp_catalog:
+        # Advisory-only, read-only
+        probes["mcp_catalog"] = _get_mcp_catalog_summary
+    probes["control_widgets"] = _get_control_widgets_summary
+
+    # reality_check runs its own probes, including the eval smoke run with its longer limit
+    results = run_probes(
+        probes,
+        _snapshot_probe_fallback(reality_check_mode),
+        timeouts={"reality_check": EVAL_SMOKE_TIMEOUT_S + PROBE_TIMEOUT_S},
+    )
+
+    db_health_json = results["db_health"]
+    system_health_json = results["system_health"]
+    if system_health_json.get("error") and system_health_json.get("db") is None:
+        system_health_json["db"] = db_health_json
+    reality_check_json = results.get("reality_check", {})
 
     # Determine overall_ok from components
     # NOTE: eval_insights and kb_registry are advisory only and do NOT affect overall_ok
@@ -599,92 +706,21 @@ def get_system_snapshot(
         "generated_at": datetime.now().astimezone().isoformat(timespec="seconds"),
         "db_health": db_health_json,
         "system_health": system_health_json,
-        "status_explain": status_explain_json,
+        "status_explain": results["status_explain"],
     }
-
-    if include_reality_check:
-        snapshot["reality_check"] = reality_check_json
-
-    if include_ai_tracking:
-        snapshot["ai_tracking"] = ai_tracking_summary
-
-    if include_share_manifest:
-        snapshot["share_manifest"] = share_manifest_summary
-
-    if include_eval_insights:
-        snapshot["eval_insights"] = eval_insights_summary
-
-    if include_kb_registry:
-        snapshot["kb_registry"] = kb_registry_summary
-        # Generate KB hints from registry status (KB-Reg:M4)
-        try:
-            kb_status_view = get_kb_status_view()
-            kb_hints = get_kb_hints(kb_status_view)
-            snapshot["kb_hints"] = kb_hints
-        except Exception as e:
-            snapshot["kb_hints"] = [
-                {
-                    "level": "WARN",
-                    "code": "KB_HINTS_ERROR",
-                    "message": f"Failed to generate KB hints: {e}",
-                }
-            ]
-
-    if include_kb_doc_health:
-        snapshot["kb_doc_health"] = kb_doc_health_summary
-
-    # Add MCP catalog summary (advisory-only, read-only)
-    if include_mcp_catalog:
-        try:
-            from pmagent.adapters.mcp_db import catalog_read_ro
-
-            mcp_catalog_result = catalog_read_ro()
-            snapshot["mcp_catalog"] = {
-                "available": mcp_catalog_result.get("ok", False),
-                "tools_count": len(mcp_catalog_result.get("tools", [])),
-                "error": mcp_catalog_result.get("error") if not mcp_catalog_result.get("ok", False) else None,
-            }
-        except Exception as e:
-            snapshot["mcp_catalog"] = {
-                "available": False,
-                "tools_count": 0,
-                "error": f"Failed to read MCP catalog: {e}",
-            }
-
-    # Add control-plane widget summaries (Phase-6D: downstream app read-only wiring)
-    try:
-        from pmagent.control_widgets.adapter import (
-            load_biblescholar_reference_widget_props,
-            load_graph_compliance_widget_props,
-        )
-
-        graph_compliance_props = load_graph_compliance_widget_props()
-        biblescholar_reference_props = load_biblescholar_reference_widget_props()
-
-        snapshot["control_widgets"] = {
-            "graph_compliance": {
-                "status": graph_compliance_props["status"],
-                "label": graph_compliance_props["label"],
-                "metrics": {
-                    "totalRunsWithViolations": graph_compliance_props["metrics"]["totalRunsWithViolations"],
-                    "windowDays": graph_compliance_props["metrics"]["windowDays"],
-                },
-            },
-            "biblescholar_reference": {
-                "status": biblescholar_reference_props["status"],
-                "label": biblescholar_reference_props["label"],
-                "metrics": {
-                    "totalQuestions": biblescholar_reference_props["metrics"]["totalQuestions"],
-                    "windowDays": biblescholar_reference_props["metrics"]["windowDays"],
-                },
-            },
-        }
-    except Exception as e:
-        snapshot["control_widgets"] = {
-            "error": f"Failed to load control-plane widgets: {e}",
-            "graph_compliance": {"status": "unknown"},
-            "biblescholar_reference": {"status": "unknown"},
-        }
+    for name in (
+        "reality_check",
+        "ai_tracking",
+        "share_manifest",
+        "eval_insights",
+        "kb_registry",
+        "kb_hints",
+        "kb_doc_health",
+        "mcp_catalog",
+        "control_widgets",
+    ):
+        if name in results:
+            snapshot[name] = results[name]
 
     # Load hints from DMS and embed into snapshot (graceful degradation if unavailable)
     if HAS_HINT_REGISTRY:
@@ -11,6 +11,7 @@ from __future__ import annotations
 from typing import Any
 
 from pmagent.lm.lm_status import compute_lm_status
+from pmagent.status.probes import shared_probe
 from scripts.guards.guard_db_health import check_db_health
 
 
@@ -25,7 +26,7 @@ def get_db_health_snapshot() -> dict[str, Any]:
             "notes": str
         }
     """
-    health = check_db_health()
+    health = shared_probe(check_db_health)
     mode = health.get("mode", "db_off")
     ok = health.get("ok", False)
     errors = health.get("details", {}).get("errors", [])
@@ -65,7 +66,7 @@ def get_lm_health_snapshot() -> dict[str, Any]:
             "notes": str
         }
     """
-    status = compute_lm_status()
+    status = shared_probe(compute_lm_status)
     slots = status.get("slots", [])
 
     # Transform slot format for web consumption
@@ -52,7 +52,7 @@ class TestLMStudioAdapter:
         assert result["mode"] == "lm_off"
         assert result["reason"] == "lm_studio_disabled_or_unconfigured"
 
-    @patch("pmagent.adapters.lm_studio.requests.post")
+    @patch("requests.Session.post")
     @patch("pmagent.adapters.lm_studio.get_lm_studio_settings")
     def test_lm_on_success(self, mock_settings, mock_post):
         """Test adapter returns lm_on when call succeeds."""
@@ -87,7 +87,7 @@ class TestLMStudioAdapter:
         assert call_args[1]["json"]["model"] == "test-model"
         assert call_args[1]["json"]["messages"] == [{"role": "user", "content": "test"}]
 
-    @patch("pmagent.adapters.lm_studio.requests.post")
+    @patch("requests.Session.post")
     @patch("pmagent.adapters.lm_studio.get_lm_studio_settings")
     def test_lm_off_connection_error(self, mock_settings, mock_post):
         """Test adapter returns lm_off on connection error."""
@@ -109,7 +109,7 @@ class TestLMStudioAdapter:
         assert "connection_error" in result["reason"]
         assert result["response"] is None
 
-    @patch("pmagent.adapters.lm_studio.requests.post")
+    @patch("requests.Session.post")
     @patch("pmagent.adapters.lm_studio.get_lm_studio_settings")
     def test_lm_off_timeout(self, mock_settings, mock_post):
         """Test adapter returns lm_off on timeout."""
@@ -131,7 +131,7 @@ class TestLMStudioAdapter:
         assert "timeout" in result["reason"]
         assert result["response"] is None
 
-    @patch("pmagent.adapters.lm_studio.requests.post")
+    @patch("requests.Session.post")
     @patch("pmagent.adapters.lm_studio.get_lm_studio_settings")
     def test_lm_off_http_error(self, mock_settings, mock_post):
         """Test adapter returns lm_off on HTTP error."""
@@ -156,7 +156,7 @@ class TestLMStudioAdapter:
         assert "http_error" in result["reason"]
         assert result["response"] is None
 
-    @patch("pmagent.adapters.lm_studio.requests.post")
+    @patch("requests.Session.post")
     @patch("pmagent.adapters.lm_studio.get_lm_studio_settings")
     def test_base_url_normalization(self, mock_settings, mock_post):
         """Test that base_url is normalized correctly (adds /v1 if missing)."""
@@ -180,7 +180,7 @@ class TestLMStudioAdapter:
         call_args = mock_post.call_args
         assert call_args[0][0] == "http://localhost:1234/v1/chat/completions"
 
-    @patch("pmagent.adapters.lm_studio.requests.post")
+    @patch("requests.Session.post")
     @patch("pmagent.adapters.lm_studio.get_lm_studio_settings")
     def test_api_key_in_headers(self, mock_settings, mock_post):
         """Test that API key is included in headers when provided."""
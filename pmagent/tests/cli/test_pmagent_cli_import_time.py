@@ -0,0 +1,82 @@
+"""Import-time budget for the pmagent CLI.
+
+`import pmagent.cli` must stay cheap: command implementations and external
+sub-apps are loaded lazily, only when a command that needs them runs.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+from typer.testing import CliRunner
+
+from pmagent.lazy import LazyImport
+
+ROOT = Path(__file__).resolve().parents[3]
+
+# Cumulative import time of pmagent.cli (was ~1.2s with eager imports)
+IMPORT_BUDGET_MS = float(os.getenv("PMAGENT_IMPORT_BUDGET_MS", "400"))
+
+HEAVY_MODULES = {
+    "sqlalchemy",
+    "psycopg",
+    "numpy",
+    "requests",
+    "pmagent.kb.registry",
+    "pmagent.status.snapshot",
+    "pmagent.hints",
+    "pmagent.handoff.commands",
+    "scripts.guards.guard_db_health",
+}
+
+
+def _importtime(code: str) -> dict[str, int]:
+    """Run code under -X importtime and return {module: cumulative_us}."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times: dict[str, int] = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = (part.strip() for part in line[len("import time:") :].split("|"))
+        times[name] = int(cumulative)
+    return times
+
+
+def test_cli_import_skips_heavy_modules():
+    times = _importtime("import pmagent.cli")
+    assert not HEAVY_MODULES & times.keys()
+
+
+def test_cli_import_within_budget():
+    times = _importtime("import pmagent.cli")
+    assert times["pmagent.cli"] / 1000.0 <= IMPORT_BUDGET_MS
+
+
+def test_lazy_subapp_dispatch():
+    from pmagent.cli import app
+
+    result = CliRunner().invoke(app, ["hints", "--help"])
+    assert result.exit_code == 0
+    assert "Hint generation" in result.output
+
+
+def test_lazy_import_resolves_on_first_use_and_can_be_patched():
+    join = LazyImport("os.path", "join")
+    assert "pending" in repr(join)
+    assert join("a", "b") == os.path.join("a", "b")
+    assert "loaded" in repr(join)
+
+    posixpath = LazyImport("os.path")
+    with patch.object(posixpath, "basename", return_value="patched"):
+        assert posixpath.basename("/x/y") == "patched"
+    assert posixpath.basename("/x/y") == "y"
@@ -0,0 +1,156 @@
+"""Tests for the snapshot probe scheduler (concurrency, timeouts, dedup, TTL cache)."""
+
+from __future__ import annotations
+
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from pmagent.status.probes import (
+    ProbeTimeoutError,
+    cached_probe,
+    clear_probe_cache,
+    probe_scope,
+    run_probes,
+    shared_probe,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    clear_probe_cache()
+    yield
+    clear_probe_cache()
+
+
+def _fallback(name, e):
+    return {"name": name, "error": type(e).__name__}
+
+
+def test_run_probes_runs_concurrently():
+    barrier = threading.Barrier(3, timeout=5)
+
+    def probe(value):
+        def _run():
+            barrier.wait()  # deadlocks unless all three run at once
+            return value
+
+        return _run
+
+    results = run_probes({"a": probe(1), "b": probe(2), "c": probe(3)}, _fallback)
+    assert results == {"a": 1, "b": 2, "c": 3}
+
+
+def test_run_probes_timeout_and_error_use_fallback():
+    release = threading.Event()
+
+    def slow():
+        release.wait(5)
+        return "late"
+
+    def broken():
+        raise RuntimeError("boom")
+
+    started = time.monotonic()
+    results = run_probes(
+        {"slow": slow, "broken": broken, "fast": lambda: "ok"},
+        _fallback,
+        timeouts={"slow": 0.1},
+    )
+    release.set()
+    assert time.monotonic() - started < 2
+    assert results["slow"] == {"name": "slow", "error": ProbeTimeoutError.__name__}
+    assert results["broken"] == {"name": "broken", "error": "RuntimeError"}
+    assert results["fast"] == "ok"
+
+
+def test_shared_probe_runs_once_per_scope():
+    calls = []
+
+    def check_db():
+        calls.append(1)
+        time.sleep(0.05)
+        return {"ok": True, "details": []}
+
+    with probe_scope():
+        results = run_probes({f"p{i}": lambda: shared_probe(check_db) for i in range(4)}, _fallback)
+        # Callers get independent copies
+        results["p0"]["details"].append("mutated")
+        assert shared_probe(check_db) == {"ok": True, "details": []}
+    assert len(calls) == 1
+
+    # No scope: plain call
+    shared_probe(check_db)
+    assert len(calls) == 2
+
+
+def test_cached_probe_respects_ttl():
+    calls = []
+
+    def build():
+        calls.append(1)
+        return {"n": len(calls)}
+
+    assert cached_probe("k", build, ttl=60) == {"n": 1}
+    assert cached_probe("k", build, ttl=60) == {"n": 1}
+    assert cached_probe("k", build, ttl=0) == {"n": 2}
+    clear_probe_cache()
+    assert cached_probe("k", build, ttl=60) == {"n": 3}
+
+
+def test_snapshot_dedups_db_health_and_caches(monkeypatch):
+    from pmagent.status import snapshot
+
+    calls = []
+
+    def fake_db_health():
+        calls.append("db")
+        return {"ok": True, "mode": "ready"}
+
+    def fake_tool_health():
+        return {"ok": True, "db": shared_probe(snapshot.check_db_health)}
+
+    kwargs = {
+        "include_reality_check": False,
+        "include_ai_tracking": False,
+        "include_share_manifest": False,
+        "include_eval_insights": False,
+        "include_kb_registry": False,
+        "include_kb_doc_health": False,
+        "include_mcp_catalog": False,
+    }
+    with (
+        patch.object(snapshot, "check_db_health", fake_db_health),
+        patch.object(snapshot, "tool_health", fake_tool_health),
+        patch.object(snapshot, "explain_system_status", return_value={"level": "OK"}),
+        patch.object(snapshot, "_get_control_widgets_summary", return_value={}),
+    ):
+        first = snapshot.get_system_snapshot(**kwargs, max_age_s=60)
+        second = snapshot.get_system_snapshot(**kwargs, max_age_s=60)
+
+    assert calls == ["db"]
+    assert first == second
+    assert first["overall_ok"] is True
+    assert first["system_health"]["db"] == {"ok": True, "mode": "ready"}
+
+
+def test_snapshot_gives_reality_check_the_eval_smoke_budget():
+    from pmagent.reality.check import EVAL_SMOKE_TIMEOUT_S
+    from pmagent.status import snapshot
+    from pmagent.status.probes import PROBE_TIMEOUT_S
+
+    captured = {}
+
+    class _Stop(Exception):
+        pass
+
+    def fake_run_probes(probes, fallback, timeout=None, timeouts=None):
+        captured.update(names=set(probes), timeouts=timeouts or {})
+        raise _Stop
+
+    with patch.object(snapshot, "run_probes", fake_run_probes), pytest.raises(_Stop):
+        snapshot._build_system_snapshot(True, False, False, False, False, False, False, "HINT", False)
+    assert "reality_check" in captured["names"]
+    assert captured["timeouts"]["reality_check"] >= EVAL_SMOKE_TIMEOUT_S + PROBE_TIMEOUT_S
@@ -14,6 +14,7 @@ from scripts.graph.graph_overview import compute_graph_overview
 from scripts.system.system_health import compute_system_health
 from pmagent.scripts.state.ledger_verify import verify_ledger
 from pmagent.reality.check import reality_check as check_reality
+from pmagent.status.probes import shared_probe
 from pmagent.scripts.docs_inventory import run_inventory
 
 
@@ -23,10 +24,10 @@ def health(**kwargs: Any) -> dict[str, Any]:
     Returns:
         Dict with health status for DB, LM, and Graph components.
     """
-    db_health = check_db_health()
-    lm_health = check_lm_health()
-    graph_overview = compute_graph_overview()
-    system_health = compute_system_health()
+    db_health = shared_probe(check_db_health)
+    lm_health = shared_probe(check_lm_health)
+    graph_overview = shared_probe(compute_graph_overview)
+    system_health = shared_probe(compute_system_health)
 
     return {
         "ok": True,
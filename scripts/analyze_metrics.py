@@ -6,13 +6,8 @@ import os
 
 import numpy as np
 
-from src.graph.metrics import (
-    bridge_score,
-    cluster_semantic_diversity,
-    density,
-    diversity_local,
-    semantic_cohesion,
-)
+from src.graph.correlation_engine import parse_embedding
+from src.graph.metrics import compute_metrics
 from src.infra.db import get_gematria_rw
 from src.infra.env_loader import ensure_env_loaded
 
@@ -20,96 +15,96 @@ from src.infra.env_loader import ensure_env_loaded
 ensure_env_loaded()
 
 TOPK = int(os.getenv("METRICS_CLUSTER_TOPK", 5))
-SAMPLE = int(os.getenv("METRICS_SAMPLE_SIZE", 200))
+
+CLUSTER_UPSERT_SQL = """
+  INSERT INTO cluster_metrics (cluster_id,size,density,modularity,semantic_diversity,top_examples)
+  VALUES (%s,%s,%s,NULL,%s,%s::uuid[])
+  ON CONFLICT (cluster_id) DO UPDATE SET
+    size=EXCLUDED.size,density=EXCLUDED.density,
+    semantic_diversity=EXCLUDED.semantic_diversity,top_examples=EXCLUDED.top_examples,
+    updated_at=now()
+"""
+
+# One statement for all concepts: parallel arrays expanded server-side
+CONCEPT_UPSERT_SQL = """
+  INSERT INTO concept_metrics (concept_id,cluster_id,semantic_cohesion,bridge_score,diversity_local)
+  SELECT * FROM unnest(%s::uuid[], %s::int[], %s::float8[], %s::float8[], %s::float8[])
+  ON CONFLICT (concept_id) DO UPDATE SET
+    cluster_id=EXCLUDED.cluster_id, semantic_cohesion=EXCLUDED.semantic_cohesion,
+    bridge_score=EXCLUDED.bridge_score, diversity_local=EXCLUDED.diversity_local,
+    updated_at=now()
+"""
 
 
 def fetch_embeddings(db):
-    rows = list(
-        db.execute(
-            """
+    """Return (concept_ids, cluster_ids, stacked embedding matrix)."""
+    rows = db.execute(
+        """
       SELECT n.concept_id, c.cluster_id, n.embedding
       FROM concept_network n
       JOIN concept_clusters c ON c.concept_id = n.concept_id
       WHERE n.embedding IS NOT NULL
     """
+    )
+    ids, clusters, vecs = [], [], []
+    for cid, cl, raw in rows:
+        vec = parse_embedding(raw)
+        if vec is None or (vecs and vec.shape != vecs[0].shape):
+            continue
+        ids.append(str(cid))
+        clusters.append(int(cl))
+        vecs.append(vec)
+    matrix = np.stack(vecs) if vecs else np.zeros((0, 0), dtype=np.float32)
+    return ids, np.array(clusters, dtype=np.int64), matrix
+
+
+def fetch_edges(db, ids):
+    """Relations between embedded concepts as (m, 2) row-index pairs into ids."""
+    pos = {cid: i for i, cid in enumerate(ids)}
+    pairs = [
+        (pos[s], pos[t])
+        for s, t in ((str(s), str(t)) for s, t in db.execute("SELECT source_id, target_id FROM concept_relations"))
+        if s in pos and t in pos
+    ]
+    return np.array(pairs, dtype=np.int64).reshape(-1, 2)
+
+
+def write_metrics(db, ids, labels, metrics):
+    ids_arr = np.array(ids, dtype=object)
+    cluster_rows = [
+        (int(cl), int(size), float(dens), float(div), ids_arr[top].tolist())
+        for cl, size, dens, div, top in zip(
+            metrics.clusters,
+            metrics.cluster_size,
+            metrics.cluster_density,
+            metrics.cluster_diversity,
+            metrics.top_examples,
+            strict=True,
+        )
+    ]
+    db.executemany(CLUSTER_UPSERT_SQL, cluster_rows)
+    # execute() is a generator: drain it so the statement actually runs
+    list(
+        db.execute(
+            CONCEPT_UPSERT_SQL,
+            (
+                list(ids),
+                labels.tolist(),
+                metrics.semantic_cohesion.tolist(),
+                metrics.bridge_score.tolist(),
+                metrics.diversity_local.tolist(),
+            ),
         )
     )
-    return [(r[0], r[1], np.array(r[2], dtype=float)) for r in rows]
-
-
-def fetch_edges(db):
-    rows = list(db.execute("SELECT source_id, target_id FROM concept_relations"))
-    adj = {}
-    for s, t in rows:
-        adj.setdefault(s, set()).add(t)
-        adj.setdefault(t, set()).add(s)
-    return adj
 
 
 if __name__ == "__main__":
     db = get_gematria_rw()
-    adj = fetch_edges(db)
-    items = fetch_embeddings(db)
-
-    by_cluster = {}
-    for cid, cl, vec in items:
-        by_cluster.setdefault(cl, []).append((cid, vec))
-
-    # cluster metrics
-    for cl, pairs in by_cluster.items():
-        ids = [cid for cid, _ in pairs]
-        vecs = [v for _, v in pairs]
-        n = len(ids)
-        e_within = next(
-            iter(
-                db.execute(
-                    """
-          SELECT COUNT(*) FROM concept_relations
-          WHERE source_id = ANY(%s) AND target_id = ANY(%s)
-        """,
-                    (ids, ids),
-                )
-            )
-        )[0]
-        dens = density(n, e_within)
-        sample = vecs if n <= SAMPLE else [vecs[i] for i in np.random.choice(n, SAMPLE, replace=False)]
-        div = cluster_semantic_diversity(sample)
-        # exemplars by mean cosine to cluster
-        means = [(cid, float(np.mean([np.dot(v, u) for u in vecs]))) for cid, v in pairs]
-        means.sort(key=lambda x: x[1], reverse=True)
-        top = [cid for cid, _ in means[:TOPK]]
-        db.execute(
-            """
-          INSERT INTO cluster_metrics (cluster_id,size,density,modularity,semantic_diversity,top_examples)
-          VALUES (%s,%s,%s,NULL,%s,%s)
-          ON CONFLICT (cluster_id) DO UPDATE SET
-            size=EXCLUDED.size,density=EXCLUDED.density,
-            semantic_diversity=EXCLUDED.semantic_diversity,top_examples=EXCLUDED.top_examples,
-            updated_at=now()
-        """,
-            (cl, n, dens, div, top),
-        )
+    ids, labels, matrix = fetch_embeddings(db)
+    edges = fetch_edges(db, ids)
 
-    all_vec = {cid: vec for cid, cl, vec in items}
-
-    # concept metrics
-    for cid, cl, v in items:
-        cluster_ids = [i for i, _ in by_cluster[cl]]
-        out_ids = [i for i in all_vec if i not in cluster_ids][:300]
-        coh = semantic_cohesion(v, [all_vec[i] for i in cluster_ids if i != cid])
-        br = bridge_score(v, [all_vec[i] for i in out_ids])
-        neigh = [all_vec[nid] for nid in adj.get(cid, []) if nid in all_vec]
-        dloc = diversity_local(neigh)
-        db.execute(
-            """
-          INSERT INTO concept_metrics (concept_id,cluster_id,semantic_cohesion,bridge_score,diversity_local)
-          VALUES (%s,%s,%s,%s,%s)
-          ON CONFLICT (concept_id) DO UPDATE SET
-            cluster_id=EXCLUDED.cluster_id, semantic_cohesion=EXCLUDED.semantic_cohesion,
-            bridge_score=EXCLUDED.bridge_score, diversity_local=EXCLUDED.diversity_local,
-            updated_at=now()
-        """,
-            (cid, cl, coh, br, dloc),
-        )
+    metrics = compute_metrics(matrix, labels, edges, topk=TOPK)
+    if ids:
+        write_metrics(db, ids, labels, metrics)
 
-    print(json.dumps({"clusters": len(by_cluster), "concepts": len(items)}, indent=2))
+    print(json.dumps({"clusters": len(metrics.clusters), "concepts": len(ids)}, indent=2))
@@ -8,8 +8,12 @@ Backfill BGE-M3 embeddings for existing concept network nodes.
 
 This script reads existing concepts with Qwen3 embeddings and generates
 corresponding BGE-M3 embeddings, storing them in the embedding_bge_m3 column.
+Runs on the shared backfill engine (src/infra/backfill.py): resumable from the
+last committed id, --limit bounds a run.
 """
 
+import argparse
+import json
 import sys
 from pathlib import Path
 
@@ -19,130 +23,86 @@ project_root = script_dir.parent
 src_path = project_root / "src"
 sys.path.insert(0, str(src_path))
 
-import psycopg  # noqa: E402
-from pgvector.psycopg import register_vector  # noqa: E402
-
+from src.infra.backfill import BackfillJob, copy_rows, format_vector, make_staging, run_backfill  # noqa: E402
 from src.infra.env_loader import ensure_env_loaded  # noqa: E402
 from src.services.lmstudio_client import get_lmstudio_client  # noqa: E402
 
 # Load environment
 ensure_env_loaded()
 
+BGE_MODEL = "text-embedding-bge-m3"
 
-def backfill_bge_embeddings():
-    """Backfill BGE-M3 embeddings for nodes that have Qwen3 embeddings."""
+# Nodes with Qwen3 embeddings but no BGE-M3 embeddings, in high-water (id) order
+SELECT_SQL = """
+    SELECT cn.id, 'Concept_' || cn.id::text, 'hebrew_placeholder', 'reference_placeholder', 1
+    FROM concept_network cn
+    WHERE cn.embedding IS NOT NULL
+    AND cn.embedding_bge_m3 IS NULL
+    AND (%(after)s::uuid IS NULL OR cn.id > %(after)s::uuid)
+    ORDER BY cn.id
+"""
 
-    dsn = get_rw_dsn()
-    if not dsn:
-        raise RuntimeError("GEMATRIA_DSN not set")
+MERGE_SQL = """
+    UPDATE concept_network cn
+    SET embedding_bge_m3 = s.embedding
+    FROM bf_concept_bge s
+    WHERE cn.id = s.id
+"""
 
-    # Use direct psycopg connection like the network aggregator
-    with psycopg.connect(dsn) as conn:
-        register_vector(conn)
-        with conn.cursor() as cur:
-            # Find nodes with Qwen3 embeddings but no BGE-M3 embeddings
-            cur.execute(
-                """
-                SELECT cn.id, 'Concept_' || cn.id::text, 'hebrew_placeholder', 'reference_placeholder', 1
-                FROM concept_network cn
-                WHERE cn.embedding IS NOT NULL
-                AND cn.embedding_bge_m3 IS NULL
-                ORDER BY cn.created_at DESC
-            """
-            )
-            rows = cur.fetchall()
-
-            if not rows:
-                print("No nodes found that need BGE-M3 backfilling.")
-                return
-
-            print(f"Found {len(rows)} nodes to backfill with BGE-M3 embeddings.")
-
-            # Get LM Studio client for BGE-M3 embeddings
-            client = get_lmstudio_client()
-
-            # Process in batches
-            batch_size = 8
-            total_processed = 0
-
-            for i in range(0, len(rows), batch_size):
-                batch = rows[i : i + batch_size]
-                print(f"Processing batch {i // batch_size + 1}/{(len(rows) + batch_size - 1) // batch_size}...")
-
-                # Prepare documents for embedding
-                documents = []
-                network_ids = []
-
-                for row in batch:
-                    (
-                        network_id,
-                        name,
-                        hebrew_text,
-                        primary_verse,
-                        verse_occurrence_count,
-                    ) = row
-
-                    # Build document string (same format as used for Qwen3)
-                    doc = f"""Concept: {name}
+
+def build_document(row) -> str:
+    """Document string (same format as used for Qwen3)."""
+    _network_id, name, hebrew_text, primary_verse, verse_occurrence_count = row
+    return f"""Concept: {name}
 Hebrew: {hebrew_text}
 Reference: {primary_verse}
 Frequency: {verse_occurrence_count} occurrences"""
 
-                    documents.append(doc)
-                    network_ids.append(network_id)
-
-                # Generate BGE-M3 embeddings
-                try:
-                    bge_embeddings = client.get_embeddings(documents, model="text-embedding-bge-m3")
-                    print(f"Generated {len(bge_embeddings)} BGE-M3 embeddings")
-
-                    # Update database
-                    for network_id, bge_embedding in zip(network_ids, bge_embeddings, strict=False):
-                        # BGE embeddings are already lists
-                        embedding_list = bge_embedding
-
-                        cur.execute(
-                            """
-                            UPDATE concept_network
-                            SET embedding_bge_m3 = %s
-                            WHERE id = %s
-                        """,
-                            (embedding_list, network_id),
-                        )
-
-                    total_processed += len(batch)
-                    print(f"Updated {total_processed}/{len(rows)} nodes with BGE-M3 embeddings")
-
-                    # Immediate verification for this batch
-                    cur.execute(
-                        """
-                        SELECT COUNT(*) FROM concept_network
-                        WHERE embedding_bge_m3 IS NOT NULL
-                    """
-                    )
-                    batch_check = cur.fetchone()[0]
-                    print(f"Current BGE embeddings in DB: {batch_check}")
-
-                except Exception as e:
-                    print(f"Error processing batch: {e}")
-                    continue
-
-            print("BGE-M3 backfill completed!")
-            print(f"Total nodes processed: {total_processed}")
-
-            # Final verification
-            cur.execute(
-                """
-                SELECT COUNT(*) FROM concept_network
-                WHERE embedding IS NOT NULL AND embedding_bge_m3 IS NOT NULL
-            """
-            )
-            final_count = cur.fetchone()[0]
-
-            print(f"Nodes with both embeddings: {final_count}")
-
-        # Transaction commits here when connection context exits
+
+def write_batch(cur, rows, embeddings) -> int:
+    """COPY the batch into a staging table and update concept_network from it."""
+    make_staging(cur, "bf_concept_bge", {"id": "uuid", "embedding": "vector"})
+    copy_rows(
+        cur,
+        "bf_concept_bge",
+        ["id", "embedding"],
+        ((row[0], format_vector(emb)) for row, emb in zip(rows, embeddings, strict=True)),
+    )
+    cur.execute(MERGE_SQL)
+    return cur.rowcount
+
+
+def backfill_bge_embeddings(limit: int | None = None, restart: bool = False, batch_size: int = 8) -> dict:
+    """Backfill BGE-M3 embeddings for nodes that have Qwen3 embeddings (resumable)."""
+
+    dsn = get_rw_dsn()
+    if not dsn:
+        raise RuntimeError("GEMATRIA_DSN not set")
+
+    client = get_lmstudio_client()
+    job = BackfillJob(
+        name=f"concept_network.embedding_bge_m3:{BGE_MODEL}",
+        select_sql=SELECT_SQL,
+        document=build_document,
+        embed=lambda docs: client.get_embeddings(docs, model=BGE_MODEL),
+        write=write_batch,
+        batch_size=batch_size,
+    )
+    stats = run_backfill(
+        job,
+        dsn,
+        limit=limit,
+        restart=restart,
+        on_progress=lambda s: print(f"Updated {s.rows} nodes ({s.rows_per_sec:.1f} rows/s)"),
+    )
+    print("BGE-M3 backfill completed!" if stats.complete else "BGE-M3 backfill stopped at --limit; rerun to resume.")
+    return stats.to_dict()
 
 
 if __name__ == "__main__":
-    backfill_bge_embeddings()
+    ap = argparse.ArgumentParser(description="Backfill BGE-M3 embeddings for concept_network")
+    ap.add_argument("--limit", type=int, help="Max rows this run (rerun to resume)")
+    ap.add_argument("--restart", action="store_true", help="Ignore the saved high-water mark")
+    ap.add_argument("--batch", type=int, default=8, help="Embedding batch size")
+    args = ap.parse_args()
+    print(json.dumps(backfill_bge_embeddings(limit=args.limit, restart=args.restart, batch_size=args.batch), indent=2))
@@ -14,6 +14,7 @@ Usage:
       --batch 512
 
 This creates gematria.noun_embeddings table and populates it with vectors.
+Resumable: progress is checkpointed by noun id; --limit bounds a run.
 """
 
 # All imports must be at the very top
@@ -24,8 +25,8 @@ import argparse
 from pathlib import Path
 
 import psycopg
-from pgvector.psycopg import register_vector
 
+from src.infra.backfill import BackfillJob, copy_rows, format_vector, make_staging, run_backfill
 from src.infra.env_loader import ensure_env_loaded
 from src.services.lmstudio_client import get_lmstudio_client
 
@@ -36,6 +37,33 @@ src_path = project_root / "src"
 sys.path.insert(0, str(src_path))
 
 
+def build_document(row) -> str:
+    """Document string for one noun row."""
+    _noun_id, lemma, surface, book, chapter, verse = row
+    return f"Lemma: {lemma} | Surface: {surface} | Reference: {book} {chapter}:{verse}"
+
+
+def write_batch(cur, rows, embeddings, model_name: str) -> int:
+    """COPY the batch into a staging table and upsert it into gematria.noun_embeddings."""
+    make_staging(cur, "bf_noun_embeddings", {"noun_id": "bigint", "embedding": "vector", "model": "text"})
+    copy_rows(
+        cur,
+        "bf_noun_embeddings",
+        ["noun_id", "embedding", "model"],
+        ((row[0], format_vector(emb), model_name) for row, emb in zip(rows, embeddings, strict=True)),
+    )
+    cur.execute(
+        """
+        INSERT INTO gematria.noun_embeddings (noun_id, embedding, model)
+        SELECT noun_id, embedding, model FROM bf_noun_embeddings
+        ON CONFLICT (noun_id) DO UPDATE SET
+            embedding = EXCLUDED.embedding,
+            model = EXCLUDED.model
+        """
+    )
+    return cur.rowcount
+
+
 def backfill_noun_embeddings(
     dsn: str,
     lmstudio_base: str,
@@ -44,8 +72,10 @@ def backfill_noun_embeddings(
     batch_size: int,
     sleep_sec: float,
     where_clause: str = "",
+    limit: int | None = None,
+    restart: bool = False,
 ):
-    """Backfill embeddings for nouns that don't have them yet."""
+    """Backfill embeddings for nouns that don't have them yet (resumable, see src/infra/backfill.py)."""
 
     # Ensure env loaded for LM Studio client
     ensure_env_loaded()
@@ -55,7 +85,6 @@ def backfill_noun_embeddings(
         os.environ["LM_STUDIO_HOST"] = lmstudio_base
 
     with psycopg.connect(dsn) as conn:
-        register_vector(conn)
         with conn.cursor() as cur:
             # Create embeddings table if it doesn't exist
             cur.execute(f"""
@@ -75,103 +104,68 @@ def backfill_noun_embeddings(
                     ON gematria.noun_embeddings USING ivfflat (embedding vector_l2_ops) WITH (lists = 100);
             """)
 
-            # Find nouns without embeddings
-            query = """
-                SELECT n.id, n.lemma, n.surface, n.book, n.chapter, n.verse
-                FROM gematria.nouns n
-                LEFT JOIN gematria.noun_embeddings ne ON n.id = ne.noun_id
-                WHERE ne.noun_id IS NULL
-            """
-            if where_clause:
-                query += f" AND ({where_clause})"
-
-            query += " ORDER BY n.id"
-
-            cur.execute(query)
-            rows = cur.fetchall()
-
-            if not rows:
-                print("No nouns found that need embeddings.")
-                return
-
-            print(f"Found {len(rows)} nouns to embed with model '{model_name}' (dim={dim})")
-
-            # Get LM Studio client
-            client = get_lmstudio_client()
-
-            # Process in batches
-            total_processed = 0
-            total_batches = (len(rows) + batch_size - 1) // batch_size
-
-            for i in range(0, len(rows), batch_size):
-                batch = rows[i : i + batch_size]
-                batch_num = i // batch_size + 1
-                print(f"Processing batch {batch_num}/{total_batches} ({len(batch)} nouns)...")
-
-                # Prepare documents for embedding
-                documents = []
-                noun_ids = []
-
-                for row in batch:
-                    noun_id, lemma, surface, book, chapter, verse = row
-
-                    # Build document string for embedding
-                    doc = f"Lemma: {lemma} | Surface: {surface} | Reference: {book} {chapter}:{verse}"
-                    documents.append(doc)
-                    noun_ids.append(noun_id)
-
-                # Generate embeddings
-                try:
-                    embeddings = client.get_embeddings(documents, model=model_name)
-
-                    if len(embeddings) != len(documents):
-                        print(f"Warning: Got {len(embeddings)} embeddings for {len(documents)} documents")
-                        continue
-
-                    # Store embeddings
-                    for noun_id, embedding in zip(noun_ids, embeddings, strict=True):
-                        # Ensure embedding is a list
-                        if hasattr(embedding, "tolist"):
-                            embedding_list = embedding.tolist()
-                        else:
-                            embedding_list = list(embedding)
-
-                        cur.execute(
-                            """
-                            INSERT INTO gematria.noun_embeddings (noun_id, embedding, model)
-                            VALUES (%s, %s, %s)
-                            ON CONFLICT (noun_id) DO UPDATE SET
-                                embedding = EXCLUDED.embedding,
-                                model = EXCLUDED.model
-                        """,
-                            (noun_id, embedding_list, model_name),
-                        )
-
-                    total_processed += len(batch)
-                    print(f"Stored {len(batch)} embeddings (total: {total_processed}/{len(rows)})")
-
-                    # Optional sleep between batches
-                    if sleep_sec > 0 and batch_num < total_batches:
-                        time.sleep(sleep_sec)
-
-                except Exception as e:
-                    print(f"Error processing batch {batch_num}: {e}")
-                    continue
-
-            print("Embedding backfill completed!")
-            print(f"Total nouns processed: {total_processed}")
-
-            # Final verification
-            cur.execute("""
-                SELECT COUNT(*) FROM gematria.nouns n
-                JOIN gematria.noun_embeddings ne ON n.id = ne.noun_id
-            """)
-            embedded_count = cur.fetchone()[0]
+    # Nouns without an embedding from this model (missing, or from a previous
+    # model), in high-water (id) order
+    query = """
+        SELECT n.id, n.lemma, n.surface, n.book, n.chapter, n.verse
+        FROM gematria.nouns n
+        LEFT JOIN gematria.noun_embeddings ne ON n.id = ne.noun_id
+        WHERE (ne.noun_id IS NULL OR ne.model <> %(model)s)
+          AND (%(after)s::bigint IS NULL OR n.id > %(after)s::bigint)
+    """
+    if where_clause:
+        # Escape literal % (e.g. LIKE patterns) now that the query takes parameters
+        query += " AND ({})".format(where_clause.replace("%", "%%"))
+    query += " ORDER BY n.id"
+
+    # Get LM Studio client
+    client = get_lmstudio_client()
+
+    def embed(documents: list[str]) -> list:
+        embeddings = [
+            e.tolist() if hasattr(e, "tolist") else list(e) for e in client.get_embeddings(documents, model=model_name)
+        ]
+        # Optional sleep between batches
+        if sleep_sec > 0:
+            time.sleep(sleep_sec)
+        return embeddings
+
+    print(f"Embedding nouns with model '{model_name}' (dim={dim}, batch={batch_size})")
+    job = BackfillJob(
+        name=f"gematria.noun_embeddings:{model_name}",
+        select_sql=query,
+        params={"model": model_name},
+        document=build_document,
+        embed=embed,
+        write=lambda cur, rows, embeddings: write_batch(cur, rows, embeddings, model_name),
+        batch_size=batch_size,
+    )
+    stats = run_backfill(
+        job,
+        dsn,
+        limit=limit,
+        restart=restart,
+        on_progress=lambda s: print(f"Stored {s.rows} embeddings ({s.rows_per_sec:.1f} rows/s)"),
+    )
+
+    print(
+        "Embedding backfill completed!" if stats.complete else "Embedding backfill stopped at --limit; rerun to resume."
+    )
+    print(f"Total nouns processed: {stats.rows} ({stats.rows_per_sec:.1f} rows/s)")
+
+    # Final verification
+    with psycopg.connect(dsn) as conn, conn.cursor() as cur:
+        cur.execute("""
+            SELECT COUNT(*) FROM gematria.nouns n
+            JOIN gematria.noun_embeddings ne ON n.id = ne.noun_id
+        """)
+        embedded_count = cur.fetchone()[0]
 
-            cur.execute("SELECT COUNT(*) FROM gematria.nouns")
-            total_nouns = cur.fetchone()[0]
+        cur.execute("SELECT COUNT(*) FROM gematria.nouns")
+        total_nouns = cur.fetchone()[0]
 
-            print(f"Nouns with embeddings: {embedded_count}/{total_nouns}")
+    print(f"Nouns with embeddings: {embedded_count}/{total_nouns}")
+    return stats.to_dict()
 
 
 def main():
@@ -183,6 +177,8 @@ def main():
     ap.add_argument("--batch", type=int, default=512, help="Batch size")
     ap.add_argument("--sleep", type=float, default=0.0, help="Sleep seconds between batches")
     ap.add_argument("--where", default="", help="Additional WHERE clause for noun selection")
+    ap.add_argument("--limit", type=int, help="Max nouns this run (rerun to resume)")
+    ap.add_argument("--restart", action="store_true", help="Ignore the saved high-water mark")
     args = ap.parse_args()
 
     backfill_noun_embeddings(
@@ -193,6 +189,8 @@ def main():
         batch_size=args.batch,
         sleep_sec=args.sleep,
         where_clause=args.where,
+        limit=args.limit,
+        restart=args.restart,
     )
 
 
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Recall-vs-latency benchmark for the local ANN index (src/infra/ann_index.py).
+
+Compares each backend (flat, ivf at several nprobe settings) against the exact
+pgvector path used by network_aggregator._get_knn_neighbors. Without a database
+(--synthetic N), the exact FlatIndex is the reference instead.
+
+Usage:
+    python scripts/bench_ann_index.py --queries 200 --k 20
+    python scripts/bench_ann_index.py --synthetic 20000 --dim 1024 --out evidence/ann_bench.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from src.infra.ann_index import FlatIndex, IVFIndex, recall_at_k  # noqa: E402
+
+PGVECTOR_KNN_SQL = """
+SELECT id, 1 - (embedding <=> (SELECT embedding FROM concept_network WHERE id = %s)) AS cosine
+FROM concept_network
+WHERE id != %s
+ORDER BY embedding <=> (SELECT embedding FROM concept_network WHERE id = %s)
+LIMIT %s
+"""
+
+
+def _timed(fn):
+    t0 = time.perf_counter()
+    out = fn()
+    return out, (time.perf_counter() - t0) * 1000.0
+
+
+def _pgvector_reference(query_ids: list[str], k: int) -> tuple[list, float]:
+    """Exact neighbours via one pgvector query per concept (the production path)."""
+    import psycopg
+
+    from scripts.config.env import get_rw_dsn
+
+    exact = []
+    t0 = time.perf_counter()
+    with psycopg.connect(get_rw_dsn()) as conn, conn.cursor() as cur:
+        for qid in query_ids:
+            cur.execute(PGVECTOR_KNN_SQL, (qid, qid, qid, k))
+            exact.append([(str(r[0]), float(r[1])) for r in cur.fetchall()])
+    return exact, (time.perf_counter() - t0) * 1000.0
+
+
+def _load_concepts() -> tuple[list[str], np.ndarray]:
+    from src.graph.correlation_engine import load_concept_embeddings
+    from src.infra.db import get_gematria_rw
+
+    return load_concept_embeddings(get_gematria_rw(), id_column="id")
+
+
+def run(args) -> dict:
+    rng = np.random.default_rng(args.seed)
+    if args.synthetic:
+        # Clustered synthetic data so IVF behaves like it does on real embeddings
+        centers = rng.normal(size=(max(1, args.synthetic // 100), args.dim)).astype(np.float32)
+        X = centers[rng.integers(0, len(centers), args.synthetic)]
+        X += 0.3 * rng.normal(size=X.shape).astype(np.float32)
+        ids = [f"c{i}" for i in range(args.synthetic)]
+    else:
+        ids, X = _load_concepts()
+    if len(ids) < 2:
+        return {"ok": False, "error": "not enough embeddings to benchmark"}
+
+    query_ids = [ids[i] for i in rng.choice(len(ids), size=min(args.queries, len(ids)), replace=False)]
+    report = {"ok": True, "rows": len(ids), "dim": int(X.shape[1]), "queries": len(query_ids), "k": args.k, "runs": []}
+
+    flat = FlatIndex()
+    _, build_ms = _timed(lambda: flat.upsert(ids, X))
+    flat_hits, flat_ms = _timed(lambda: flat.search_ids(query_ids, args.k))
+    if args.synthetic:
+        exact, exact_ms, reference = flat_hits, flat_ms, "flat"
+    else:
+        exact, exact_ms = _pgvector_reference(query_ids, args.k)
+        reference = "pgvector"
+    report["reference"] = {"backend": reference, "total_ms": round(exact_ms, 2)}
+    report["runs"].append(
+        {
+            "backend": "flat",
+            "build_ms": round(build_ms, 2),
+            "total_ms": round(flat_ms, 2),
+            "per_query_ms": round(flat_ms / len(query_ids), 4),
+            "recall": round(recall_at_k(flat_hits, exact), 4),
+        }
+    )
+
+    ivf = IVFIndex(nlist=args.nlist or None)
+    _, build_ms = _timed(lambda: ivf.upsert(ids, X))
+    for nprobe in args.nprobe:
+        ivf.nprobe = nprobe
+        hits, ms = _timed(lambda: ivf.search_ids(query_ids, args.k))
+        report["runs"].append(
+            {
+                "backend": "ivf",
+                "nlist": int(ivf._centroids.shape[0]),
+                "nprobe": nprobe,
+                "build_ms": round(build_ms, 2),
+                "total_ms": round(ms, 2),
+                "per_query_ms": round(ms / len(query_ids), 4),
+                "recall": round(recall_at_k(hits, exact), 4),
+            }
+        )
+    return report
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Benchmark local ANN index recall/latency vs exact pgvector KNN")
+    ap.add_argument("--queries", type=int, default=200, help="Number of sampled query concepts")
+    ap.add_argument("--k", type=int, default=20, help="Neighbours per query (NN_TOPK)")
+    ap.add_argument("--nlist", type=int, default=0, help="IVF lists (0 = sqrt(n))")
+    ap.add_argument("--nprobe", type=int, nargs="+", default=[1, 4, 8, 16, 32])
+    ap.add_argument("--synthetic", type=int, default=0, help="Use N synthetic vectors instead of the DB")
+    ap.add_argument("--dim", type=int, default=1024, help="Synthetic vector dimension")
+    ap.add_argument("--seed", type=int, default=42)
+    ap.add_argument("--out", type=Path, default=None, help="Optional JSON output path")
+    args = ap.parse_args()
+
+    report = run(args)
+    text = json.dumps(report, indent=2)
+    if args.out:
+        args.out.parent.mkdir(parents=True, exist_ok=True)
+        args.out.write_text(text + "\n", encoding="utf-8")
+    print(text)
+    return 0 if report.get("ok") else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Mixed-traffic latency benchmark for the API server (src/services/api_server.py).
+
+Fires a weighted mix of requests at fixed concurrency and reports p50/p95/p99
+latency per route. Slow DB/LM routes should not drag the p99 of cheap routes
+(e.g. /health) up with them; if they do, something is blocking the event loop.
+Runs in-process against the ASGI app by default, or against a live server
+with --url.
+
+Usage:
+    python scripts/bench_api_latency.py --requests 500 --concurrency 32
+    python scripts/bench_api_latency.py --url http://127.0.0.1:8000 \\
+        --mix "/health=4,/api/status/system=1,/api/bible/passage?reference=John%203:16=2"
+    python scripts/bench_api_latency.py --out evidence/api_latency.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+import httpx
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+DEFAULT_MIX = (
+    "/health=4,"
+    "/api/status/system=1,"
+    "/api/bible/passage?reference=John%203:16=1,"
+    "/api/mcp/tools/search?limit=5=1,"
+    "/api/docs/search?q=governance&k=5=1"
+)
+
+
+def parse_mix(spec: str) -> list[tuple[str, int]]:
+    """'path=weight,...' -> [(path, weight)]; the weight follows the last '='."""
+    mix = []
+    for item in spec.split(","):
+        path, _, weight = item.strip().rpartition("=")
+        if path:
+            mix.append((path, max(1, int(weight))))
+    return mix
+
+
+def percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    idx = min(len(ordered) - 1, max(0, round(pct / 100.0 * len(ordered)) - 1))
+    return ordered[idx]
+
+
+async def run_load(
+    client: httpx.AsyncClient, mix: list[tuple[str, int]], requests: int, concurrency: int, seed: int
+) -> dict[str, list[tuple[float, int]]]:
+    rng = random.Random(seed)
+    paths = rng.choices([p for p, _ in mix], weights=[w for _, w in mix], k=requests)
+    samples: dict[str, list[tuple[float, int]]] = {p: [] for p, _ in mix}
+    queue: asyncio.Queue[str] = asyncio.Queue()
+    for path in paths:
+        queue.put_nowait(path)
+
+    async def worker() -> None:
+        while not queue.empty():
+            path = queue.get_nowait()
+            t0 = time.perf_counter()
+            try:
+                status = (await client.get(path)).status_code
+            except httpx.HTTPError:
+                status = 0
+            samples[path].append(((time.perf_counter() - t0) * 1000.0, status))
+
+    await asyncio.gather(*(worker() for _ in range(max(1, concurrency))))
+    return samples
+
+
+def summarize(samples: dict[str, list[tuple[float, int]]]) -> dict[str, dict]:
+    report = {}
+    everything = []
+    for path, rows in samples.items():
+        latencies = [ms for ms, _ in rows]
+        everything.extend(latencies)
+        report[path] = {
+            "count": len(rows),
+            "errors": sum(1 for _, status in rows if status == 0 or status >= 500),
+            "p50_ms": round(percentile(latencies, 50), 2),
+            "p95_ms": round(percentile(latencies, 95), 2),
+            "p99_ms": round(percentile(latencies, 99), 2),
+            "max_ms": round(max(latencies, default=0.0), 2),
+        }
+    report["ALL"] = {
+        "count": len(everything),
+        "p50_ms": round(percentile(everything, 50), 2),
+        "p95_ms": round(percentile(everything, 95), 2),
+        "p99_ms": round(percentile(everything, 99), 2),
+    }
+    return report
+
+
+async def _main(args: argparse.Namespace) -> dict:
+    mix = parse_mix(args.mix)
+    if args.url:
+        client = httpx.AsyncClient(base_url=args.url, timeout=args.timeout)
+    else:
+        from src.services.api_server import app
+
+        client = httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://bench", timeout=args.timeout
+        )
+    async with client:
+        t0 = time.perf_counter()
+        samples = await run_load(client, mix, args.requests, args.concurrency, args.seed)
+        elapsed = time.perf_counter() - t0
+    return {
+        "target": args.url or "in-process",
+        "requests": args.requests,
+        "concurrency": args.concurrency,
+        "elapsed_s": round(elapsed, 3),
+        "throughput_rps": round(args.requests / elapsed, 1) if elapsed else 0.0,
+        "routes": summarize(samples),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", help="Base URL of a running server (default: in-process ASGI app)")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help="Weighted routes: 'path=weight,...'")
+    parser.add_argument("--requests", type=int, default=300)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", type=Path, help="Write the JSON report here")
+    args = parser.parse_args()
+
+    report = asyncio.run(_main(args))
+    print(f"{'route':60} {'n':>5} {'err':>4} {'p50':>9} {'p95':>9} {'p99':>9}")
+    for path, row in report["routes"].items():
+        print(
+            f"{path[:60]:60} {row['count']:5d} {row.get('errors', 0):4d} "
+            f"{row['p50_ms']:9.1f} {row['p95_ms']:9.1f} {row['p99_ms']:9.1f}"
+        )
+    print(f"throughput: {report['throughput_rps']} req/s over {report['elapsed_s']}s")
+    if args.out:
+        args.out.parent.mkdir(parents=True, exist_ok=True)
+        args.out.write_text(json.dumps(report, indent=2) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
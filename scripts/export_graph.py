@@ -15,6 +15,7 @@ import pathlib
 import sys
 from datetime import datetime, UTC
 
+from src.graph.correlation_engine import load_concept_embeddings, topk_correlations
 from src.infra.db import get_gematria_rw
 from src.infra.env_loader import ensure_env_loaded
 from src.infra.structured_logger import get_logger, log_json
@@ -39,8 +40,8 @@ def _load_correlation_weights(db) -> dict:
     """
     correlations_path = os.path.join("exports", "graph_correlations.json")
     if not os.path.exists(correlations_path):
-        LOG.warning(f"Correlation file not found: {correlations_path}")
-        return {}
+        LOG.warning(f"Correlation file not found: {correlations_path}, computing from embeddings")
+        return _compute_correlation_weights(db)
 
     try:
         with open(correlations_path, encoding="utf-8") as f:
@@ -102,6 +103,40 @@ def _load_correlation_weights(db) -> dict:
         return {}
 
 
+def _compute_correlation_weights(db) -> dict:
+    """
+    Compute correlation weights directly from concept_network embeddings.
+
+    Uses the streaming top-K correlation engine keyed by concept_network.id, so
+    no concept_id->network_id mapping is needed and the n x n matrix is never built.
+
+    Returns:
+        Dict mapping (source_network_id, target_network_id) tuple to correlation value.
+    """
+    try:
+        network_ids, embeddings = load_concept_embeddings(db, id_column="id")
+        if len(network_ids) < 2:
+            return {}
+
+        src_idx, tgt_idx, values = topk_correlations(
+            embeddings,
+            top_k=int(os.getenv("CORR_MAX_PAIRS", "10000")),
+            per_row_k=int(os.getenv("CORR_PER_ROW_K", "0")) or None,
+        )
+
+        lookup = {}
+        for src, tgt, correlation in zip(src_idx.tolist(), tgt_idx.tolist(), values.tolist()):
+            lookup[(network_ids[src], network_ids[tgt])] = correlation
+            lookup[(network_ids[tgt], network_ids[src])] = correlation
+
+        LOG.info(f"Computed {len(src_idx)} correlations from embeddings, {len(lookup)} lookup entries")
+        return lookup
+
+    except Exception as e:
+        LOG.warning(f"Failed to compute correlations from embeddings: {e}")
+        return {}
+
+
 def _node_payload(noun: dict) -> dict:
     out = {
         "id": noun["noun_id"],
@@ -21,6 +21,11 @@ try:
     HAS_PANDAS = True
 except ImportError:
     HAS_PANDAS = False
+from src.graph.correlation_engine import (
+    correlation_significance,
+    load_concept_embeddings,
+    topk_correlations,
+)
 from src.graph.patterns import build_graph, compute_patterns
 from src.infra.db import get_gematria_rw
 from src.infra.env_loader import ensure_env_loaded
@@ -204,32 +209,31 @@ def calculate_graph_stats(db):
     )
     if use_fallback:
         try:
-            import networkx as nx  # noqa: E402
+            from src.graph import csr  # noqa: E402
 
             # consider "cosine" as edge weight if present
             rows = list(db.execute("SELECT source_id, target_id, COALESCE(cosine, 0.0) FROM concept_relations"))  # noqa: E501
             if rows:
-                G = nx.Graph()
-                for s, t, w in rows:
-                    G.add_edge(s, t, weight=float(w))
+                sources, targets, weights = zip(*rows, strict=True)
+                G = csr.CSRGraph.from_edges(sources, targets, (float(w) for w in weights))
                 # Degree centrality (normalized to 0-1)
-                degrees = dict(G.degree())
-                max_possible_degree = len(G.nodes()) - 1
-                degree_centrality = (
-                    {n: d / max_possible_degree for n, d in degrees.items()} if max_possible_degree > 0 else {}  # noqa: E501
-                )
+                degree_centrality = csr.degree_centrality(G) if len(G) > 1 else {}
 
                 # Betweenness (weighted by inverse similarity to prefer stronger ties)
-                inv_weights = {
-                    (u, v): (1.0 - max(0.0, min(1.0, d.get("weight", 0.0)))) + 1e-6
-                    for u, v, d in G.edges(data=True)  # noqa: E501
-                }
-                nx.set_edge_attributes(G, inv_weights, name="invw")
-                bet = nx.betweenness_centrality(G, weight="invw", normalized=True) if G.number_of_edges() else {}
+                bet = (
+                    csr.betweenness_centrality(
+                        G,
+                        length=lambda w: (1.0 - np.clip(w, 0.0, 1.0)) + 1e-6,
+                        normalized=True,
+                        **csr.betweenness_sampling(len(G)),
+                    )
+                    if G.number_of_edges
+                    else {}
+                )
 
                 # Eigenvector centrality (use weight, already normalized)
                 try:
-                    eig = nx.eigenvector_centrality_numpy(G, weight="weight") if G.number_of_edges() else {}
+                    eig = csr.eigenvector_centrality(G) if G.number_of_edges else {}
                 except Exception:
                     eig = {}
 
@@ -248,15 +252,15 @@ def calculate_graph_stats(db):
                     LOG,
                     20,
                     "centrality_fallback_networkx_applied",
-                    node_count=G.number_of_nodes(),
-                    edge_count=G.number_of_edges(),
+                    node_count=len(G),
+                    edge_count=G.number_of_edges,
                 )
         except ImportError:
             log_json(
                 LOG,
                 20,
                 "centrality_fallback_networkx_skipped",
-                reason="networkx_not_installed",
+                reason="scipy_not_installed",
             )
 
     # Edge strength distribution
@@ -408,150 +412,43 @@ def export_correlations(db):
 
 
 def _compute_correlations_python(db):
-    """GPU-accelerated correlation computation using PyTorch, falls back to CPU if needed."""
-    try:
-        import torch  # noqa: E402
-        import numpy as np  # noqa: E402
-    except ImportError:
-        LOG.error("torch/numpy not available for correlation computation")
-        return []
-
+    """Blocked top-K Pearson correlations over concept embeddings (never materializes n x n)."""
     try:
-        # Get concept embeddings from database
-        concept_data = list(
-            db.execute(
-                """
-            SELECT cn.concept_id, cn.embedding, NULL::int as cluster_id, cn.concept_id::text as name
-            FROM concept_network cn
-            WHERE cn.embedding IS NOT NULL
-            ORDER BY cn.concept_id
-        """
-            )
-        )
-
-        if len(concept_data) < 2:
-            LOG.warning("Insufficient concept data for correlation analysis")
-            return []
-
-        # Convert embeddings to numpy arrays
-        concept_ids = []
-        embeddings_list = []
-        cluster_ids = []
-
-        for row in concept_data:
-            try:
-                embedding_raw = row[1]  # row[1] is embedding
-
-                # Handle pgvector type - may come as string or array
-                if isinstance(embedding_raw, str):
-                    # Parse string representation: "[0.1, 0.2, ...]"
-                    embedding = np.fromstring(embedding_raw.strip("[]"), sep=",")
-                elif hasattr(embedding_raw, "__iter__"):
-                    # Already an array-like object
-                    embedding = np.array(embedding_raw)
-                else:
-                    LOG.warning(f"Unknown embedding type for concept {row[0]}: {type(embedding_raw)}")
-                    continue
-
-                # Validate embedding shape
-                if embedding.ndim != 1 or len(embedding) == 0:
-                    LOG.warning(f"Invalid embedding shape for concept {row[0]}: {embedding.shape}")
-                    continue
+        concept_ids, embeddings_matrix = load_concept_embeddings(db)
 
-                concept_ids.append(str(row[0]))
-                embeddings_list.append(embedding)
-                cluster_ids.append(row[2])
-            except Exception as e:
-                LOG.warning(f"Skipping concept {row[0]} due to embedding parsing error: {e}")
-                continue
-
-        if len(embeddings_list) < 2:
+        if len(concept_ids) < 2:
             LOG.warning("Insufficient valid embeddings for correlation analysis")
             return []
 
-        # Stack embeddings into matrix: (n_concepts, embedding_dim)
-        embeddings_matrix = np.stack(embeddings_list)
         n_concepts, embedding_dim = embeddings_matrix.shape
+        max_correlations = int(os.getenv("CORR_MAX_PAIRS", "10000"))
+        per_row_k = int(os.getenv("CORR_PER_ROW_K", "0")) or None
 
         LOG.info(f"Computing correlations for {n_concepts} concepts with {embedding_dim}-D embeddings")
 
-        # Determine device (GPU if available, else CPU)
-        use_gpu = torch.cuda.is_available()
-        device = torch.device("cuda" if use_gpu else "cpu")
-        LOG.info(f"Using device: {device}")
-
-        # Convert to PyTorch tensor and move to device
-        embeddings_tensor = torch.from_numpy(embeddings_matrix).float().to(device)
-
-        # Center the embeddings (subtract mean along embedding dimension)
-        embeddings_centered = embeddings_tensor - embeddings_tensor.mean(dim=1, keepdim=True)
-
-        # Compute standard deviation along embedding dimension
-        std = embeddings_centered.std(dim=1, keepdim=True)
-        std = torch.clamp(std, min=1e-8)  # Avoid division by zero
-
-        # Normalize embeddings (z-score normalization)
-        embeddings_normalized = embeddings_centered / std
-
-        # Compute correlation matrix using matrix multiplication
-        # Correlation = normalized_X @ normalized_X.T / (n_features - 1)
-        # But since we normalized, we can compute directly
-        correlation_matrix = embeddings_normalized @ embeddings_normalized.T / (embedding_dim - 1)
-
-        # Clamp correlation values to valid range [-1, 1]
-        correlation_matrix = torch.clamp(correlation_matrix, min=-1.0, max=1.0)
-
-        # Extract upper triangle (avoid duplicates and self-correlations)
-        # Create mask for upper triangle
-        n = correlation_matrix.shape[0]
-        mask = torch.triu(torch.ones(n, n, device=device), diagonal=1).bool()
-        correlations_flat = correlation_matrix[mask].cpu().numpy()
-
-        # Get indices for source/target pairs
-        source_indices, target_indices = torch.where(mask)
-        source_indices = source_indices.cpu().numpy()
-        target_indices = target_indices.cpu().numpy()
+        src_idx, tgt_idx, values = topk_correlations(
+            embeddings_matrix,
+            top_k=max_correlations,
+            per_row_k=per_row_k,
+        )
 
-        # Build correlation records
+        # Build records only for the surviving pairs (already sorted by |r| desc)
         correlations = []
-        for i, (src_idx, tgt_idx) in enumerate(zip(source_indices, target_indices)):
-            corr_value = float(correlations_flat[i])
-
-            # Skip if correlation is NaN or invalid
-            if not np.isfinite(corr_value):
-                continue
-
-            # Compute p-value approximation (for large n, use t-test)
-            # Simplified p-value based on correlation strength
-            abs_corr = abs(corr_value)
-            if abs_corr > 0.5:
-                p_value = 0.01
-            elif abs_corr > 0.3:
-                p_value = 0.05
-            else:
-                p_value = 0.1
-
-            corr_record = {
-                "source": concept_ids[src_idx],
-                "target": concept_ids[tgt_idx],
-                "correlation": corr_value,
-                "p_value": p_value,
-                "metric": "gpu_pearson" if use_gpu else "cpu_pearson",
-                "cluster_source": cluster_ids[src_idx],
-                "cluster_target": cluster_ids[tgt_idx],
-                "sample_size": embedding_dim,
-            }
-
-            correlations.append(corr_record)
-
-        # Sort by absolute correlation strength
-        correlations.sort(key=lambda x: abs(x["correlation"]), reverse=True)
-
-        # Limit to top correlations for output size
-        max_correlations = 10000  # Increased from 500 for GPU-accelerated version
-        correlations = correlations[:max_correlations]
+        for src, tgt, corr_value in zip(src_idx.tolist(), tgt_idx.tolist(), values.tolist()):
+            correlations.append(
+                {
+                    "source": concept_ids[src],
+                    "target": concept_ids[tgt],
+                    "correlation": corr_value,
+                    "p_value": correlation_significance(corr_value),
+                    "metric": "cpu_pearson",
+                    "cluster_source": None,
+                    "cluster_target": None,
+                    "sample_size": embedding_dim,
+                }
+            )
 
-        LOG.info(f"Computed {len(correlations)} correlations using {'GPU' if use_gpu else 'CPU'}")
+        LOG.info(f"Computed {len(correlations)} correlations with blocked top-K engine")
         return correlations
 
     except Exception as e:
@@ -36,7 +36,8 @@ from sqlalchemy import text
 
 from pmagent.adapters import lm_studio
 from pmagent.db.loader import get_control_engine
-from scripts.config.env import get_retrieval_lane_models
+from scripts.config.env import get_retrieval_lane_models, get_rw_dsn
+from src.infra.backfill import BackfillJob, copy_rows, format_vector, make_staging, run_backfill
 
 
 REPO_ROOT = Path(__file__).resolve().parents[2]
@@ -57,18 +58,8 @@ def get_embedding_model(model_name: str | None = None) -> str:
     return model
 
 
-def get_fragments_needing_embeddings(
-    conn,
-    model_name: str,
-    only_agents: bool = True,
-    all_docs: bool = False,
-    limit: int | None = None,
-) -> List[dict]:
-    """
-    Query fragments that don't have embeddings for the target model.
-
-    Returns list of dicts with: fragment_id, doc_id, content, fragment_index.
-    """
+def fragment_scope_sql(only_agents: bool = True, all_docs: bool = False) -> str:
+    """SQL condition on doc_registry (dr) selecting which docs to embed."""
     # Build WHERE clause for Tier-0 docs
     where_clauses = []
     if all_docs:
@@ -88,7 +79,22 @@ def get_fragments_needing_embeddings(
             """
         )
 
-    where_sql = " AND ".join(where_clauses)
+    return " AND ".join(where_clauses)
+
+
+def get_fragments_needing_embeddings(
+    conn,
+    model_name: str,
+    only_agents: bool = True,
+    all_docs: bool = False,
+    limit: int | None = None,
+) -> List[dict]:
+    """
+    Query fragments that don't have embeddings for the target model.
+
+    Returns list of dicts with: fragment_id, doc_id, content, fragment_index.
+    """
+    where_sql = fragment_scope_sql(only_agents, all_docs)
 
     limit_sql = ""
     if limit:
@@ -254,6 +260,53 @@ def store_embeddings(
     return inserted
 
 
+BACKFILL_SELECT_SQL = """
+    SELECT df.id, df.doc_id, df.content
+    FROM control.doc_fragment df
+    INNER JOIN control.doc_registry dr ON df.doc_id = dr.doc_id
+    WHERE NOT EXISTS (
+            SELECT 1 FROM control.doc_embedding de
+            WHERE de.fragment_id = df.id AND de.model_name = %(model_name)s
+          )
+      AND df.content IS NOT NULL
+      AND df.content != ''
+      AND {scope}
+      AND (%(after)s::uuid IS NULL OR df.id > %(after)s::uuid)
+    ORDER BY df.id
+"""
+
+
+def embed_texts(texts: List[str]) -> List[list]:
+    """Embed one batch with the embedding slot, enforcing the canonical 1024-D format."""
+    embeddings = lm_studio.embed(texts, model_slot="embedding")
+    if embeddings and len(embeddings[0]) != 1024:
+        raise RuntimeError(
+            f"Critical violation: Embedding dimension is {len(embeddings[0])}, expected 1024. "
+            f"Legacy 768-D embeddings are not allowed. "
+            f"Please use a model that produces 1024-dimensional embeddings."
+        )
+    return embeddings
+
+
+def write_embeddings(cur, rows, embeddings, model_name: str) -> int:
+    """COPY a batch into a staging table and insert it into control.doc_embedding."""
+    make_staging(cur, "bf_doc_embedding", {"fragment_id": "uuid", "model_name": "text", "embedding": "vector"})
+    copy_rows(
+        cur,
+        "bf_doc_embedding",
+        ["fragment_id", "model_name", "embedding"],
+        ((row[0], model_name, format_vector(emb)) for row, emb in zip(rows, embeddings, strict=True)),
+    )
+    cur.execute(
+        """
+        INSERT INTO control.doc_embedding (fragment_id, model_name, embedding)
+        SELECT fragment_id, model_name, embedding FROM bf_doc_embedding
+        ON CONFLICT (fragment_id, model_name) DO NOTHING
+        """
+    )
+    return cur.rowcount
+
+
 def ingest_embeddings(
     dry_run: bool = False,
     only_agents: bool = True,
@@ -263,10 +316,17 @@ def ingest_embeddings(
     embedding_batch_size: int = DEFAULT_EMBEDDING_BATCH_SIZE,
     db_batch_size: int = DEFAULT_DB_BATCH_SIZE,
     show_progress: bool = True,
+    restart: bool = False,
 ) -> dict:
     """
     Main ingestion function.
 
+    Real runs go through the shared backfill engine (src/infra/backfill.py):
+    fragments are streamed, embedded in concurrent batches and COPY-written,
+    with progress checkpointed per model so an interrupted run resumes.
+    db_batch_size only applies to store_embeddings(); the engine writes one
+    COPY per embedding batch.
+
     Returns dict with stats: docs_processed, fragments_embedded, model_name, dry_run.
     """
     try:
@@ -291,72 +351,70 @@ def ingest_embeddings(
             "dry_run": dry_run,
         }
 
-    with engine.connect() as conn:
-        # Get fragments needing embeddings
-        fragments = get_fragments_needing_embeddings(conn, model, only_agents, all_docs, limit)
-
-        if not fragments:
-            if show_progress:
-                print("[INFO] No fragments need embeddings", file=sys.stderr)
-            return {
-                "docs_processed": 0,
-                "fragments_embedded": 0,
-                "model_name": model,
-                "dry_run": dry_run,
-                "message": "No fragments need embeddings",
-            }
-
-        # Group by doc for stats
+    if dry_run:
+        with engine.connect() as conn:
+            fragments = get_fragments_needing_embeddings(conn, model, only_agents, all_docs, limit)
         docs_processed = len(set(f["doc_id"] for f in fragments))
-        total_fragments = len(fragments)
-
         if show_progress:
-            print(
-                f"[INFO] Processing {total_fragments:,} fragments from {docs_processed} docs "
-                f"(embedding batch: {embedding_batch_size}, DB batch: {db_batch_size})",
-                file=sys.stderr,
-            )
+            print(f"[INFO] Would embed {len(fragments):,} fragments from {docs_processed} docs", file=sys.stderr)
+        return {
+            "docs_processed": docs_processed,
+            "fragments_embedded": len(fragments),
+            "model_name": model,
+            "dry_run": dry_run,
+        }
 
-        start_time = time.time()
+    doc_ids: set[str] = set()
 
-        # Generate embeddings
-        try:
-            embedded_data = embed_fragments(fragments, model, dry_run, embedding_batch_size, show_progress)
-            if show_progress:
-                elapsed = time.time() - start_time
-                print(
-                    f"[INFO] Generated {len(embedded_data):,} embeddings in {elapsed:.1f}s "
-                    f"({len(embedded_data) / elapsed:.1f} embeddings/s)",
-                    file=sys.stderr,
-                )
-        except RuntimeError as e:
-            return {
-                "error": str(e),
-                "docs_processed": docs_processed,
-                "fragments_embedded": 0,
-                "model_name": model,
-                "dry_run": dry_run,
-            }
-
-        # Store embeddings
-        store_start = time.time()
-        inserted = store_embeddings(conn, embedded_data, model, dry_run, db_batch_size)
+    def write(cur, rows, embeddings) -> int:
+        doc_ids.update(str(row[1]) for row in rows)
+        return write_embeddings(cur, rows, embeddings, model)
+
+    def progress(stats) -> None:
         if show_progress:
-            store_elapsed = time.time() - store_start
-            total_elapsed = time.time() - start_time
             print(
-                f"[INFO] Stored {inserted:,} embeddings in {store_elapsed:.1f}s "
-                f"({inserted / store_elapsed:.1f} inserts/s) | Total: {total_elapsed:.1f}s",
-                file=sys.stderr,
+                f"[PROGRESS] {stats.rows:,} fragments | Rate: {stats.rows_per_sec:.1f}/s", file=sys.stderr, flush=True
             )
 
+    job = BackfillJob(
+        name=f"control.doc_embedding:{model}:{'all' if all_docs else 'agents' if only_agents else 'tier0'}",
+        select_sql=BACKFILL_SELECT_SQL.format(scope=fragment_scope_sql(only_agents, all_docs).replace("%", "%%")),
+        params={"model_name": model},
+        document=lambda row: row[2],
+        embed=embed_texts,
+        write=write,
+        batch_size=embedding_batch_size,
+    )
+    try:
+        stats = run_backfill(job, get_rw_dsn(), limit=limit, restart=restart, on_progress=progress)
+    except Exception as e:
         return {
-            "docs_processed": docs_processed,
-            "fragments_embedded": inserted,
+            "error": str(e),
+            "docs_processed": len(doc_ids),
+            "fragments_embedded": 0,
             "model_name": model,
             "dry_run": dry_run,
         }
 
+    if show_progress:
+        print(
+            f"[INFO] Embedded {stats.rows:,} fragments from {len(doc_ids)} docs in {stats.elapsed_s:.1f}s "
+            f"({stats.rows_per_sec:.1f} fragments/s)",
+            file=sys.stderr,
+        )
+
+    result = {
+        "docs_processed": len(doc_ids),
+        "fragments_embedded": stats.written,
+        "model_name": model,
+        "dry_run": dry_run,
+        "rows_per_sec": round(stats.rows_per_sec, 1),
+        "complete": stats.complete,
+    }
+    if not stats.rows:
+        result["message"] = "No fragments need embeddings"
+    return result
+
 
 def main() -> int:
     """CLI entry point."""
@@ -404,6 +462,11 @@ def main() -> int:
         default=DEFAULT_DB_BATCH_SIZE,
         help=f"Batch size for DB inserts (default: {DEFAULT_DB_BATCH_SIZE})",
     )
+    parser.add_argument(
+        "--restart",
+        action="store_true",
+        help="Ignore the saved progress checkpoint and start from the first fragment",
+    )
     parser.add_argument(
         "--no-progress",
         action="store_true",
@@ -423,6 +486,7 @@ def main() -> int:
         embedding_batch_size=args.embedding_batch_size,
         db_batch_size=args.db_batch_size,
         show_progress=not args.no_progress,
+        restart=args.restart,
     )
 
     print(json.dumps(result, indent=2))
@@ -11,6 +11,7 @@ import psycopg
 # Add src to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
 
+from src.core.hebrew_utils import calculate_gematria
 from src.infra.env_loader import ensure_env_loaded
 from src.infra.db_utils import get_connection_dsn
 from scripts.config.env import get_bible_db_dsn
@@ -18,40 +19,6 @@ from scripts.config.env import get_bible_db_dsn
 ensure_env_loaded()
 
 
-def calculate_gematria(word):
-    """Simple standard gematria calculation."""
-    gematria_map = {
-        "א": 1,
-        "ב": 2,
-        "ג": 3,
-        "ד": 4,
-        "ה": 5,
-        "ו": 6,  # noqa: RUF001
-        "ז": 7,
-        "ח": 8,
-        "ט": 9,  # noqa: RUF001
-        "י": 10,  # noqa: RUF001
-        "כ": 20,
-        "ך": 20,
-        "ל": 30,
-        "מ": 40,
-        "ם": 40,
-        "נ": 50,
-        "ן": 50,  # noqa: RUF001
-        "ס": 60,  # noqa: RUF001
-        "ע": 70,
-        "פ": 80,
-        "ף": 80,
-        "צ": 90,
-        "ץ": 90,
-        "ק": 100,
-        "ר": 200,
-        "ש": 300,
-        "ת": 400,
-    }
-    return sum(gematria_map.get(char, 0) for char in word)
-
-
 def ingest_nouns():
     bible_dsn = get_bible_db_dsn()
     gematria_dsn = get_connection_dsn("GEMATRIA_DSN")
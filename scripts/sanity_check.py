@@ -152,12 +152,12 @@ def test_genesis_chapter_1():
         ids = [f"id_{i}" for i in range(len(embeddings))]
 
         # Test exploration threshold (0.4)
-        pairs_0_4 = _knn_pairs(embeddings, ids, k=5)  # k=5 for meaningful connections
-        exploration_edges = len(pairs_0_4)
+        _, _, pair_sims = _knn_pairs(embeddings, ids, k=5)  # k=5 for meaningful connections
+        exploration_edges = len(pair_sims)
 
         # Count KPI edges (≥0.75 and ≥0.90)
-        weak_edges = sum(1 for _, _, sim in pairs_0_4 if sim >= 0.75)
-        strong_edges = sum(1 for _, _, sim in pairs_0_4 if sim >= 0.90)
+        weak_edges = int((pair_sims >= 0.75).sum())
+        strong_edges = int((pair_sims >= 0.90).sum())
 
         print(f"   Exploration edges (≥0.4): {exploration_edges}")
         print(f"   KPI weak edges (≥0.75): {weak_edges}")
@@ -168,7 +168,7 @@ def test_genesis_chapter_1():
 
         # Mock reranker scores (normally from actual reranker)
         # For testing, we'll use similarity scores as proxy
-        mock_rerank_scores = [sim for _, _, sim in pairs_0_4]
+        mock_rerank_scores = pair_sims.tolist()
 
         if mock_rerank_scores:
             yes_at_02 = sum(1 for s in mock_rerank_scores if s >= 0.2) / len(mock_rerank_scores)
@@ -3,7 +3,7 @@
 
 """Core utilities for Hebrew processing and identity generation."""
 
-from .hebrew_utils import calc_string, calculate_gematria
+from .hebrew_utils import calc_string, calculate_gematria, calculate_gematria_batch
 from .ids import content_hash, normalize_hebrew, uuidv7_surrogate
 from .ssot import MasterPlan
 
@@ -11,6 +11,7 @@ __all__ = [
     "MasterPlan",
     "calc_string",
     "calculate_gematria",
+    "calculate_gematria_batch",
     "content_hash",
     "normalize_hebrew",
     "uuidv7_surrogate",
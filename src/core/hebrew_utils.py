@@ -3,6 +3,8 @@
 
 from __future__ import annotations
 
+from pmagent.modules.gematria.kernel import letter_values, text_value, word_values
+
 # Finals mapped to regular values (Mispar Hechrachi)
 MAP: dict[str, int] = {
     "א": 1,
@@ -49,12 +51,18 @@ def calculate_gematria(word: str) -> int:
     Returns:
         Sum of letter values according to Mispar Hechrachi
     """
-    return sum(MAP.get(ch, 0) for ch in word)
+    return text_value(word)
+
+
+def calculate_gematria_batch(words: list[str]) -> list[int]:
+    """Mispar Hechrachi values for many words in one vectorized pass."""
+    return word_values(words)
 
 
 def calc_string(word: str) -> str:
-    parts = [f"{ch}({MAP.get(ch, 0)})" for ch in word]
-    return " + ".join(parts) + f" = {calculate_gematria(word)}"
+    values = letter_values(word)
+    parts = [f"{ch}({value})" for ch, value in zip(word, values, strict=True)]
+    return " + ".join(parts) + f" = {sum(values)}"
 
 
 def get_ketiv_for_gematria(noun: dict) -> str:
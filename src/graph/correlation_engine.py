@@ -0,0 +1,247 @@
+# OPS meta: Rules 050/051/052 AlwaysApply | SSOT: ruff | Housekeeping: `make housekeeping`
+# Timestamp contract: RFC3339 fast-lane (generated_at RFC3339; metadata.source="fallback_fast_lane")
+
+"""
+Streaming top-K Pearson correlation engine for concept embeddings.
+
+Computes pairwise correlations tile by tile over the upper triangle of the
+n x n matrix and keeps only the strongest pairs, so memory stays bounded by
+the tile size plus the top-K pool instead of growing with n².
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Tile sizing: explicit block size wins, otherwise derive from the memory budget
+CORR_BLOCK_SIZE = int(os.getenv("CORR_BLOCK_SIZE", "0"))
+CORR_MEMORY_BUDGET_MB = float(os.getenv("CORR_MEMORY_BUDGET_MB", "256"))
+
+# Each tile holds the float32 correlations plus an abs/score copy and a mask
+_TILE_COPIES = 3
+_MIN_BLOCK = 64
+
+_EMBEDDING_SQL = {
+    column: f"""
+        SELECT {column}, embedding
+        FROM concept_network
+        WHERE embedding IS NOT NULL
+        ORDER BY {column}
+        """
+    for column in ("concept_id", "id")
+}
+
+
+def parse_embedding(raw) -> np.ndarray | None:
+    """Parse a pgvector value (string "[...]" or array-like) into a 1-D float32 array."""
+    if raw is None:
+        return None
+    if isinstance(raw, str):
+        vec = np.array([float(x) for x in raw.strip("[]").split(",") if x.strip()], dtype=np.float32)
+    elif hasattr(raw, "__iter__"):
+        vec = np.asarray(raw, dtype=np.float32)
+    else:
+        return None
+    if vec.ndim != 1 or vec.size == 0:
+        return None
+    return vec
+
+
+def load_concept_embeddings(db, id_column: str = "concept_id") -> tuple[list[str], np.ndarray]:
+    """
+    Load concept_network embeddings as a stacked float32 matrix.
+
+    Args:
+        db: Database facade exposing execute()
+        id_column: concept_network column used as the pair identifier
+            ("concept_id" for exports, "id" for graph edges)
+
+    Returns:
+        tuple: (ids, matrix) where matrix has shape (len(ids), dim)
+    """
+    sql = _EMBEDDING_SQL.get(id_column)
+    if sql is None:
+        raise ValueError(f"Unsupported id column: {id_column}")
+
+    rows = db.execute(sql)
+
+    ids: list[str] = []
+    vecs: list[np.ndarray] = []
+    dim = None
+    for row in rows:
+        try:
+            vec = parse_embedding(row[1])
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Skipping concept {row[0]} due to embedding parsing error: {e}")
+            continue
+        if vec is None:
+            logger.warning(f"Invalid embedding for concept {row[0]}")
+            continue
+        if dim is None:
+            dim = vec.size
+        elif vec.size != dim:
+            logger.warning(f"Skipping concept {row[0]}: embedding dim {vec.size} != {dim}")
+            continue
+        ids.append(str(row[0]))
+        vecs.append(vec)
+
+    if not vecs:
+        return [], np.zeros((0, 0), dtype=np.float32)
+    return ids, np.stack(vecs)
+
+
+def pearson_normalize(X: np.ndarray) -> np.ndarray:
+    """
+    Row-standardize X so that Z @ Z.T equals the Pearson correlation matrix.
+
+    Rows are centered and scaled by their sample std (ddof=1) and sqrt(d - 1).
+    Constant rows become all-zero and therefore correlate 0 with everything.
+    """
+    X = np.asarray(X, dtype=np.float32)
+    d = X.shape[1]
+    if d < 2:
+        return np.zeros_like(X)
+    Z = X - X.mean(axis=1, keepdims=True)
+    norm = np.linalg.norm(Z, axis=1, keepdims=True)
+    norm = np.maximum(norm, 1e-8 * np.sqrt(d - 1))
+    return (Z / norm).astype(np.float32, copy=False)
+
+
+def resolve_block_size(n: int, block_size: int | None = None, memory_budget_mb: float | None = None) -> int:
+    """Pick a tile edge so block_size² float32 tiles fit within the memory budget."""
+    if n <= 0:
+        return 1
+    if block_size is None:
+        block_size = CORR_BLOCK_SIZE
+    if block_size and block_size > 0:
+        return max(1, min(int(block_size), n))
+    budget_mb = CORR_MEMORY_BUDGET_MB if memory_budget_mb is None else memory_budget_mb
+    budget_bytes = max(budget_mb, 1.0) * 1024 * 1024
+    edge = int(np.sqrt(budget_bytes / (4 * _TILE_COPIES)))
+    return max(1, min(max(edge, _MIN_BLOCK), n))
+
+
+def _merge_pool(pool, src, tgt, val, top_k):
+    """Merge candidate pairs into the running pool, keeping the top_k by |value|."""
+    if src.size == 0:
+        return pool
+    src = np.concatenate([pool[0], src])
+    tgt = np.concatenate([pool[1], tgt])
+    val = np.concatenate([pool[2], val])
+    if top_k is not None and val.size > top_k:
+        keep = np.argpartition(-np.abs(val), top_k - 1)[:top_k]
+        src, tgt, val = src[keep], tgt[keep], val[keep]
+    return src, tgt, val
+
+
+def _row_topk(scores: np.ndarray, k: int) -> np.ndarray:
+    """Column indices of the k highest scores in each row (unordered)."""
+    if k >= scores.shape[1]:
+        return np.broadcast_to(np.arange(scores.shape[1]), scores.shape).copy()
+    return np.argpartition(-scores, k - 1, axis=1)[:, :k]
+
+
+def topk_correlations(
+    embeddings: np.ndarray,
+    top_k: int | None = 10000,
+    per_row_k: int | None = None,
+    min_abs: float = 0.0,
+    block_size: int | None = None,
+    memory_budget_mb: float | None = None,
+    normalized: bool = False,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Stream the strongest pairwise Pearson correlations without building the n x n matrix.
+
+    Tiles of the upper triangle are computed with one GEMM each. With per_row_k,
+    every row keeps a partial top-k (argpartition per tile, merged across tiles);
+    survivors are merged into a global pool bounded by top_k.
+
+    Args:
+        embeddings: (n, d) matrix of concept embeddings
+        top_k: Maximum number of pairs to return overall (None = unbounded)
+        per_row_k: Maximum pairs contributed by each source row (None = unbounded)
+        min_abs: Drop pairs with |r| below this threshold
+        block_size: Tile edge; defaults to CORR_BLOCK_SIZE or the memory budget
+        memory_budget_mb: Per-tile working memory budget (CORR_MEMORY_BUDGET_MB)
+        normalized: Treat embeddings as already Pearson-normalized
+
+    Returns:
+        tuple: (source_idx, target_idx, correlation) arrays with source_idx < target_idx,
+        sorted by |correlation| descending then (source_idx, target_idx)
+    """
+    X = np.asarray(embeddings, dtype=np.float32)
+    n = X.shape[0] if X.ndim == 2 else 0
+    empty = (np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float32))
+    if n < 2 or (top_k is not None and top_k <= 0) or (per_row_k is not None and per_row_k <= 0):
+        return empty
+
+    Z = X if normalized else pearson_normalize(X)
+    b = resolve_block_size(n, block_size, memory_budget_mb)
+    logger.info(f"Streaming correlations for {n} concepts in {b}x{b} tiles")
+
+    pool = empty
+    for i0 in range(0, n, b):
+        i1 = min(i0 + b, n)
+        A = Z[i0:i1]
+        rows = np.arange(i0, i1)
+        # Per-row running top-k for this row block: (rows, k) columns and values
+        row_cols = np.zeros((i1 - i0, 0), dtype=np.int64)
+        row_vals = np.zeros((i1 - i0, 0), dtype=np.float32)
+
+        for j0 in range(i0, n, b):
+            j1 = min(j0 + b, n)
+            tile = A @ Z[j0:j1].T
+            np.clip(tile, -1.0, 1.0, out=tile)
+
+            scores = np.abs(tile)
+            # Mask the diagonal/lower triangle and anything below the floor
+            invalid = ~np.isfinite(scores) | (scores < min_abs)
+            if j0 == i0:
+                invalid |= np.arange(j0, j1)[None, :] <= rows[:, None]
+            scores[invalid] = -1.0
+
+            if per_row_k is not None:
+                # Invalid slots carry NaN so they never outrank a real pair
+                local = _row_topk(scores, per_row_k)
+                local_vals = np.take_along_axis(np.where(invalid, np.nan, tile), local, axis=1)
+                cand_cols = np.concatenate([row_cols, local + j0], axis=1)
+                cand_vals = np.concatenate([row_vals, local_vals], axis=1)
+                keep = _row_topk(np.nan_to_num(np.abs(cand_vals), nan=-1.0), per_row_k)
+                row_cols = np.take_along_axis(cand_cols, keep, axis=1)
+                row_vals = np.take_along_axis(cand_vals, keep, axis=1)
+                continue
+
+            flat = scores.ravel()
+            valid = int(np.count_nonzero(flat >= 0.0))
+            if valid == 0:
+                continue
+            k = valid if top_k is None else min(top_k, valid)
+            idx = np.argpartition(-flat, k - 1)[:k] if k < flat.size else np.arange(flat.size)
+            idx = idx[flat[idx] >= 0.0]
+            r, c = np.divmod(idx, j1 - j0)
+            pool = _merge_pool(pool, r + i0, c + j0, tile[r, c], top_k)
+
+        if per_row_k is not None and row_cols.size:
+            ok = np.isfinite(row_vals)
+            src = np.broadcast_to(rows[:, None], row_cols.shape)[ok]
+            pool = _merge_pool(pool, src, row_cols[ok], row_vals[ok], top_k)
+
+    src, tgt, val = pool
+    order = np.lexsort((tgt, src, -np.abs(val)))
+    return src[order].astype(np.int64), tgt[order].astype(np.int64), val[order].astype(np.float32)
+
+
+def correlation_significance(corr: float) -> float:
+    """Coarse p-value bucket used by the correlation exports."""
+    abs_corr = abs(corr)
+    if abs_corr > 0.5:
+        return 0.01
+    if abs_corr > 0.3:
+        return 0.05
+    return 0.1
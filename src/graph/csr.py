@@ -0,0 +1,296 @@
+# OPS meta: Rules 050/051/052 AlwaysApply | SSOT: ruff | Housekeeping: `make housekeeping`
+# Timestamp contract: RFC3339 fast-lane (generated_at RFC3339; metadata.source="fallback_fast_lane")
+
+"""
+Sparse (CSR) graph analytics backend for large concept networks.
+
+Concept UUIDs are mapped to dense int ids and the undirected weighted graph is
+stored as a symmetric scipy.sparse CSR matrix. Centrality measures match the
+NetworkX calls used by src.graph.patterns.compute_patterns:
+
+- degree: degree / (n - 1) (nx.degree_centrality),
+- betweenness: Brandes with edge weights as lengths
+  (nx.betweenness_centrality(weight=..., normalized=...)). Distances come
+  from scipy.sparse.csgraph.dijkstra for a batch of sources at once; path
+  counts and dependencies are propagated over the shortest-path DAG in one
+  pass each, edges grouped by their endpoint's rank in distance order.
+  Above GRAPH_BETWEENNESS_EXACT_MAX nodes only a sample of pivot sources is
+  used (scaled estimate): a fixed budget of GRAPH_BETWEENNESS_PIVOTS, spread
+  over components by size (networkx's ``k``), or, with
+  GRAPH_BETWEENNESS_EPSILON > 0, enough pivots that every normalized value is
+  within epsilon of the exact one with probability >= 1 - delta. That bound
+  needs about ln(2n / delta) / (2 epsilon^2) pivots per large component
+  (~72k at epsilon=0.01, ~2.9k at 0.05 for n=100k), so it only saves work
+  when epsilon is coarse or components are larger than that,
+- eigenvector: leading eigenvector of the weighted adjacency via
+  scipy.sparse.linalg.eigsh (nx.eigenvector_centrality_numpy); like
+  compute_patterns it is all zeros for disconnected graphs.
+
+Connected components and source batches are processed in parallel
+(GRAPH_WORKERS threads).
+"""
+
+from __future__ import annotations
+
+import itertools
+import math
+import os
+from collections.abc import Callable, Hashable, Iterable
+from dataclasses import dataclass
+
+import numpy as np
+import scipy.sparse as sp
+from scipy.sparse.csgraph import connected_components, dijkstra
+from scipy.sparse.linalg import eigsh
+
+from src.infra.rate_limit import run_ordered
+
+GRAPH_WORKERS = int(os.getenv("GRAPH_WORKERS", "4"))
+# Betweenness is exact up to this many nodes and sampled beyond it: a fixed pivot
+# budget, or (epsilon > 0) as many pivots as the error bound below requires
+GRAPH_BETWEENNESS_EXACT_MAX = int(os.getenv("GRAPH_BETWEENNESS_EXACT_MAX", "5000"))
+GRAPH_BETWEENNESS_PIVOTS = int(os.getenv("GRAPH_BETWEENNESS_PIVOTS", "1000"))
+GRAPH_BETWEENNESS_EPSILON = float(os.getenv("GRAPH_BETWEENNESS_EPSILON", "0"))
+GRAPH_BETWEENNESS_DELTA = float(os.getenv("GRAPH_BETWEENNESS_DELTA", "0.1"))
+
+# Elements of a (sources x edges) working array per batch
+_BATCH_ELEMENTS = 1 << 22
+# Components up to this size use a dense eigensolver
+_DENSE_EIGEN_MAX = 64
+
+
+@dataclass
+class CSRGraph:
+    """Undirected weighted graph: node ids plus a symmetric CSR weight matrix."""
+
+    nodes: list
+    adj: sp.csr_array
+
+    @classmethod
+    def from_edges(
+        cls,
+        sources: Iterable[Hashable],
+        targets: Iterable[Hashable],
+        weights: Iterable[float] | None = None,
+        nodes: Iterable[Hashable] = (),
+    ) -> CSRGraph:
+        """
+        Build from parallel edge lists (a repeated pair keeps its last weight, as nx.Graph does).
+
+        Node order is ``nodes`` followed by edge endpoints in first-appearance order.
+        """
+        sources, targets = list(sources), list(targets)
+        index = {n: i for i, n in enumerate(dict.fromkeys([*nodes, *sources, *targets]))}
+        n = len(index)
+        u = np.fromiter((index[s] for s in sources), dtype=np.int64, count=len(sources))
+        v = np.fromiter((index[t] for t in targets), dtype=np.int64, count=len(targets))
+        w = np.ones(len(u)) if weights is None else np.asarray(list(weights), dtype=np.float64)
+
+        lo, hi = np.minimum(u, v), np.maximum(u, v)
+        _, last = np.unique((lo * n + hi)[::-1], return_index=True)
+        keep = len(u) - 1 - last
+        lo, hi, w = lo[keep], hi[keep], w[keep]
+        off = lo != hi
+        rows = np.concatenate([lo, hi[off]])
+        cols = np.concatenate([hi, lo[off]])
+        adj = sp.csr_array((np.concatenate([w, w[off]]), (rows, cols)), shape=(n, n))
+        adj.sort_indices()
+        return cls(list(index), adj)
+
+    @classmethod
+    def from_networkx(cls, G, weight: str = "weight") -> CSRGraph:
+        import networkx as nx  # noqa: E402
+
+        nodes = list(G)
+        adj = nx.to_scipy_sparse_array(G, nodelist=nodes, weight=weight, format="csr")
+        return cls(nodes, sp.csr_array(adj, dtype=np.float64))
+
+    def __len__(self) -> int:
+        return self.adj.shape[0]
+
+    @property
+    def number_of_edges(self) -> int:
+        return int((self.adj.nnz + np.count_nonzero(self.adj.diagonal())) // 2)
+
+    def components(self) -> list[np.ndarray]:
+        """Node index arrays of the connected components (ordered by first node)."""
+        if not len(self):
+            return []
+        _, labels = connected_components(self.adj, directed=False)
+        order = np.argsort(labels, kind="stable")
+        bounds = np.flatnonzero(np.diff(labels[order])) + 1
+        return sorted(np.split(order, bounds), key=lambda idx: int(idx[0]))
+
+    def subgraph(self, idx: np.ndarray) -> sp.csr_array:
+        return sp.csr_array(self.adj[idx][:, idx])
+
+
+def degree_centrality(g: CSRGraph) -> dict:
+    n = len(g)
+    if n <= 1:
+        return dict.fromkeys(g.nodes, 1.0)
+    # Self-loops count twice, as in networkx
+    degree = np.diff(g.adj.indptr) + (g.adj.diagonal() != 0)
+    return dict(zip(g.nodes, (degree * (1.0 / (n - 1))).tolist(), strict=True))
+
+
+def pivots_needed(n_component: int, n: int, epsilon: float, delta: float) -> int:
+    """
+    Sampled sources for a component so normalized betweenness is within epsilon w.p. >= 1 - delta.
+
+    A sampled source s contributes n_c * delta_s(v) / ((n-1)(n-2)) in [0, R],
+    R = n_c (n_c - 2) / ((n-1)(n-2)); Hoeffding over k samples with a union
+    bound over all n nodes gives k >= R^2 ln(2n / delta) / (2 epsilon^2). For a
+    dominant component (R ~ 1) that is nearly independent of its size, so it
+    is only fewer than n_c sources for coarse epsilon or very large components.
+    """
+    if epsilon <= 0 or n < 3 or n_component < 3:
+        return n_component
+    spread = n_component * (n_component - 2) / ((n - 1) * (n - 2))
+    return min(n_component, math.ceil(spread**2 * math.log(2 * n / delta) / (2 * epsilon**2)))
+
+
+def _level_order(level: np.ndarray, n_levels: int) -> tuple[np.ndarray, np.ndarray]:
+    """Permutation grouping items by level (0..n_levels-1) and the level boundaries in it."""
+    # Stable argsort of 16-bit keys is a radix sort
+    key = level.astype(np.uint16 if n_levels <= 1 << 16 else np.uint32)
+    order = np.argsort(key, kind="stable")
+    return order, np.searchsorted(key[order], np.arange(n_levels + 1))
+
+
+def _sweep(X: np.ndarray, frm: np.ndarray, to: np.ndarray, bounds: np.ndarray) -> None:
+    """X[to] += X[frm], one level at a time (no index repeats in ``to`` within a level)."""
+    for start, stop in itertools.pairwise(bounds):
+        if start < stop:
+            X[to[start:stop]] += X[frm[start:stop]]
+
+
+def _dependencies(lengths: sp.csr_array, sources: np.ndarray) -> np.ndarray:
+    """Sum over sources of Brandes dependencies delta_s(v) within one connected component."""
+    n = lengths.shape[0]
+    src = np.repeat(np.arange(n), np.diff(lengths.indptr))
+    dst, w = lengths.indices, lengths.data
+    # Zero-length edges would make the shortest-path "DAG" cyclic; they never count as path steps
+    pos = w > 0
+    src, dst, w = src[pos], dst[pos], w[pos]
+    b = len(sources)
+
+    D = dijkstra(lengths, directed=True, indices=sources)
+    # Edges on a shortest path from each source (D[u] + w >= D[v] always holds; equality = tight)
+    tight = D[:, src]
+    tight += w
+    rows, edges = np.nonzero(tight <= D[:, dst] * (1.0 + 1e-12))
+    tail, head = src[edges], dst[edges]
+    flat_tail, flat_head = rows * n + tail, rows * n + head
+
+    # Rank of each node in its source's distance order: DAG edges always go up in rank,
+    # and each (source, rank) is a single node, so a level never repeats a target index
+    rank = np.empty((b, n), dtype=np.int64)
+    np.put_along_axis(rank, np.argsort(D, axis=1), np.arange(n)[None, :], axis=1)
+
+    # Shortest-path counts: edges by rank of their tail (every tail is final when read)
+    sigma = np.zeros(b * n)
+    sigma[np.arange(b) * n + sources] = 1.0
+    order, bounds = _level_order(rank[rows, tail], n)
+    _sweep(sigma, flat_tail[order], flat_head[order], bounds)
+    # x[v] = (1 + delta[v]) / sigma[v] = 1 / sigma[v] + sum over DAG successors w of x[w],
+    # edges by decreasing rank of their head
+    x = 1.0 / sigma
+    order, bounds = _level_order(n - 1 - rank[rows, head], n)
+    _sweep(x, flat_head[order], flat_tail[order], bounds)
+    dep = (sigma * x - 1.0).reshape(b, n)
+    dep[np.arange(b), sources] = 0.0
+    return dep.sum(axis=0)
+
+
+def betweenness_centrality(
+    g: CSRGraph,
+    length: Callable[[np.ndarray], np.ndarray] | None = None,
+    normalized: bool = True,
+    pivots: int | None = None,
+    epsilon: float = 0.0,
+    delta: float = GRAPH_BETWEENNESS_DELTA,
+    seed: int = 42,
+    workers: int = GRAPH_WORKERS,
+) -> dict:
+    """
+    Shortest-path betweenness (networkx semantics, endpoints excluded).
+
+    Args:
+        g: Graph
+        length: Maps edge weights to path lengths (default: the weight itself,
+            like ``weight="weight"`` in networkx)
+        normalized: Divide by (n-1)(n-2) like networkx; otherwise count each
+            unordered pair once
+        pivots: Sample this many pivot sources, split over components in
+            proportion to their size (like networkx's ``k``; None = use epsilon)
+        epsilon: Max absolute error of normalized values (0 = exact; see pivots_needed)
+        delta: Failure probability of the epsilon bound
+        seed: Pivot sampling seed
+        workers: Threads for components / source batches
+
+    Returns:
+        dict: node -> betweenness
+    """
+    n = len(g)
+    total = np.zeros(n)
+    rng = np.random.default_rng(seed)
+
+    tasks = []
+    for idx in g.components():
+        n_c = len(idx)
+        if n_c < 3:
+            continue
+        lengths = g.subgraph(idx)
+        if length is not None:
+            lengths.data = np.asarray(length(lengths.data), dtype=np.float64)
+        if pivots:
+            k = min(n_c, math.ceil(pivots * n_c / n))
+        else:
+            k = pivots_needed(n_c, n, epsilon, delta)
+        sources = np.arange(n_c) if k >= n_c else np.sort(rng.choice(n_c, size=k, replace=False))
+        batch = max(1, _BATCH_ELEMENTS // max(1, lengths.nnz))
+        for start in range(0, len(sources), batch):
+            tasks.append((idx, lengths, sources[start : start + batch], n_c / len(sources)))
+
+    def _run(_i, task):
+        idx, lengths, sources, scale = task
+        return idx, _dependencies(lengths, sources) * scale
+
+    for idx, dep in run_ordered(_run, tasks, max_workers=workers):
+        total[idx] += dep
+
+    if normalized:
+        total *= 1.0 / ((n - 1) * (n - 2)) if n > 2 else 0.0
+    else:
+        total /= 2.0  # each unordered pair was counted from both ends
+    return dict(zip(g.nodes, total.tolist(), strict=True))
+
+
+def eigenvector_centrality(g: CSRGraph) -> dict:
+    """
+    Leading eigenvector of the weighted adjacency (unit norm, positive sum).
+
+    Zeros for disconnected graphs and graphs under 3 nodes, where
+    nx.eigenvector_centrality_numpy raises and compute_patterns falls back to zeros.
+    """
+    n = len(g)
+    if n < 3 or len(g.components()) != 1:
+        return dict.fromkeys(g.nodes, 0.0)
+    if n <= _DENSE_EIGEN_MAX:
+        _, vectors = np.linalg.eigh(g.adj.toarray())
+        vec = vectors[:, -1]
+    else:
+        _, vectors = eigsh(g.adj, k=1, which="LA")
+        vec = vectors[:, 0]
+    vec = vec / (np.sign(vec.sum()) or 1.0) / np.linalg.norm(vec)
+    return dict(zip(g.nodes, vec.tolist(), strict=True))
+
+
+def betweenness_sampling(n: int) -> dict:
+    """Configured betweenness_centrality sampling arguments for a graph of n nodes ({} = exact)."""
+    if n <= GRAPH_BETWEENNESS_EXACT_MAX:
+        return {}
+    if GRAPH_BETWEENNESS_EPSILON > 0:
+        return {"epsilon": GRAPH_BETWEENNESS_EPSILON}
+    return {"pivots": GRAPH_BETWEENNESS_PIVOTS}
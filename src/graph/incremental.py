@@ -0,0 +1,327 @@
+# OPS meta: Rules 050/051/052 AlwaysApply | SSOT: ruff | Housekeeping: `make housekeeping`
+# Timestamp contract: RFC3339 fast-lane (generated_at RFC3339; metadata.source="fallback_fast_lane")
+
+"""
+Incremental community detection and centrality for the concept network.
+
+A GraphSnapshot of the last analysed graph (edges, partition, raw per-component
+centrality) is persisted to GRAPH_SNAPSHOT_PATH. On the next run:
+
+- if concept_network/concept_relations counts and the newest relation
+  timestamp (created_at / rerank_at) are unchanged, nothing is recomputed;
+- otherwise the fresh graph is diffed against the snapshot; nodes touching an
+  added, removed or re-weighted edge (and added nodes) are "changed", and only
+  connected components containing a changed node are recomputed:
+  - Louvain is warm-started from the previous partition: unchanged nodes
+    start grouped in their previous community, changed nodes as singletons,
+  - betweenness and eigenvector centrality are recomputed per component on
+    the CSR backend (src.graph.csr)
+    (both only depend on the component; normalization is applied globally).
+
+Outputs match src.graph.patterns.compute_patterns on a cold start (no snapshot).
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+
+import networkx as nx
+
+from src.graph.csr import CSRGraph, betweenness_centrality, betweenness_sampling, eigenvector_centrality
+from src.graph.patterns import build_graph
+from src.infra.structured_logger import get_logger, log_json
+
+LOG = get_logger("gematria.graph.incremental")
+
+GRAPH_SNAPSHOT_PATH = os.getenv("GRAPH_SNAPSHOT_PATH", "var/cache/graph/analytics_snapshot.json")
+GRAPH_SNAPSHOT_VERSION = 1
+
+_WEIGHT_TOL = 1e-12
+
+
+@dataclass
+class GraphSnapshot:
+    """Analysed graph state carried between runs (per-node values keyed by concept id)."""
+
+    edges: dict[tuple[str, str], float] = field(default_factory=dict)
+    cluster: dict[str, int] = field(default_factory=dict)
+    betweenness_raw: dict[str, float] = field(default_factory=dict)
+    eigen_vec: dict[str, float] = field(default_factory=dict)
+    mark: list | None = None
+
+    def save(self, path: Path) -> None:
+        nodes = list(self.cluster)
+        payload = {
+            "version": GRAPH_SNAPSHOT_VERSION,
+            "generated_at": datetime.now(UTC).isoformat(),
+            "mark": self.mark,
+            "nodes": nodes,
+            "cluster": [self.cluster[n] for n in nodes],
+            "betweenness_raw": [self.betweenness_raw.get(n, 0.0) for n in nodes],
+            "eigen_vec": [self.eigen_vec.get(n, 0.0) for n in nodes],
+            "edges": [[u, v, w] for (u, v), w in self.edges.items()],
+        }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(payload, f)
+        tmp.replace(path)
+
+    @classmethod
+    def load(cls, path: Path) -> GraphSnapshot | None:
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != GRAPH_SNAPSHOT_VERSION:
+                return None
+            nodes = data["nodes"]
+            return cls(
+                edges={(u, v): float(w) for u, v, w in data["edges"]},
+                cluster=dict(zip(nodes, data["cluster"], strict=True)),
+                betweenness_raw=dict(zip(nodes, data["betweenness_raw"], strict=True)),
+                eigen_vec=dict(zip(nodes, data["eigen_vec"], strict=True)),
+                mark=data.get("mark"),
+            )
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+
+@dataclass
+class PatternUpdate:
+    """Result of update_patterns / analyze_incremental."""
+
+    cluster_map: dict[str, int]
+    degree: dict[str, float]
+    betweenness: dict[str, float]
+    eigenvector: dict[str, float]
+    snapshot: GraphSnapshot
+    changed_nodes: set[str]
+    cluster_changes: dict[str, int]
+    recomputed_nodes: int
+    mode: str  # "cold" | "incremental" | "unchanged"
+
+    def as_tuple(self):
+        """Same shape as compute_patterns()."""
+        return self.cluster_map, self.degree, self.betweenness, self.eigenvector
+
+
+def _edge_key(u: str, v: str) -> tuple[str, str]:
+    return (u, v) if u <= v else (v, u)
+
+
+def _edge_weights(G) -> dict[tuple[str, str], float]:
+    return {_edge_key(u, v): float(w) for u, v, w in G.edges(data="weight", default=1.0)}
+
+
+def changed_nodes(G, edges: dict[tuple[str, str], float], previous: GraphSnapshot) -> set[str]:
+    """Nodes of G that are new or touch an added, removed or re-weighted edge."""
+    changed = {n for n in G if n not in previous.cluster}
+    for key in edges.keys() ^ previous.edges.keys():
+        changed.update(key)
+    for key, w in edges.items():
+        old = previous.edges.get(key)
+        if old is not None and abs(old - w) > _WEIGHT_TOL:
+            changed.update(key)
+    return {n for n in changed if n in G}
+
+
+def _warm_louvain(G, components, changed, previous: GraphSnapshot, seed: int) -> list[set[str]]:
+    """Louvain over the affected components, starting from the previous partition."""
+    comp_of = {n: ci for ci, comp in enumerate(components) for n in comp}
+    group_of: dict[str, int] = {}
+    group_ids: dict[tuple, int] = {}
+    for n in G:  # graph order keeps the seeded Louvain run deterministic
+        ci = comp_of.get(n)
+        if ci is None:
+            continue
+        key = (ci, previous.cluster[n]) if n not in changed and n in previous.cluster else ("node", n)
+        group_of[n] = group_ids.setdefault(key, len(group_ids))
+
+    A = nx.Graph()
+    A.add_nodes_from(range(len(group_ids)))
+    for u, v, w in G.edges(group_of, data="weight", default=1.0):
+        gu, gv = group_of[u], group_of[v]
+        A.add_edge(gu, gv, weight=A.get_edge_data(gu, gv, {"weight": 0.0})["weight"] + w)
+
+    members: dict[int, set[str]] = {}
+    for n, g in group_of.items():
+        members.setdefault(g, set()).add(n)
+
+    from networkx.algorithms.community import louvain_communities  # noqa: E402
+
+    return [set().union(*(members[g] for g in comm)) for comm in louvain_communities(A, weight="weight", seed=seed)]
+
+
+def _relabel(comms, previous: GraphSnapshot, claimed: set[int]) -> dict[str, int]:
+    """Give each community its majority previous id when still free, else a fresh id."""
+    next_id = max([*previous.cluster.values(), *claimed], default=-1) + 1
+    labels: dict[str, int] = {}
+    for comm in sorted(comms, key=lambda c: (-len(c), min(c))):
+        votes = Counter(previous.cluster[n] for n in sorted(comm) if n in previous.cluster)
+        cid = next((c for c, _ in votes.most_common() if c not in claimed), None)
+        if cid is None:
+            cid, next_id = next_id, next_id + 1
+        claimed.add(cid)
+        labels.update(dict.fromkeys(comm, cid))
+    return labels
+
+
+def update_patterns(G, previous: GraphSnapshot | None = None, seed: int = 42) -> PatternUpdate:
+    """
+    Communities and centrality for G, recomputing only components changed since previous.
+
+    Args:
+        G: NetworkX graph as built by src.graph.patterns.build_graph
+        previous: Snapshot of the last analysed graph (None = cold start)
+        seed: Louvain seed
+
+    Returns:
+        PatternUpdate with compute_patterns-style results and the new snapshot
+    """
+    edges = _edge_weights(G)
+    changed = set(G) if previous is None else changed_nodes(G, edges, previous)
+    components = [comp for comp in nx.connected_components(G) if comp & changed]
+    affected = set().union(*components)
+    base = previous or GraphSnapshot()
+
+    # Communities
+    if previous is None:
+        from networkx.algorithms.community import louvain_communities  # noqa: E402
+
+        comms = louvain_communities(G, weight="weight", seed=seed)
+        cluster = {n: idx for idx, comm in enumerate(comms) for n in comm}
+    else:
+        cluster = {n: base.cluster[n] for n in G if n not in affected}
+        comms = _warm_louvain(G, components, changed, base, seed) if components else []
+        cluster.update(_relabel(comms, base, set(cluster.values())))
+
+    # Per-component raw centrality (unchanged components are carried over)
+    keep = [n for n in G if n not in affected]
+    betw_raw = {n: base.betweenness_raw.get(n, 0.0) for n in keep}
+    eigen_vec = {n: base.eigen_vec.get(n, 0.0) for n in keep}
+    # (an epsilon bound met per component also holds after the global, smaller
+    # normalization; a pivot budget is scaled to the component as a full run would)
+    n_total = G.number_of_nodes()
+    sampling = betweenness_sampling(n_total)
+    for comp in components:
+        g = CSRGraph.from_networkx(G.subgraph(comp), weight="weight")
+        kwargs = sampling
+        if "pivots" in sampling:
+            kwargs = {"pivots": math.ceil(sampling["pivots"] * len(comp) / n_total)}
+        betw_raw.update(betweenness_centrality(g, normalized=False, **kwargs))
+        eigen_vec.update(eigenvector_centrality(g))
+
+    snapshot = GraphSnapshot(
+        edges=edges,
+        cluster={n: cluster[n] for n in G},
+        betweenness_raw=betw_raw,
+        eigen_vec=eigen_vec,
+        mark=base.mark,
+    )
+    degree, betweenness, eigenvector = centrality_from_snapshot(G, snapshot)
+    return PatternUpdate(
+        cluster_map=snapshot.cluster,
+        degree=degree,
+        betweenness=betweenness,
+        eigenvector=eigenvector,
+        snapshot=snapshot,
+        changed_nodes=changed,
+        cluster_changes={n: c for n, c in snapshot.cluster.items() if base.cluster.get(n) != c},
+        recomputed_nodes=len(affected),
+        mode="cold" if previous is None else "incremental",
+    )
+
+
+def centrality_from_snapshot(G, snapshot: GraphSnapshot):
+    """Globally normalized (degree, betweenness, eigenvector) as compute_patterns returns them."""
+    n = G.number_of_nodes()
+    degree = nx.degree_centrality(G)
+    # networkx normalized undirected betweenness = unnormalized * 2 / ((n-1)(n-2))
+    scale = 2.0 / ((n - 1) * (n - 2)) if n > 2 else 0.0
+    betweenness = {v: snapshot.betweenness_raw.get(v, 0.0) * scale for v in G}
+
+    # compute_patterns reports zeros for disconnected graphs (networkx rejects them); per-component
+    # vectors are still kept in the snapshot so a connected graph needs no recomputation
+    eigenvector = dict.fromkeys(G, 0.0)
+    if n and nx.is_connected(G):
+        eigenvector.update((v, snapshot.eigen_vec.get(v, 0.0)) for v in G)
+    return degree, betweenness, eigenvector
+
+
+def relations_mark(db) -> list | None:
+    """Cheap change marker: node/edge counts and newest relation timestamp (None if unavailable)."""
+    try:
+        row = next(
+            iter(
+                db.execute(
+                    """
+                    SELECT (SELECT count(*) FROM concept_network), count(*),
+                           max(GREATEST(created_at, rerank_at))::text
+                    FROM concept_relations
+                    """
+                )
+            )
+        )
+    except Exception as e:
+        log_json(LOG, 30, "graph_mark_unavailable", error=str(e))
+        return None
+    return [int(row[0]), int(row[1]), row[2]]
+
+
+def analyze_incremental(db, snapshot_path: str | None = None, seed: int = 42) -> PatternUpdate:
+    """
+    Incremental counterpart of build_graph + compute_patterns.
+
+    The returned snapshot is not persisted; call save_snapshot() once the
+    results have been stored so a failed write is retried on the next run.
+    """
+    path = Path(snapshot_path or GRAPH_SNAPSHOT_PATH)
+    previous = GraphSnapshot.load(path) if path.exists() else None
+    mark = relations_mark(db)
+
+    if previous is not None and mark is not None and previous.mark == mark:
+        G = nx.Graph()
+        G.add_nodes_from(previous.cluster)
+        G.add_weighted_edges_from((u, v, w) for (u, v), w in previous.edges.items())
+        degree, betweenness, eigenvector = centrality_from_snapshot(G, previous)
+        log_json(LOG, 20, "graph_incremental_unchanged", nodes=len(previous.cluster))
+        return PatternUpdate(
+            cluster_map=previous.cluster,
+            degree=degree,
+            betweenness=betweenness,
+            eigenvector=eigenvector,
+            snapshot=previous,
+            changed_nodes=set(),
+            cluster_changes={},
+            recomputed_nodes=0,
+            mode="unchanged",
+        )
+
+    G = build_graph(db)
+    update = update_patterns(G, previous, seed=seed)
+    update.snapshot.mark = mark
+    log_json(
+        LOG,
+        20,
+        "graph_incremental_update",
+        mode=update.mode,
+        nodes=G.number_of_nodes(),
+        changed=len(update.changed_nodes),
+        recomputed=update.recomputed_nodes,
+        cluster_changes=len(update.cluster_changes),
+    )
+    return update
+
+
+def save_snapshot(update: PatternUpdate, snapshot_path: str | None = None) -> None:
+    path = Path(snapshot_path or GRAPH_SNAPSHOT_PATH)
+    try:
+        update.snapshot.save(path)
+    except OSError as e:
+        log_json(LOG, 30, "graph_snapshot_save_failed", path=str(path), error=str(e))
@@ -1,6 +1,23 @@
 # OPS meta: Rules 050/051/052 AlwaysApply | SSOT: ruff | Housekeeping: `make housekeeping`
 # Timestamp contract: RFC3339 fast-lane (generated_at RFC3339; metadata.source="fallback_fast_lane")
 
+"""
+Cluster and concept metrics over (unit-normalized) concept embeddings.
+
+Mean pairwise cosine is computed from sums instead of pair loops:
+
+    sum_{i<j} v_i.v_j = (|sum_i v_i|^2 - sum_i |v_i|^2) / 2
+
+so a cluster's diversity, a concept's cohesion with its cluster, its bridge
+score against everything outside the cluster and the diversity of its graph
+neighbourhood all reduce to per-group vector sums and row-wise dot products
+over one stacked embedding matrix (see compute_metrics).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
 import numpy as np
 
 
@@ -8,16 +25,25 @@ def _cos(a, b):
     return float(np.dot(a, b))
 
 
+def _mean_pairwise(sum_sq: np.ndarray, self_sq: np.ndarray, n: np.ndarray) -> np.ndarray:
+    """Mean v_i.v_j over unordered pairs from |sum|^2, sum |v|^2 and group size (0 where n < 2)."""
+    pairs = n * (n - 1) / 2.0
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = (sum_sq - self_sq) / 2.0 / pairs
+    return np.where(n >= 2, mean, 0.0)
+
+
+def _diversity(sum_sq: np.ndarray, self_sq: np.ndarray, n: np.ndarray) -> np.ndarray:
+    return np.where(n >= 2, np.maximum(0.0, 1.0 - _mean_pairwise(sum_sq, self_sq, n)), 0.0)
+
+
 def cluster_semantic_diversity(vecs):
     n = len(vecs)
     if n < 2:
         return 0.0
-    s = c = 0.0
-    for i in range(n):
-        for j in range(i + 1, n):
-            s += _cos(vecs[i], vecs[j])
-            c += 1
-    return max(0.0, 1.0 - (s / max(c, 1)))
+    V = np.asarray(vecs, dtype=np.float64)
+    s = V.sum(axis=0)
+    return float(_diversity(np.array(s @ s), np.array((V * V).sum()), np.array(n)))
 
 
 def density(n_nodes, n_edges):
@@ -27,20 +53,110 @@ def density(n_nodes, n_edges):
 
 
 def semantic_cohesion(v, cluster_vecs):
-    return 0.0 if not cluster_vecs else float(np.mean([_cos(v, u) for u in cluster_vecs]))
+    return 0.0 if not len(cluster_vecs) else float(np.mean(np.asarray(cluster_vecs) @ np.asarray(v)))
 
 
 def bridge_score(v, out_cluster_vecs):
-    return 0.0 if not out_cluster_vecs else float(np.mean([_cos(v, u) for u in out_cluster_vecs]))
+    return 0.0 if not len(out_cluster_vecs) else float(np.mean(np.asarray(out_cluster_vecs) @ np.asarray(v)))
 
 
 def diversity_local(neigh_vecs):
-    n = len(neigh_vecs)
-    if n < 2:
-        return 0.0
-    s = c = 0.0
-    for i in range(n):
-        for j in range(i + 1, n):
-            s += _cos(neigh_vecs[i], neigh_vecs[j])
-            c += 1
-    return max(0.0, 1.0 - (s / max(c, 1)))
+    return cluster_semantic_diversity(neigh_vecs)
+
+
+def _group_sums(values: np.ndarray, groups: np.ndarray, n_groups: int) -> np.ndarray:
+    """Row sums of values per group id (0..n_groups-1); empty groups are zero rows."""
+    out = np.zeros((n_groups, values.shape[1]), dtype=np.float64)
+    if not len(groups):
+        return out
+    order = np.argsort(groups, kind="stable")
+    sorted_groups = groups[order]
+    starts = np.flatnonzero(np.r_[True, sorted_groups[1:] != sorted_groups[:-1]])
+    out[sorted_groups[starts]] = np.add.reduceat(values[order], starts, axis=0)
+    return out
+
+
+@dataclass
+class GraphMetrics:
+    """Output of compute_metrics; per-cluster arrays follow ``clusters`` order, per-concept arrays input order."""
+
+    clusters: np.ndarray
+    cluster_size: np.ndarray
+    cluster_density: np.ndarray
+    cluster_diversity: np.ndarray
+    top_examples: list[np.ndarray]
+    semantic_cohesion: np.ndarray
+    bridge_score: np.ndarray
+    diversity_local: np.ndarray
+
+
+def compute_metrics(vectors, labels, edges=None, topk: int = 5) -> GraphMetrics:
+    """
+    All cluster and concept metrics in one vectorized pass.
+
+    Args:
+        vectors: (n, dim) embedding matrix (rows are expected to be unit-normalized)
+        labels: (n,) cluster label per row
+        edges: (m, 2) row-index pairs of concept relations (directed rows as stored;
+            density counts them as-is, neighbourhoods treat them as undirected)
+        topk: exemplars per cluster (highest mean cosine to the cluster)
+
+    Returns:
+        GraphMetrics with, per cluster: size, edge density, semantic diversity and
+        exemplar row indices; per concept: cohesion with the rest of its cluster,
+        bridge score (mean cosine to all concepts outside its cluster) and the
+        diversity of its graph neighbours.
+    """
+    V = np.asarray(vectors, dtype=np.float64)
+    n = len(V)
+    clusters, inv = np.unique(np.asarray(labels), return_inverse=True)
+    k = len(clusters)
+    sq = (V * V).sum(axis=1)
+
+    # Per-cluster sums: one reduction over the stacked matrix
+    S = _group_sums(V, inv, k)
+    size = np.bincount(inv, minlength=k).astype(np.float64)
+    sq_c = np.bincount(inv, weights=sq, minlength=k)
+    diversity = _diversity((S * S).sum(axis=1), sq_c, size)
+
+    # v_i . S_cluster(i) gives cohesion (minus self) and exemplar means (with self)
+    own = (V * S[inv]).sum(axis=1)
+    n_own = size[inv]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        cohesion = np.where(n_own > 1, (own - sq) / (n_own - 1), 0.0)
+        to_cluster = own / n_own
+        out_sum = V @ S.sum(axis=0) - own
+        n_out = n - n_own
+        bridge = np.where(n_out > 0, out_sum / n_out, 0.0)
+
+    order = np.lexsort((-to_cluster, inv))
+    starts = np.searchsorted(inv[order], np.arange(k))
+    top_examples = [order[s : s + min(topk, int(c))] for s, c in zip(starts, size, strict=True)]
+
+    E = np.asarray(edges if edges is not None else np.zeros((0, 2)), dtype=np.int64).reshape(-1, 2)
+    within = E[inv[E[:, 0]] == inv[E[:, 1]]] if len(E) else E
+    e_within = np.bincount(inv[within[:, 0]], minlength=k).astype(np.float64)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        dens = np.where(size >= 2, e_within / (size * (size - 1) / 2.0), 0.0)
+
+    # Neighbourhood diversity: undirected, de-duplicated neighbour sets
+    if len(E):
+        both = np.unique(np.concatenate([E[:, 0] * n + E[:, 1], E[:, 1] * n + E[:, 0]]))
+        src, dst = both // n, both % n
+    else:
+        src = dst = np.zeros(0, dtype=np.int64)
+    deg = np.bincount(src, minlength=n).astype(np.float64)
+    S_n = _group_sums(V[dst], src, n)
+    sq_n = np.bincount(src, weights=sq[dst], minlength=n)
+    local = _diversity((S_n * S_n).sum(axis=1), sq_n, deg)
+
+    return GraphMetrics(
+        clusters=clusters,
+        cluster_size=size.astype(np.int64),
+        cluster_density=dens,
+        cluster_diversity=diversity,
+        top_examples=top_examples,
+        semantic_cohesion=cohesion,
+        bridge_score=bridge,
+        diversity_local=local,
+    )
@@ -11,6 +11,15 @@ with centrality analysis using NetworkX algorithms.
 import logging
 
 import networkx as nx
+from scipy.sparse.linalg import ArpackNoConvergence
+
+from src.graph.csr import (
+    CSRGraph,
+    betweenness_centrality,
+    betweenness_sampling,
+    degree_centrality,
+    eigenvector_centrality,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -62,14 +71,15 @@ def compute_patterns(G):
 
     logger.info(f"Found {len(comms)} communities")
 
-    # centrality measures
-    degree = nx.degree_centrality(G)
-    betw = nx.betweenness_centrality(G, weight="weight", normalized=True)
+    # centrality measures on the CSR backend (betweenness is sampled above GRAPH_BETWEENNESS_EXACT_MAX nodes)
+    g = CSRGraph.from_networkx(G, weight="weight")
+    degree = degree_centrality(g)
+    betw = betweenness_centrality(g, normalized=True, **betweenness_sampling(len(g)))
 
-    # eigenvector centrality (may fail on disconnected graphs)
+    # eigenvector centrality (zeros on disconnected graphs)
     try:
-        eigen = nx.eigenvector_centrality_numpy(G, weight="weight")
-    except nx.PowerIterationFailedConvergence:
+        eigen = eigenvector_centrality(g)
+    except ArpackNoConvergence:
         logger.warning("Eigenvector centrality failed to converge, using zeros")
         eigen = {n: 0.0 for n in G.nodes()}
     except Exception as e:
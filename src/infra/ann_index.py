@@ -0,0 +1,431 @@
+# OPS meta: Rules 050/051/052 AlwaysApply | SSOT: ruff | Housekeeping: `make housekeeping`
+# Timestamp contract: RFC3339 fast-lane (generated_at RFC3339; metadata.source="fallback_fast_lane")
+
+"""
+In-process nearest-neighbour indexes over cosine embeddings.
+
+Local alternative to per-row pgvector ``ORDER BY embedding <=> ...`` queries:
+vectors are held as L2-normalized float32 rows, answered in batches with one
+matrix product per query block, persisted to ``ANN_INDEX_DIR`` and updated
+incrementally with ``upsert``. A snapshot records a signature of its source
+rows and is rebuilt when the source no longer matches it.
+
+Backends:
+    flat: exact brute-force search (reference for recall measurements)
+    ivf:  inverted-file index (spherical k-means coarse quantizer + nprobe)
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections.abc import Callable, Iterable, Sequence
+from pathlib import Path
+
+import numpy as np
+
+from .structured_logger import get_logger, log_json
+
+LOG = get_logger("gemantria.ann_index")
+
+ANN_BACKEND = os.getenv("ANN_BACKEND", "flat").lower()
+ANN_INDEX_DIR = Path(os.getenv("ANN_INDEX_DIR", "var/cache/ann"))
+ANN_IVF_NLIST = int(os.getenv("ANN_IVF_NLIST", "0"))  # 0 = sqrt(n)
+ANN_IVF_NPROBE = int(os.getenv("ANN_IVF_NPROBE", "8"))
+ANN_QUERY_BLOCK = int(os.getenv("ANN_QUERY_BLOCK", "256"))
+ANN_REVALIDATE_S = float(os.getenv("ANN_REVALIDATE_S", "300"))
+
+Neighbors = list[list[tuple[str, float]]]
+
+
+def _normalize_rows(X) -> np.ndarray:
+    X = np.atleast_2d(np.asarray(X, dtype=np.float32))
+    norms = np.linalg.norm(X, axis=1, keepdims=True)
+    return X / np.maximum(norms, 1e-12)
+
+
+def _topk_rows(sims: np.ndarray, k: int) -> tuple[np.ndarray, np.ndarray]:
+    """Row-wise top-k (sorted desc) positions and values."""
+    k = min(k, sims.shape[1])
+    if k <= 0:
+        empty = np.zeros((sims.shape[0], 0))
+        return empty.astype(np.int64), empty.astype(np.float32)
+    top = np.argpartition(-sims, k - 1, axis=1)[:, :k] if k < sims.shape[1] else np.argsort(-sims, axis=1)
+    vals = np.take_along_axis(sims, top, axis=1)
+    order = np.argsort(-vals, axis=1, kind="stable")
+    return np.take_along_axis(top, order, axis=1), np.take_along_axis(vals, order, axis=1)
+
+
+class VectorIndex:
+    """Base index: id bookkeeping, incremental upsert/remove and persistence."""
+
+    kind = "base"
+
+    def __init__(self, dim: int | None = None):
+        self.dim = dim
+        self.signature = ""  # source signature the rows were built from ("" = unknown)
+        self._ids: list[str] = []
+        self._pos: dict[str, int] = {}
+        self._vecs = np.zeros((0, dim or 0), dtype=np.float32)
+        self._alive = np.zeros(0, dtype=bool)
+
+    def __len__(self) -> int:
+        return int(self._alive.sum())
+
+    def __contains__(self, item_id) -> bool:
+        pos = self._pos.get(str(item_id))
+        return pos is not None and bool(self._alive[pos])
+
+    def upsert(self, ids: Sequence, vectors) -> int:
+        """Insert or replace vectors by id. Returns the number of rows written."""
+        ids = [str(i) for i in ids]
+        if not ids:
+            return 0
+        V = _normalize_rows(vectors)
+        if V.shape[0] != len(ids):
+            raise ValueError(f"Got {len(ids)} ids for {V.shape[0]} vectors")
+        if self.dim is None or self._vecs.shape[0] == 0:
+            self.dim = self.dim or V.shape[1]
+            self._vecs = self._vecs.reshape(0, self.dim)
+        if V.shape[1] != self.dim:
+            raise ValueError(f"Vector dimension mismatch: index={self.dim}, got={V.shape[1]}")
+
+        positions = np.empty(len(ids), dtype=np.int64)
+        new_rows = []
+        for i, item_id in enumerate(ids):
+            pos = self._pos.get(item_id)
+            if pos is None:
+                pos = len(self._ids) + len(new_rows)
+                self._pos[item_id] = pos
+                new_rows.append(item_id)
+            positions[i] = pos
+
+        if new_rows:
+            self._ids.extend(new_rows)
+            self._vecs = np.concatenate([self._vecs, np.zeros((len(new_rows), self.dim), dtype=np.float32)])
+            self._alive = np.concatenate([self._alive, np.zeros(len(new_rows), dtype=bool)])
+        # Last write wins for duplicate ids within one call
+        self._vecs[positions] = V
+        self._alive[positions] = True
+        self._on_upsert(np.unique(positions))
+        return len(ids)
+
+    def remove(self, ids: Iterable) -> int:
+        """Tombstone ids so they are no longer returned. Returns the number removed."""
+        removed = 0
+        for item_id in ids:
+            pos = self._pos.get(str(item_id))
+            if pos is not None and self._alive[pos]:
+                self._alive[pos] = False
+                removed += 1
+        return removed
+
+    def vector(self, item_id) -> np.ndarray | None:
+        pos = self._pos.get(str(item_id))
+        if pos is None or not self._alive[pos]:
+            return None
+        return self._vecs[pos]
+
+    def search(self, queries, k: int, exclude: Sequence | None = None) -> Neighbors:
+        """
+        Batched KNN by cosine similarity.
+
+        Args:
+            queries: (m, d) query vectors (normalized internally)
+            k: Neighbours per query
+            exclude: Optional per-query id to drop from its own results (self-matches)
+
+        Returns:
+            One [(id, cosine), ...] list per query, highest similarity first.
+        """
+        Q = _normalize_rows(queries)
+        if len(self) == 0 or k <= 0:
+            return [[] for _ in range(Q.shape[0])]
+        skip = [self._pos.get(str(e), -1) if e is not None else -1 for e in exclude] if exclude else None
+        # Over-fetch by one so self-exclusion still leaves k results
+        want = k + (1 if skip else 0)
+
+        results: Neighbors = []
+        for q0 in range(0, Q.shape[0], max(1, ANN_QUERY_BLOCK)):
+            block = Q[q0 : q0 + ANN_QUERY_BLOCK]
+            pos, vals = self._search_block(block, want)
+            for r in range(block.shape[0]):
+                own = skip[q0 + r] if skip else -1
+                hits = [
+                    (self._ids[p], float(v))
+                    for p, v in zip(pos[r].tolist(), vals[r].tolist(), strict=True)
+                    if p >= 0 and p != own
+                ]
+                results.append(hits[:k])
+        return results
+
+    def search_ids(self, ids: Sequence, k: int) -> Neighbors:
+        """Batched KNN for vectors already in the index, excluding each query's own id."""
+        known = [str(i) for i in ids]
+        out: Neighbors = [[] for _ in known]
+        present = [i for i, item_id in enumerate(known) if item_id in self]
+        if not present:
+            return out
+        Q = self._vecs[[self._pos[known[i]] for i in present]]
+        for i, hits in zip(present, self.search(Q, k, exclude=[known[i] for i in present]), strict=True):
+            out[i] = hits
+        return out
+
+    # --- backend hooks -------------------------------------------------------
+
+    def _on_upsert(self, positions: np.ndarray) -> None:
+        """Called after rows at positions were written."""
+
+    def _search_block(self, Q: np.ndarray, k: int) -> tuple[np.ndarray, np.ndarray]:
+        """Return (positions, sims) of shape (len(Q), <=k); position -1 pads missing hits."""
+        raise NotImplementedError
+
+    def _extra_state(self) -> dict:
+        return {}
+
+    def _load_extra_state(self, data) -> None:
+        pass
+
+    # --- persistence -----------------------------------------------------------
+
+    def save(self, path: str | Path) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp.npz")
+        np.savez(
+            tmp,
+            kind=np.array(self.kind),
+            dim=np.array(self.dim or 0),
+            signature=np.array(self.signature),
+            ids=np.array(self._ids, dtype=str),
+            vecs=self._vecs,
+            alive=self._alive,
+            **self._extra_state(),
+        )
+        os.replace(tmp, path)
+        return path
+
+    @classmethod
+    def load(cls, path: str | Path) -> VectorIndex:
+        with np.load(Path(path), allow_pickle=False) as data:
+            kind = str(data["kind"])
+            index_cls = INDEX_BACKENDS.get(kind)
+            if index_cls is None:
+                raise ValueError(f"Unknown ANN index kind in {path}: {kind}")
+            index = index_cls(dim=int(data["dim"]) or None)
+            index.signature = str(data["signature"]) if "signature" in data.files else ""
+            index._ids = [str(i) for i in data["ids"].tolist()]
+            index._pos = {item_id: i for i, item_id in enumerate(index._ids)}
+            index._vecs = data["vecs"].astype(np.float32, copy=False)
+            index._alive = data["alive"].astype(bool, copy=False)
+            index._load_extra_state(data)
+        return index
+
+
+class FlatIndex(VectorIndex):
+    """Exact cosine search with one GEMM per query block."""
+
+    kind = "flat"
+
+    def _search_block(self, Q, k):
+        sims = Q @ self._vecs.T
+        sims[:, ~self._alive] = -np.inf
+        pos, vals = _topk_rows(sims, k)
+        pos[~np.isfinite(vals)] = -1
+        return pos, vals
+
+
+class IVFIndex(VectorIndex):
+    """Inverted-file index: rows are bucketed by nearest centroid and only nprobe buckets are scanned."""
+
+    kind = "ivf"
+
+    def __init__(self, dim: int | None = None, nlist: int | None = None, nprobe: int | None = None):
+        super().__init__(dim)
+        self.nlist = nlist or ANN_IVF_NLIST
+        self.nprobe = nprobe or ANN_IVF_NPROBE
+        self._centroids = np.zeros((0, dim or 0), dtype=np.float32)
+        self._assign = np.zeros(0, dtype=np.int64)
+        self._trained_n = 0
+        self._lists: list[np.ndarray] | None = None
+
+    def train(self, iterations: int = 10, seed: int = 42) -> None:
+        """Spherical k-means over live rows; retrains the coarse quantizer from scratch."""
+        live = np.flatnonzero(self._alive)
+        n = live.size
+        if n == 0:
+            return
+        nlist = self.nlist or max(1, int(np.sqrt(n)))
+        nlist = min(nlist, n)
+        rng = np.random.default_rng(seed)
+        X = self._vecs[live]
+        C = X[rng.choice(n, size=nlist, replace=False)].copy()
+        for _ in range(iterations):
+            labels = np.argmax(X @ C.T, axis=1)
+            sums = np.zeros_like(C)
+            np.add.at(sums, labels, X)
+            counts = np.bincount(labels, minlength=nlist)
+            empty = counts == 0
+            sums[empty] = C[empty]  # keep empty centroids where they were
+            C = _normalize_rows(sums)
+        self._centroids = C
+        self._assign = np.full(len(self._ids), -1, dtype=np.int64)
+        self._assign[live] = np.argmax(X @ C.T, axis=1)
+        self._trained_n = n
+        self._lists = None
+        log_json(LOG, 20, "ann_ivf_trained", rows=n, nlist=nlist)
+
+    def _on_upsert(self, positions):
+        if self._assign.size < len(self._ids):
+            self._assign = np.concatenate(
+                [self._assign, np.full(len(self._ids) - self._assign.size, -1, dtype=np.int64)]
+            )
+        # Retrain when the index has grown well past what the quantizer saw
+        if self._centroids.shape[0] == 0 or len(self) > 4 * max(self._trained_n, 1):
+            self.train()
+            return
+        self._assign[positions] = np.argmax(self._vecs[positions] @ self._centroids.T, axis=1)
+        self._lists = None
+
+    def _inverted_lists(self) -> list[np.ndarray]:
+        if self._lists is None:
+            live = np.flatnonzero(self._alive & (self._assign >= 0))
+            order = live[np.argsort(self._assign[live], kind="stable")]
+            bounds = np.searchsorted(self._assign[order], np.arange(self._centroids.shape[0] + 1))
+            self._lists = [order[bounds[c] : bounds[c + 1]] for c in range(self._centroids.shape[0])]
+        return self._lists
+
+    def _search_block(self, Q, k):
+        lists = self._inverted_lists()
+        nprobe = min(self.nprobe, len(lists))
+        probes, _ = _topk_rows(Q @ self._centroids.T, nprobe)
+        pos = np.full((Q.shape[0], k), -1, dtype=np.int64)
+        vals = np.full((Q.shape[0], k), -np.inf, dtype=np.float32)
+        for r in range(Q.shape[0]):
+            cand = np.concatenate([lists[c] for c in probes[r]])
+            cand = cand[self._alive[cand]]  # drop rows removed since the lists were built
+            if cand.size == 0:
+                continue
+            sims = self._vecs[cand] @ Q[r]
+            top, top_vals = _topk_rows(sims[None, :], k)
+            pos[r, : top.shape[1]] = cand[top[0]]
+            vals[r, : top.shape[1]] = top_vals[0]
+        return pos, vals
+
+    def _extra_state(self):
+        return {
+            "centroids": self._centroids,
+            "assign": self._assign,
+            "trained_n": np.array(self._trained_n),
+            "nlist": np.array(self.nlist),
+            "nprobe": np.array(self.nprobe),
+        }
+
+    def _load_extra_state(self, data):
+        self._centroids = data["centroids"].astype(np.float32, copy=False)
+        self._assign = data["assign"].astype(np.int64, copy=False)
+        self._trained_n = int(data["trained_n"])
+        self.nlist = int(data["nlist"])
+        self.nprobe = int(data["nprobe"])
+
+
+INDEX_BACKENDS: dict[str, type[VectorIndex]] = {"flat": FlatIndex, "ivf": IVFIndex}
+
+
+def create_index(kind: str | None = None, dim: int | None = None) -> VectorIndex:
+    kind = (kind or ANN_BACKEND).lower()
+    if kind not in INDEX_BACKENDS:
+        raise ValueError(f"Unknown ANN backend: {kind} (expected one of {sorted(INDEX_BACKENDS)})")
+    return INDEX_BACKENDS[kind](dim=dim)
+
+
+def index_path(name: str) -> Path:
+    return ANN_INDEX_DIR / f"{name}.npz"
+
+
+_INDEXES: dict[str, VectorIndex] = {}
+_CHECKED_AT: dict[str, float] = {}
+_INDEX_LOCK = threading.Lock()
+
+
+def _current_signature(name: str, signature: Callable[[], str] | None) -> str | None:
+    if signature is None:
+        return None
+    try:
+        return signature()
+    except Exception as e:
+        # Source unreachable: keep serving what we have rather than dropping the index
+        log_json(LOG, 30, "ann_index_signature_failed", name=name, error=str(e))
+        return None
+
+
+def get_index(
+    name: str,
+    loader: Callable[[], tuple[Sequence, np.ndarray]] | None = None,
+    kind: str | None = None,
+    signature: Callable[[], str] | None = None,
+) -> VectorIndex | None:
+    """
+    Return the process-wide index for name, loading it from disk or building it.
+
+    Args:
+        name: Index name (file stem under ANN_INDEX_DIR)
+        loader: Optional callable returning (ids, vectors) used when no usable snapshot exists
+        kind: Backend for newly built indexes (defaults to ANN_BACKEND)
+        signature: Optional cheap callable describing the source rows; a snapshot or
+            in-memory index whose signature differs is rebuilt via loader (checked at
+            most every ANN_REVALIDATE_S seconds)
+
+    Returns:
+        The index, or None when there is no snapshot and no loader/data.
+    """
+    with _INDEX_LOCK:
+        index = _INDEXES.get(name)
+        now = time.monotonic()
+        if index is not None and (signature is None or now - _CHECKED_AT.get(name, now) < ANN_REVALIDATE_S):
+            return index
+        current = _current_signature(name, signature)
+        if index is not None and current is not None and index.signature != current:
+            log_json(LOG, 20, "ann_index_stale", name=name, source="memory")
+            index = None
+        path = index_path(name)
+        if index is None and path.exists():
+            try:
+                index = VectorIndex.load(path)
+            except Exception as e:
+                log_json(LOG, 30, "ann_index_load_failed", name=name, error=str(e))
+            if index is not None and current is not None and index.signature != current:
+                log_json(LOG, 20, "ann_index_stale", name=name, source="snapshot")
+                index = None
+        if index is None and loader is not None:
+            ids, vectors = loader()
+            if len(ids):
+                index = create_index(kind)
+                index.upsert(ids, vectors)
+                index.signature = current or ""
+                index.save(path)
+                log_json(LOG, 20, "ann_index_built", name=name, kind=index.kind, rows=len(index))
+        if index is not None:
+            _INDEXES[name] = index
+            _CHECKED_AT[name] = now
+        else:
+            _INDEXES.pop(name, None)
+        return index
+
+
+def reset_index_cache() -> None:
+    with _INDEX_LOCK:
+        _INDEXES.clear()
+        _CHECKED_AT.clear()
+
+
+def recall_at_k(approx: Neighbors, exact: Neighbors) -> float:
+    """Mean fraction of exact neighbour ids recovered by the approximate results."""
+    scores = []
+    for a, e in zip(approx, exact, strict=True):
+        if not e:
+            continue
+        truth = {item_id for item_id, _ in e}
+        scores.append(len(truth & {item_id for item_id, _ in a}) / len(truth))
+    return float(np.mean(scores)) if scores else 1.0
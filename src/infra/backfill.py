@@ -0,0 +1,297 @@
+# OPS meta: Rules 050/051/052 AlwaysApply | SSOT: ruff | Housekeeping: `make housekeeping`
+# Timestamp contract: RFC3339 fast-lane (generated_at RFC3339; metadata.source="fallback_fast_lane")
+
+"""
+Resumable embedding backfill engine.
+
+One pipeline shared by the embedding backfill scripts:
+
+    reader (server-side cursor) -> embed pool (concurrent batches) -> writer (COPY + merge)
+
+Rows are streamed in key order with a named cursor, so memory stays flat on
+full-corpus runs. Batches are embedded concurrently while the writer thread
+stores finished batches on its own connection, in order. After each committed
+batch the key of its last row is saved as a high-water mark; a job stopped by
+--limit or an error resumes after it. The mark is removed once a run reads
+the source to the end, so the next run rescans from the start (keys are not
+necessarily increasing with insertion, e.g. random UUIDs).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import queue
+import threading
+import time
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from operator import itemgetter
+from pathlib import Path
+from typing import Any
+
+from src.infra.rate_limit import LM_MAX_INFLIGHT
+from src.infra.structured_logger import get_logger, log_json
+
+LOG = get_logger("backfill")
+
+BACKFILL_BATCH_SIZE = int(os.getenv("BACKFILL_BATCH_SIZE", "64"))
+BACKFILL_EMBED_WORKERS = int(os.getenv("BACKFILL_EMBED_WORKERS", str(LM_MAX_INFLIGHT)))
+BACKFILL_FETCH_SIZE = int(os.getenv("BACKFILL_FETCH_SIZE", "2000"))
+BACKFILL_CHECKPOINT_DIR = os.getenv("BACKFILL_CHECKPOINT_DIR", "var/cache/backfill")
+BACKFILL_PROGRESS_EVERY_S = float(os.getenv("BACKFILL_PROGRESS_EVERY_S", "10"))
+
+Row = Sequence[Any]
+_DONE = object()
+
+
+def format_vector(values: Iterable[float]) -> str:
+    """pgvector text form ("[x,y,...]"), usable in COPY without registering the vector type."""
+    return "[" + ",".join(repr(float(v)) for v in values) + "]"
+
+
+def make_staging(cur, name: str, columns: dict[str, str]) -> None:
+    """Create a session temp table {column: sql_type} that empties itself on commit."""
+    from psycopg import sql
+
+    cur.execute(
+        sql.SQL("CREATE TEMP TABLE IF NOT EXISTS {} ({}) ON COMMIT DELETE ROWS").format(
+            sql.Identifier(name),
+            sql.SQL(", ").join(sql.SQL("{} {}").format(sql.Identifier(c), sql.SQL(t)) for c, t in columns.items()),
+        )
+    )
+
+
+def copy_rows(cur, table: str, columns: Sequence[str], rows: Iterable[Row]) -> int:
+    """COPY rows into table(columns). Returns the number of rows sent."""
+    from psycopg import sql
+
+    statement = sql.SQL("COPY {} ({}) FROM STDIN").format(
+        sql.Identifier(*table.split(".")),
+        sql.SQL(", ").join(map(sql.Identifier, columns)),
+    )
+    count = 0
+    with cur.copy(statement) as copy:
+        for row in rows:
+            copy.write_row(row)
+            count += 1
+    return count
+
+
+class Checkpoint:
+    """High-water mark for one backfill job, stored as JSON under BACKFILL_CHECKPOINT_DIR."""
+
+    def __init__(self, name: str, directory: str | Path | None = None):
+        safe = "".join(ch if ch.isalnum() or ch in "-_." else "_" for ch in name)
+        self.path = Path(directory or BACKFILL_CHECKPOINT_DIR) / f"{safe}.json"
+
+    def load(self) -> dict[str, Any] | None:
+        try:
+            return json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def save(self, after: Any, rows: int) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        payload = {"after": after, "rows": rows, "updated_at": datetime.now(UTC).isoformat()}
+        tmp.write_text(json.dumps(payload, default=str), encoding="utf-8")
+        os.replace(tmp, self.path)
+
+    def clear(self) -> None:
+        self.path.unlink(missing_ok=True)
+
+
+@dataclass
+class BackfillJob:
+    """
+    What to backfill and how.
+
+    select_sql runs on a server-side cursor with params plus "after" (the
+    high-water key, None on a fresh start). It must only return rows whose key
+    is greater than %(after)s and must ORDER BY that key.
+    """
+
+    name: str
+    select_sql: str
+    document: Callable[[Row], str]
+    embed: Callable[[list[str]], list[list[float]]]
+    write: Callable[[Any, list[Row], list[list[float]]], int]
+    params: dict[str, Any] = field(default_factory=dict)
+    key: Callable[[Row], Any] = itemgetter(0)
+    batch_size: int = BACKFILL_BATCH_SIZE
+    workers: int = BACKFILL_EMBED_WORKERS
+
+
+@dataclass
+class BackfillStats:
+    job: str
+    resumed_from: Any = None
+    rows: int = 0
+    written: int = 0
+    batches: int = 0
+    elapsed_s: float = 0.0
+    complete: bool = False
+
+    @property
+    def rows_per_sec(self) -> float:
+        return self.rows / self.elapsed_s if self.elapsed_s > 0 else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "job": self.job,
+            "resumed_from": self.resumed_from,
+            "rows": self.rows,
+            "written": self.written,
+            "batches": self.batches,
+            "elapsed_s": round(self.elapsed_s, 3),
+            "rows_per_sec": round(self.rows_per_sec, 1),
+            "complete": self.complete,
+        }
+
+
+def _default_connect(dsn: str):
+    import psycopg
+
+    return psycopg.connect(dsn)
+
+
+def _embed_batch(job: BackfillJob, rows: list[Row]) -> tuple[list[Row], list[list[float]]]:
+    embeddings = job.embed([job.document(row) for row in rows])
+    if len(embeddings) != len(rows):
+        raise RuntimeError(f"{job.name}: got {len(embeddings)} embeddings for {len(rows)} rows")
+    return rows, embeddings
+
+
+def run_backfill(
+    job: BackfillJob,
+    dsn: str,
+    limit: int | None = None,
+    restart: bool = False,
+    checkpoint_dir: str | Path | None = None,
+    connect: Callable[[str], Any] | None = None,
+    on_progress: Callable[[BackfillStats], None] | None = None,
+) -> BackfillStats:
+    """
+    Run (or resume) a backfill job and return its stats.
+
+    limit caps the rows handled in this run, so a full-corpus re-embed can be
+    done as a series of bounded runs. restart discards the saved high-water
+    mark. On error the exception is re-raised after in-flight batches are
+    dropped; the checkpoint still points at the last committed batch. A
+    complete run clears the checkpoint.
+    """
+    connect = connect or _default_connect
+    checkpoint = Checkpoint(job.name, checkpoint_dir)
+    if restart:
+        checkpoint.clear()
+    saved = checkpoint.load() or {}
+    after = saved.get("after")
+    stats = BackfillStats(job=job.name, resumed_from=after)
+
+    batch_size = max(1, job.batch_size)
+    workers = max(1, job.workers)
+    pending: queue.Queue = queue.Queue(maxsize=workers * 2)
+    stop = threading.Event()
+    errors: list[BaseException] = []
+    started = time.monotonic()
+    total_rows = int(saved.get("rows", 0))
+
+    def report(event: str) -> None:
+        stats.elapsed_s = time.monotonic() - started
+        log_json(LOG, 20, event, **stats.to_dict())
+        if on_progress is not None:
+            on_progress(stats)
+
+    def writer() -> None:
+        nonlocal total_rows
+        last_report = time.monotonic()
+        try:
+            conn = connect(dsn)
+        except BaseException as e:
+            errors.append(e)
+            stop.set()
+            conn = None
+        try:
+            while True:
+                item = pending.get()
+                if item is _DONE:
+                    return
+                if stop.is_set():
+                    # Keep draining so the reader never blocks on a full queue
+                    continue
+                try:
+                    rows, embeddings = item.result()
+                    with conn.cursor() as cur:
+                        stats.written += job.write(cur, rows, embeddings)
+                    conn.commit()
+                except BaseException as e:
+                    errors.append(e)
+                    stop.set()
+                    continue
+                total_rows += len(rows)
+                checkpoint.save(job.key(rows[-1]), total_rows)
+                stats.rows += len(rows)
+                stats.batches += 1
+                if time.monotonic() - last_report >= BACKFILL_PROGRESS_EVERY_S:
+                    last_report = time.monotonic()
+                    report("backfill_progress")
+        finally:
+            if conn is not None:
+                conn.close()
+
+    def submit(pool: ThreadPoolExecutor, rows: list[Row]) -> None:
+        future: Future = pool.submit(_embed_batch, job, rows)
+        while not stop.is_set():
+            try:
+                pending.put(future, timeout=0.5)
+                return
+            except queue.Full:
+                continue
+
+    writer_thread = threading.Thread(target=writer, name=f"backfill-writer-{job.name}", daemon=True)
+    writer_thread.start()
+    pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="backfill-embed")
+    exhausted = False
+    try:
+        conn = connect(dsn)
+        try:
+            with conn.cursor(name="backfill_reader") as cur:
+                cur.itersize = BACKFILL_FETCH_SIZE
+                cur.execute(job.select_sql, {**job.params, "after": after})
+                batch: list[Row] = []
+                read = 0
+                exhausted = True
+                for row in cur:
+                    if stop.is_set():
+                        exhausted = False
+                        break
+                    if limit is not None and read >= limit:
+                        exhausted = False
+                        break
+                    batch.append(row)
+                    read += 1
+                    if len(batch) >= batch_size:
+                        submit(pool, batch)
+                        batch = []
+                if batch and not stop.is_set():
+                    submit(pool, batch)
+        finally:
+            conn.close()
+    except BaseException as e:
+        errors.append(e)
+        stop.set()
+    finally:
+        pending.put(_DONE)
+        writer_thread.join()
+        pool.shutdown(wait=True, cancel_futures=True)
+
+    stats.complete = exhausted and not errors
+    if stats.complete:
+        checkpoint.clear()
+    report("backfill_done" if not errors else "backfill_failed")
+    if errors:
+        raise errors[0]
+    return stats
@@ -0,0 +1,103 @@
+# OPS meta: Rules 050/051/052 AlwaysApply | SSOT: ruff | Housekeeping: `make housekeeping`
+# Timestamp contract: RFC3339 fast-lane (generated_at RFC3339; metadata.source="fallback_fast_lane")
+
+"""
+Bounded thread-pool offload for blocking work in async request handlers.
+
+Sync DB/LM calls made directly in an `async def` handler stall the event loop
+and every other request with it. run_blocking() runs them on one bounded,
+process-wide executor instead, and caps how many requests of the same route
+group may occupy it at once so a slow route cannot starve the rest.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+import os
+import threading
+import weakref
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+
+R = TypeVar("R")
+
+# Worker threads shared by all offloaded handlers
+API_BLOCKING_WORKERS = int(os.getenv("API_BLOCKING_WORKERS", "32"))
+# Default in-flight cap per route group; override per group with API_ROUTE_LIMITS="bible=8,mcp=4"
+API_ROUTE_CONCURRENCY = int(os.getenv("API_ROUTE_CONCURRENCY", "8"))
+API_ROUTE_LIMITS = os.getenv("API_ROUTE_LIMITS", "")
+
+_EXECUTOR: ThreadPoolExecutor | None = None
+_EXECUTOR_LOCK = threading.Lock()
+
+# asyncio.Semaphore belongs to one event loop, so limits are kept per loop
+_ROUTE_SEMAPHORES: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, asyncio.Semaphore]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """Return the process-wide executor for blocking handler work (created on first use)."""
+    global _EXECUTOR
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is None:
+            _EXECUTOR = ThreadPoolExecutor(max_workers=max(1, API_BLOCKING_WORKERS), thread_name_prefix="api-blocking")
+        return _EXECUTOR
+
+
+def shutdown_executor(wait: bool = True) -> None:
+    global _EXECUTOR
+    with _EXECUTOR_LOCK:
+        executor, _EXECUTOR = _EXECUTOR, None
+    if executor is not None:
+        executor.shutdown(wait=wait)
+
+
+def _parse_route_limits(spec: str) -> dict[str, int]:
+    limits: dict[str, int] = {}
+    for item in spec.split(","):
+        name, sep, value = item.partition("=")
+        if sep and name.strip() and value.strip().isdigit():
+            limits[name.strip()] = int(value)
+    return limits
+
+
+def route_limit(route: str, default: int | None = None) -> int:
+    """In-flight cap for a route group: API_ROUTE_LIMITS, else default, else API_ROUTE_CONCURRENCY."""
+    configured = _parse_route_limits(API_ROUTE_LIMITS).get(route)
+    return max(1, configured or default or API_ROUTE_CONCURRENCY)
+
+
+def _route_semaphore(route: str, limit: int | None) -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    semaphores = _ROUTE_SEMAPHORES.setdefault(loop, {})
+    if route not in semaphores:
+        semaphores[route] = asyncio.Semaphore(route_limit(route, limit))
+    return semaphores[route]
+
+
+async def run_blocking(route: str, fn: Callable[..., R], *args: Any, limit: int | None = None, **kwargs: Any) -> R:
+    """Await fn(*args, **kwargs) on the blocking executor, at most route_limit(route) at a time."""
+    call = functools.partial(contextvars.copy_context().run, fn, *args, **kwargs)
+    async with _route_semaphore(route, limit):
+        return await asyncio.get_running_loop().run_in_executor(get_executor(), call)
+
+
+def blocking_route(route: str, limit: int | None = None) -> Callable[[Callable[..., R]], Callable[..., Awaitable[R]]]:
+    """Turn a sync handler into an async one that runs via run_blocking().
+
+    Apply below the FastAPI route decorator; the wrapped signature (and so the
+    request parameters FastAPI derives from it) is preserved.
+    """
+
+    def decorator(fn: Callable[..., R]) -> Callable[..., Awaitable[R]]:
+        @functools.wraps(fn)
+        async def handler(*args: Any, **kwargs: Any) -> R:
+            return await run_blocking(route, fn, *args, limit=limit, **kwargs)
+
+        return handler
+
+    return decorator
@@ -0,0 +1,89 @@
+# OPS meta: Rules 050/051/052 AlwaysApply | SSOT: ruff | Housekeeping: `make housekeeping`
+# Timestamp contract: RFC3339 fast-lane (generated_at RFC3339; metadata.source="fallback_fast_lane")
+
+"""
+Bulk write helpers for graph upserts.
+
+Rows are sent with cursor.executemany() in chunks of BULK_FLUSH_SIZE. psycopg 3
+runs executemany in pipeline mode, so each chunk costs one network round trip
+instead of one per row, while ON CONFLICT clauses keep their per-row semantics.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+BULK_FLUSH_SIZE = int(os.getenv("BULK_FLUSH_SIZE", "1000"))
+
+Row = Sequence[Any]
+
+
+def _chunks(rows: Sequence[Row], size: int) -> Iterable[Sequence[Row]]:
+    size = max(1, size)
+    for i in range(0, len(rows), size):
+        yield rows[i : i + size]
+
+
+def executemany_chunked(cur, sql: str, rows: Iterable[Row], flush_size: int | None = None) -> int:
+    """Execute sql once per row, flush_size rows per executemany call. Returns rows written."""
+    rows = list(rows)
+    for chunk in _chunks(rows, flush_size or BULK_FLUSH_SIZE):
+        cur.executemany(sql, chunk)
+    return len(rows)
+
+
+def executemany_returning(cur, sql: str, rows: Iterable[Row], flush_size: int | None = None) -> list[tuple]:
+    """
+    Bulk variant of execute + fetchone for INSERT ... RETURNING statements.
+
+    Returns the first RETURNING row of every statement, in input order.
+    """
+    rows = list(rows)
+    returned: list[tuple] = []
+    for chunk in _chunks(rows, flush_size or BULK_FLUSH_SIZE):
+        cur.executemany(sql, chunk, returning=True)
+        while True:
+            returned.append(cur.fetchone())
+            if not cur.nextset():
+                break
+    return returned
+
+
+class BulkWriter:
+    """
+    Buffer rows for one statement and flush them in executemany chunks.
+
+    Use as a context manager so the tail is flushed on success:
+
+        with BulkWriter(cur, INSERT_SQL) as writer:
+            for row in rows:
+                writer.add(row)
+    """
+
+    def __init__(self, cur, sql: str, flush_size: int | None = None):
+        self.cur = cur
+        self.sql = sql
+        self.flush_size = max(1, flush_size or BULK_FLUSH_SIZE)
+        self.written = 0
+        self._pending: list[Row] = []
+
+    def add(self, row: Row) -> None:
+        self._pending.append(row)
+        if len(self._pending) >= self.flush_size:
+            self.flush()
+
+    def flush(self) -> int:
+        if self._pending:
+            self.cur.executemany(self.sql, self._pending)
+            self.written += len(self._pending)
+            self._pending = []
+        return self.written
+
+    def __enter__(self) -> BulkWriter:
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.flush()
@@ -12,12 +12,7 @@ from langgraph.checkpoint.base import BaseCheckpointSaver
 from langgraph.checkpoint.memory import MemorySaver
 from scripts.config.env import get_rw_dsn
 
-try:
-    import psycopg
-
-    HAS_DB = True
-except Exception:  # pragma: no cover
-    HAS_DB = False
+from .db_pool import HAS_DB, pooled_connection
 
 WORKFLOW_ID = os.getenv("WORKFLOW_ID", "gemantria.v1")
 
@@ -33,7 +28,8 @@ class PostgresCheckpointer(BaseCheckpointSaver):
         self.conn_string = conn_string
 
     def _connect(self):
-        return psycopg.connect(self.conn_string)
+        # Borrow from the shared pool; LangGraph calls this on every node transition
+        return pooled_connection(self.conn_string)
 
     def get_tuple(self, config: dict[str, Any]) -> Any:
         """Get latest checkpoint tuple for thread."""
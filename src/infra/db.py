@@ -10,13 +10,8 @@ from typing import Any
 
 from scripts.config.env import get_bible_db_dsn, get_rw_dsn
 
-try:
-    # psycopg 3 preferred
-    import psycopg
-
-    HAS_DB = True
-except Exception:  # pragma: no cover
-    HAS_DB = False  # Import optional for CI paths without DSNs
+from .bulk_writer import executemany_chunked
+from .db_pool import HAS_DB, pooled_connection  # psycopg stays optional for CI paths without DSNs
 
 __all__ = [
     "BibleReadOnly",
@@ -55,7 +50,7 @@ class BibleReadOnly:
             raise RuntimeError("BIBLE_DB_DSN not set; cannot execute read query")
         if not HAS_DB:
             raise RuntimeError("psycopg not available in this environment")
-        with psycopg.connect(self.dsn) as conn:
+        with pooled_connection(self.dsn) as conn:
             with conn.cursor() as cur:
                 cur.execute(sql, params or ())
                 yield from cur
@@ -70,12 +65,25 @@ class GematriaRW:
             raise RuntimeError("GEMATRIA_DSN not set; cannot execute query")
         if not HAS_DB:
             raise RuntimeError("psycopg not available in this environment")
-        with psycopg.connect(self.dsn) as conn:
+        with pooled_connection(self.dsn) as conn:
             with conn.cursor() as cur:
                 cur.execute(sql, params or ())
                 if cur.description:
                     yield from cur
 
+    def executemany(self, sql: str, rows: Iterable[Sequence[Any]], flush_size: int | None = None) -> int:
+        """Write many parameter rows over one connection/transaction (pipelined executemany chunks)."""
+        rows = list(rows)
+        if not rows:
+            return 0
+        if not self.dsn:
+            raise RuntimeError("GEMATRIA_DSN not set; cannot execute query")
+        if not HAS_DB:
+            raise RuntimeError("psycopg not available in this environment")
+        with pooled_connection(self.dsn) as conn:
+            with conn.cursor() as cur:
+                return executemany_chunked(cur, sql, rows, flush_size)
+
 
 def get_bible_ro() -> BibleReadOnly:
     return BibleReadOnly(dsn=get_bible_db_dsn())
@@ -0,0 +1,144 @@
+# OPS meta: Rules 050/051/052 AlwaysApply | SSOT: ruff | Housekeeping: `make housekeeping`
+# Timestamp contract: RFC3339 fast-lane (generated_at RFC3339; metadata.source="fallback_fast_lane")
+
+"""
+Process-wide psycopg connection pools, one per DSN.
+
+Shared by the LangGraph checkpointer, the GematriaRW/BibleReadOnly facades and
+the metrics sink so hot paths borrow an open connection instead of paying a
+connect per call. Falls back to plain psycopg.connect() when psycopg_pool is
+not installed.
+"""
+
+from __future__ import annotations
+
+import atexit
+import os
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+try:
+    import psycopg
+
+    HAS_DB = True
+except Exception:  # pragma: no cover
+    HAS_DB = False
+
+try:
+    from psycopg_pool import ConnectionPool, PoolTimeout
+
+    HAS_POOL = True
+except Exception:  # pragma: no cover
+    HAS_POOL = False
+
+DB_POOL_ENABLED = os.getenv("DB_POOL_ENABLED", "1") not in ("0", "false", "False")
+DB_POOL_MIN_SIZE = int(os.getenv("DB_POOL_MIN_SIZE", "1"))
+DB_POOL_MAX_SIZE = int(os.getenv("DB_POOL_MAX_SIZE", "10"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))  # seconds to wait for a free connection
+DB_POOL_MAX_IDLE = float(os.getenv("DB_POOL_MAX_IDLE", "600"))  # close idle extras after this many seconds
+DB_CONNECT_TIMEOUT = int(os.getenv("DB_CONNECT_TIMEOUT", "5"))  # libpq connect_timeout for new connections
+
+_POOLS: dict[str, Any] = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def _redact(dsn: str) -> str:
+    """Pool name safe for logs/stats (no password)."""
+    if "@" in dsn and "://" in dsn:
+        scheme, rest = dsn.split("://", 1)
+        return f"{scheme}://{rest.split('@', 1)[1]}"
+    return dsn.split("password=")[0].strip()
+
+
+def _probe(dsn: str) -> None:
+    """Open and close one direct connection; raises psycopg.OperationalError when dsn is unreachable."""
+    psycopg.connect(dsn, connect_timeout=DB_CONNECT_TIMEOUT).close()
+
+
+def _discard(dsn: str, pool) -> None:
+    with _POOLS_LOCK:
+        if _POOLS.get(dsn) is pool:
+            del _POOLS[dsn]
+    pool.close(timeout=0)
+
+
+def get_pool(dsn: str):
+    """
+    Return the shared pool for dsn, opening it on first use (None if pooling is unavailable).
+
+    A direct connection is tried before the pool is created, so an unreachable
+    server raises psycopg.OperationalError right away instead of leaving a pool
+    that retries in the background while callers wait DB_POOL_TIMEOUT.
+    """
+    if not (DB_POOL_ENABLED and HAS_POOL and dsn):
+        return None
+    with _POOLS_LOCK:
+        pool = _POOLS.get(dsn)
+        if pool is None:
+            _probe(dsn)
+            pool = ConnectionPool(
+                dsn,
+                kwargs={"connect_timeout": DB_CONNECT_TIMEOUT},
+                min_size=max(0, DB_POOL_MIN_SIZE),
+                max_size=max(1, DB_POOL_MAX_SIZE, DB_POOL_MIN_SIZE),
+                timeout=DB_POOL_TIMEOUT,
+                max_idle=DB_POOL_MAX_IDLE,
+                # Health check: validate a connection before handing it out
+                check=ConnectionPool.check_connection,
+                name=_redact(dsn),
+                open=False,
+            )
+            pool.open(wait=False)
+            _POOLS[dsn] = pool
+        return pool
+
+
+@contextmanager
+def pooled_connection(dsn: str) -> Iterator[Any]:
+    """
+    Borrow a connection for dsn.
+
+    Behaves like `with psycopg.connect(dsn) as conn`: commits on clean exit and
+    rolls back on error, then returns the connection to the pool.
+    """
+    if not HAS_DB:
+        raise RuntimeError("psycopg not available in this environment")
+    pool = get_pool(dsn)
+    if pool is None:
+        with psycopg.connect(dsn) as conn:
+            yield conn
+        return
+    try:
+        conn = pool.getconn()
+    except PoolTimeout:
+        # Server gone since the pool opened: surface the connect error and drop the
+        # pool so later calls fail fast in get_pool until the server is back
+        try:
+            _probe(dsn)
+        except psycopg.OperationalError:
+            _discard(dsn, pool)
+            raise
+        raise  # reachable, just saturated
+    try:
+        with conn:
+            yield conn
+    finally:
+        pool.putconn(conn)
+
+
+def pool_stats() -> dict[str, dict[str, int]]:
+    """Per-pool counters from psycopg_pool (requests, waits, connections, errors, ...)."""
+    with _POOLS_LOCK:
+        pools = list(_POOLS.values())
+    return {pool.name: pool.get_stats() for pool in pools}
+
+
+@atexit.register
+def close_pools() -> None:
+    with _POOLS_LOCK:
+        pools = list(_POOLS.values())
+        _POOLS.clear()
+    for pool in pools:
+        pool.close()
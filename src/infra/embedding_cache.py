@@ -0,0 +1,222 @@
+# OPS meta: Rules 050/051/052 AlwaysApply | SSOT: ruff | Housekeeping: `make housekeeping`
+# Timestamp contract: RFC3339 fast-lane (generated_at RFC3339; metadata.source="fallback_fast_lane")
+
+"""
+Content-addressed embedding cache shared by all embed call sites.
+
+Vectors are keyed by sha256(provider endpoint, model, normalized text) and
+stored exactly as the provider returned them; callers that post-process
+(e.g. L2-normalize) do so after the lookup. Lookups go through an in-memory
+LRU tier first, then a local SQLite store of float32 blobs; only the
+remaining misses are sent to the provider, deduplicated within the batch.
+Empty vectors (items the provider returned no embedding for) are never stored.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import unicodedata
+from array import array
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from pathlib import Path
+
+from .structured_logger import get_logger, log_json
+
+LOG = get_logger("gemantria.embedding_cache")
+
+EMBED_CACHE_PATH = os.getenv("EMBED_CACHE_PATH", "var/cache/embeddings.sqlite")  # "" = memory tier only
+EMBED_CACHE_LRU_SIZE = int(os.getenv("EMBED_CACHE_LRU_SIZE", "8192"))
+
+Vector = list[float]
+
+
+def normalize_text(text: str) -> str:
+    """NFC + whitespace squeeze so formatting differences share one cache entry."""
+    text = unicodedata.normalize("NFC", str(text))
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def cache_key(model: str, text: str, provider: str = "") -> str:
+    return hashlib.sha256(f"{provider}\x00{model}\x00{normalize_text(text)}".encode()).hexdigest()
+
+
+class EmbeddingCache:
+    """Two-tier (LRU memory + SQLite disk) embedding cache with hit/miss/eviction counters."""
+
+    def __init__(self, path: str | Path | None = EMBED_CACHE_PATH, capacity: int = EMBED_CACHE_LRU_SIZE):
+        self.path = Path(path) if path else None
+        self.capacity = max(0, capacity)
+        self._lru: OrderedDict[str, Vector] = OrderedDict()
+        self._lock = threading.RLock()
+        self._db: sqlite3.Connection | None = None
+        self._disk_failed = False
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.dedup_saved = 0
+
+    # --- disk tier -------------------------------------------------------------
+
+    def _conn(self) -> sqlite3.Connection | None:
+        if self.path is None or self._disk_failed:
+            return None
+        if self._db is None:
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._db = sqlite3.connect(str(self.path), check_same_thread=False)
+                self._db.execute("PRAGMA journal_mode=WAL")
+                self._db.execute(
+                    "CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, model TEXT, dim INTEGER, vec BLOB)"
+                )
+            except sqlite3.Error as e:
+                # Fail-open: keep serving from the memory tier
+                log_json(LOG, 30, "embedding_cache_disk_unavailable", path=str(self.path), error=str(e))
+                self._disk_failed = True
+                self._db = None
+        return self._db
+
+    def _disk_get(self, keys: list[str]) -> dict[str, Vector]:
+        conn = self._conn()
+        if conn is None or not keys:
+            return {}
+        found: dict[str, Vector] = {}
+        try:
+            for i in range(0, len(keys), 500):
+                chunk = keys[i : i + 500]
+                sql = "SELECT key, vec FROM embeddings WHERE key IN (" + ",".join("?" * len(chunk)) + ")"
+                for key, blob in conn.execute(sql, chunk):
+                    found[key] = array("f", blob).tolist()
+        except sqlite3.Error as e:
+            log_json(LOG, 30, "embedding_cache_disk_read_failed", error=str(e))
+        return found
+
+    def _disk_put(self, model: str, items: dict[str, Vector]) -> None:
+        conn = self._conn()
+        if conn is None or not items:
+            return
+        try:
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO embeddings (key, model, dim, vec) VALUES (?, ?, ?, ?)",
+                    [(key, model, len(vec), array("f", vec).tobytes()) for key, vec in items.items()],
+                )
+        except sqlite3.Error as e:
+            log_json(LOG, 30, "embedding_cache_disk_write_failed", error=str(e))
+
+    # --- memory tier -----------------------------------------------------------
+
+    def _remember(self, key: str, vec: Vector) -> None:
+        if self.capacity == 0:
+            return
+        self._lru[key] = vec
+        self._lru.move_to_end(key)
+        while len(self._lru) > self.capacity:
+            self._lru.popitem(last=False)
+            self.evictions += 1
+
+    # --- public API ------------------------------------------------------------
+
+    def embed(
+        self, model: str, texts: Sequence[str], compute: Callable[[list[str]], list[Vector]], provider: str = ""
+    ) -> list[Vector]:
+        """
+        Return one embedding per text, calling compute only for unique cache misses.
+
+        Args:
+            model: Embedding model name (part of the cache key)
+            texts: Texts to embed, in caller order
+            compute: Provider call taking a list of texts and returning their raw vectors in order
+            provider: Provider endpoint (part of the cache key; the same model name
+                served elsewhere may return different vectors)
+
+        Returns:
+            Embeddings aligned with texts.
+        """
+        texts = [str(t) for t in texts]
+        if not texts:
+            return []
+        keys = [cache_key(model, t, provider) for t in texts]
+
+        with self._lock:
+            found: dict[str, Vector] = {}
+            for key in dict.fromkeys(keys):
+                vec = self._lru.get(key)
+                if vec is not None:
+                    self._lru.move_to_end(key)
+                    found[key] = vec
+            from_disk = self._disk_get([k for k in dict.fromkeys(keys) if k not in found])
+            for key, vec in from_disk.items():
+                self._remember(key, vec)
+            found.update(from_disk)
+            self.disk_hits += sum(1 for k in keys if k in from_disk)
+            self.hits += sum(1 for k in keys if k in found)
+
+        # Deduplicate misses so each unique text is sent to the provider once
+        missing: dict[str, str] = {}
+        for key, text in zip(keys, texts, strict=True):
+            if key not in found and key not in missing:
+                missing[key] = text
+        if missing:
+            vectors = compute(list(missing.values()))
+            if len(vectors) != len(missing):
+                raise RuntimeError(f"Embedding provider returned {len(vectors)} vectors for {len(missing)} texts")
+            computed = {key: list(vec) for key, vec in zip(missing, vectors, strict=True)}
+            storable = {key: vec for key, vec in computed.items() if vec}
+            with self._lock:
+                for key, vec in storable.items():
+                    self._remember(key, vec)
+                self._disk_put(model, storable)
+                self.misses += len(missing)
+                self.dedup_saved += sum(1 for k in keys if k in missing) - len(missing)
+            found.update(computed)
+
+        return [found[key] for key in keys]
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "dedup_saved": self.dedup_saved,
+                "memory_items": len(self._lru),
+            }
+
+    def clear(self, disk: bool = False) -> None:
+        with self._lock:
+            self._lru.clear()
+            if disk and self._conn() is not None:
+                with self._db:
+                    self._db.execute("DELETE FROM embeddings")
+
+
+_CACHE: EmbeddingCache | None = None
+_CACHE_LOCK = threading.Lock()
+
+
+def get_embedding_cache() -> EmbeddingCache:
+    global _CACHE
+    with _CACHE_LOCK:
+        if _CACHE is None:
+            _CACHE = EmbeddingCache()
+        return _CACHE
+
+
+def cached_embed(
+    model: str, texts: Sequence[str], compute: Callable[[list[str]], list[Vector]], provider: str = ""
+) -> list[Vector]:
+    """Embed through the shared cache, or call compute directly when EMBED_CACHE_ENABLED=0."""
+    if os.getenv("EMBED_CACHE_ENABLED", "1") in ("0", "false", "False"):
+        return compute([str(t) for t in texts])
+    return get_embedding_cache().embed(model, texts, compute, provider)
+
+
+def embedding_cache_stats() -> dict[str, int]:
+    return get_embedding_cache().stats() if _CACHE is not None else {}
@@ -0,0 +1,144 @@
+# OPS meta: Rules 050/051/052 AlwaysApply | SSOT: ruff | Housekeeping: `make housekeeping`
+# Timestamp contract: RFC3339 fast-lane (generated_at RFC3339; metadata.source="fallback_fast_lane")
+
+"""
+Shared keep-alive HTTP transport for LM provider adapters.
+
+All adapters post through one process-wide requests.Session per name, backed by
+a pooled HTTPAdapter, so repeated embedding/chat calls reuse TCP connections
+instead of paying a handshake each time. Connection counters (requests, new
+connections, connect time) are kept so reuse can be observed in pipeline runs.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+# Distinct hosts kept in the pool, and keep-alive connections per host
+HTTP_POOL_CONNECTIONS = int(os.getenv("HTTP_POOL_CONNECTIONS", "10"))
+HTTP_POOL_MAXSIZE = int(os.getenv("HTTP_POOL_MAXSIZE", "32"))
+# Block (rather than open throwaway connections) when a host's pool is exhausted
+HTTP_POOL_BLOCK = os.getenv("HTTP_POOL_BLOCK", "0") in ("1", "true", "True")
+
+
+class _PoolStats:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        self.requests = 0
+        self.connections_opened = 0
+        self.connect_ms_total = 0.0
+
+    def record_request(self) -> None:
+        with self._lock:
+            self.requests += 1
+
+    def record_connect(self, ms: float) -> None:
+        with self._lock:
+            self.connections_opened += 1
+            self.connect_ms_total += ms
+
+    def snapshot(self) -> dict[str, float]:
+        with self._lock:
+            reused = max(0, self.requests - self.connections_opened)
+            return {
+                "requests": self.requests,
+                "connections_opened": self.connections_opened,
+                "reuse_ratio": round(reused / self.requests, 4) if self.requests else 0.0,
+                "connect_ms_total": round(self.connect_ms_total, 3),
+                "avg_connect_ms": (
+                    round(self.connect_ms_total / self.connections_opened, 3) if self.connections_opened else 0.0
+                ),
+            }
+
+
+_STATS = _PoolStats()
+
+
+def _timed_connect(conn) -> None:
+    connect = conn.connect
+
+    def _connect():
+        t0 = time.perf_counter()
+        try:
+            return connect()
+        finally:
+            _STATS.record_connect((time.perf_counter() - t0) * 1000.0)
+
+    conn.connect = _connect
+
+
+class _InstrumentedHTTPPool(HTTPConnectionPool):
+    def _new_conn(self):
+        conn = super()._new_conn()
+        _timed_connect(conn)
+        return conn
+
+
+class _InstrumentedHTTPSPool(HTTPSConnectionPool):
+    def _new_conn(self):
+        conn = super()._new_conn()
+        _timed_connect(conn)
+        return conn
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter whose connection pools report new connections and connect latency."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {"http": _InstrumentedHTTPPool, "https": _InstrumentedHTTPSPool}
+
+    def send(self, request, *args, **kwargs):
+        _STATS.record_request()
+        return super().send(request, *args, **kwargs)
+
+
+def build_session(
+    pool_connections: int = HTTP_POOL_CONNECTIONS,
+    pool_maxsize: int = HTTP_POOL_MAXSIZE,
+    pool_block: bool = HTTP_POOL_BLOCK,
+) -> requests.Session:
+    session = requests.Session()
+    # Retries stay with the callers, which already implement their own backoff
+    adapter = PooledHTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+_SESSIONS: dict[str, requests.Session] = {}
+_SESSIONS_LOCK = threading.Lock()
+
+
+def get_http_session(name: str = "default") -> requests.Session:
+    """Process-wide pooled session; adapters share "default" unless they need isolation."""
+    with _SESSIONS_LOCK:
+        session = _SESSIONS.get(name)
+        if session is None:
+            session = _SESSIONS[name] = build_session()
+        return session
+
+
+def close_http_sessions() -> None:
+    with _SESSIONS_LOCK:
+        for session in _SESSIONS.values():
+            session.close()
+        _SESSIONS.clear()
+
+
+def http_pool_stats() -> dict[str, float]:
+    return _STATS.snapshot()
+
+
+def reset_http_pool_stats() -> None:
+    with _STATS._lock:
+        _STATS.reset()
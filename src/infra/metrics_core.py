@@ -3,13 +3,17 @@
 
 from __future__ import annotations
 
+import atexit
 import contextlib
+import json
 import os
+import threading
+import time
 import uuid
+from collections import deque
 from typing import Any
 
-import psycopg
-
+from .db_pool import pooled_connection
 from .structured_logger import get_logger, log_json
 from scripts.config.env import get_rw_dsn
 
@@ -18,77 +22,200 @@ LOG = get_logger("gemantria.metrics")
 METRICS_ENABLED = os.getenv("METRICS_ENABLED", "1") not in ("0", "false", "False")
 WORKFLOW_ID = os.getenv("WORKFLOW_ID", "gemantria.v1")
 
+# Background sink: bounded ring buffer (drop-oldest) flushed in COPY batches
+METRICS_BUFFER_SIZE = int(os.getenv("METRICS_BUFFER_SIZE", "10000"))
+METRICS_FLUSH_BATCH = int(os.getenv("METRICS_FLUSH_BATCH", "500"))
+METRICS_FLUSH_INTERVAL_S = float(os.getenv("METRICS_FLUSH_INTERVAL_S", "1.0"))
+# Hard limit on the flush at interpreter exit (remaining rows are dropped)
+METRICS_EXIT_FLUSH_TIMEOUT_S = float(os.getenv("METRICS_EXIT_FLUSH_TIMEOUT_S", "5.0"))
+
+METRICS_COLUMNS = (
+    "run_id",
+    "workflow",
+    "thread_id",
+    "node",
+    "event",
+    "status",
+    "started_at",
+    "finished_at",
+    "duration_ms",
+    "items_in",
+    "items_out",
+    "error_json",
+    "meta",
+)
+_COPY_SQL = f"COPY metrics_log ({', '.join(METRICS_COLUMNS)}) FROM STDIN"
+
+_DEFAULTS = {
+    "workflow": WORKFLOW_ID,
+    "thread_id": "default",
+    "status": "ok",
+    "started_at": None,
+    "finished_at": None,
+    "duration_ms": None,
+    "items_in": None,
+    "items_out": None,
+    "error_json": None,
+    "meta": {},
+}
+
+
+def _db_row(row: dict[str, Any]) -> tuple:
+    """Convert an event dict into a metrics_log tuple (defaults filled, JSON serialized)."""
+    values = []
+    for key in METRICS_COLUMNS:
+        v = row.get(key, _DEFAULTS.get(key))
+        if hasattr(v, "isoformat"):  # datetime objects
+            v = v.isoformat()
+        elif isinstance(v, dict):
+            v = json.dumps(v)
+        values.append(v)
+    return tuple(values)
+
+
+class _MetricsSink:
+    """Ring buffer + daemon flusher writing metrics_log rows with COPY, shared per DSN."""
+
+    def __init__(
+        self,
+        dsn: str,
+        capacity: int = METRICS_BUFFER_SIZE,
+        batch_size: int = METRICS_FLUSH_BATCH,
+        interval_s: float = METRICS_FLUSH_INTERVAL_S,
+    ):
+        self._dsn = dsn
+        self._buffer: deque[tuple] = deque(maxlen=max(1, capacity))
+        self._batch_size = max(1, batch_size)
+        self._interval_s = interval_s
+        self._cond = threading.Condition()
+        self._write_lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._closed = False
+        self.stats = {"enqueued": 0, "written": 0, "dropped": 0, "flushes": 0, "failures": 0}
+
+    def put(self, db_row: tuple) -> None:
+        with self._cond:
+            if len(self._buffer) == self._buffer.maxlen:
+                self.stats["dropped"] += 1  # deque evicts the oldest row
+            self._buffer.append(db_row)
+            self.stats["enqueued"] += 1
+            if self._thread is None and not self._closed:
+                self._thread = threading.Thread(target=self._run, name="metrics-flusher", daemon=True)
+                self._thread.start()
+            if len(self._buffer) >= self._batch_size:
+                self._cond.notify()
+
+    def _drain(self) -> list[tuple]:
+        with self._cond:
+            batch = [self._buffer.popleft() for _ in range(min(self._batch_size, len(self._buffer)))]
+        return batch
+
+    def _write(self, batch: list[tuple]) -> None:
+        try:
+            # Pooled connection commits the COPY on clean exit
+            with pooled_connection(self._dsn) as conn, conn.cursor() as cur, cur.copy(_COPY_SQL) as copy:
+                for db_row in batch:
+                    copy.write_row(db_row)
+            self.stats["written"] += len(batch)
+            self.stats["flushes"] += 1
+        except Exception as e:
+            # Fail-open for metrics; never break pipeline
+            self.stats["failures"] += 1
+            log_json(LOG, 30, "metrics_insert_failed", error=str(e), rows=len(batch))
+
+    def flush(self, deadline: float | None = None) -> None:
+        """Write everything buffered so far (blocking; stops starting batches after deadline)."""
+        with self._write_lock:
+            while (deadline is None or time.monotonic() < deadline) and (batch := self._drain()):
+                self._write(batch)
+
+    def pending(self) -> int:
+        with self._cond:
+            return len(self._buffer)
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                if not self._closed and len(self._buffer) < self._batch_size:
+                    self._cond.wait(self._interval_s)
+                closed = self._closed
+            self.flush()
+            if closed:
+                return
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self.flush()
+
+
+_SINKS: dict[str, _MetricsSink] = {}
+_SINKS_LOCK = threading.Lock()
+
+
+def _get_sink(dsn: str) -> _MetricsSink:
+    with _SINKS_LOCK:
+        sink = _SINKS.get(dsn)
+        if sink is None:
+            sink = _SINKS[dsn] = _MetricsSink(dsn)
+        return sink
+
+
+@atexit.register
+def flush_metrics(timeout_s: float = METRICS_EXIT_FLUSH_TIMEOUT_S) -> None:
+    """
+    Flush every metrics sink, giving up after timeout_s.
+
+    Registered at exit so buffered events are not lost; the writes run on a
+    daemon thread so an unreachable database cannot hold up shutdown.
+    """
+    with _SINKS_LOCK:
+        sinks = list(_SINKS.values())
+    if not sinks:
+        return
+    deadline = time.monotonic() + timeout_s
+
+    def _flush_all() -> None:
+        for sink in sinks:
+            sink.flush(deadline)
+
+    try:
+        worker = threading.Thread(target=_flush_all, name="metrics-exit-flush", daemon=True)
+        worker.start()
+    except RuntimeError:  # no new threads this late in shutdown
+        _flush_all()
+    else:
+        worker.join(timeout_s)
+    pending = sum(sink.pending() for sink in sinks)
+    if pending:
+        log_json(LOG, 30, "metrics_exit_flush_incomplete", pending=pending, timeout_s=timeout_s)
+
 
 class MetricsClient:
     def __init__(self, dsn: str | None):
         self._dsn = dsn
         self._enabled = bool(METRICS_ENABLED and dsn)
-        self._pool = None
-
-    def _conn(self):
-        if not self._enabled:
-            return None
-        if self._pool is None:
-            self._pool = psycopg.Connection.connect(self._dsn)  # simple conn; swap to pool later
-        return self._pool
+        self._sink = _get_sink(dsn) if self._enabled else None
 
     def emit(self, row: dict[str, Any]) -> None:
+        """Log the event and enqueue it for the background COPY flusher (never blocks on the DB)."""
         # Always emit to stdout JSON; db insert only if enabled
         with contextlib.suppress(Exception):
             log_json(LOG, 20, "metrics", **row)
-        if not self._enabled:
-            return
-        conn = self._conn()
-        if conn is None:
+        if self._sink is None:
             return
         try:
-            # Convert complex types for database insertion
-            db_row = {}
-            for k, v in row.items():
-                if hasattr(v, "isoformat"):  # datetime objects
-                    db_row[k] = v.isoformat()
-                elif isinstance(v, dict):
-                    # psycopg 3 requires explicit JSON serialization for dicts
-                    import json
-
-                    db_row[k] = json.dumps(v)
-                else:
-                    db_row[k] = v
-
-            # Fill in missing required fields with defaults
-            defaults = {
-                "workflow": WORKFLOW_ID,
-                "thread_id": "default",
-                "status": "ok",
-                "started_at": None,
-                "finished_at": None,
-                "duration_ms": None,
-                "items_in": None,
-                "items_out": None,
-                "error_json": None,
-                "meta": {},
-            }
-            for key, default_value in defaults.items():
-                if key not in db_row:
-                    db_row[key] = default_value
-
-            # Use connection context manager properly - reuse same connection
-            with conn.cursor() as cur:
-                cur.execute(
-                    """
-                    INSERT INTO metrics_log
-                    (run_id, workflow, thread_id, node, event, status,
-                     started_at, finished_at, duration_ms, items_in, items_out, error_json, meta)
-                    VALUES (%(run_id)s, %(workflow)s, %(thread_id)s, %(node)s, %(event)s, %(status)s,
-                            %(started_at)s, %(finished_at)s, %(duration_ms)s, %(items_in)s, %(items_out)s,
-                            %(error_json)s, %(meta)s)
-                    """,
-                    db_row,
-                )
-            conn.commit()
+            self._sink.put(_db_row(row))
         except Exception as e:
-            # Fail-open for metrics; never break pipeline
-            log_json(LOG, 30, "metrics_insert_failed", error=str(e))
+            log_json(LOG, 30, "metrics_enqueue_failed", error=str(e))
+
+    def flush(self) -> None:
+        if self._sink is not None:
+            self._sink.flush()
+
+    def stats(self) -> dict[str, int]:
+        return dict(self._sink.stats) if self._sink is not None else {}
 
 
 def now():
@@ -0,0 +1,112 @@
+# OPS meta: Rules 050/051/052 AlwaysApply | SSOT: ruff | Housekeeping: `make housekeeping`
+# Timestamp contract: RFC3339 fast-lane (generated_at RFC3339; metadata.source="fallback_fast_lane")
+
+"""
+Bounded concurrency and token-bucket rate limiting for LLM provider calls.
+
+Each (provider, model) pair gets one process-wide limiter that caps in-flight
+requests and, optionally, the request rate. run_ordered() fans a batch out over
+a thread pool and returns results in input order.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Max concurrent requests per (provider, model); match the server's parallel slots
+LM_MAX_INFLIGHT = int(os.getenv("LM_MAX_INFLIGHT", "4"))
+# Sustained requests/second per (provider, model); 0 disables rate limiting
+LM_RATE_LIMIT_RPS = float(os.getenv("LM_RATE_LIMIT_RPS", "0"))
+LM_RATE_LIMIT_BURST = int(os.getenv("LM_RATE_LIMIT_BURST", "0"))  # 0 = max(1, LM_MAX_INFLIGHT)
+
+# Provider key for every LM Studio caller, so all of them share one limiter per model
+LM_STUDIO_PROVIDER = "lm_studio"
+
+
+class TokenBucket:
+    """Thread-safe token bucket; acquire() blocks until a token is available."""
+
+    def __init__(self, rate: float, burst: int, clock: Callable[[], float] = time.monotonic, sleep=time.sleep):
+        self.rate = float(rate)
+        self.capacity = max(1, int(burst))
+        self._tokens = float(self.capacity)
+        self._clock = clock
+        self._sleep = sleep
+        self._last = clock()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take a token if available, otherwise return the seconds to wait."""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                return 0.0
+            return (1.0 - self._tokens) / self.rate
+
+    def acquire(self) -> None:
+        if self.rate <= 0:
+            return
+        while (wait := self._reserve()) > 0:
+            self._sleep(wait)
+
+
+class ProviderLimiter:
+    """In-flight cap plus optional token bucket for one (provider, model)."""
+
+    def __init__(self, max_inflight: int = LM_MAX_INFLIGHT, rate: float = LM_RATE_LIMIT_RPS, burst: int = 0):
+        self.max_inflight = max(1, int(max_inflight))
+        self._slots = threading.BoundedSemaphore(self.max_inflight)
+        self.bucket = TokenBucket(rate, burst or LM_RATE_LIMIT_BURST or self.max_inflight) if rate > 0 else None
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """Hold one in-flight slot (after taking a rate token) for the duration of a request."""
+        with self._slots:
+            if self.bucket is not None:
+                self.bucket.acquire()
+            yield
+
+
+_LIMITERS: dict[tuple[str, str], ProviderLimiter] = {}
+_LIMITERS_LOCK = threading.Lock()
+
+
+def get_limiter(provider: str, model: str) -> ProviderLimiter:
+    """Process-wide limiter shared by every caller hitting the same provider/model."""
+    key = (provider, model)
+    with _LIMITERS_LOCK:
+        limiter = _LIMITERS.get(key)
+        if limiter is None:
+            limiter = _LIMITERS[key] = ProviderLimiter()
+        return limiter
+
+
+def reset_limiters() -> None:
+    with _LIMITERS_LOCK:
+        _LIMITERS.clear()
+
+
+def run_ordered(fn: Callable[[int, T], R], items: Sequence[T], max_workers: int) -> list[R]:
+    """
+    Call fn(index, item) for every item, up to max_workers at a time.
+
+    Results are returned in input order. The first exception raised by any call
+    is re-raised after the pool shuts down.
+    """
+    if max_workers <= 1 or len(items) <= 1:
+        return [fn(i, item) for i, item in enumerate(items)]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as pool:
+        futures = [pool.submit(fn, i, item) for i, item in enumerate(items)]
+        return [f.result() for f in futures]
@@ -0,0 +1,176 @@
+# OPS meta: Rules 050/051/052 AlwaysApply | SSOT: ruff | Housekeeping: `make housekeeping`
+# Timestamp contract: RFC3339 fast-lane (generated_at RFC3339; metadata.source="fallback_fast_lane")
+
+"""
+Per-book normalized token index for noun validation.
+
+One pass over a book's words builds {normalized token: freq, first verse,
+token offsets}. Indexes are cached in memory and as JSON under
+TOKEN_INDEX_DIR, keyed by book and the sha256 of the source words, so
+frequency checks and primary_verse resolution scan the book's distinct tokens
+once per candidate (memoized) instead of rescanning the whole book.
+
+Lookups count containment, as the old substring scan of the normalized text
+did: a surface also matches inside prefixed/suffixed forms (ארץ in הארץ,
+בארץ), counting non-overlapping occurrences per token.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import threading
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+from typing import Any
+
+from src.core.ids import normalize_hebrew
+
+from .structured_logger import get_logger, log_json
+
+LOG = get_logger("gemantria.token_index")
+
+TOKEN_INDEX_DIR = os.getenv("TOKEN_INDEX_DIR", "var/cache/token_index")  # "" = memory only
+TOKEN_INDEX_VERSION = 1
+
+# (verse ref such as "1:1" or None when unknown, word text)
+Word = tuple[str | None, str]
+
+
+def words_from_text(text: str) -> list[Word]:
+    """Words of a plain text without verse boundaries."""
+    return [(None, w) for w in text.split()]
+
+
+def words_hash(words: Sequence[Word]) -> str:
+    h = hashlib.sha256()
+    for ref, word in words:
+        h.update(f"{ref or ''}\t{word}\n".encode())
+    return h.hexdigest()
+
+
+class TokenIndex:
+    """Normalized token -> {"freq", "first_ref", "offsets"} for one book."""
+
+    def __init__(self, book: str, text_hash: str, entries: dict[str, dict[str, Any]], token_count: int):
+        self.book = book
+        self.text_hash = text_hash
+        self.entries = entries
+        self.token_count = token_count
+        # key -> [(token containing key, non-overlapping occurrences in it)]
+        self._matches: dict[str, list[tuple[str, int]]] = {}
+
+    @classmethod
+    def build(cls, book: str, words: Sequence[Word], text_hash: str | None = None) -> TokenIndex:
+        entries: dict[str, dict[str, Any]] = {}
+        pos = 0
+        for ref, word in words:
+            for token in normalize_hebrew(word).split():
+                entry = entries.get(token)
+                if entry is None:
+                    entries[token] = {"freq": 1, "first_ref": ref, "offsets": [pos]}
+                else:
+                    entry["freq"] += 1
+                    entry["offsets"].append(pos)
+                pos += 1
+        return cls(book, text_hash or words_hash(words), entries, pos)
+
+    @staticmethod
+    def key(surface: str) -> str:
+        return normalize_hebrew(surface).strip()
+
+    def matches(self, surface: str) -> list[tuple[str, int]]:
+        """Tokens containing the normalized surface, with occurrence counts per token."""
+        key = self.key(surface)
+        if not key:
+            return []
+        found = self._matches.get(key)
+        if found is None:
+            found = [(token, token.count(key)) for token in self.entries if key in token]
+            self._matches[key] = found
+        return found
+
+    def frequency(self, surface: str) -> int:
+        return sum(self.entries[token]["freq"] * n for token, n in self.matches(surface))
+
+    def first_ref(self, surface: str) -> str | None:
+        found = self.matches(surface)
+        if not found:
+            return None
+        first = min(found, key=lambda m: self.entries[m[0]]["offsets"][0])
+        return self.entries[first[0]]["first_ref"]
+
+    def offsets(self, surface: str) -> list[int]:
+        return sorted(pos for token, _ in self.matches(surface) for pos in self.entries[token]["offsets"])
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "version": TOKEN_INDEX_VERSION,
+            "book": self.book,
+            "text_hash": self.text_hash,
+            "token_count": self.token_count,
+            "entries": self.entries,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> TokenIndex:
+        return cls(data["book"], data["text_hash"], data["entries"], data["token_count"])
+
+
+_INDEXES: dict[tuple[str, str], TokenIndex] = {}
+_INDEXES_LOCK = threading.Lock()
+
+
+def _cache_path(base: Path, book: str, text_hash: str) -> Path:
+    safe_book = re.sub(r"[^A-Za-z0-9_-]+", "_", book) or "book"
+    return base / f"{safe_book}-{text_hash[:16]}.json"
+
+
+def _load(path: Path, text_hash: str) -> TokenIndex | None:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if data.get("version") != TOKEN_INDEX_VERSION or data.get("text_hash") != text_hash:
+        return None
+    return TokenIndex.from_dict(data)
+
+
+def _store(path: Path, index: TokenIndex) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(index.to_dict(), ensure_ascii=False), encoding="utf-8")
+        tmp.replace(path)
+    except OSError as e:
+        log_json(LOG, 30, "token_index_store_failed", path=str(path), error=str(e))
+
+
+def get_token_index(book: str, words: Iterable[Word], cache_dir: str | Path | None = TOKEN_INDEX_DIR) -> TokenIndex:
+    """Return the index for book's words: memory, then disk, then a single build pass."""
+    words = list(words)
+    text_hash = words_hash(words)
+    key = (book, text_hash)
+    with _INDEXES_LOCK:
+        index = _INDEXES.get(key)
+    if index is not None:
+        return index
+
+    path = _cache_path(Path(cache_dir), book, text_hash) if cache_dir else None
+    index = _load(path, text_hash) if path else None
+    if index is None:
+        index = TokenIndex.build(book, words, text_hash)
+        if path:
+            _store(path, index)
+        log_json(LOG, 20, "token_index_built", book=book, tokens=index.token_count, types=len(index.entries))
+
+    with _INDEXES_LOCK:
+        _INDEXES[key] = index
+    return index
+
+
+def clear_token_indexes() -> None:
+    with _INDEXES_LOCK:
+        _INDEXES.clear()
@@ -9,19 +9,124 @@ AI analyzes raw Hebrew text to discover nouns, break them down into letters,
 calculate gematria values, and classify as person/place/thing.
 """
 
+import hashlib
 import json
 import os
 import re
+from pathlib import Path
 from typing import Any, Dict, List
 
 from src.core.books import normalize_book
-from src.core.ids import normalize_hebrew
+from src.core.hebrew_utils import calculate_gematria
 from src.infra.db import get_bible_ro
+from src.infra.rate_limit import LM_MAX_INFLIGHT, run_ordered
 from src.infra.structured_logger import get_logger, log_json
+from src.infra.token_index import TokenIndex, Word, get_token_index, words_from_text
 from src.services.lmstudio_client import chat_completion
 
 LOG = get_logger("ai_noun_discovery")
 
+# "windows" = whole book in chapter-aligned windows; "sample" = first window only (legacy)
+AI_DISCOVERY_MODE = os.getenv("AI_DISCOVERY_MODE", "windows")
+AI_DISCOVERY_WINDOW_CHARS = int(os.getenv("AI_DISCOVERY_WINDOW_CHARS", "4000"))
+AI_DISCOVERY_MAX_WINDOWS = int(os.getenv("AI_DISCOVERY_MAX_WINDOWS", "0"))  # 0 = no cap
+AI_DISCOVERY_CONCURRENCY = int(os.getenv("AI_DISCOVERY_CONCURRENCY", str(LM_MAX_INFLIGHT)))
+# Finished windows are stored here so an interrupted run resumes; "" disables
+AI_DISCOVERY_CHECKPOINT_DIR = os.getenv("AI_DISCOVERY_CHECKPOINT_DIR", "var/cache/discovery")
+
+SYSTEM_PROMPT = (
+    "You are a data extraction AI. You must respond with ONLY valid JSON. No explanations, no markdown, "
+    "no additional text. Start your response with { and end with }."
+)
+
+
+def chapter_windows(words: List[Word], max_chars: int) -> List[str]:
+    """
+    Split a book into windows of at most max_chars that start on chapter boundaries.
+
+    Consecutive whole chapters are packed together; a chapter longer than
+    max_chars is split between verses. Words without a ref are packed word by word.
+    """
+    # Group words into verses, and verses into chapters
+    chapters: List[List[str]] = []
+    chapter_key = verse_key = object()
+    for ref, word in words:
+        chapter = ref.split(":", 1)[0] if ref else None
+        if chapter != chapter_key or not chapters:
+            chapters.append([])
+            chapter_key, verse_key = chapter, object()
+        if ref is None or ref != verse_key:
+            chapters[-1].append(word)
+            verse_key = ref
+        else:
+            chapters[-1][-1] += " " + word
+
+    windows: List[str] = []
+    current = ""
+    for units in chapters:
+        text = " ".join(units)
+        if current and len(current) + 1 + len(text) <= max_chars:
+            current += " " + text
+            continue
+        if current:
+            windows.append(current)
+        if len(text) <= max_chars:
+            current = text
+            continue
+        current = ""
+        for unit in units:
+            if current and len(current) + 1 + len(unit) > max_chars:
+                windows.append(current)
+                current = ""
+            current = f"{current} {unit}" if current else unit
+        windows.append(current)
+        current = ""
+    if current:
+        windows.append(current)
+    return windows
+
+
+def merge_candidates(per_window: List[List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """Flatten window results, keeping the first candidate per normalized surface form."""
+    merged: Dict[str, Dict[str, Any]] = {}
+    for nouns in per_window:
+        for noun in nouns:
+            if not isinstance(noun, dict):
+                continue
+            key = TokenIndex.key(str(noun.get("surface") or noun.get("hebrew") or ""))
+            if key and key not in merged:
+                merged[key] = noun
+    return list(merged.values())
+
+
+def _window_checkpoint_path(book: str, model: str, prompt: str) -> Path | None:
+    if not AI_DISCOVERY_CHECKPOINT_DIR:
+        return None
+    key = hashlib.sha256(f"{model}\x00{prompt}".encode()).hexdigest()[:24]
+    safe_book = re.sub(r"[^A-Za-z0-9_-]+", "_", book) or "book"
+    return Path(AI_DISCOVERY_CHECKPOINT_DIR) / safe_book / f"{key}.json"
+
+
+def _load_window(path: Path | None) -> List[Dict[str, Any]] | None:
+    if path is None:
+        return None
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))["nouns"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _store_window(path: Path | None, nouns: List[Dict[str, Any]]) -> None:
+    if path is None:
+        return
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps({"nouns": nouns}, ensure_ascii=False), encoding="utf-8")
+        tmp.replace(path)
+    except OSError as e:
+        log_json(LOG, 30, "discovery_checkpoint_store_failed", path=str(path), error=str(e))
+
 
 class AINounDiscovery:
     """AI-powered organic noun discovery from Hebrew text."""
@@ -51,8 +156,9 @@ class AINounDiscovery:
         normalized_book = normalize_book(book)
         db_book = self.book_map.get(normalized_book, normalized_book[:3])
 
-        # Get raw Hebrew text for the book
-        raw_text = self._get_raw_hebrew_text(db_book)
+        # Get raw Hebrew words (with verse refs) for the book
+        words = self._get_book_words(db_book)
+        raw_text = " ".join(word for _, word in words)
 
         if not raw_text:
             log_json(LOG, 30, "no_hebrew_text", book=book)
@@ -67,8 +173,11 @@ class AINounDiscovery:
             text_preview=raw_text[:100],
         )
 
+        # One pass over the book; validation then works by token lookup
+        index = get_token_index(db_book, words)
+
         # Use AI to discover and analyze nouns
-        discovered_nouns = self._ai_discover_nouns(raw_text, book)
+        discovered_nouns = self._ai_discover_nouns(raw_text, book, index, words)
 
         log_json(LOG, 20, "ai_noun_discovery_complete", book=book, nouns_discovered=len(discovered_nouns))
 
@@ -76,12 +185,16 @@ class AINounDiscovery:
 
     def _get_raw_hebrew_text(self, db_book: str) -> str:
         """Extract raw Hebrew text for the book."""
+        return " ".join(word for _, word in self._get_book_words(db_book))
+
+    def _get_book_words(self, db_book: str) -> List[tuple]:
+        """Extract (chapter:verse, word) pairs for the book in reading order."""
         try:
             # BibleReadOnly.execute() handles connection internally
             rows = list(
                 get_bible_ro().execute(
                     """
-                SELECT hw.word_text
+                SELECT v.chapter_num, v.verse_num, hw.word_text
                 FROM bible.hebrew_ot_words hw
                 JOIN bible.verses v ON hw.verse_id = v.verse_id
                 WHERE v.book_name = %s
@@ -92,23 +205,18 @@ class AINounDiscovery:
                 )
             )
 
-            # Join all words with spaces
-            text = " ".join(row[0] for row in rows)
-            return text
+            return [(f"{chapter}:{verse}", word) for chapter, verse, word in rows]
         except Exception as e:
             log_json(LOG, 40, "raw_text_extraction_error", book=db_book, error=str(e))
             # Fallback to mock Hebrew text for testing when database is unavailable
             log_json(LOG, 30, "using_mock_hebrew_text", book=db_book, reason="database_unavailable")
             # Use longer Genesis text to include more nouns for validation
-            return """בראשית ברא אלהים את השמים ואת הארץ והארץ היתה תהו ובהו וחשך על פני תהום ורוח אלהים מרחפת על פני המים ויאמר אלהים יהי אור ויהי אור וירא אלהים את האור כי טוב ויבדל אלהים בין האור ובין החשך ויקרא אלהים לאור יום ולחשך קרא לילה ויהי ערב ויהי בקר יום אחד ויאמר אלהים יהי רקיע בתוך המים ויהי מבדיל בין מים למים ויעש אלהים את הרקיע ויבדל בין המים אשר מתחת לרקיע ובין המים אשר מעל לרקיע ויהי כן ויקרא אלהים לרקיע שמים ויהי ערב ויהי בקר יום שני ויאמר אלהים יקוו המים מתחת השמים אל מקום אחד ותראה היבשה ויהי כן ויקרא אלהים ליבשה ארץ ולמקוה המים קרא ימים וירא אלהים כי טוב ויאמר אלהים תדשא הארץ דשא עשב מזריע זרע עץ פרי עשה פרי למינו אשר זרעו בו על הארץ ויהי כן ותוצא הארץ דשא עשב מזריע זרע למינהו ועץ עשה פרי אשר זרעו בו למינו וירא אלהים כי טוב ויהי ערב ויהי בקר יום שלישי ויאמר אלהים יהי מארת ברקיע השמים להבדיל בין היום ובין הלילה והיו לאתת ולמועדים ולימים ושנים והיו למאורת ברקיע השמים להאיר על הארץ ויהי כן ויעש אלהים שני מאורת גדלים את המאור הגדל לממשלת היום ואת המאור הקטן לממשלת הלילה ואת הכוכבים ויתן אתם אלהים ברקיע השמים להאיר על הארץ ולמשל ביום ובלילה ולהבדיל בין האור ובין החשך וירא אלהים כי טוב ויהי ערב ויהי בקר יום רביעי ויאמר אלהים ישרצו המים שרץ נפש חיה ועוף יעופף על הארץ על פני רקיע השמים ויברא אלהים את התנינם הגדלים ואת כל נפש החיה הרמשת אשר שרצו המים למינהם ואת כל עוף כנף למינהו וירא אלהים כי טוב ויברך אתם אלהים לאמר פרו ורבו ומלאו את המים בימים והעוף ירב בארץ ויהי ערב ויהי בקר יום חמישי ויאמר אלהים תוצא הארץ נפש חיה למינה בהמה ורמש וחיתו ארץ למינה ויהי כן ויעש אלהים את חית הארץ למינה ואת הבהמה למינה ואת כל רמש האדמה למינהו וירא אלהים כי טוב ויאמר אלהים נעשה אדם בצלמנו כדמותנו וירדו בדגת הים ובעוף השמים ובבהמה ובכל הארץ ובכל הרמש הרמש על הארץ ויברא אלהים את האדם בצלמו בצלם אלהים ברא אתו זכר ונקבה ברא אתם ויברך אתם אלהים ויאמר להם אלהים פרו ורבו ומלאו את הארץ וכבשה ורדו בדגת הים ובעוף השמים ובכל חיה הרמשת על הארץ ויאמר אלהים הנה נתתי לכם את כל עשב זורע זרע אשר על פני כל הארץ ואת כל העץ אשר בו פרי עץ זורע זרע לכם יהיה לאכלה ולכל חית הארץ ולכל עוף השמים ולכל רמש על הארץ אשר בו נפש חיה את כל ירק עשב לאכלה ויהי כן וירא אלהים את כל אשר עשה והנה טוב מאד ויהי ערב ויהי בקר יום הששי"""
-
-    def _ai_discover_nouns(self, hebrew_text: str, book: str) -> List[Dict[str, Any]]:
-        """Use AI to discover and analyze nouns from Hebrew text."""
-
-        # Sample the text for analysis (avoid token limits)
-        sampled_text = self._sample_text(hebrew_text)
+            return words_from_text(
+                """בראשית ברא אלהים את השמים ואת הארץ והארץ היתה תהו ובהו וחשך על פני תהום ורוח אלהים מרחפת על פני המים ויאמר אלהים יהי אור ויהי אור וירא אלהים את האור כי טוב ויבדל אלהים בין האור ובין החשך ויקרא אלהים לאור יום ולחשך קרא לילה ויהי ערב ויהי בקר יום אחד ויאמר אלהים יהי רקיע בתוך המים ויהי מבדיל בין מים למים ויעש אלהים את הרקיע ויבדל בין המים אשר מתחת לרקיע ובין המים אשר מעל לרקיע ויהי כן ויקרא אלהים לרקיע שמים ויהי ערב ויהי בקר יום שני ויאמר אלהים יקוו המים מתחת השמים אל מקום אחד ותראה היבשה ויהי כן ויקרא אלהים ליבשה ארץ ולמקוה המים קרא ימים וירא אלהים כי טוב ויאמר אלהים תדשא הארץ דשא עשב מזריע זרע עץ פרי עשה פרי למינו אשר זרעו בו על הארץ ויהי כן ותוצא הארץ דשא עשב מזריע זרע למינהו ועץ עשה פרי אשר זרעו בו למינו וירא אלהים כי טוב ויהי ערב ויהי בקר יום שלישי ויאמר אלהים יהי מארת ברקיע השמים להבדיל בין היום ובין הלילה והיו לאתת ולמועדים ולימים ושנים והיו למאורת ברקיע השמים להאיר על הארץ ויהי כן ויעש אלהים שני מאורת גדלים את המאור הגדל לממשלת היום ואת המאור הקטן לממשלת הלילה ואת הכוכבים ויתן אתם אלהים ברקיע השמים להאיר על הארץ ולמשל ביום ובלילה ולהבדיל בין האור ובין החשך וירא אלהים כי טוב ויהי ערב ויהי בקר יום רביעי ויאמר אלהים ישרצו המים שרץ נפש חיה ועוף יעופף על הארץ על פני רקיע השמים ויברא אלהים את התנינם הגדלים ואת כל נפש החיה הרמשת אשר שרצו המים למינהם ואת כל עוף כנף למינהו וירא אלהים כי טוב ויברך אתם אלהים לאמר פרו ורבו ומלאו את המים בימים והעוף ירב בארץ ויהי ערב ויהי בקר יום חמישי ויאמר אלהים תוצא הארץ נפש חיה למינה בהמה ורמש וחיתו ארץ למינה ויהי כן ויעש אלהים את חית הארץ למינה ואת הבהמה למינה ואת כל רמש האדמה למינהו וירא אלהים כי טוב ויאמר אלהים נעשה אדם בצלמנו כדמותנו וירדו בדגת הים ובעוף השמים ובבהמה ובכל הארץ ובכל הרמש הרמש על הארץ ויברא אלהים את האדם בצלמו בצלם אלהים ברא אתו זכר ונקבה ברא אתם ויברך אתם אלהים ויאמר להם אלהים פרו ורבו ומלאו את הארץ וכבשה ורדו בדגת הים ובעוף השמים ובכל חיה הרמשת על הארץ ויאמר אלהים הנה נתתי לכם את כל עשב זורע זרע אשר על פני כל הארץ ואת כל העץ אשר בו פרי עץ זורע זרע לכם יהיה לאכלה ולכל חית הארץ ולכל עוף השמים ולכל רמש על הארץ אשר בו נפש חיה את כל ירק עשב לאכלה ויהי כן וירא אלהים את כל אשר עשה והנה טוב מאד ויהי ערב ויהי בקר יום הששי"""
+            )
 
-        prompt = f"""Extract significant Hebrew nouns from this Hebrew text. Return ONLY JSON:
+    def _build_prompt(self, hebrew_text: str) -> str:
+        return f"""Extract significant Hebrew nouns from this Hebrew text. Return ONLY JSON:
 
 {{
   "nouns": [
@@ -124,10 +232,78 @@ class AINounDiscovery:
   ]
 }}
 
-Hebrew text: {sampled_text}
+Hebrew text: {hebrew_text}
 
 IMPORTANT: Your response must be ONLY the JSON object above, with actual nouns extracted from the text."""
 
+    def _discover_in_text(self, hebrew_text: str, model: str) -> List[Dict[str, Any]]:
+        """Send one window of text to the discovery model and return its candidate nouns."""
+        messages_batch = [
+            [
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": self._build_prompt(hebrew_text)},
+            ]
+        ]
+
+        results = chat_completion(messages_batch, model=model, temperature=0.0)
+
+        if not results:
+            raise ValueError("discovery model returned no completion")
+        content = results[0].text
+        log_json(LOG, 20, "ai_response_received", content_preview=content[:200])
+        nouns = self._parse_ai_response(content).get("nouns")
+        if not isinstance(nouns, list):
+            # Unparseable or off-schema reply (e.g. a mock fallback): a failed window, not an empty one
+            raise ValueError("discovery response has no 'nouns' list")
+        return nouns
+
+    def _discover_windows(self, words: List[Word], book: str, model: str) -> List[Dict[str, Any]]:
+        """
+        Run discovery over the whole book, one chapter-aligned window per request.
+
+        Windows run concurrently (bounded by AI_DISCOVERY_CONCURRENCY and the
+        model's limiter), each finished window is checkpointed, and candidates
+        are merged by normalized surface form.
+        """
+        windows = chapter_windows(words, AI_DISCOVERY_WINDOW_CHARS)
+        if AI_DISCOVERY_MAX_WINDOWS > 0:
+            windows = windows[:AI_DISCOVERY_MAX_WINDOWS]
+
+        def _one(i: int, text: str) -> tuple:
+            path = _window_checkpoint_path(book, model, self._build_prompt(text))
+            nouns = _load_window(path)
+            if nouns is not None:
+                return "resumed", nouns
+            try:
+                nouns = self._discover_in_text(text, model)
+            except Exception as e:
+                # Not checkpointed, so the next run retries this window
+                log_json(LOG, 40, "discovery_window_error", book=book, window=i, error=str(e))
+                return "failed", []
+            _store_window(path, nouns)
+            return "done", nouns
+
+        outcomes = run_ordered(_one, windows, max_workers=AI_DISCOVERY_CONCURRENCY)
+        statuses = [status for status, _ in outcomes]
+        per_window = [nouns for _, nouns in outcomes]
+        candidates = merge_candidates(per_window)
+        log_json(
+            LOG,
+            20,
+            "discovery_windows_complete",
+            book=book,
+            windows=len(windows),
+            resumed=statuses.count("resumed"),
+            failed=statuses.count("failed"),
+            candidates=sum(len(n) for n in per_window),
+            unique_candidates=len(candidates),
+        )
+        return candidates
+
+    def _ai_discover_nouns(
+        self, hebrew_text: str, book: str, index: TokenIndex | None = None, words: List[Word] | None = None
+    ) -> List[Dict[str, Any]]:
+        """Use AI to discover and analyze nouns from Hebrew text."""
         try:
             # Check if mock mode is enabled (fallback for JSON prompting issues)
             if os.getenv("LM_STUDIO_MOCK", "false").lower() in ("1", "true", "yes"):
@@ -166,37 +342,24 @@ IMPORTANT: Your response must be ONLY the JSON object above, with actual nouns e
             # Use theology model with strict JSON prompting
             discovery_model = os.getenv("THEOLOGY_MODEL", "christian-bible-expert-v2.0-12b")
 
-            messages_batch = [
-                [
-                    {
-                        "role": "system",
-                        "content": "You are a data extraction AI. You must respond with ONLY valid JSON. No explanations, no markdown, no additional text. Start your response with { and end with }.",
-                    },
-                    {"role": "user", "content": prompt},
-                ]
-            ]
-
-            results = chat_completion(messages_batch, model=discovery_model, temperature=0.0)
-
-            if results and len(results) > 0:
-                content = results[0].text
-                log_json(LOG, 20, "ai_response_received", content_preview=content[:200])
-                result = self._parse_ai_response(content)
+            if AI_DISCOVERY_MODE == "windows" and words:
+                nouns_to_validate = self._discover_windows(words, book, discovery_model)
             else:
-                result = {"nouns": []}
+                # Sample the text for analysis (avoid token limits)
+                sampled_text = self._sample_text(hebrew_text, AI_DISCOVERY_WINDOW_CHARS)
+                nouns_to_validate = self._discover_in_text(sampled_text, discovery_model)
 
             # Validate and enhance with frequency data
             log_json(
                 LOG,
                 20,
                 "pre_validation",
-                nouns_count=len(result.get("nouns", [])),
-                sample_noun=result.get("nouns", [{}])[0] if result.get("nouns") else {},
+                nouns_count=len(nouns_to_validate),
+                sample_noun=nouns_to_validate[0] if nouns_to_validate else {},
             )
-            nouns_to_validate = result.get("nouns", [])
             log_json(LOG, 20, "about_to_validate", nouns_to_validate_count=len(nouns_to_validate))
             try:
-                validated_nouns = self._validate_and_enhance_nouns(nouns_to_validate, hebrew_text, book)
+                validated_nouns = self._validate_and_enhance_nouns(nouns_to_validate, hebrew_text, book, index)
                 log_json(LOG, 20, "post_validation", validated_count=len(validated_nouns))
             except Exception as e:
                 log_json(LOG, 40, "validation_function_error", error=str(e), error_type=type(e).__name__)
@@ -217,33 +380,8 @@ IMPORTANT: Your response must be ONLY the JSON object above, with actual nouns e
         return text[:max_length]
 
     def _calculate_gematria(self, hebrew_word: str) -> int:
-        """Calculate basic gematria value for a Hebrew word."""
-        # Simple mapping - this could be enhanced with proper Hebrew gematria rules
-        gematria_map = {
-            "א": 1,
-            "ב": 2,
-            "ג": 3,
-            "ד": 4,
-            "ה": 5,
-            "ו": 6,
-            "ז": 7,
-            "ח": 8,
-            "ט": 9,
-            "י": 10,
-            "כ": 20,
-            "ל": 30,
-            "מ": 40,
-            "נ": 50,
-            "ס": 60,
-            "ע": 70,
-            "פ": 80,
-            "צ": 90,
-            "ק": 100,
-            "ר": 200,
-            "ש": 300,
-            "ת": 400,
-        }
-        return sum(gematria_map.get(char, 0) for char in hebrew_word)
+        """Calculate the Mispar Hechrachi gematria value for a Hebrew word (finals included)."""
+        return calculate_gematria(hebrew_word)
 
     def _parse_ai_response(self, content: str) -> Dict[str, Any]:
         """Parse AI response, handling various formats."""
@@ -302,15 +440,18 @@ IMPORTANT: Your response must be ONLY the JSON object above, with actual nouns e
                 except json.JSONDecodeError:
                     pass
 
-            # Fallback: return empty result
+            # Fallback: no "nouns" key, so the caller treats the reply as failed
             log_json(LOG, 30, "ai_response_parse_error", content_preview=content[:200])
-            return {"nouns": []}
+            return {}
 
     def _validate_and_enhance_nouns(
-        self, ai_nouns: List[Dict[str, Any]], full_text: str, book: str
+        self, ai_nouns: List[Dict[str, Any]], full_text: str, book: str, index: TokenIndex | None = None
     ) -> List[Dict[str, Any]]:
         """Validate AI-discovered nouns and enhance with frequency data."""
         validated = []
+        if index is None:
+            # No verse-aware index from the caller: build one from the plain text
+            index = TokenIndex.build(book, words_from_text(full_text))
 
         for noun in ai_nouns:
             log_json(LOG, 10, "validating_noun", noun_index=len(validated), total_nouns=len(ai_nouns))
@@ -328,24 +469,17 @@ IMPORTANT: Your response must be ONLY the JSON object above, with actual nouns e
                     )
                     continue
 
-                # Calculate actual frequency in full text
+                # Actual frequency in the book (normalized, prefixed forms included)
                 hebrew_word = noun["surface"]
-                # Normalize the full text to remove vowels/cantillation for matching
-                normalized_text = normalize_hebrew(full_text)
-                freq = len(re.findall(re.escape(hebrew_word), normalized_text))
-                log_json(
-                    LOG,
-                    10,
-                    "frequency_check",
-                    word=hebrew_word,
-                    calculated_freq=freq,
-                    text_length=len(full_text),
-                    normalized_length=len(normalized_text),
-                )
+                freq = index.frequency(hebrew_word)
+                log_json(LOG, 10, "frequency_check", word=hebrew_word, calculated_freq=freq)
 
                 if freq == 0:
                     continue  # Word not actually found in text
 
+                first_ref = index.first_ref(hebrew_word)
+                primary_verse = f"{book} {first_ref}" if first_ref else noun.get("primary_verse")
+
                 # Enhance with pipeline-required fields (ai-nouns.v1 schema + pipeline compatibility)
                 enhanced_noun = {
                     "surface": hebrew_word,
@@ -354,7 +488,11 @@ IMPORTANT: Your response must be ONLY the JSON object above, with actual nouns e
                     "gematria": noun["gematria"],
                     "value": noun["gematria"],  # For pipeline compatibility
                     "class": noun["class"],
-                    "sources": noun.get("sources", [{"ref": f"{book} unknown", "offset": None}]),
+                    "sources": noun.get(
+                        "sources",
+                        [{"ref": primary_verse or f"{book} unknown", "offset": index.offsets(hebrew_word)[0]}],
+                    ),
+                    "primary_verse": primary_verse,
                     "analysis": noun.get("analysis", ""),
                     "freq": freq,  # Add frequency for pipeline use
                     "book": book,
@@ -10,6 +10,9 @@ from src.infra.structured_logger import get_logger, log_json
 
 LOG = get_logger("gematria.analysis_runner")
 
+# Recompute communities/centrality only for changed graph regions (snapshot in GRAPH_SNAPSHOT_PATH)
+GRAPH_INCREMENTAL = os.getenv("GRAPH_INCREMENTAL", "false").lower() == "true"
+
 
 class AnalysisError(Exception):
     """Raised when analysis operations fail."""
@@ -33,59 +36,94 @@ def analysis_runner_node(state: dict[str, Any]) -> dict[str, Any]:
                 from src.infra.db import get_gematria_rw
 
                 db = get_gematria_rw()
-                G = build_graph(db)
+                update = None
+                if GRAPH_INCREMENTAL:
+                    from src.graph.incremental import analyze_incremental
 
-                if G.number_of_nodes() > 0:
-                    cluster_map, degree, betw, eigen = compute_patterns(G)
+                    update = analyze_incremental(db)
+                    nodes = list(update.cluster_map)
+                else:
+                    G = build_graph(db)
+                    nodes = list(G.nodes())
 
-                    # Store clusters and centrality
+                if update is not None and update.mode == "unchanged":
+                    analysis_results["graph_analysis"] = {
+                        "mode": update.mode,
+                        "clusters_stored": 0,
+                        "centrality_measures_stored": 0,
+                        "communities_found": len(set(update.cluster_map.values())),
+                    }
+                    log_json(LOG, 20, "graph_analysis_unchanged", nodes=len(nodes))
+                elif nodes:
+                    if update is not None:
+                        cluster_map, degree, betw, eigen = update.as_tuple()
+                    else:
+                        cluster_map, degree, betw, eigen = compute_patterns(G)
+
+                    # Store clusters and centrality (bulk: one connection, pipelined chunks)
                     cluster_count = 0
                     centrality_count = 0
+                    stored = True
 
-                    for node, cluster_id in cluster_map.items():
-                        try:
-                            db.execute(
+                    try:
+                        if update is not None:
+                            # Warm-started partitions move nodes between clusters: upsert the moves
+                            cluster_count = db.executemany(
                                 """
                                 INSERT INTO concept_clusters (concept_id, cluster_id)
                                 VALUES (%s, %s)
-                                ON CONFLICT (concept_id) DO NOTHING
+                                ON CONFLICT (concept_id) DO UPDATE SET cluster_id = EXCLUDED.cluster_id
                             """,
-                                (node, cluster_id),
+                                list(update.cluster_changes.items()),
                             )
-                            cluster_count += 1
-                        except Exception as e:
-                            log_json(LOG, 30, "cluster_insert_failed", node=str(node), error=str(e))
-
-                    # Store centrality measures
-                    for node in G.nodes():
-                        try:
-                            db.execute(
+                        else:
+                            cluster_count = db.executemany(
                                 """
-                                INSERT INTO concept_centrality (
-                                    concept_id, degree, betweenness, eigenvector
-                                ) VALUES (%s, %s, %s, %s)
-                                ON CONFLICT (concept_id) DO UPDATE SET
-                                    degree = EXCLUDED.degree,
-                                    betweenness = EXCLUDED.betweenness,
-                                    eigenvector = EXCLUDED.eigenvector,
-                                    metrics_at = now()
+                                INSERT INTO concept_clusters (concept_id, cluster_id)
+                                VALUES (%s, %s)
+                                ON CONFLICT (concept_id) DO NOTHING
                             """,
-                                (
-                                    node,
-                                    degree.get(node, 0),
-                                    betw.get(node, 0),
-                                    eigen.get(node, 0),
-                                ),
+                                list(cluster_map.items()),
                             )
-                            centrality_count += 1
-                        except Exception as e:
-                            log_json(LOG, 30, "centrality_insert_failed", node=str(node), error=str(e))
+                    except Exception as e:
+                        stored = False
+                        log_json(LOG, 30, "cluster_insert_failed", rows=len(cluster_map), error=str(e))
+
+                    # Store centrality measures
+                    try:
+                        centrality_count = db.executemany(
+                            """
+                            INSERT INTO concept_centrality (
+                                concept_id, degree, betweenness, eigenvector
+                            ) VALUES (%s, %s, %s, %s)
+                            ON CONFLICT (concept_id) DO UPDATE SET
+                                degree = EXCLUDED.degree,
+                                betweenness = EXCLUDED.betweenness,
+                                eigenvector = EXCLUDED.eigenvector,
+                                metrics_at = now()
+                        """,
+                            [(node, degree.get(node, 0), betw.get(node, 0), eigen.get(node, 0)) for node in nodes],
+                        )
+                    except Exception as e:
+                        stored = False
+                        log_json(LOG, 30, "centrality_insert_failed", rows=len(nodes), error=str(e))
 
                     analysis_results["graph_analysis"] = {
                         "clusters_stored": cluster_count,
                         "centrality_measures_stored": centrality_count,
                         "communities_found": len(set(cluster_map.values())),
                     }
+                    if update is not None:
+                        analysis_results["graph_analysis"].update(
+                            mode=update.mode,
+                            changed_nodes=len(update.changed_nodes),
+                            recomputed_nodes=update.recomputed_nodes,
+                        )
+                        # Only advance the snapshot once its results are stored
+                        if stored:
+                            from src.graph.incremental import save_snapshot
+
+                            save_snapshot(update)
 
                     log_json(
                         LOG,
@@ -12,7 +12,7 @@ from __future__ import annotations
 
 import os
 
-from src.core.hebrew_utils import MAP, calculate_gematria
+from src.core.hebrew_utils import letter_values
 from src.infra.metrics_core import get_metrics_client
 from src.infra.structured_logger import get_logger, log_json
 from src.services.lmstudio_client import chat_completion
@@ -94,21 +94,10 @@ def math_verifier_node(state: dict) -> dict:
                 batch_verified.append(noun_copy)
                 continue
 
-            # Calculate local sum from letters or hebrew text
-            if letters:
-                # Use letters if available
-                letter_values_list = [MAP.get(ch, 0) for ch in letters]
-                local_sum = sum(letter_values_list)
-                letters_str = ", ".join(letters)
-            elif hebrew:
-                # Fallback to hebrew text
-                local_sum = calculate_gematria(hebrew)
-                letter_values_list = [MAP.get(ch, 0) for ch in hebrew]
-                letters_str = hebrew
-            else:
-                local_sum = 0
-                letter_values_list = []
-                letters_str = ""
+            # Calculate local sum from letters or hebrew text (one kernel lookup)
+            letters_str = ", ".join(letters) if letters else hebrew
+            letter_values_list = letter_values("".join(letters) if letters else hebrew)
+            local_sum = sum(letter_values_list)
 
             # Skip if no claimed value to verify
             if claimed is None:
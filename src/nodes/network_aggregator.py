@@ -37,6 +37,9 @@ except ImportError:
         pass
 
 
+from src.infra.bulk_writer import BulkWriter, executemany_chunked, executemany_returning  # noqa: E402
+from src.infra.embedding_cache import embedding_cache_stats  # noqa: E402
+from src.infra.http_pool import http_pool_stats  # noqa: E402
 from src.infra.structured_logger import get_logger, log_json  # noqa: E402
 from src.services.lmstudio_client import get_lmstudio_client  # noqa: E402
 from src.ssot.noun_adapter import adapt_ai_noun  # noqa: E402
@@ -77,6 +80,12 @@ ENABLE_REL = os.getenv("ENABLE_RELATIONS", "true").lower() == "true"
 ENABLE_RERANK = os.getenv("ENABLE_RERANK", "true").lower() == "true"
 RERANK_TOPK = int(os.getenv("RERANK_TOPK", 50))
 RERANK_PASS = float(os.getenv("RERANK_PASS", 0.50))
+KNN_MIN_COSINE = float(os.getenv("KNN_MIN_COSINE", "0.4"))  # Semantic floor for candidate pairs
+KNN_BLOCK_SIZE = int(os.getenv("KNN_BLOCK_SIZE", "1024"))  # Rows scored per KNN block
+
+# Neighbour backend for rerank recall: "pgvector" (one query per concept) or "ann" (local batched index)
+NN_BACKEND = os.getenv("NN_BACKEND", "pgvector").lower()
+CONCEPT_INDEX_NAME = "concept_network"
 
 # Fallback mode configuration (skip vector DB + rerank, rely on in-memory graph)
 FALLBACK_ONLY = os.getenv("NETWORK_AGGREGATOR_MODE", "").lower() == "fallback"
@@ -88,45 +97,99 @@ def _l2_normalize(vec: list[float]) -> list[float]:
     return [x / norm for x in vec]
 
 
+def _knn_pair_arrays(X, k, min_cos=KNN_MIN_COSINE, block_size=KNN_BLOCK_SIZE):
+    """Blocked top-k cosine KNN over L2-normalized rows of X.
+
+    Each row block is scored against all rows with one matrix product, top-k is
+    selected with argpartition, and self-matches and the cosine floor are applied
+    with vectorized masks. Peak memory is block_size x n similarities.
+
+    Returns:
+        (src_idx, tgt_idx, cos, sim_range) where the arrays hold directed pairs
+        ordered by source row, then descending cosine.
+    """
+    import numpy as np  # noqa: E402
+
+    X = np.asarray(X, dtype=np.float32)
+    n = X.shape[0]
+    k = min(int(k), n - 1)
+    if n < 2 or k <= 0:
+        empty = np.zeros(0, dtype=np.int64)
+        return empty, empty, np.zeros(0, dtype=np.float32), None
+
+    block_size = max(1, int(block_size))
+    src_parts, tgt_parts, cos_parts = [], [], []
+    lo, hi = np.inf, -np.inf
+    for i0 in range(0, n, block_size):
+        i1 = min(i0 + block_size, n)
+        rows = np.arange(i0, i1)
+        sims = X[i0:i1] @ X.T  # Cosine similarity (vectors are L2 normalized)
+        np.clip(sims, -1.0, 1.0, out=sims)
+        lo, hi = min(lo, float(sims.min())), max(hi, float(sims.max()))
+
+        # Exclude self, then take the unordered top-k per row and sort just those
+        sims[rows - i0, rows] = -np.inf
+        top = np.argpartition(-sims, k - 1, axis=1)[:, :k]
+        top_sims = np.take_along_axis(sims, top, axis=1)
+        order = np.argsort(-top_sims, axis=1, kind="stable")
+        top = np.take_along_axis(top, order, axis=1)
+        top_sims = np.take_along_axis(top_sims, order, axis=1)
+
+        keep = top_sims >= min_cos
+        src_parts.append(np.broadcast_to(rows[:, None], top.shape)[keep])
+        tgt_parts.append(top[keep])
+        cos_parts.append(top_sims[keep])
+
+    return (
+        np.concatenate(src_parts).astype(np.int64),
+        np.concatenate(tgt_parts).astype(np.int64),
+        np.concatenate(cos_parts).astype(np.float32),
+        (lo, hi),
+    )
+
+
 def _knn_pairs(vecs, ids, k):
-    """Naive cosine KNN for small batches with improved similarity computation."""
+    """Cosine KNN with the KNN_MIN_COSINE floor, returned as (source_ids, target_ids, cos) arrays."""
     import numpy as np  # noqa: E402
 
     X = np.vstack(vecs)  # L2-normalized already
-    sims = X @ X.T  # Cosine similarity (vectors are L2 normalized)
-
-    # Ensure similarities are in valid range [-1, 1] and handle numerical precision
-    sims = np.clip(sims, -1.0, 1.0)
-
-    pairs = []
-    n = len(ids)
-    for i in range(n):
-        # top-k excluding self
-        idxs = np.argsort(-sims[i])  # descending order
-        take = []
-        for j in idxs:
-            if j == i:
-                continue
-            if len(take) >= k:
-                break
-            cos = float(sims[i, j])
+    src_idx, tgt_idx, cos, sim_range = _knn_pair_arrays(X, k)
 
-            # Semantic similarity threshold - allow broader relationships initially
-            if cos >= 0.4:  # More permissive threshold for semantic relationships
-                pairs.append((ids[i], ids[j], cos))
-                take.append(j)
+    id_arr = np.empty(len(ids), dtype=object)
+    id_arr[:] = list(ids)
 
     log_json(
         LOG,
         20,
         "knn_pairs_computed",
-        batch_size=n,
-        pairs_found=len(pairs),
+        batch_size=len(ids),
+        pairs_found=len(cos),
         k=k,
-        similarity_range=(float(np.min(sims)), float(np.max(sims))) if n > 1 else None,
+        similarity_range=sim_range,
     )
 
-    return pairs
+    return id_arr[src_idx], id_arr[tgt_idx], cos
+
+
+CONCEPT_RELATION_UPSERT_SQL = """INSERT INTO concept_relations
+   (source_id, target_id, similarity, relation_type,
+    cosine, rerank_score, edge_strength, rerank_model)
+   VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+   ON CONFLICT (source_id, target_id) DO UPDATE SET
+     similarity = EXCLUDED.similarity,
+     relation_type = EXCLUDED.relation_type,
+     cosine = EXCLUDED.cosine,
+     rerank_score = EXCLUDED.rerank_score,
+     edge_strength = EXCLUDED.edge_strength,
+     rerank_model = EXCLUDED.rerank_model,
+     rerank_at = now()"""
+
+CONCEPT_NETWORK_UPSERT_SQL = """INSERT INTO concept_network (concept_id, embedding)
+   VALUES (%s, %s)
+   ON CONFLICT (concept_id) DO UPDATE SET
+   embedding = EXCLUDED.embedding,
+   created_at = now()
+   RETURNING id"""
 
 
 def build_relations(db, embeddings_batch, enriched_nouns=None):
@@ -139,7 +202,7 @@ def build_relations(db, embeddings_batch, enriched_nouns=None):
         ids = [e[1] for e in embeddings_batch]  # concept_network_id for relations
         vecs = [e[2] for e in embeddings_batch]  # embedding
 
-        pairs = _knn_pairs(vecs, ids, K)  # list[(sid, tid, cos)]
+        src_ids, tgt_ids, cosines = _knn_pairs(vecs, ids, K)  # parallel arrays
         rerank_calls = 0
     except Exception as e:
         log_json(
@@ -183,8 +246,15 @@ def build_relations(db, embeddings_batch, enriched_nouns=None):
     EDGE_ALPHA = float(os.getenv("EDGE_ALPHA", "0.70"))  # 0..1
 
     BATCH = max(1, min(RERANK_TOPK, int(os.getenv("RERANK_BATCH_MAX", "128"))))
-    for i in range(0, len(pairs), BATCH):
-        batch = pairs[i : i + BATCH]
+    for i in range(0, len(cosines), BATCH):
+        batch = list(
+            zip(
+                src_ids[i : i + BATCH].tolist(),
+                tgt_ids[i : i + BATCH].tolist(),
+                cosines[i : i + BATCH].tolist(),
+                strict=True,
+            )
+        )
         payload = [(sid, tid) for (sid, tid, _) in batch]
         try:
             scores = rerank_pairs(payload, name_map)  # list[float 0..1]
@@ -209,22 +279,14 @@ def build_relations(db, embeddings_batch, enriched_nouns=None):
     # Execute inserts using the same schema as rerank pipeline
     # Use specific model tag for bi-encoder proxy to avoid cache collisions
     rerank_model = f"bge-m3-emb-proxy@{os.getenv('EMBEDDING_MODEL', 'text-embedding-bge-m3')}"
-    for sid, tid, cos, score, edge_strength, relation_type in kept:
-        db.execute(
-            """INSERT INTO concept_relations
-               (source_id, target_id, similarity, relation_type,
-                cosine, rerank_score, edge_strength, rerank_model)
-               VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-               ON CONFLICT (source_id, target_id) DO UPDATE SET
-                 similarity = EXCLUDED.similarity,
-                 relation_type = EXCLUDED.relation_type,
-                 cosine = EXCLUDED.cosine,
-                 rerank_score = EXCLUDED.rerank_score,
-                 edge_strength = EXCLUDED.edge_strength,
-                 rerank_model = EXCLUDED.rerank_model,
-                 rerank_at = now()""",
-            (sid, tid, cos, relation_type, cos, score, edge_strength, rerank_model),
-        )
+    executemany_chunked(
+        db,
+        CONCEPT_RELATION_UPSERT_SQL,
+        [
+            (sid, tid, cos, relation_type, cos, score, edge_strength, rerank_model)
+            for sid, tid, cos, score, edge_strength, relation_type in kept
+        ],
+    )
     return len(kept), rerank_calls
 
 
@@ -437,15 +499,19 @@ def network_aggregator_node(state: dict[str, Any]) -> dict[str, Any]:
             edges_persisted, rerank_calls = build_relations(cur, concept_data, nouns)
             network_summary["edges_persisted"] = edges_persisted
             network_summary["rerank_calls"] = rerank_calls
+            network_summary["embedding_cache"] = embedding_cache_stats()
+            network_summary["http_pool"] = http_pool_stats()
 
             # Build rerank-driven relationships using KNN + reranker (legacy)
             if len(concept_data) >= 2:
+                ann_index = _sync_concept_index(cur, concept_data) if NN_BACKEND == "ann" else None
                 _build_rerank_relationships(
                     client,
                     cur,
                     concept_data,
                     network_summary,
                     use_provider_aware=HAS_PROVIDER_AWARE,
+                    ann_index=ann_index,
                 )
 
             # Transaction commits automatically on successful exit
@@ -498,8 +564,8 @@ def _generate_and_store_embeddings(
     if not embedding_texts:
         return []
 
-    # Batch process embeddings
-    concept_data = []
+    # Batch process embeddings; rows are upserted together once all batches are embedded
+    pending = []
     batch_size = 16
 
     for i in range(0, len(embedding_texts), batch_size):
@@ -535,29 +601,7 @@ def _generate_and_store_embeddings(
             )
 
             for noun, embedding, doc_text in zip(batch_nouns, batch_embeddings, batch_texts, strict=False):
-                noun_id = noun.get("noun_id", uuid.uuid4())
-
-                # Store in concept_network
-                cur.execute(
-                    """INSERT INTO concept_network (concept_id, embedding)
-                       VALUES (%s, %s)
-                       ON CONFLICT (concept_id) DO UPDATE SET
-                       embedding = EXCLUDED.embedding,
-                       created_at = now()
-                       RETURNING id""",
-                    (noun_id, embedding),
-                )
-                concept_network_id = cur.fetchone()[0]
-                concept_data.append((noun_id, concept_network_id, embedding, doc_text))
-
-                log_json(
-                    LOG,
-                    20,
-                    "embedding_stored",
-                    noun_id=str(noun_id),
-                    noun_name=_noun_display_name(noun),
-                    network_id=str(concept_network_id),
-                )
+                pending.append((noun, noun.get("noun_id", uuid.uuid4()), embedding, doc_text))
 
         except Exception as e:
             log_json(
@@ -570,6 +614,25 @@ def _generate_and_store_embeddings(
             )
             continue
 
+    if not pending:
+        return []
+
+    # Store in concept_network: one pipelined executemany per flush instead of a round trip per noun
+    returned = executemany_returning(
+        cur, CONCEPT_NETWORK_UPSERT_SQL, [(noun_id, embedding) for _, noun_id, embedding, _ in pending]
+    )
+    concept_data = []
+    for (noun, noun_id, embedding, doc_text), (concept_network_id,) in zip(pending, returned, strict=True):
+        concept_data.append((noun_id, concept_network_id, embedding, doc_text))
+        log_json(
+            LOG,
+            20,
+            "embedding_stored",
+            noun_id=str(noun_id),
+            noun_name=_noun_display_name(noun),
+            network_id=str(concept_network_id),
+        )
+
     return concept_data
 
 
@@ -626,17 +689,34 @@ def _build_document_string(noun: dict[str, Any]) -> str:
 
 
 def _build_rerank_relationships(
-    client, cur, concept_data: list[tuple], summary: dict, use_provider_aware: bool = False
+    client,
+    cur,
+    concept_data: list[tuple],
+    summary: dict,
+    use_provider_aware: bool = False,
+    ann_index=None,
 ):
-    """Build relationships using KNN recall + reranker precision."""
+    """Build relationships using KNN recall + reranker precision.
+
+    Neighbours come from one batched ANN search when ann_index is given,
+    otherwise from one pgvector query per source concept.
+    """
     total_edge_strength = 0.0
     total_yes_scores = 0
     total_rerank_calls = 0
 
+    by_net_id = {str(row[1]): row for row in concept_data}
+    rerank_model = get_reranker_model()
+    relation_writer = BulkWriter(cur, CONCEPT_RELATION_UPSERT_SQL)
+    ann_neighbors = ann_index.search_ids([row[1] for row in concept_data], NN_TOPK) if ann_index is not None else None
+
     # Process each concept as a potential source
-    for source_id, source_net_id, _source_emb, source_doc in concept_data:
-        # Get KNN neighbors using pgvector
-        neighbors = _get_knn_neighbors(cur, source_net_id, NN_TOPK)
+    for idx, (source_id, source_net_id, _source_emb, source_doc) in enumerate(concept_data):
+        # Get KNN neighbors from the local index or pgvector
+        if ann_neighbors is not None:
+            neighbors = ann_neighbors[idx]
+        else:
+            neighbors = _get_knn_neighbors(cur, source_net_id, NN_TOPK)
 
         if not neighbors:
             continue
@@ -646,15 +726,15 @@ def _build_rerank_relationships(
         neighbor_data = []
 
         for neighbor_net_id, neighbor_cosine in neighbors:
-            if neighbor_net_id == source_net_id:
+            if str(neighbor_net_id) == str(source_net_id):
                 continue
 
             # Find the neighbor's data
-            for n_id, n_net_id, n_emb, n_doc in concept_data:
-                if n_net_id == neighbor_net_id:
-                    candidates.append(n_doc)
-                    neighbor_data.append((n_id, n_net_id, neighbor_cosine, n_emb))
-                    break
+            row = by_net_id.get(str(neighbor_net_id))
+            if row is not None:
+                n_id, n_net_id, n_emb, n_doc = row
+                candidates.append(n_doc)
+                neighbor_data.append((n_id, n_net_id, neighbor_cosine, n_emb))
 
         if not candidates:
             continue
@@ -712,21 +792,8 @@ def _build_rerank_relationships(
             else:
                 continue  # Skip edges below weak threshold
 
-            # Store relationship with rerank evidence
-            rerank_model = get_reranker_model()
-            cur.execute(
-                """INSERT INTO concept_relations
-                   (source_id, target_id, similarity, relation_type, cosine,
-                    rerank_score, edge_strength, rerank_model)
-                   VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-                   ON CONFLICT (source_id, target_id) DO UPDATE SET
-                   similarity = EXCLUDED.similarity,
-                   relation_type = EXCLUDED.relation_type,
-                   cosine = EXCLUDED.cosine,
-                   rerank_score = EXCLUDED.rerank_score,
-                   edge_strength = EXCLUDED.edge_strength,
-                   rerank_model = EXCLUDED.rerank_model,
-                   rerank_at = now()""",
+            # Store relationship with rerank evidence (buffered, flushed every BULK_FLUSH_SIZE rows)
+            relation_writer.add(
                 (
                     source_net_id,
                     target_net_id,
@@ -736,7 +803,7 @@ def _build_rerank_relationships(
                     rerank_score,
                     edge_strength,
                     rerank_model,
-                ),
+                )
             )
 
             log_json(
@@ -751,6 +818,8 @@ def _build_rerank_relationships(
                 type=relation_type,
             )
 
+    relation_writer.flush()
+
     # Update summary metrics
     if summary["strong_edges"] + summary["weak_edges"] > 0:
         summary["avg_edge_strength"] = total_edge_strength / (summary["strong_edges"] + summary["weak_edges"])
@@ -775,6 +844,35 @@ def _get_knn_neighbors(cur, source_net_id: uuid.UUID, top_k: int) -> list[tuple[
     return [(row[0], float(row[1])) for row in cur.fetchall()]
 
 
+def _load_concept_vectors(cur) -> tuple[list[str], Any]:
+    """Fetch all concept_network embeddings for building the local ANN index."""
+    import numpy as np  # noqa: E402
+
+    cur.execute("SELECT id, embedding FROM concept_network WHERE embedding IS NOT NULL")
+    rows = cur.fetchall()
+    if not rows:
+        return [], np.zeros((0, VECTOR_DIM), dtype=np.float32)
+    return [str(r[0]) for r in rows], np.asarray([np.asarray(r[1], dtype=np.float32) for r in rows])
+
+
+def _sync_concept_index(cur, concept_data: list[tuple]):
+    """Load (or build) the concept ANN index and upsert this run's embeddings into it."""
+    from src.infra.ann_index import get_index, index_path  # noqa: E402
+
+    try:
+        index = get_index(CONCEPT_INDEX_NAME, loader=lambda: _load_concept_vectors(cur))
+        if index is None:
+            return None
+        index.upsert([str(row[1]) for row in concept_data], [row[2] for row in concept_data])
+        index.save(index_path(CONCEPT_INDEX_NAME))
+        log_json(LOG, 20, "ann_index_synced", kind=index.kind, rows=len(index), upserted=len(concept_data))
+        return index
+    except Exception as e:
+        # Fall back to per-row pgvector queries rather than failing the node
+        log_json(LOG, 30, "ann_index_sync_failed", error=str(e))
+        return None
+
+
 def _cosine_similarity(vec1: list[float], vec2: list[float]) -> float:
     """Compute cosine similarity between two vectors."""
     import math  # noqa: E402
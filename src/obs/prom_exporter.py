@@ -5,10 +5,13 @@ from __future__ import annotations
 
 import os
 
-import psycopg
 from fastapi import FastAPI, Response
 from scripts.config.env import get_rw_dsn
 
+from src.infra.db_pool import pool_stats, pooled_connection
+from src.infra.embedding_cache import embedding_cache_stats
+from src.infra.http_pool import http_pool_stats
+
 PROM_EXPORTER_ENABLED = os.getenv("PROM_EXPORTER_ENABLED", "0") not in (
     "0",
     "false",
@@ -23,7 +26,7 @@ def _fetch():
     dsn = get_rw_dsn()
     if not dsn:
         return {}
-    with psycopg.connect(dsn) as conn, conn.cursor() as cur:
+    with pooled_connection(dsn) as conn, conn.cursor() as cur:
         cur.execute("SELECT node, calls, avg_ms, p50_ms, p90_ms, p95_ms, p99_ms FROM v_node_latency_7d")
         latency = cur.fetchall()
         cur.execute("SELECT node, COALESCE(SUM(items_out),0) FROM v_node_throughput_24h GROUP BY node")
@@ -58,6 +61,38 @@ def metrics():
         lines.append(f'gemantria_node_latency_ms_7d_quantile{{quantile="0.95",node="{node}"}} {p95}')
         lines.append(f'gemantria_node_latency_ms_7d_quantile{{quantile="0.99",node="{node}"}} {p99}')
 
+    # In-process embedding cache counters (empty until the first cached embed call)
+    cache = embedding_cache_stats()
+    lines.append("# HELP gemantria_embedding_cache_events_total Embedding cache lookups by outcome.")
+    lines.append("# TYPE gemantria_embedding_cache_events_total counter")
+    for outcome in ("hits", "disk_hits", "misses", "evictions", "dedup_saved"):
+        lines.append(f'gemantria_embedding_cache_events_total{{outcome="{outcome}"}} {cache.get(outcome, 0)}')
+    lines.append("# HELP gemantria_embedding_cache_memory_items Vectors held in the in-memory LRU tier.")
+    lines.append("# TYPE gemantria_embedding_cache_memory_items gauge")
+    lines.append(f"gemantria_embedding_cache_memory_items {cache.get('memory_items', 0)}")
+
+    # Shared LM HTTP transport: keep-alive reuse and handshake overhead
+    pool = http_pool_stats()
+    lines.append("# HELP gemantria_http_pool_requests_total Requests sent through the shared LM HTTP pool.")
+    lines.append("# TYPE gemantria_http_pool_requests_total counter")
+    lines.append(f"gemantria_http_pool_requests_total {pool['requests']}")
+    lines.append("# HELP gemantria_http_pool_connections_opened_total New TCP connections opened by the pool.")
+    lines.append("# TYPE gemantria_http_pool_connections_opened_total counter")
+    lines.append(f"gemantria_http_pool_connections_opened_total {pool['connections_opened']}")
+    lines.append("# HELP gemantria_http_pool_connect_ms_total Time spent establishing connections.")
+    lines.append("# TYPE gemantria_http_pool_connect_ms_total counter")
+    lines.append(f"gemantria_http_pool_connect_ms_total {pool['connect_ms_total']}")
+    lines.append("# HELP gemantria_http_pool_reuse_ratio Share of requests served on a reused connection.")
+    lines.append("# TYPE gemantria_http_pool_reuse_ratio gauge")
+    lines.append(f"gemantria_http_pool_reuse_ratio {pool['reuse_ratio']}")
+
+    # psycopg_pool counters per DSN (password redacted in the pool name)
+    lines.append("# HELP gemantria_db_pool_stat Connection pool statistics by pool and stat name.")
+    lines.append("# TYPE gemantria_db_pool_stat gauge")
+    for pool_name, stats in pool_stats().items():
+        for stat, value in sorted(stats.items()):
+            lines.append(f'gemantria_db_pool_stat{{pool="{pool_name}",stat="{stat}"}} {value}')
+
     body = "\n".join(lines) + "\n"
     return Response(content=body, media_type="text/plain; version=0.0.4; charset=utf-8")
 
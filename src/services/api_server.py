@@ -13,19 +13,23 @@ Usage:
     # Or: uvicorn src.services.api_server:app --host 0.0.0.0 --port 8000
 """
 
+import hashlib
 import json
 import os
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import FastAPI, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, JSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
 
+from src.infra.blocking import blocking_route
 from src.infra.env_loader import ensure_env_loaded
 from src.infra.structured_logger import get_logger
+from src.services.export_store import ExportSnapshot, get_export_store
 
 # Import system status helpers
 from pmagent.status.eval_exports import (
@@ -34,6 +38,7 @@ from pmagent.status.eval_exports import (
     load_lm_indicator,
 )
 from pmagent.status.explain import explain_system_status
+from pmagent.status.probes import SNAPSHOT_CACHE_TTL_S, cached_probe, probe_scope, shared_probe
 from pmagent.status.system import get_system_status
 from datetime import UTC
 
@@ -120,6 +125,34 @@ def load_json_file(filepath: Path) -> dict[str, Any]:
         return {}
 
 
+def _load_export(filename: str) -> ExportSnapshot | None:
+    """Cached export snapshot (reloaded on change), or None if missing or unreadable."""
+    filepath = get_export_path(filename)
+    try:
+        export = get_export_store().get(filepath)
+    except Exception as e:
+        LOG.error(f"Error loading {filepath}: {e}")
+        return None
+    if export is None:
+        LOG.warning(f"Export file not found: {filepath}")
+    return export
+
+
+def _export_response(request: Request, export: ExportSnapshot, build: Callable[[], Any]) -> Response:
+    """JSON response for one view of an export, with ETag / If-None-Match (304) support.
+
+    The ETag combines the export version with the request's query, so an
+    unchanged export answers repeat requests with 304 and no body.
+    """
+    key = f"{request.url.path}?{request.url.query}"
+    etag = f'W/"{export.tag}-{hashlib.sha1(key.encode("utf-8")).hexdigest()[:12]}"'
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if_none_match = request.headers.get("if-none-match", "")
+    if if_none_match.strip() == "*" or etag in (t.strip() for t in if_none_match.split(",")):
+        return Response(status_code=304, headers=headers)
+    return Response(content=export.rendered(key, build), media_type="application/json", headers=headers)
+
+
 @app.get("/", response_model=APIInfo)
 async def root() -> APIInfo:
     """Root endpoint with API information."""
@@ -170,7 +203,8 @@ async def health_check() -> HealthResponse:
 
 
 @app.get("/api/status/system")
-async def get_system_status_endpoint() -> JSONResponse:
+@blocking_route("status", limit=4)
+def get_system_status_endpoint() -> JSONResponse:
     """Get system status (DB + LM health snapshot).
 
     Returns:
@@ -209,16 +243,22 @@ async def get_system_status_endpoint() -> JSONResponse:
         # Use unified snapshot helper for consistency with pm.snapshot
         from pmagent.status.snapshot import get_system_snapshot
 
-        snapshot = get_system_snapshot(
-            include_reality_check=False,  # Skip for /api/status/system (use /api/status/explain for that)
-            include_ai_tracking=True,
-            include_share_manifest=True,
-            include_eval_insights=True,  # Include eval exports summary
-            use_lm_for_explain=False,  # Fast path for API
-        )
+        # Snapshot and db/lm status are both cached for SNAPSHOT_CACHE_TTL_S, so a hit
+        # does no probe I/O; on a miss the probe scope shares db/lm checks between them
+        with probe_scope():
+            snapshot = get_system_snapshot(
+                include_reality_check=False,  # Skip for /api/status/system (use /api/status/explain for that)
+                include_ai_tracking=True,
+                include_share_manifest=True,
+                include_eval_insights=True,  # Include eval exports summary
+                use_lm_for_explain=False,  # Fast path for API
+                max_age_s=SNAPSHOT_CACHE_TTL_S,  # Dashboards poll this; reuse a recent snapshot
+            )
 
-        # Extract and format response (backward compatible with existing frontend)
-        system_status = get_system_status()  # Keep existing format for db/lm
+            # Extract and format response (backward compatible with existing frontend)
+            system_status = cached_probe(  # Keep existing format for db/lm
+                "system_status", lambda: shared_probe(get_system_status), ttl=SNAPSHOT_CACHE_TTL_S
+            )
         response = {
             "db": system_status.get("db", {}),
             "lm": system_status.get("lm", {}),
@@ -249,7 +289,8 @@ async def get_system_status_endpoint() -> JSONResponse:
 
 
 @app.get("/api/status/explain")
-async def get_status_explanation_endpoint() -> JSONResponse:
+@blocking_route("status", limit=4)
+def get_status_explanation_endpoint() -> JSONResponse:
     """Get human-readable explanation of system status.
 
     Returns:
@@ -1714,7 +1755,8 @@ async def db_insights_page() -> HTMLResponse:
 
 
 @app.get("/api/bible/passage")
-async def get_bible_passage(
+@blocking_route("bible")
+def get_bible_passage(
     reference: str = Query(..., description="Bible reference (e.g., 'John 3:16-18')"),
     use_lm: bool = Query(False, description="Use AI commentary (default: False to avoid model loads)"),
 ) -> JSONResponse:
@@ -1763,7 +1805,8 @@ async def get_bible_passage(
 
 
 @app.get("/api/bible/semantic-search")
-async def semantic_search_endpoint(
+@blocking_route("bible")
+def semantic_search_endpoint(
     query: str = Query(..., description="Search query (e.g., 'hope in difficult times')"),
     limit: int = Query(10, ge=1, le=50, description="Maximum number of results (1-50)"),
     translation: str = Query("KJV", description="Bible translation (default: KJV)"),
@@ -1848,7 +1891,8 @@ class CrossLanguageRequest(BaseModel):
 
 
 @app.post("/api/bible/search")
-async def keyword_search_endpoint(request: KeywordSearchRequest) -> JSONResponse:  # noqa: B008
+@blocking_route("bible")
+def keyword_search_endpoint(request: KeywordSearchRequest) -> JSONResponse:  # noqa: B008
     """Keyword search across Bible verses.
 
     Args:
@@ -1928,7 +1972,8 @@ async def keyword_search_endpoint(request: KeywordSearchRequest) -> JSONResponse
 
 
 @app.get("/api/bible/lexicon/{strongs_id}")
-async def lexicon_lookup_endpoint(strongs_id: str) -> JSONResponse:
+@blocking_route("bible")
+def lexicon_lookup_endpoint(strongs_id: str) -> JSONResponse:
     """Lookup lexicon entry by Strong's number.
 
     Args:
@@ -1997,7 +2042,8 @@ async def lexicon_lookup_endpoint(strongs_id: str) -> JSONResponse:
 
 
 @app.post("/api/bible/cross-language")
-async def cross_language_endpoint(request: CrossLanguageRequest) -> JSONResponse:  # noqa: B008
+@blocking_route("bible")
+def cross_language_endpoint(request: CrossLanguageRequest) -> JSONResponse:  # noqa: B008
     """Find Hebrew↔Greek semantic connections for a Strong's number.
 
     Args:
@@ -2066,7 +2112,8 @@ async def cross_language_endpoint(request: CrossLanguageRequest) -> JSONResponse
 
 
 @app.get("/api/bible/insights/{reference}")
-async def insights_endpoint(
+@blocking_route("bible")
+def insights_endpoint(
     reference: str,
     translations: str | None = Query(None, description="Comma-separated list of translations (e.g., 'ESV,ASV')"),
     include_lexicon: bool = Query(True, description="Include lexicon entries"),
@@ -2178,7 +2225,8 @@ async def insights_endpoint(
 
 
 @app.get("/api/mcp/tools/search")
-async def mcp_tools_search_endpoint(
+@blocking_route("mcp", limit=4)
+def mcp_tools_search_endpoint(
     q: str | None = Query(None, description="Search query (semantic + keyword)"),
     subsystem: str | None = Query(None, description="Filter by subsystem (e.g., 'biblescholar')"),
     visibility: str | None = Query(None, description="Filter by visibility ('internal' or 'external')"),
@@ -2529,94 +2577,79 @@ async def bible_page() -> HTMLResponse:
 
 
 @app.get("/api/v1/stats")
-async def get_stats() -> JSONResponse:
+async def get_stats(request: Request) -> Response:
     """Get comprehensive graph statistics."""
-    filepath = get_export_path("graph_stats.json")
-    data = load_json_file(filepath)
+    export = _load_export("graph_stats.json")
 
-    if not data:
+    if export is None or not export.data:
         raise HTTPException(
             status_code=404,
             detail="Statistics data not available. Run export pipeline first.",
         )
 
-    return JSONResponse(content=data)
+    return _export_response(request, export, lambda: export.data)
 
 
 @app.get("/api/v1/correlations")
 async def get_correlations(
+    request: Request,
     limit: int | None = Query(100, description="Maximum number of correlations to return"),
     min_strength: float | None = Query(0.0, description="Minimum correlation strength threshold"),
-) -> JSONResponse:
-    """Get concept correlation data."""
-    filepath = get_export_path("graph_correlations.json")
-    data = load_json_file(filepath)
+) -> Response:
+    """Get concept correlation data (strongest first)."""
+    export = _load_export("graph_correlations.json")
 
-    if not data or "correlations" not in data:
+    if export is None or "correlations" not in export.data:
         raise HTTPException(
             status_code=404,
             detail="Correlation data not available. Run export pipeline first.",
         )
 
-    correlations = data["correlations"]
+    def build() -> dict[str, Any]:
+        correlations = export.index.strongest(min_strength)
+        if limit and limit > 0:
+            correlations = correlations[:limit]
 
-    # Apply filters
-    if min_strength > 0.0:
-        correlations = [c for c in correlations if abs(c.get("correlation", 0)) >= min_strength]
-
-    if limit and limit > 0:
-        correlations = correlations[:limit]
-
-    # Return filtered data with metadata
-    return JSONResponse(
-        content={
+        # Return filtered data with metadata
+        return {
             "correlations": correlations,
             "metadata": {
-                **data.get("metadata", {}),
+                **export.data.get("metadata", {}),
                 "filtered_count": len(correlations),
                 "applied_filters": {"limit": limit, "min_strength": min_strength},
             },
         }
-    )
+
+    return _export_response(request, export, build)
 
 
 @app.get("/api/v1/patterns")
 async def get_patterns(
+    request: Request,
     limit: int | None = Query(50, description="Maximum number of patterns to return"),
     min_strength: float | None = Query(0.0, description="Minimum pattern strength threshold"),
     metric: str | None = Query(None, description="Filter by pattern metric"),
-) -> JSONResponse:
+) -> Response:
     """Get cross-text pattern analysis data."""
-    filepath = get_export_path("graph_patterns.json")
-    data = load_json_file(filepath)
+    export = _load_export("graph_patterns.json")
 
-    if not data or "patterns" not in data:
+    if export is None or "patterns" not in export.data:
         raise HTTPException(
             status_code=404,
             detail="Pattern data not available. Run export pipeline first.",
         )
 
-    patterns = data["patterns"]
-
-    # Apply filters
-    if min_strength > 0.0:
-        patterns = [p for p in patterns if p.get("pattern_strength", 0) >= min_strength]
-
-    if metric:
-        patterns = [p for p in patterns if p.get("metric", "") == metric]
+    def build() -> dict[str, Any]:
+        # Filtered and sorted by strength (descending) via the prebuilt index
+        patterns = export.index.strongest(min_strength, metric=metric)
+        if limit and limit > 0:
+            patterns = patterns[:limit]
 
-    # Sort by strength (descending)
-    patterns = sorted(patterns, key=lambda x: x.get("pattern_strength", 0), reverse=True)
-
-    if limit and limit > 0:
-        patterns = patterns[:limit]
-
-    # Return filtered data with metadata
-    return JSONResponse(
-        content={
+        # Return filtered data with metadata
+        return {
             "patterns": patterns,
             "metadata": {
-                **data.get("metadata", {}),
+                **export.data.get("metadata", {}),
                 "filtered_count": len(patterns),
                 "applied_filters": {
                     "limit": limit,
@@ -2625,59 +2658,47 @@ async def get_patterns(
                 },
             },
         }
-    )
+
+    return _export_response(request, export, build)
 
 
 @app.get("/api/v1/network/{concept_id}")
 async def get_concept_network(
+    request: Request,
     concept_id: str,
     depth: int | None = Query(1, description="Network depth to traverse"),
     max_connections: int | None = Query(20, description="Maximum connections to return"),
-) -> JSONResponse:
+) -> Response:
     """Get network subgraph for a specific concept."""
-    # Load correlation data to build network
-    filepath = get_export_path("graph_correlations.json")
-    correlation_data = load_json_file(filepath)
+    # Network is served from the correlation export's adjacency index
+    export = _load_export("graph_correlations.json")
 
-    if not correlation_data or "correlations" not in correlation_data:
+    if export is None or "correlations" not in export.data:
         raise HTTPException(
             status_code=404,
             detail="Correlation data not available for network analysis.",
         )
 
-    correlations = correlation_data["correlations"]
-
-    # Find all connections for this concept
-    connections = []
-    seen_concepts = {concept_id}
-
-    # Direct connections (depth 1)
-    for corr in correlations:
-        if corr.get("source") == concept_id:
-            target = corr.get("target")
-            if target not in seen_concepts:
-                connections.append({"concept_id": target, "correlation": corr, "depth": 1})
-                seen_concepts.add(target)
-        elif corr.get("target") == concept_id:
-            source = corr.get("source")
-            if source not in seen_concepts:
-                connections.append({"concept_id": source, "correlation": corr, "depth": 1})
-                seen_concepts.add(source)
-
-    # For depth > 1, we could implement BFS, but keeping it simple for now
-    # In a full implementation, this would traverse the graph
-
-    # Limit connections if specified
-    if max_connections and len(connections) > max_connections:
-        # Sort by correlation strength and take top N
-        connections = sorted(
-            connections,
-            key=lambda x: abs(x["correlation"].get("correlation", 0)),
-            reverse=True,
-        )[:max_connections]
-
-    return JSONResponse(
-        content={
+    def build() -> dict[str, Any]:
+        # Direct connections (depth 1)
+        connections = [
+            {"concept_id": neighbour, "correlation": corr, "depth": 1}
+            for neighbour, corr in export.index.neighbours(concept_id)
+        ]
+
+        # For depth > 1, we could implement BFS, but keeping it simple for now
+        # In a full implementation, this would traverse the graph
+
+        # Limit connections if specified
+        if max_connections and len(connections) > max_connections:
+            # Sort by correlation strength and take top N
+            connections = sorted(
+                connections,
+                key=lambda x: abs(x["correlation"].get("correlation", 0)),
+                reverse=True,
+            )[:max_connections]
+
+        return {
             "center_concept": concept_id,
             "connections": connections,
             "network_stats": {
@@ -2685,9 +2706,10 @@ async def get_concept_network(
                 "depth": depth,
                 "max_connections_requested": max_connections,
             },
-            "metadata": correlation_data.get("metadata", {}),
+            "metadata": export.data.get("metadata", {}),
         }
-    )
+
+    return _export_response(request, export, build)
 
 
 @app.exception_handler(Exception)
@@ -2706,10 +2728,11 @@ async def global_exception_handler(request, exc):
 
 @app.get("/api/v1/temporal")
 async def get_temporal_patterns(
+    request: Request,
     series_id: str = Query(None, description="Specific series ID to filter by"),
     unit: str = Query("chapter", description="Time unit: 'verse' or 'chapter'"),
     window: int = Query(5, min=1, description="Rolling window size"),
-) -> JSONResponse:
+) -> Response:
     """
     Get temporal pattern data with optional filtering.
 
@@ -2718,36 +2741,22 @@ async def get_temporal_patterns(
     - **window**: Rolling window size for pattern computation
     """
     try:
-        temporal_file = get_export_path("temporal_patterns.json")
-        if not temporal_file.exists():
+        export = get_export_store().get(get_export_path("temporal_patterns.json"))
+        if export is None:
             raise HTTPException(status_code=404, detail="Temporal patterns data not available")
 
-        with open(temporal_file, encoding="utf-8") as f:
-            data = json.load(f)
-
-        patterns = data.get("temporal_patterns", [])
-
-        # Apply filters
-        if series_id:
-            patterns = [p for p in patterns if p.get("series_id") == series_id]
-
-        # Filter by unit if specified
-        if unit:
-            patterns = [p for p in patterns if p.get("unit") == unit]
+        def build() -> dict[str, Any]:
+            # Apply filters (unit/window via the prebuilt index)
+            patterns = export.index.select(series_id=series_id, unit=unit, window=window)
 
-        # Filter by window if specified
-        if window:
-            patterns = [p for p in patterns if p.get("window") == window]
+            # Limit results for API performance
+            max_results = 50
+            if len(patterns) > max_results:
+                patterns = patterns[:max_results]
 
-        # Limit results for API performance
-        max_results = 50
-        if len(patterns) > max_results:
-            patterns = patterns[:max_results]
-
-        return JSONResponse(
-            content={
+            return {
                 "temporal_patterns": patterns,
-                "metadata": data.get("metadata", {}),
+                "metadata": export.data.get("metadata", {}),
                 "filters_applied": {
                     "series_id": series_id,
                     "unit": unit,
@@ -2756,8 +2765,11 @@ async def get_temporal_patterns(
                 "result_count": len(patterns),
                 "max_results": max_results,
             }
-        )
 
+        return _export_response(request, export, build)
+
+    except HTTPException:
+        raise
     except FileNotFoundError as e:
         raise HTTPException(status_code=404, detail="Temporal patterns data not found") from e
     except json.JSONDecodeError as e:
@@ -2769,9 +2781,10 @@ async def get_temporal_patterns(
 
 @app.get("/api/v1/forecast")
 async def get_forecasts(
+    request: Request,
     series_id: str = Query(None, description="Specific series ID to filter by"),
     horizon: int = Query(10, min=1, description="Forecast horizon"),
-) -> JSONResponse:
+) -> Response:
     """
     Get forecast data with optional filtering.
 
@@ -2779,38 +2792,31 @@ async def get_forecasts(
     - **horizon**: Forecast horizon (steps ahead)
     """
     try:
-        forecast_file = get_export_path("pattern_forecast.json")
-        if not forecast_file.exists():
+        export = get_export_store().get(get_export_path("pattern_forecast.json"))
+        if export is None:
             raise HTTPException(status_code=404, detail="Forecast data not available")
 
-        with open(forecast_file, encoding="utf-8") as f:
-            data = json.load(f)
+        def build() -> dict[str, Any]:
+            # Apply filters (horizon via the prebuilt index)
+            forecasts = export.index.select(series_id=series_id, horizon=horizon)
 
-        forecasts = data.get("forecasts", [])
-
-        # Apply filters
-        if series_id:
-            forecasts = [f for f in forecasts if f.get("series_id") == series_id]
-
-        # Filter by horizon if specified
-        if horizon:
-            forecasts = [f for f in forecasts if f.get("horizon") == horizon]
+            # Limit results for API performance
+            max_results = 20
+            if len(forecasts) > max_results:
+                forecasts = forecasts[:max_results]
 
-        # Limit results for API performance
-        max_results = 20
-        if len(forecasts) > max_results:
-            forecasts = forecasts[:max_results]
-
-        return JSONResponse(
-            content={
+            return {
                 "forecasts": forecasts,
-                "metadata": data.get("metadata", {}),
+                "metadata": export.data.get("metadata", {}),
                 "filters_applied": {"series_id": series_id, "horizon": horizon},
                 "result_count": len(forecasts),
                 "max_results": max_results,
             }
-        )
 
+        return _export_response(request, export, build)
+
+    except HTTPException:
+        raise
     except FileNotFoundError as e:
         raise HTTPException(status_code=404, detail="Forecast data not found") from e
     except json.JSONDecodeError as e:
@@ -2956,7 +2962,8 @@ async def get_temporal_forecast_filtered(
 
 
 @app.get("/api/docs/search")
-async def search_docs_endpoint(
+@blocking_route("docs", limit=4)
+def search_docs_endpoint(
     q: str = Query(..., description="Search query"),
     k: int = Query(10, ge=1, le=50, description="Number of results"),
     tier0_only: bool = Query(True, description="Restrict to Tier-0 docs"),
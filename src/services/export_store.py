@@ -0,0 +1,221 @@
+# OPS meta: Rules 050/051/052 AlwaysApply | SSOT: ruff | Housekeeping: `make housekeeping`
+# Timestamp contract: RFC3339 fast-lane (generated_at RFC3339; metadata.source="fallback_fast_lane")
+
+"""
+In-memory export store for the /api/v1 endpoints.
+
+Each export JSON is parsed once and kept until its mtime/size changes, along
+with secondary indexes built at load time (adjacency by concept, correlations
+and patterns pre-sorted by strength, lookups by metric/unit/window/horizon),
+so requests filter by lookup and bisect instead of re-reading and scanning the
+whole file. Every loaded version carries a tag usable as an HTTP ETag.
+"""
+
+from __future__ import annotations
+
+import bisect
+import json
+import threading
+from collections import defaultdict
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+
+def _strength_order(items: list[dict[str, Any]], key: Callable[[dict[str, Any]], float]) -> tuple[list, list]:
+    """Sort items strongest first (stable) and return (items, negated keys) for bisecting thresholds."""
+    ordered = sorted(items, key=key, reverse=True)
+    return ordered, [-key(item) for item in ordered]
+
+
+def _at_least(ordered: list, neg_keys: list[float], threshold: float) -> list:
+    """Prefix of a strength-ordered list whose strength is >= threshold."""
+    return ordered[: bisect.bisect_right(neg_keys, -threshold)]
+
+
+def _abs_correlation(corr: dict[str, Any]) -> float:
+    return abs(corr.get("correlation", 0))
+
+
+def _pattern_strength(pattern: dict[str, Any]) -> float:
+    return pattern.get("pattern_strength", 0)
+
+
+@dataclass
+class CorrelationIndex:
+    """graph_correlations.json: strength-ordered correlations and per-concept adjacency."""
+
+    by_strength: list[dict[str, Any]]
+    neg_strength: list[float]
+    # concept -> [(neighbour, correlation)], file order, first edge per neighbour
+    adjacency: dict[Any, list[tuple[Any, dict[str, Any]]]]
+
+    @classmethod
+    def build(cls, data: dict[str, Any]) -> CorrelationIndex:
+        correlations = data.get("correlations", [])
+        by_strength, neg_strength = _strength_order(correlations, _abs_correlation)
+        adjacency: dict[Any, list[tuple[Any, dict[str, Any]]]] = defaultdict(list)
+        seen: dict[Any, set] = defaultdict(set)
+        for corr in correlations:
+            source, target = corr.get("source"), corr.get("target")
+            if source == target:
+                continue
+            for concept, neighbour in ((source, target), (target, source)):
+                if neighbour not in seen[concept]:
+                    seen[concept].add(neighbour)
+                    adjacency[concept].append((neighbour, corr))
+        return cls(by_strength, neg_strength, dict(adjacency))
+
+    def strongest(self, min_strength: float = 0.0) -> list[dict[str, Any]]:
+        """Correlations strongest first, optionally only those with |correlation| >= min_strength."""
+        if min_strength > 0.0:
+            return _at_least(self.by_strength, self.neg_strength, min_strength)
+        return self.by_strength
+
+    def neighbours(self, concept_id: Any) -> list[tuple[Any, dict[str, Any]]]:
+        return self.adjacency.get(concept_id, [])
+
+
+@dataclass
+class PatternIndex:
+    """graph_patterns.json: patterns pre-sorted by strength, overall and per metric."""
+
+    by_strength: list[dict[str, Any]]
+    neg_strength: list[float]
+    by_metric: dict[str, tuple[list[dict[str, Any]], list[float]]]
+
+    @classmethod
+    def build(cls, data: dict[str, Any]) -> PatternIndex:
+        patterns = data.get("patterns", [])
+        by_strength, neg_strength = _strength_order(patterns, _pattern_strength)
+        grouped: dict[str, list[dict[str, Any]]] = defaultdict(list)
+        for pattern in by_strength:
+            grouped[pattern.get("metric", "")].append(pattern)
+        by_metric = {metric: (items, [-_pattern_strength(p) for p in items]) for metric, items in grouped.items()}
+        return cls(by_strength, neg_strength, by_metric)
+
+    def strongest(self, min_strength: float = 0.0, metric: str | None = None) -> list[dict[str, Any]]:
+        ordered, neg = self.by_metric.get(metric, ([], [])) if metric else (self.by_strength, self.neg_strength)
+        return _at_least(ordered, neg, min_strength) if min_strength > 0.0 else ordered
+
+
+@dataclass
+class GroupIndex:
+    """Records grouped by a tuple of fields (file order kept within each group)."""
+
+    fields: tuple[str, ...]
+    records: list[dict[str, Any]]
+    groups: dict[tuple, list[dict[str, Any]]]
+
+    @classmethod
+    def build(cls, records: list[dict[str, Any]], fields: tuple[str, ...]) -> GroupIndex:
+        groups: dict[tuple, list[dict[str, Any]]] = defaultdict(list)
+        for record in records:
+            groups[tuple(record.get(f) for f in fields)].append(record)
+        return cls(fields, records, dict(groups))
+
+    def select(self, **filters: Any) -> list[dict[str, Any]]:
+        """Records matching every truthy filter value (falsy values mean "any")."""
+        active = {k: v for k, v in filters.items() if v}
+        if set(self.fields) <= active.keys():
+            candidates = self.groups.get(tuple(active[f] for f in self.fields), [])
+        else:
+            candidates = self.records
+        return [r for r in candidates if all(r.get(k) == v for k, v in active.items())]
+
+
+def _temporal_index(data: dict[str, Any]) -> GroupIndex:
+    return GroupIndex.build(data.get("temporal_patterns", []), ("unit", "window"))
+
+
+def _forecast_index(data: dict[str, Any]) -> GroupIndex:
+    return GroupIndex.build(data.get("forecasts", []), ("horizon",))
+
+
+# Export filename -> index builder
+EXPORT_INDEXERS: dict[str, Callable[[dict[str, Any]], Any]] = {
+    "graph_correlations.json": CorrelationIndex.build,
+    "graph_patterns.json": PatternIndex.build,
+    "temporal_patterns.json": _temporal_index,
+    "pattern_forecast.json": _forecast_index,
+}
+
+
+@dataclass
+class ExportSnapshot:
+    """One parsed version of an export file plus its index."""
+
+    path: Path
+    data: dict[str, Any]
+    tag: str
+    index: Any = None
+    _rendered: dict[str, bytes] = field(default_factory=dict, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def rendered(self, key: str, build: Callable[[], Any]) -> bytes:
+        """JSON bytes for one response variant of this version (built once)."""
+        with self._lock:
+            body = self._rendered.get(key)
+        if body is None:
+            body = json.dumps(build(), ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+            with self._lock:
+                if len(self._rendered) >= 256:
+                    self._rendered.clear()
+                self._rendered[key] = body
+        return body
+
+
+class ExportStore:
+    """Thread-safe cache of export files keyed by path, reloaded when (mtime, size) changes."""
+
+    def __init__(self, indexers: dict[str, Callable[[dict[str, Any]], Any]] | None = None):
+        self.indexers = EXPORT_INDEXERS if indexers is None else indexers
+        self._snapshots: dict[Path, ExportSnapshot] = {}
+        self._lock = threading.Lock()
+
+    def get(self, path: Path) -> ExportSnapshot | None:
+        """Current snapshot of path, or None if the file does not exist.
+
+        Raises json.JSONDecodeError / OSError if the file cannot be parsed.
+        """
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            return None
+        tag = f"{st.st_mtime_ns:x}-{st.st_size:x}"
+        with self._lock:
+            snapshot = self._snapshots.get(path)
+        if snapshot is not None and snapshot.tag == tag:
+            return snapshot
+
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        indexer = self.indexers.get(path.name)
+        snapshot = ExportSnapshot(path=path, data=data, tag=tag, index=indexer(data) if indexer else None)
+        with self._lock:
+            self._snapshots[path] = snapshot
+        return snapshot
+
+    def clear(self) -> None:
+        with self._lock:
+            self._snapshots.clear()
+
+
+_STORE: ExportStore | None = None
+_STORE_LOCK = threading.Lock()
+
+
+def get_export_store() -> ExportStore:
+    """Process-wide export store (created on first use)."""
+    global _STORE
+    with _STORE_LOCK:
+        if _STORE is None:
+            _STORE = ExportStore()
+        return _STORE
+
+
+def clear_export_store() -> None:
+    with _STORE_LOCK:
+        if _STORE is not None:
+            _STORE.clear()
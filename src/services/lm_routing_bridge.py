@@ -13,6 +13,7 @@ from types import SimpleNamespace
 
 from pmagent.runtime.lm_logging import lm_studio_chat_with_logging
 from pmagent.runtime.lm_routing import select_lm_backend
+from src.infra.rate_limit import LM_STUDIO_PROVIDER, get_limiter, run_ordered
 from src.infra.structured_logger import get_logger, log_json
 
 LOG = get_logger("gemantria.lm_routing_bridge")
@@ -46,8 +47,9 @@ def chat_completion_with_routing(
 
     if backend == "lm_studio":
         # Use new adapter with control-plane logging
-        results = []
-        for idx, messages in enumerate(messages_batch):
+        limiter = get_limiter(LM_STUDIO_PROVIDER, model)
+
+        def _one(idx: int, messages: list[dict[str, str]]) -> list[SimpleNamespace]:
             log_json(
                 LOG,
                 20,
@@ -59,47 +61,48 @@ def chat_completion_with_routing(
             )
 
             # Call LM Studio adapter with logging
-            result = lm_studio_chat_with_logging(
-                messages=messages,
-                temperature=temperature,
-                max_tokens=max_tokens,
-                timeout=30.0,
-            )
+            with limiter.slot():
+                result = lm_studio_chat_with_logging(
+                    messages=messages,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    timeout=30.0,
+                )
 
             if result.get("ok") and result.get("mode") == "lm_on":
                 # Extract content from response
                 response = result.get("response", {})
                 if choices := response.get("choices"):
                     content = choices[0].get("message", {}).get("content", "")
-                    results.append(SimpleNamespace(text=content))
-                else:
-                    # Fallback: empty response
-                    log_json(
-                        LOG,
-                        30,
-                        "lm_routing_bridge_no_content",
-                        backend="lm_studio",
-                        batch_idx=idx,
-                    )
-                    results.append(SimpleNamespace(text='{"insight": "", "confidence": 0.0}'))
-            else:
-                # LM Studio unavailable - fall back to legacy chat_completion
+                    return [SimpleNamespace(text=content)]
+                # Fallback: empty response
                 log_json(
                     LOG,
                     30,
-                    "lm_routing_bridge_fallback",
+                    "lm_routing_bridge_no_content",
                     backend="lm_studio",
-                    reason=result.get("reason", "unknown"),
                     batch_idx=idx,
-                    fallback_to="legacy_chat_completion",
                 )
-                # Import legacy function for fallback
-                from src.services.lmstudio_client import chat_completion
+                return [SimpleNamespace(text='{"insight": "", "confidence": 0.0}')]
+
+            # LM Studio unavailable - fall back to legacy chat_completion
+            log_json(
+                LOG,
+                30,
+                "lm_routing_bridge_fallback",
+                backend="lm_studio",
+                reason=result.get("reason", "unknown"),
+                batch_idx=idx,
+                fallback_to="legacy_chat_completion",
+            )
+            # Import legacy function for fallback
+            from src.services.lmstudio_client import chat_completion
 
-                legacy_result = chat_completion([messages], model=model, temperature=temperature)
-                results.extend(legacy_result)
+            return chat_completion([messages], model=model, temperature=temperature)
 
-        return results
+        # Batch entries run concurrently up to the per-model in-flight cap, in order
+        per_message = run_ordered(_one, messages_batch, max_workers=limiter.max_inflight)
+        return [out for outs in per_message for out in outs]
 
     # Remote backend (future: implement remote LLM calls)
     # For now, fall back to legacy chat_completion
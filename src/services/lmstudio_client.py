@@ -19,6 +19,9 @@ from scripts.config.env import (
     get_reranker_model,
     get_theology_model,
 )
+from src.infra.embedding_cache import cached_embed
+from src.infra.http_pool import get_http_session
+from src.infra.rate_limit import LM_STUDIO_PROVIDER, get_limiter, run_ordered
 
 # Dependency checks
 try:
@@ -279,7 +282,7 @@ RERANKER_MODEL = get_reranker_model()
 
 class LMStudioClient:
     def __init__(self):
-        self.session = requests.Session()
+        self.session = get_http_session()
 
     def _post(self, endpoint: str, payload: dict) -> dict:
         if _is_mock_mode():
@@ -404,53 +407,47 @@ class LMStudioClient:
             return result
 
         model = model or EMBEDDING_MODEL
-        payload = {"model": model, "input": texts}
         url = f"{HOST}/v1/embeddings"
 
-        for attempt in range(RETRY_ATTEMPTS):
-            try:
-                resp = self.session.post(url, json=payload, timeout=TIMEOUT)
-                resp.raise_for_status()
-                data = resp.json()
-
-                embeddings = []
-                for item in data["data"]:
-                    embedding = item["embedding"]
-                    # L2 normalize the embedding
-                    norm = sum(x * x for x in embedding) ** 0.5
-                    if norm > 0:
-                        normalized = [x / norm for x in embedding]
-                    else:
-                        normalized = embedding  # Fallback for zero vector
-                    embeddings.append(normalized)
-
-                return embeddings
-            except Exception as e:
-                if attempt < RETRY_ATTEMPTS - 1:
-                    time.sleep(RETRY_DELAY)
-                else:
-                    # Hard fail - no mock fallback in production
-                    if _get_bool_env("ALLOW_MOCKS_FOR_TESTS", "false"):
-                        # Test-only bypass for unit tests
-                        import random  # noqa: E402
-
-                        result = []
-                        for text in texts:
-                            random.seed(hash(text) % 10000)  # Deterministic for testing
-                            embedding = [random.uniform(-1, 1) for _ in range(1024)]
-                            # L2 normalize
-                            norm = sum(x * x for x in embedding) ** 0.5
-                            normalized = [x / norm for x in embedding]
-                            result.append(normalized)
-                        return result
-                    else:
-                        # Production mode - hard fail
-                        raise QwenUnavailableError(
-                            f"LM Studio embeddings failed after {RETRY_ATTEMPTS} attempts: {e!s}"
-                        ) from e
+        def _fetch(batch: list[str]) -> list[list[float]]:
+            last_error: Exception | None = None
+            for attempt in range(RETRY_ATTEMPTS):
+                try:
+                    resp = self.session.post(url, json={"model": model, "input": batch}, timeout=TIMEOUT)
+                    resp.raise_for_status()
+                    return [item["embedding"] for item in resp.json()["data"]]
+                except Exception as e:
+                    last_error = e
+                    if attempt < RETRY_ATTEMPTS - 1:
+                        time.sleep(RETRY_DELAY)
+            raise QwenUnavailableError(
+                f"LM Studio embeddings failed after {RETRY_ATTEMPTS} attempts: {last_error!s}"
+            ) from last_error
+
+        try:
+            # Repeated/previously seen texts are served from the shared (raw-vector) cache
+            embeddings = []
+            for embedding in cached_embed(model, texts, _fetch, provider=HOST):
+                # L2 normalize the embedding
+                norm = sum(x * x for x in embedding) ** 0.5
+                embeddings.append([x / norm for x in embedding] if norm > 0 else embedding)
+            return embeddings
+        except QwenUnavailableError:
+            # Hard fail - no mock fallback in production
+            if not _get_bool_env("ALLOW_MOCKS_FOR_TESTS", "false"):
+                raise
+            # Test-only bypass for unit tests (never written to the cache)
+            import random  # noqa: E402
 
-        # This should never be reached, but satisfies MyPy
-        raise QwenUnavailableError("Unexpected error in get_embeddings method")
+            result = []
+            for text in texts:
+                random.seed(hash(text) % 10000)  # Deterministic for testing
+                embedding = [random.uniform(-1, 1) for _ in range(1024)]
+                # L2 normalize
+                norm = sum(x * x for x in embedding) ** 0.5
+                normalized = [x / norm for x in embedding]
+                result.append(normalized)
+            return result
 
     def rerank(self, query: str, candidates: list[str], model: str | None = None) -> list[float]:
         """
@@ -620,6 +617,10 @@ def chat_completion(messages_batch: list[list[dict]], model: str, temperature: f
     """
     Execute batched chat completions using LM Studio.
 
+    Messages are sent concurrently, up to LM_MAX_INFLIGHT requests per model
+    (optionally rate limited via LM_RATE_LIMIT_RPS), and each request retries
+    with exponential backoff on its own.
+
     Args:
         messages_batch: List of message lists, each containing conversation history
         model: Model name to use
@@ -643,8 +644,9 @@ def chat_completion(messages_batch: list[list[dict]], model: str, temperature: f
             SimpleNamespace(text='{"insight": "Mock theological insight", "confidence": 0.95}') for _ in messages_batch
         ]
 
-    results = []
-    for idx, messages in enumerate(messages_batch):
+    limiter = get_limiter(LM_STUDIO_PROVIDER, model)
+
+    def _complete_one(idx: int, messages: list[dict]) -> SimpleNamespace:
         # Extract prompt text from messages (combine system + user messages)
         prompt_parts = []
         for msg in messages:
@@ -665,11 +667,11 @@ def chat_completion(messages_batch: list[list[dict]], model: str, temperature: f
 
         for attempt in range(RETRY_ATTEMPTS):
             try:
-                resp = requests.post(f"{HOST}/v1/chat/completions", json=payload, timeout=TIMEOUT)
+                with limiter.slot():
+                    resp = get_http_session().post(f"{HOST}/v1/chat/completions", json=payload, timeout=TIMEOUT)
                 resp.raise_for_status()
                 data = resp.json()
                 content = data["choices"][0]["message"]["content"]
-                results.append(SimpleNamespace(text=content))
 
                 # Log prompt and response if logging is enabled
                 if log_prompt:
@@ -678,23 +680,24 @@ def chat_completion(messages_batch: list[list[dict]], model: str, temperature: f
                         agent_name = f"{agent_name}_batch{idx}"
                     log_prompt(agent_name, prompt_text, content)
 
-                break
+                return SimpleNamespace(text=content)
             except Exception as e:
                 if attempt < RETRY_ATTEMPTS - 1:
-                    time.sleep(RETRY_DELAY)
+                    # Exponential backoff per request; other requests keep their slots moving
+                    time.sleep(RETRY_DELAY * (2**attempt))
+                elif _get_bool_env("ALLOW_MOCKS_FOR_TESTS", "false"):
+                    # Test-only fallback
+                    return SimpleNamespace(text='{"insight": "Fallback theological insight", "confidence": 0.90}')
                 else:
-                    if _get_bool_env("ALLOW_MOCKS_FOR_TESTS", "false"):
-                        # Test-only fallback
-                        results.append(
-                            SimpleNamespace(text='{"insight": "Fallback theological insight", "confidence": 0.90}')
-                        )
-                        break
-                    else:
-                        raise QwenUnavailableError(
-                            f"LM Studio chat completion failed after {RETRY_ATTEMPTS} attempts: {e!s}"
-                        ) from e
+                    raise QwenUnavailableError(
+                        f"LM Studio chat completion failed after {RETRY_ATTEMPTS} attempts: {e!s}"
+                    ) from e
+
+        # This should never be reached, but satisfies MyPy
+        raise QwenUnavailableError("Unexpected error in chat_completion")
 
-    return results
+    # Requests run concurrently (bounded by the per-model limiter); results keep batch order
+    return run_ordered(_complete_one, messages_batch, max_workers=limiter.max_inflight)
 
 
 def safe_json_parse(text: str, required_keys: list[str]) -> dict:
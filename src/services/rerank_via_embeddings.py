@@ -12,12 +12,14 @@ The rerank_pairs function maintains the same interface as the previous implement
 for drop-in replacement.
 """
 
-import math
 import os
 import re
 import unicodedata
 
-import requests
+import numpy as np
+
+from src.infra.embedding_cache import cached_embed
+from src.infra.http_pool import get_http_session
 
 # Guard against mocks for this run
 if os.getenv("USE_MOCKS", "0") == "1":
@@ -51,6 +53,8 @@ def _embed(texts: list[str]) -> list[list[float]]:
     """
     Generate embeddings for a batch of texts using LM Studio /v1/embeddings.
 
+    Texts already in the shared embedding cache are not sent to the server.
+
     Args:
         texts: List of text strings to embed
 
@@ -60,26 +64,13 @@ def _embed(texts: list[str]) -> list[list[float]]:
     Raises:
         requests.HTTPError: If the API call fails
     """
-    r = requests.post(f"{LM_BASE}/embeddings", json={"model": EMBED_MODEL, "input": texts}, timeout=60)
-    r.raise_for_status()
-    return [item["embedding"] for item in r.json()["data"]]
-
-
-def _cos(a: list[float], b: list[float]) -> float:
-    """
-    Compute cosine similarity between two vectors.
 
-    Args:
-        a: First embedding vector
-        b: Second embedding vector
+    def _fetch(batch: list[str]) -> list[list[float]]:
+        r = get_http_session().post(f"{LM_BASE}/embeddings", json={"model": EMBED_MODEL, "input": batch}, timeout=60)
+        r.raise_for_status()
+        return [item["embedding"] for item in r.json()["data"]]
 
-    Returns:
-        Cosine similarity score in [0, 1]
-    """
-    dot = sum(x * y for x, y in zip(a, b, strict=False))
-    na = math.sqrt(sum(x * x for x in a))
-    nb = math.sqrt(sum(y * y for y in b))
-    return 0.0 if na == 0 or nb == 0 else dot / (na * nb)
+    return cached_embed(EMBED_MODEL, texts, _fetch, provider=LM_BASE)
 
 
 def rerank_via_embeddings(pairs: list[tuple[int, int]], name_map: dict[int, str]) -> list[float]:
@@ -87,7 +78,8 @@ def rerank_via_embeddings(pairs: list[tuple[int, int]], name_map: dict[int, str]
     Rerank concept pairs by computing cosine similarity of their BGE-M3 embeddings.
 
     This is a bi-encoder proxy that replaces the previous cross-encoder reranker.
-    It maintains the same interface for drop-in replacement.
+    It maintains the same interface for drop-in replacement. Each distinct
+    concept is embedded once per call, however many pairs it appears in.
 
     Args:
         pairs: List of (source_id, target_id) tuples
@@ -99,13 +91,16 @@ def rerank_via_embeddings(pairs: list[tuple[int, int]], name_map: dict[int, str]
     if not pairs:
         return []
 
-    # Extract and normalize texts in fixed order for efficient batch embedding
-    A = [_norm(name_map.get(sid, str(sid))) for sid, _ in pairs]
-    B = [_norm(name_map.get(tid, str(tid))) for _, tid in pairs]
+    # Embed each unique concept once; pairs then index into the vector matrix
+    ids = list(dict.fromkeys(cid for pair in pairs for cid in pair))
+    row = {cid: i for i, cid in enumerate(ids)}
+    vecs = np.asarray(_embed([_norm(name_map.get(cid, str(cid))) for cid in ids]), dtype=np.float64)
 
-    # Batch embed all texts at once
-    vecA = _embed(A)
-    vecB = _embed(B)
+    # L2-normalize rows (zero vectors stay zero and score 0.0)
+    norms = np.linalg.norm(vecs, axis=1, keepdims=True)
+    vecs = np.divide(vecs, norms, out=np.zeros_like(vecs), where=norms > 0)
 
-    # Compute cosine similarities
-    return [_cos(a, b) for a, b in zip(vecA, vecB, strict=False)]
+    # Gather both sides and take row-wise dot products in one pass
+    src = np.fromiter((row[sid] for sid, _ in pairs), dtype=np.intp, count=len(pairs))
+    tgt = np.fromiter((row[tid] for _, tid in pairs), dtype=np.intp, count=len(pairs))
+    return np.einsum("ij,ij->i", vecs[src], vecs[tgt]).tolist()
@@ -5,6 +5,7 @@ Comprehensive test for bi-encoder rerank proxy implementation.
 Tests the rerank_via_embeddings service and pipeline integration.
 """
 
+import os
 import sys
 import unittest.mock as mock
 
@@ -29,7 +30,11 @@ def test_bi_encoder_rerank():
     # Test 1: Basic functionality
     print("\n1. Testing basic rerank functionality...")
 
-    with mock.patch("src.services.rerank_via_embeddings.requests") as mock_requests:
+    with (
+        mock.patch.dict(os.environ, {"EMBED_CACHE_ENABLED": "0"}),
+        mock.patch("src.services.rerank_via_embeddings.get_http_session") as mock_session,
+    ):
+        mock_requests = mock_session.return_value
         # Mock embeddings for three Hebrew concepts
         embeddings = {
             "אלהים": [1.0, 0.0, 0.0],  # God - unit vector
@@ -37,30 +42,17 @@ def test_bi_encoder_rerank():
             "שמים": [0.707, 0.707, 0.0],  # heaven - 45-degree angle
         }
 
-        # The function makes two separate _embed() calls: one for A texts, one for B texts
-        # So we need two responses: one for A batch, one for B batch
-
-        # Mock response for A batch
-        mock_resp_a = mock.MagicMock()
-        mock_resp_a.json.return_value = {
+        # Each unique concept is embedded once, in first-appearance order: 0, 1, 2
+        mock_resp = mock.MagicMock()
+        mock_resp.json.return_value = {
             "data": [
                 {"embedding": embeddings["אלהים"]},
-                {"embedding": embeddings["אלהים"]},
-                {"embedding": embeddings["ברא"]},
-            ]
-        }
-
-        # Mock response for B batch
-        mock_resp_b = mock.MagicMock()
-        mock_resp_b.json.return_value = {
-            "data": [
                 {"embedding": embeddings["ברא"]},
                 {"embedding": embeddings["שמים"]},
-                {"embedding": embeddings["שמים"]},
             ]
         }
 
-        mock_requests.post.side_effect = [mock_resp_a, mock_resp_b]
+        mock_requests.post.return_value = mock_resp
 
         # Import and test the rerank function
         from src.services.rerank_via_embeddings import (  # noqa: E402
@@ -87,6 +79,7 @@ def test_bi_encoder_rerank():
         assert all(0 <= s <= 1 for s in scores), "Scores should be in [0,1] range"
         assert len(scores) == len(test_pairs), "Should return one score per pair"
         assert scores[0] < scores[1], "Orthogonal vectors should have lower similarity than 45°"
+        assert mock_requests.post.call_count == 1, "Unique concepts should be embedded in one call"
 
         print("   ✅ Basic functionality test PASSED")
 
@@ -131,12 +124,14 @@ def test_bi_encoder_rerank():
     )
 
     # Test with simple mock
-    with mock.patch("src.services.rerank_via_embeddings.requests") as mock_requests:
-        mock_resp_a = mock.MagicMock()
-        mock_resp_a.json.return_value = {"data": [{"embedding": [1.0, 0.0]}]}
-        mock_resp_b = mock.MagicMock()
-        mock_resp_b.json.return_value = {"data": [{"embedding": [0.0, 1.0]}]}
-        mock_requests.post.side_effect = [mock_resp_a, mock_resp_b]
+    with (
+        mock.patch.dict(os.environ, {"EMBED_CACHE_ENABLED": "0"}),
+        mock.patch("src.services.rerank_via_embeddings.get_http_session") as mock_session,
+    ):
+        mock_requests = mock_session.return_value
+        mock_resp = mock.MagicMock()
+        mock_resp.json.return_value = {"data": [{"embedding": [1.0, 0.0]}, {"embedding": [0.0, 1.0]}]}
+        mock_requests.post.return_value = mock_resp
 
         # Test that it can be called with the old interface
         pairs = [(0, 1)]
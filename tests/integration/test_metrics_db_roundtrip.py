@@ -31,6 +31,7 @@ def test_metrics_insert_roundtrip():
         "meta": {"batch_size": 10},
     }
     mc.emit(row)
+    mc.flush()
     with psycopg.connect(dsn) as conn, conn.cursor() as cur:
         cur.execute(
             "SELECT count(*) FROM metrics_log WHERE run_id=%s AND node=%s",
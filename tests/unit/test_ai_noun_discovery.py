@@ -0,0 +1,97 @@
+import json
+import threading
+from types import SimpleNamespace
+
+import src.nodes.ai_noun_discovery as discovery
+from src.nodes.ai_noun_discovery import AINounDiscovery, chapter_windows, merge_candidates
+
+WORDS = [
+    ("1:1", "בראשית"),
+    ("1:1", "ברא"),
+    ("1:2", "אלהים"),
+    ("2:1", "ויכלו"),
+    ("2:1", "השמים"),
+    ("3:1", "והנחש"),
+    ("3:2", "היה"),
+    ("3:3", "ערום"),
+]
+
+
+def test_windows_pack_whole_chapters():
+    # ch1 = 16 chars, ch2 = 11, ch3 = 17
+    assert chapter_windows(WORDS, 30) == ["בראשית ברא אלהים ויכלו השמים", "והנחש היה ערום"]
+
+
+def test_oversize_chapter_splits_between_verses_and_next_chapter_starts_fresh():
+    assert chapter_windows(WORDS, 12) == ["בראשית ברא", "אלהים", "ויכלו השמים", "והנחש היה", "ערום"]
+
+
+def test_windows_without_refs_pack_words():
+    words = [(None, w) for w in "אור טוב אור יום".split()]
+    assert chapter_windows(words, 8) == ["אור טוב", "אור יום"]
+
+
+def test_merge_dedups_by_normalized_surface():
+    merged = merge_candidates(
+        [
+            [{"surface": "אֱלֹהִים", "class": "person"}, {"surface": "ארץ"}],
+            [{"surface": "אלהים", "class": "thing"}, "junk", {"hebrew": "שמים"}],
+        ]
+    )
+    assert [n.get("surface") or n.get("hebrew") for n in merged] == ["אֱלֹהִים", "ארץ", "שמים"]
+    assert merged[0]["class"] == "person"
+
+
+def _fake_completion(calls, fail_on=None):
+    lock = threading.Lock()
+
+    def _complete(messages_batch, model, temperature=0.0):
+        text = messages_batch[0][1]["content"].split("Hebrew text: ", 1)[1].split("\n", 1)[0]
+        with lock:
+            calls.append(text)
+        if fail_on and fail_on in text:
+            raise RuntimeError("model unavailable")
+        first = text.split()[0]
+        return [SimpleNamespace(text=json.dumps({"nouns": [{"surface": first}, {"surface": "אלהים"}]}))]
+
+    return _complete
+
+
+def test_windows_run_concurrently_merge_and_resume(tmp_path, monkeypatch):
+    monkeypatch.setattr(discovery, "AI_DISCOVERY_WINDOW_CHARS", 12)
+    monkeypatch.setattr(discovery, "AI_DISCOVERY_CONCURRENCY", 3)
+    monkeypatch.setattr(discovery, "AI_DISCOVERY_CHECKPOINT_DIR", str(tmp_path))
+    calls = []
+    monkeypatch.setattr(discovery, "chat_completion", _fake_completion(calls, fail_on="ויכלו"))
+
+    nouns = AINounDiscovery()._discover_windows(WORDS, "Genesis", "m")
+    assert len(calls) == 5
+    assert [n["surface"] for n in nouns] == ["בראשית", "אלהים", "והנחש", "ערום"]
+    assert len(list(tmp_path.glob("Genesis/*.json"))) == 4
+
+    # Resume: only the failed window is sent again
+    calls.clear()
+    monkeypatch.setattr(discovery, "chat_completion", _fake_completion(calls))
+    nouns = AINounDiscovery()._discover_windows(WORDS, "Genesis", "m")
+    assert calls == ["ויכלו השמים"]
+    assert "ויכלו" in [n["surface"] for n in nouns]
+
+
+def test_unparseable_or_off_schema_windows_are_failed_not_checkpointed(tmp_path, monkeypatch):
+    monkeypatch.setattr(discovery, "AI_DISCOVERY_WINDOW_CHARS", 30)
+    monkeypatch.setattr(discovery, "AI_DISCOVERY_CHECKPOINT_DIR", str(tmp_path))
+    replies = iter(["not json at all", '{"insight": "Fallback theological insight", "confidence": 0.9}'])
+    monkeypatch.setattr(
+        discovery,
+        "chat_completion",
+        lambda messages_batch, model, temperature=0.0: [SimpleNamespace(text=next(replies))],
+    )
+
+    assert AINounDiscovery()._discover_windows(WORDS, "Genesis", "m") == []
+    assert list(tmp_path.glob("Genesis/*.json")) == []
+
+    # The next run sends both windows again
+    calls = []
+    monkeypatch.setattr(discovery, "chat_completion", _fake_completion(calls))
+    AINounDiscovery()._discover_windows(WORDS, "Genesis", "m")
+    assert len(calls) == 2
@@ -0,0 +1,115 @@
+import numpy as np
+
+from src.infra import ann_index
+from src.infra.ann_index import FlatIndex, IVFIndex, VectorIndex, create_index, get_index, recall_at_k
+
+
+def _data(n=300, d=16, seed=0):
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(10, d))
+    X = centers[rng.integers(0, 10, n)] + 0.2 * rng.normal(size=(n, d))
+    return [f"id{i}" for i in range(n)], X.astype(np.float32)
+
+
+def test_flat_matches_brute_force():
+    ids, X = _data()
+    index = FlatIndex()
+    index.upsert(ids, X)
+    Xn = X / np.linalg.norm(X, axis=1, keepdims=True)
+    hits = index.search(Xn[:5], 3)
+    for q, row in enumerate(hits):
+        expected = np.argsort(-(Xn @ Xn[q]))[:3]
+        assert [h[0] for h in row] == [ids[i] for i in expected]
+
+
+def test_search_ids_excludes_self():
+    ids, X = _data(n=50)
+    index = FlatIndex()
+    index.upsert(ids, X)
+    hits = index.search_ids(["id3", "missing"], 5)
+    assert len(hits[0]) == 5
+    assert "id3" not in [h[0] for h in hits[0]]
+    assert hits[1] == []
+
+
+def test_ivf_recall_against_flat():
+    ids, X = _data(n=1000)
+    flat, ivf = FlatIndex(), IVFIndex(nprobe=4)
+    flat.upsert(ids, X)
+    ivf.upsert(ids, X)
+    queries = ids[:100]
+    assert recall_at_k(ivf.search_ids(queries, 10), flat.search_ids(queries, 10)) >= 0.9
+
+
+def test_incremental_upsert_and_remove():
+    ids, X = _data(n=40)
+    index = create_index("ivf")
+    index.upsert(ids[:20], X[:20])
+    index.upsert(ids[20:], X[20:])
+    assert len(index) == 40
+    # Replacing a vector moves it next to its new neighbour
+    index.upsert(["id0"], X[[39]])
+    assert index.search(X[[39]], 2, exclude=["id39"])[0][0][0] == "id0"
+    assert index.remove(["id0", "nope"]) == 1
+    assert "id0" not in index
+    assert all(h[0] != "id0" for h in index.search(X[[39]], 5)[0])
+
+
+def test_save_and_load_roundtrip(tmp_path):
+    ids, X = _data(n=60)
+    for kind in ("flat", "ivf"):
+        index = create_index(kind)
+        index.upsert(ids, X)
+        path = index.save(tmp_path / f"{kind}.npz")
+        loaded = VectorIndex.load(path)
+        assert loaded.kind == kind
+        assert len(loaded) == 60
+        assert loaded.search_ids(ids[:3], 4) == index.search_ids(ids[:3], 4)
+
+
+def test_get_index_rebuilds_when_source_signature_changes(tmp_path, monkeypatch):
+    monkeypatch.setattr(ann_index, "ANN_INDEX_DIR", tmp_path)
+    monkeypatch.setattr(ann_index, "ANN_REVALIDATE_S", 0)
+    ids, X = _data(n=30)
+    source = {"n": 20, "sig": "20|v1"}
+    loads = []
+
+    def loader():
+        loads.append(source["n"])
+        return ids[: source["n"]], X[: source["n"]]
+
+    ann_index.reset_index_cache()
+    try:
+        assert len(get_index("verses", loader, signature=lambda: source["sig"])) == 20
+        # Unchanged source: the snapshot is reused from memory and from disk
+        assert len(get_index("verses", loader, signature=lambda: source["sig"])) == 20
+        ann_index.reset_index_cache()
+        assert len(get_index("verses", loader, signature=lambda: source["sig"])) == 20
+        assert loads == [20]
+        assert VectorIndex.load(tmp_path / "verses.npz").signature == "20|v1"
+
+        source.update(n=30, sig="30|v1")
+        assert len(get_index("verses", loader, signature=lambda: source["sig"])) == 30
+        ann_index.reset_index_cache()
+        assert len(get_index("verses", loader, signature=lambda: source["sig"])) == 30
+        assert loads == [20, 30]
+    finally:
+        ann_index.reset_index_cache()
+
+
+def test_get_index_keeps_snapshot_when_signature_unavailable(tmp_path, monkeypatch):
+    monkeypatch.setattr(ann_index, "ANN_INDEX_DIR", tmp_path)
+    ids, X = _data(n=10)
+    index = create_index("flat")
+    index.upsert(ids, X)
+    index.signature = "10|v1"
+    index.save(tmp_path / "verses.npz")
+
+    def unreachable():
+        raise ConnectionError("db down")
+
+    ann_index.reset_index_cache()
+    try:
+        assert len(get_index("verses", signature=unreachable)) == 10
+    finally:
+        ann_index.reset_index_cache()
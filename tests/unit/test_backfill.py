@@ -0,0 +1,125 @@
+import threading
+
+import pytest
+
+from src.infra.backfill import BackfillJob, Checkpoint, format_vector, run_backfill
+
+ROWS = [(i, f"text {i}") for i in range(1, 11)]
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+        self.itersize = None
+        self._rows = []
+
+    def execute(self, sql, params=None):
+        after = (params or {}).get("after")
+        self._rows = [r for r in ROWS if after is None or r[0] > after]
+
+    def __iter__(self):
+        return iter(self._rows)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class FakeConn:
+    def __init__(self, db):
+        self.db = db
+        self.staged = []
+
+    def cursor(self, name=None):
+        return FakeCursor(self)
+
+    def commit(self):
+        self.db.extend(self.staged)
+        self.staged = []
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def db():
+    return []
+
+
+def _job(db, embed_calls, fail_on=None, batch_size=3):
+    lock = threading.Lock()
+
+    def embed(texts):
+        with lock:
+            embed_calls.append(list(texts))
+        return [[float(len(t))] for t in texts]
+
+    def write(cur, rows, embeddings):
+        if fail_on is not None and any(r[0] == fail_on for r in rows):
+            raise RuntimeError("db went away")
+        cur.conn.staged.extend((r[0], e) for r, e in zip(rows, embeddings, strict=True))
+        return len(rows)
+
+    return BackfillJob(
+        name="test:model",
+        select_sql="SELECT id, body FROM t WHERE id > %(after)s ORDER BY id",
+        document=lambda row: row[1],
+        embed=embed,
+        write=write,
+        batch_size=batch_size,
+        workers=3,
+    )
+
+
+def test_backfill_writes_all_rows_in_order(tmp_path, db):
+    calls = []
+    stats = run_backfill(_job(db, calls), "dsn", checkpoint_dir=tmp_path, connect=lambda dsn: FakeConn(db))
+    assert [r[0] for r in db] == list(range(1, 11))
+    assert sorted(map(len, calls)) == [1, 3, 3, 3]
+    assert stats.rows == stats.written == 10
+    assert stats.complete
+    assert Checkpoint("test:model", tmp_path).load() is None
+
+
+def test_backfill_resumes_after_crash_from_high_water_mark(tmp_path, db):
+    connect = lambda dsn: FakeConn(db)  # noqa: E731
+    with pytest.raises(RuntimeError, match="db went away"):
+        run_backfill(_job(db, [], fail_on=5), "dsn", checkpoint_dir=tmp_path, connect=connect)
+    assert [r[0] for r in db] == [1, 2, 3]
+    assert Checkpoint("test:model", tmp_path).load()["after"] == 3
+
+    calls = []
+    stats = run_backfill(_job(db, calls), "dsn", checkpoint_dir=tmp_path, connect=connect)
+    assert stats.resumed_from == 3
+    assert [r[0] for r in db] == list(range(1, 11))
+    assert all("text 1" != t for batch in calls for t in batch)
+
+
+def test_backfill_limit_bounds_a_run(tmp_path, db):
+    connect = lambda dsn: FakeConn(db)  # noqa: E731
+    stats = run_backfill(_job(db, []), "dsn", limit=4, checkpoint_dir=tmp_path, connect=connect)
+    assert stats.rows == 4 and not stats.complete
+    stats = run_backfill(_job(db, []), "dsn", checkpoint_dir=tmp_path, connect=connect)
+    assert stats.rows == 6 and stats.complete
+    assert [r[0] for r in db] == list(range(1, 11))
+
+
+def test_complete_run_clears_checkpoint_so_new_low_keys_are_picked_up(tmp_path, db, monkeypatch):
+    connect = lambda dsn: FakeConn(db)  # noqa: E731
+    run_backfill(_job(db, []), "dsn", limit=4, checkpoint_dir=tmp_path, connect=connect)
+    assert Checkpoint("test:model", tmp_path).load()["after"] == 4
+    run_backfill(_job(db, []), "dsn", checkpoint_dir=tmp_path, connect=connect)
+    assert Checkpoint("test:model", tmp_path).load() is None
+
+    # A row inserted later with a key below the old high-water mark (e.g. a random UUID)
+    monkeypatch.setattr(f"{__name__}.ROWS", [*ROWS, (0, "text 0")])
+    db.clear()
+    stats = run_backfill(_job(db, []), "dsn", checkpoint_dir=tmp_path, connect=connect)
+    assert stats.resumed_from is None
+    assert 0 in [r[0] for r in db]
+
+
+def test_format_vector():
+    assert format_vector([1, 0.5]) == "[1.0,0.5]"
@@ -0,0 +1,70 @@
+import asyncio
+import threading
+import time
+
+import httpx
+from fastapi import FastAPI, Query
+
+import src.infra.blocking as blocking
+from src.infra.blocking import blocking_route, route_limit, run_blocking
+
+
+def _app(slow_started: threading.Event, release: threading.Event) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/slow")
+    @blocking_route("slow")
+    def slow(n: int = Query(1)):
+        slow_started.set()
+        release.wait(5)
+        return {"n": n}
+
+    @app.get("/fast")
+    async def fast():
+        return {"ok": True}
+
+    return app
+
+
+def test_blocking_handler_does_not_stall_event_loop():
+    slow_started, release = threading.Event(), threading.Event()
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=_app(slow_started, release))
+        async with httpx.AsyncClient(transport=transport, base_url="http://t") as client:
+            slow = asyncio.create_task(client.get("/slow", params={"n": 7}))
+            while not slow_started.is_set():
+                await asyncio.sleep(0.01)
+            fast = await asyncio.wait_for(client.get("/fast"), timeout=2)
+            release.set()
+            return fast.json(), (await slow).json()
+
+    assert asyncio.run(scenario()) == ({"ok": True}, {"n": 7})
+
+
+def test_route_limit_caps_in_flight_calls():
+    lock = threading.Lock()
+    state = {"now": 0, "peak": 0}
+
+    def work(i):
+        with lock:
+            state["now"] += 1
+            state["peak"] = max(state["peak"], state["now"])
+        time.sleep(0.02)
+        with lock:
+            state["now"] -= 1
+        return i
+
+    async def scenario():
+        return await asyncio.gather(*(run_blocking("capped", work, i, limit=2) for i in range(8)))
+
+    assert asyncio.run(scenario()) == list(range(8))
+    assert state["peak"] == 2
+
+
+def test_route_limits_env_override(monkeypatch):
+    monkeypatch.setattr(blocking, "API_ROUTE_LIMITS", "bible=3, mcp=x")
+    monkeypatch.setattr(blocking, "API_ROUTE_CONCURRENCY", 8)
+    assert route_limit("bible", 6) == 3
+    assert route_limit("mcp", 4) == 4
+    assert route_limit("docs") == 8
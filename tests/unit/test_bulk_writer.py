@@ -0,0 +1,54 @@
+from src.infra.bulk_writer import BulkWriter, executemany_chunked, executemany_returning
+
+
+class FakeCursor:
+    """Records executemany chunks; emulates psycopg's returning=True result sets."""
+
+    def __init__(self):
+        self.calls = []
+        self._results = []
+
+    def executemany(self, sql, rows, returning=False):
+        rows = list(rows)
+        self.calls.append(rows)
+        self._results = [(f"id-{row[0]}",) for row in rows] if returning else []
+
+    def fetchone(self):
+        return self._results[0]
+
+    def nextset(self):
+        self._results.pop(0)
+        return True if self._results else None
+
+
+def test_executemany_chunked_splits_by_flush_size():
+    cur = FakeCursor()
+    assert executemany_chunked(cur, "INSERT", [(i,) for i in range(7)], flush_size=3) == 7
+    assert [len(c) for c in cur.calls] == [3, 3, 1]
+
+
+def test_executemany_returning_keeps_input_order():
+    cur = FakeCursor()
+    returned = executemany_returning(cur, "INSERT ... RETURNING id", [(i, "v") for i in range(5)], flush_size=2)
+    assert returned == [(f"id-{i}",) for i in range(5)]
+    assert len(cur.calls) == 3
+
+
+def test_bulk_writer_flushes_tail_on_exit():
+    cur = FakeCursor()
+    with BulkWriter(cur, "INSERT", flush_size=4) as writer:
+        for i in range(10):
+            writer.add((i,))
+    assert [len(c) for c in cur.calls] == [4, 4, 2]
+    assert writer.written == 10
+
+
+def test_bulk_writer_skips_flush_on_error():
+    cur = FakeCursor()
+    try:
+        with BulkWriter(cur, "INSERT", flush_size=4) as writer:
+            writer.add((1,))
+            raise RuntimeError("boom")
+    except RuntimeError:
+        pass
+    assert cur.calls == []
@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+
+from src.graph.correlation_engine import (
+    load_concept_embeddings,
+    parse_embedding,
+    resolve_block_size,
+    topk_correlations,
+)
+
+
+def _brute_force(X, top_k=None, per_row_k=None, min_abs=0.0):
+    C = np.corrcoef(X)
+    n = len(X)
+    pairs = []
+    for i in range(n):
+        row = [(abs(C[i, j]), i, j, C[i, j]) for j in range(i + 1, n) if abs(C[i, j]) >= min_abs]
+        row.sort(key=lambda t: (-t[0], t[2]))
+        pairs.extend(row[:per_row_k] if per_row_k else row)
+    pairs.sort(key=lambda t: (-t[0], t[1], t[2]))
+    return pairs[:top_k] if top_k else pairs
+
+
+@pytest.mark.parametrize("block_size", [1, 3, 7, 64])
+def test_topk_matches_brute_force(block_size):
+    rng = np.random.default_rng(7)
+    X = rng.normal(size=(23, 16))
+    src, tgt, val = topk_correlations(X, top_k=40, block_size=block_size)
+    expected = _brute_force(X, top_k=40)
+    assert list(zip(src.tolist(), tgt.tolist(), strict=True)) == [(i, j) for _, i, j, _ in expected]
+    np.testing.assert_allclose(val, [c for *_, c in expected], atol=1e-5)
+
+
+@pytest.mark.parametrize("block_size", [2, 5, 50])
+def test_per_row_k_and_threshold(block_size):
+    rng = np.random.default_rng(11)
+    X = rng.normal(size=(17, 8))
+    src, tgt, val = topk_correlations(X, top_k=None, per_row_k=3, min_abs=0.2, block_size=block_size)
+    expected = _brute_force(X, per_row_k=3, min_abs=0.2)
+    assert sorted(zip(src.tolist(), tgt.tolist(), strict=True)) == sorted((i, j) for _, i, j, _ in expected)
+    assert np.all(np.abs(val) >= 0.2)
+    assert np.all(src < tgt)
+
+
+def test_degenerate_inputs():
+    assert topk_correlations(np.zeros((1, 4)))[0].size == 0
+    _, _, val = topk_correlations(np.ones((4, 4)), top_k=10)
+    # Constant rows correlate 0 with everything rather than producing NaN
+    assert np.all(np.isfinite(val))
+    assert np.allclose(val, 0.0)
+
+
+def test_block_size_from_memory_budget():
+    assert resolve_block_size(10, block_size=4) == 4
+    assert resolve_block_size(10, block_size=100) == 10
+    assert resolve_block_size(100_000, memory_budget_mb=1) < resolve_block_size(100_000, memory_budget_mb=64)
+
+
+def test_load_concept_embeddings_parses_pgvector_rows():
+    class FakeDB:
+        def execute(self, sql):
+            return [("a", "[1, 2, 3]"), ("b", [3.0, 2.0, 1.0]), ("c", "[]"), ("d", [1.0, 2.0])]
+
+    ids, matrix = load_concept_embeddings(FakeDB())
+    assert ids == ["a", "b"]
+    assert matrix.shape == (2, 3)
+    assert parse_embedding(None) is None
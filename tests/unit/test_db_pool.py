@@ -0,0 +1,66 @@
+import time
+from contextlib import contextmanager
+
+import psycopg
+import pytest
+
+from src.infra import db_pool
+
+
+def test_redact_strips_credentials():
+    assert db_pool._redact("postgresql://user:secret@db:5432/gematria") == "postgresql://db:5432/gematria"
+    assert "secret" not in db_pool._redact("host=db dbname=g password=secret")
+
+
+def test_falls_back_to_direct_connect_when_disabled(monkeypatch):
+    opened = []
+
+    @contextmanager
+    def fake_connect(dsn):
+        opened.append(dsn)
+        yield "conn"
+
+    monkeypatch.setattr(db_pool, "DB_POOL_ENABLED", False)
+    monkeypatch.setattr(db_pool.psycopg, "connect", fake_connect)
+    assert db_pool.get_pool("postgresql://x") is None
+    with db_pool.pooled_connection("postgresql://x") as conn:
+        assert conn == "conn"
+    assert opened == ["postgresql://x"]
+
+
+def test_pool_is_shared_per_dsn(monkeypatch):
+    created = []
+
+    class FakePool:
+        check_connection = staticmethod(lambda conn: None)
+
+        def __init__(self, dsn, **kwargs):
+            created.append(dsn)
+            self.name = kwargs["name"]
+
+        def open(self, wait=False):
+            pass
+
+        def get_stats(self):
+            return {"requests_num": 0}
+
+        def close(self):
+            pass
+
+    monkeypatch.setattr(db_pool, "ConnectionPool", FakePool)
+    monkeypatch.setattr(db_pool, "_POOLS", {})
+    monkeypatch.setattr(db_pool, "_probe", lambda dsn: None)
+    a = db_pool.get_pool("postgresql://u:p@h/db")
+    assert db_pool.get_pool("postgresql://u:p@h/db") is a
+    assert created == ["postgresql://u:p@h/db"]
+    assert db_pool.pool_stats() == {"postgresql://h/db": {"requests_num": 0}}
+    db_pool.close_pools()
+
+
+def test_unreachable_server_fails_fast_without_caching_a_pool(monkeypatch):
+    monkeypatch.setattr(db_pool, "_POOLS", {})
+    t0 = time.monotonic()
+    with pytest.raises(psycopg.OperationalError), db_pool.pooled_connection("postgresql://u@127.0.0.1:1/x"):
+        pass
+    assert time.monotonic() - t0 < db_pool.DB_POOL_TIMEOUT
+    assert db_pool._POOLS == {}
@@ -0,0 +1,100 @@
+from src.infra.embedding_cache import EmbeddingCache, cache_key, cached_embed
+
+
+class CountingProvider:
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, texts):
+        self.calls.append(list(texts))
+        return [[float(len(t)), float(sum(map(ord, t)) % 97)] for t in texts]
+
+
+def test_dedups_within_batch_and_preserves_order():
+    cache = EmbeddingCache(path=None, capacity=16)
+    provider = CountingProvider()
+    out = cache.embed("m", ["a", "bb", "a", "ccc", "bb"], provider)
+    assert provider.calls == [["a", "bb", "ccc"]]
+    assert [v[0] for v in out] == [1.0, 2.0, 1.0, 3.0, 2.0]
+    assert cache.stats()["dedup_saved"] == 2
+    assert cache.stats()["misses"] == 3
+
+
+def test_memory_hits_skip_provider():
+    cache = EmbeddingCache(path=None, capacity=16)
+    provider = CountingProvider()
+    cache.embed("m", ["alpha", "beta"], provider)
+    cache.embed("m", ["beta", "gamma"], provider)
+    assert provider.calls == [["alpha", "beta"], ["gamma"]]
+    assert cache.stats()["hits"] == 1
+
+
+def test_key_depends_on_model_and_normalized_text():
+    assert cache_key("m", "in  the\nbeginning ") == cache_key("m", "in the beginning")
+    assert cache_key("m1", "x") != cache_key("m2", "x")
+
+
+def test_lru_eviction():
+    cache = EmbeddingCache(path=None, capacity=2)
+    provider = CountingProvider()
+    cache.embed("m", ["a", "b", "c"], provider)
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["memory_items"] == 2
+    cache.embed("m", ["a"], provider)
+    assert provider.calls[-1] == ["a"]
+
+
+def test_disk_tier_survives_new_instance(tmp_path):
+    path = tmp_path / "emb.sqlite"
+    provider = CountingProvider()
+    EmbeddingCache(path=path, capacity=4).embed("m", ["shalom", "torah"], provider)
+
+    fresh = EmbeddingCache(path=path, capacity=4)
+    out = fresh.embed("m", ["torah", "shalom"], provider)
+    assert len(provider.calls) == 1
+    assert [v[0] for v in out] == [5.0, 6.0]
+    assert fresh.stats()["disk_hits"] == 2
+
+
+def test_cached_embed_bypass(monkeypatch):
+    monkeypatch.setenv("EMBED_CACHE_ENABLED", "0")
+    provider = CountingProvider()
+    cached_embed("m", ["x", "x"], provider)
+    assert provider.calls == [["x", "x"]]
+
+
+def test_key_depends_on_provider():
+    assert cache_key("m", "x", "http://lmstudio/v1") != cache_key("m", "x", "http://ollama")
+    cache = EmbeddingCache(path=None, capacity=16)
+    provider = CountingProvider()
+    cache.embed("m", ["x"], provider, provider="http://a")
+    cache.embed("m", ["x"], provider, provider="http://b")
+    assert provider.calls == [["x"], ["x"]]
+
+
+def test_empty_vectors_are_not_cached():
+    cache = EmbeddingCache(path=None, capacity=16)
+    calls = []
+
+    def flaky(texts):
+        calls.append(list(texts))
+        return [[] for _ in texts] if len(calls) == 1 else [[1.0] for _ in texts]
+
+    assert cache.embed("m", ["x"], flaky) == [[]]
+    assert cache.embed("m", ["x"], flaky) == [[1.0]]
+    assert cache.stats()["memory_items"] == 1
+
+
+def test_lmstudio_client_normalizes_after_shared_raw_lookup(monkeypatch):
+    from src.infra import embedding_cache
+    from src.services import lmstudio_client
+
+    monkeypatch.setattr(embedding_cache, "_CACHE", EmbeddingCache(path=None, capacity=16))
+    monkeypatch.setattr(lmstudio_client, "_is_mock_mode", lambda: False)
+    monkeypatch.setenv("USE_QWEN_EMBEDDINGS", "true")
+    # A raw vector cached by another call site on the same endpoint
+    embedding_cache.cached_embed("emb", ["hello"], lambda texts: [[3.0, 4.0]], provider=lmstudio_client.HOST)
+
+    client = lmstudio_client.LMStudioClient.__new__(lmstudio_client.LMStudioClient)
+    assert client.get_embeddings(["hello"], model="emb") == [[0.6, 0.8]]
+    assert embedding_cache.cached_embed("emb", ["hello"], None, provider=lmstudio_client.HOST) == [[3.0, 4.0]]
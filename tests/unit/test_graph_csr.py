@@ -0,0 +1,106 @@
+import networkx as nx
+import numpy as np
+import pytest
+
+from src.graph import csr
+from src.graph.csr import CSRGraph, betweenness_centrality, degree_centrality, eigenvector_centrality
+from src.graph.patterns import compute_patterns
+
+
+def _weighted(G, seed=1, choices=(0.5, 1.0, 1.5)):
+    """String node ids and weights drawn from a few values (so shortest paths tie)."""
+    rng = np.random.default_rng(seed)
+    H = nx.Graph()
+    H.add_nodes_from(f"n{v}" for v in G)
+    for u, v in G.edges():
+        H.add_edge(f"n{u}", f"n{v}", weight=float(rng.choice(choices)))
+    return H
+
+
+GRAPHS = [
+    _weighted(nx.karate_club_graph()),
+    _weighted(nx.grid_2d_graph(4, 5)),
+    _weighted(nx.gnm_random_graph(60, 110, seed=3)),  # disconnected, isolated nodes
+]
+
+
+@pytest.mark.parametrize("G", GRAPHS)
+def test_centrality_matches_networkx(G):
+    g = CSRGraph.from_networkx(G)
+    assert degree_centrality(g) == nx.degree_centrality(G)
+    for normalized in (True, False):
+        expected = nx.betweenness_centrality(G, weight="weight", normalized=normalized)
+        assert betweenness_centrality(g, normalized=normalized, workers=2) == pytest.approx(expected, abs=1e-12)
+    if nx.is_connected(G):
+        assert eigenvector_centrality(g) == pytest.approx(nx.eigenvector_centrality_numpy(G, weight="weight"))
+    else:
+        assert set(eigenvector_centrality(g).values()) == {0.0}
+
+
+@pytest.mark.parametrize("G", GRAPHS)
+def test_compute_patterns_matches_networkx(G):
+    cluster_map, degree, betw, eigen = compute_patterns(G)
+    assert cluster_map == {
+        n: i for i, c in enumerate(nx.community.louvain_communities(G, weight="weight", seed=42)) for n in c
+    }
+    assert degree == nx.degree_centrality(G)
+    assert betw == pytest.approx(nx.betweenness_centrality(G, weight="weight", normalized=True), abs=1e-12)
+    if nx.is_connected(G):
+        assert eigen == pytest.approx(nx.eigenvector_centrality_numpy(G, weight="weight"))
+
+
+def test_from_edges_maps_ids_and_keeps_last_weight():
+    g = CSRGraph.from_edges(["a", "b", "a", "c"], ["b", "c", "b", "c"], [0.1, 0.2, 0.3, 0.4], nodes=["z"])
+    assert g.nodes == ["z", "a", "b", "c"]
+    assert g.number_of_edges == 3
+    assert g.adj[1, 2] == g.adj[2, 1] == 0.3
+    assert g.adj[3, 3] == 0.4
+    assert [idx.tolist() for idx in g.components()] == [[0], [1, 2, 3]]
+    assert degree_centrality(g)["c"] == pytest.approx(3 / 3)  # self-loop counts twice
+
+
+def test_sampled_betweenness_within_error_bound(monkeypatch):
+    G = _weighted(nx.barabasi_albert_graph(1200, 2, seed=5), choices=(0.4, 0.7, 0.9, 1.0))
+    g = CSRGraph.from_networkx(G)
+    exact = betweenness_centrality(g)
+
+    epsilon = 0.1
+    k = csr.pivots_needed(len(g), len(g), epsilon, 0.1)
+    assert 3 <= k < len(g)
+    approx = betweenness_centrality(g, epsilon=epsilon, delta=0.1, seed=7)
+    assert max(abs(approx[n] - exact[n]) for n in G) <= epsilon
+    assert approx == betweenness_centrality(g, epsilon=epsilon, delta=0.1, seed=7)
+
+    # compute_patterns switches to sampling above the configured size
+    monkeypatch.setattr(csr, "GRAPH_BETWEENNESS_EXACT_MAX", 100)
+    monkeypatch.setattr(csr, "GRAPH_BETWEENNESS_EPSILON", epsilon)
+    assert csr.betweenness_sampling(len(g)) == {"epsilon": epsilon} and csr.betweenness_sampling(100) == {}
+
+
+def test_pivot_budget_bounds_the_sources_and_stays_close(monkeypatch):
+    G = _weighted(nx.barabasi_albert_graph(1200, 2, seed=5), choices=(0.4, 0.7, 0.9, 1.0))
+    g = CSRGraph.from_networkx(G)
+    exact = betweenness_centrality(g)
+
+    used = []
+    dependencies = csr._dependencies
+
+    def counting(lengths, sources):
+        used.append(len(sources))
+        return dependencies(lengths, sources)
+
+    monkeypatch.setattr(csr, "_dependencies", counting)
+    approx = betweenness_centrality(g, pivots=300, seed=7)
+    assert sum(used) == 300
+    assert max(abs(approx[n] - exact[n]) for n in G) <= 0.05
+    assert sum(abs(approx[n] - exact[n]) for n in G) / len(G) <= 0.005
+
+    monkeypatch.setattr(csr, "GRAPH_BETWEENNESS_EXACT_MAX", 100)
+    monkeypatch.setattr(csr, "GRAPH_BETWEENNESS_PIVOTS", 300)
+    assert csr.betweenness_sampling(len(g)) == {"pivots": 300}
+
+
+def test_deep_dag_is_exact():
+    G = _weighted(nx.path_graph(300))
+    expected = nx.betweenness_centrality(G, weight="weight")
+    assert betweenness_centrality(CSRGraph.from_networkx(G)) == pytest.approx(expected, abs=1e-12)
@@ -0,0 +1,102 @@
+import networkx as nx
+import pytest
+
+from src.graph import incremental
+from src.graph.incremental import GraphSnapshot, analyze_incremental, update_patterns
+from src.graph.patterns import compute_patterns
+
+
+def _graph():
+    """Weighted karate club plus a separate weighted 5-cycle, string node ids."""
+    G = nx.Graph()
+    for u, v in nx.karate_club_graph().edges():
+        G.add_edge(f"k{u:02d}", f"k{v:02d}", weight=0.5 + ((u * 7 + v * 3) % 10) / 20)
+    for i in range(5):
+        G.add_edge(f"c{i}", f"c{(i + 1) % 5}", weight=0.9)
+    G.add_node("lonely")
+    return G
+
+
+def _assert_centrality_matches(update, G):
+    _, degree, betw, eigen = compute_patterns(G)
+    assert update.degree == pytest.approx(degree)
+    assert update.betweenness == pytest.approx(betw)
+    assert update.eigenvector == pytest.approx(eigen, abs=1e-8)
+
+
+def test_cold_start_matches_compute_patterns():
+    G = _graph()
+    update = update_patterns(G)
+    assert update.mode == "cold" and update.recomputed_nodes == G.number_of_nodes()
+    assert update.cluster_map == compute_patterns(G)[0]
+    _assert_centrality_matches(update, G)
+
+
+def test_incremental_recomputes_only_changed_component():
+    G = _graph()
+    first = update_patterns(G)
+
+    G.add_edge("c0", "c2", weight=0.7)
+    G.add_edge("c5", "c0", weight=0.4)  # new node
+    update = update_patterns(G, first.snapshot)
+
+    assert update.mode == "incremental"
+    assert update.changed_nodes == {"c0", "c2", "c5"}
+    assert update.recomputed_nodes == 6
+    # The karate component is carried over untouched
+    assert all(update.cluster_map[n] == first.cluster_map[n] for n in G if n.startswith("k"))
+    assert set(update.cluster_changes) >= {"c5"}
+    _assert_centrality_matches(update, G)
+
+    # Removing an edge is detected from the snapshot diff
+    G.remove_edge("k00", "k01")
+    again = update_patterns(G, update.snapshot)
+    assert again.changed_nodes == {"k00", "k01"}
+    assert again.recomputed_nodes == 34
+    assert all(again.cluster_map[n] == update.cluster_map[n] for n in G if n.startswith("c"))
+    _assert_centrality_matches(again, G)
+
+
+class _FakeDB:
+    def __init__(self, G, mark):
+        self.G, self.mark, self.queries = G, mark, []
+
+    def execute(self, sql, params=None):
+        self.queries.append(sql)
+        if "GREATEST" in sql:
+            return iter([self.mark])
+        if "FROM concept_network" in sql:
+            return iter([(n, n[:8]) for n in self.G])
+        return iter([(u, v, w) for u, v, w in self.G.edges(data="weight")])
+
+
+def test_snapshot_round_trip_and_unchanged_short_circuit(tmp_path, monkeypatch):
+    path = str(tmp_path / "graph" / "snapshot.json")
+    G = _graph()
+    db = _FakeDB(G, (40, 83, "2026-01-01 00:00:00+00"))
+
+    cold = analyze_incremental(db, path)
+    assert cold.mode == "cold" and cold.snapshot.mark == [40, 83, "2026-01-01 00:00:00+00"]
+    incremental.save_snapshot(cold, path)
+
+    loaded = GraphSnapshot.load(tmp_path / "graph" / "snapshot.json")
+    assert loaded.cluster == cold.snapshot.cluster and loaded.edges == cold.snapshot.edges
+
+    monkeypatch.setattr(incremental, "build_graph", lambda db: pytest.fail("graph rebuild not expected"))
+    unchanged = analyze_incremental(_FakeDB(G, [40, 83, "2026-01-01 00:00:00+00"]), path)
+    assert unchanged.mode == "unchanged" and unchanged.cluster_changes == {}
+    assert unchanged.cluster_map == cold.cluster_map
+    assert unchanged.betweenness == pytest.approx(cold.betweenness)
+    assert unchanged.eigenvector == pytest.approx(cold.eigenvector)
+
+
+def test_connected_graph_eigenvector_after_reweight():
+    G = _graph().subgraph(f"k{i:02d}" for i in range(34)).copy()
+    first = update_patterns(G)
+    _assert_centrality_matches(first, G)
+    assert max(first.eigenvector.values()) > 0
+
+    G["k00"]["k01"]["weight"] = 2.0
+    update = update_patterns(G, first.snapshot)
+    assert update.changed_nodes == {"k00", "k01"}
+    _assert_centrality_matches(update, G)
@@ -0,0 +1,64 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from src.graph.metrics import compute_metrics
+
+
+def _unit(rng, n, dim=8):
+    V = rng.normal(size=(n, dim))
+    return V / np.linalg.norm(V, axis=1, keepdims=True)
+
+
+def _pairwise_diversity(vecs):
+    if len(vecs) < 2:
+        return 0.0
+    sims = [float(np.dot(a, b)) for a, b in itertools.combinations(vecs, 2)]
+    return max(0.0, 1.0 - float(np.mean(sims)))
+
+
+def test_compute_metrics_matches_pairwise_loops():
+    rng = np.random.default_rng(7)
+    V = _unit(rng, 40)
+    labels = rng.choice([3, 8, 11, 20], size=40)
+    labels[-1] = 99  # singleton cluster
+    edges = rng.integers(0, 40, size=(60, 2))
+    edges = edges[edges[:, 0] != edges[:, 1]]
+
+    m = compute_metrics(V, labels, edges, topk=3)
+    assert m.clusters.tolist() == [3, 8, 11, 20, 99]
+
+    for k, cl in enumerate(m.clusters):
+        members = np.flatnonzero(labels == cl)
+        assert m.cluster_size[k] == len(members)
+        assert m.cluster_diversity[k] == pytest.approx(_pairwise_diversity(V[members]))
+        within = sum(1 for s, t in edges if labels[s] == cl and labels[t] == cl)
+        n = len(members)
+        assert m.cluster_density[k] == pytest.approx(within / (n * (n - 1) / 2) if n > 1 else 0.0)
+        means = {i: float(np.mean(V[members] @ V[i])) for i in members}
+        expected_top = sorted(means, key=means.get, reverse=True)[:3]
+        assert m.top_examples[k].tolist() == expected_top
+
+    adj = {}
+    for s, t in edges:
+        adj.setdefault(s, set()).add(t)
+        adj.setdefault(t, set()).add(s)
+    for i in range(len(V)):
+        same = [j for j in range(len(V)) if labels[j] == labels[i] and j != i]
+        other = [j for j in range(len(V)) if labels[j] != labels[i]]
+        assert m.semantic_cohesion[i] == pytest.approx(float(np.mean(V[same] @ V[i])) if same else 0.0)
+        assert m.bridge_score[i] == pytest.approx(float(np.mean(V[other] @ V[i])))
+        neigh = [V[j] for j in sorted(adj.get(i, ()))]
+        assert m.diversity_local[i] == pytest.approx(_pairwise_diversity(neigh))
+
+
+def test_compute_metrics_without_edges_or_rows():
+    m = compute_metrics(np.eye(3), [1, 1, 1])
+    assert m.cluster_density.tolist() == [0.0]
+    assert m.bridge_score.tolist() == [0.0, 0.0, 0.0]
+    assert m.diversity_local.tolist() == [0.0, 0.0, 0.0]
+    assert m.cluster_diversity[0] == pytest.approx(1.0)
+
+    empty = compute_metrics(np.zeros((0, 4)), [])
+    assert len(empty.clusters) == 0 and empty.top_examples == []
@@ -0,0 +1,44 @@
+import http.server
+import threading
+
+import pytest
+
+from src.infra.http_pool import build_session, http_pool_stats, reset_http_pool_stats
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        body = b'{"ok": true}'
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    srv = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{srv.server_port}"
+    srv.shutdown()
+    srv.server_close()
+
+
+def test_keep_alive_reuses_connection(server):
+    reset_http_pool_stats()
+    session = build_session()
+    for _ in range(10):
+        assert session.post(f"{server}/v1/embeddings", json={"input": "x"}, timeout=5).json() == {"ok": True}
+    session.close()
+
+    stats = http_pool_stats()
+    assert stats["requests"] == 10
+    assert stats["connections_opened"] == 1
+    assert stats["reuse_ratio"] == pytest.approx(0.9)
+    assert stats["avg_connect_ms"] >= 0.0
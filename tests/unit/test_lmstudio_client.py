@@ -52,3 +52,25 @@ def test_safe_json_parse_invalid_json():
     text = '{"insight": "Test insight", invalid}'
     with pytest.raises(ValueError, match="Failed to parse JSON"):
         safe_json_parse(text, required_keys=["insight"])
+
+
+def test_chat_completion_concurrent_keeps_order(monkeypatch):
+    """Concurrent requests come back in batch order even when they finish out of order."""
+    import time
+    from unittest.mock import MagicMock
+
+    import src.services.lmstudio_client as lmc
+
+    monkeypatch.delenv("LM_STUDIO_MOCK", raising=False)
+
+    def fake_post(self, url, json, timeout):
+        text = json["messages"][0]["content"]
+        time.sleep(0.01 * (5 - int(text)))
+        resp = MagicMock()
+        resp.json.return_value = {"choices": [{"message": {"content": text}}]}
+        return resp
+
+    monkeypatch.setattr(lmc.requests.Session, "post", fake_post)
+    batch = [[{"role": "user", "content": str(i)}] for i in range(5)]
+    results = chat_completion(batch, model="order-test")
+    assert [r.text for r in results] == ["0", "1", "2", "3", "4"]
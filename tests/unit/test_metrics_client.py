@@ -22,3 +22,102 @@ def test_metrics_disabled_no_crash(monkeypatch):
         }
     )
     assert True
+
+
+class _FakeCopy:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def write_row(self, row):
+        self.rows.append(row)
+
+
+class _FakeConn:
+    def __init__(self, rows):
+        self.rows = rows
+        self.commits = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.commits += 1
+        return False
+
+    def cursor(self):
+        conn = self
+
+        class _Cur:
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+            def copy(self, sql):
+                assert sql.startswith("COPY metrics_log")
+                return _FakeCopy(conn.rows)
+
+        return _Cur()
+
+
+def test_sink_batches_and_drops_oldest(monkeypatch):
+    from src.infra import metrics_core
+
+    rows = []
+    conn = _FakeConn(rows)
+    monkeypatch.setattr(metrics_core, "pooled_connection", lambda dsn: conn)
+    sink = metrics_core._MetricsSink("dsn", capacity=3, batch_size=2, interval_s=60)
+    for i in range(5):
+        sink._buffer.append(metrics_core._db_row({"run_id": i, "node": "n", "event": "e"}))
+    sink.flush()
+
+    # Ring buffer kept only the newest 3 rows; they were written in batches of 2
+    assert [r[0] for r in rows] == [2, 3, 4]
+    assert conn.commits == 2
+    assert sink.stats["written"] == 3
+
+
+def test_emit_is_buffered_until_flush(monkeypatch):
+    from src.infra import metrics_core
+
+    rows = []
+    monkeypatch.setattr(metrics_core, "pooled_connection", lambda dsn: _FakeConn(rows))
+    monkeypatch.setattr(metrics_core, "METRICS_ENABLED", True)
+    monkeypatch.setattr(metrics_core, "_SINKS", {})
+    mc = MetricsClient(dsn="postgresql://buffered-test")
+    mc.emit({"run_id": "r", "node": "n", "event": "node_start", "meta": {"k": 1}})
+    mc.flush()
+    assert len(rows) == 1
+    assert rows[0][metrics_core.METRICS_COLUMNS.index("workflow")] == metrics_core.WORKFLOW_ID
+    assert rows[0][metrics_core.METRICS_COLUMNS.index("meta")] == '{"k": 1}'
+    assert mc.stats()["enqueued"] == 1
+
+
+def test_exit_flush_is_bounded(monkeypatch):
+    import threading
+    import time
+
+    from src.infra import metrics_core
+
+    release = threading.Event()
+
+    def stuck(dsn):
+        release.wait(5)
+        raise RuntimeError("db unreachable")
+
+    monkeypatch.setattr(metrics_core, "pooled_connection", stuck)
+    sink = metrics_core._MetricsSink("dsn", batch_size=1, interval_s=60)
+    for i in range(3):
+        sink._buffer.append(metrics_core._db_row({"run_id": i, "node": "n", "event": "e"}))
+    monkeypatch.setattr(metrics_core, "_SINKS", {"dsn": sink})
+    t0 = time.monotonic()
+    metrics_core.flush_metrics(timeout_s=0.2)
+    assert time.monotonic() - t0 < 2
+    release.set()
@@ -15,6 +15,8 @@ from nodes.network_aggregator import (
     VECTOR_DIM,
     _build_document_string,
     _cosine_similarity,
+    _knn_pair_arrays,
+    _knn_pairs,
     _l2_normalize,
 )
 from services.lmstudio_client import LMStudioClient
@@ -67,6 +69,50 @@ class TestCosineSimilarity(unittest.TestCase):
             _cosine_similarity(vec1, vec2)
 
 
+class TestKnnPairs(unittest.TestCase):
+    """Test blocked, threshold-aware KNN pair selection."""
+
+    def _reference_pairs(self, X, k, min_cos):
+        """Per-row argsort reference (the original scalar implementation)."""
+        import numpy as np
+
+        sims = np.clip(X @ X.T, -1.0, 1.0)
+        pairs = []
+        for i in range(len(X)):
+            take = 0
+            for j in np.argsort(-sims[i], kind="stable"):
+                if j == i:
+                    continue
+                if take >= k:
+                    break
+                take += 1
+                if sims[i, j] >= min_cos:
+                    pairs.append((i, int(j)))
+        return pairs
+
+    def test_blocked_knn_matches_reference(self):
+        """Test every block size yields the reference top-k pairs above the floor."""
+        import numpy as np
+
+        rng = np.random.default_rng(3)
+        X = rng.normal(size=(37, 12)).astype(np.float32)
+        X /= np.linalg.norm(X, axis=1, keepdims=True)
+        expected = self._reference_pairs(X, 4, 0.1)
+        for block_size in (1, 5, 16, 100):
+            src, tgt, cos, _ = _knn_pair_arrays(X, 4, min_cos=0.1, block_size=block_size)
+            self.assertEqual(list(zip(src.tolist(), tgt.tolist(), strict=True)), expected)
+            self.assertTrue(np.all(cos >= 0.1))
+            self.assertTrue(np.all(src != tgt))
+
+    def test_knn_pairs_returns_id_arrays(self):
+        """Test _knn_pairs maps indices back to ids and applies the 0.4 floor."""
+        vecs = [_l2_normalize(v) for v in ([1.0, 0.0], [0.9, 0.1], [0.0, 1.0])]
+        src, tgt, cos = _knn_pairs(vecs, ["a", "b", "c"], 2)
+        pairs = set(zip(src.tolist(), tgt.tolist(), strict=True))
+        self.assertEqual(pairs, {("a", "b"), ("b", "a")})
+        self.assertTrue(all(c >= 0.4 for c in cos.tolist()))
+
+
 class TestNetworkAggregatorLogic(unittest.TestCase):
     """Test network aggregator logic without database dependencies."""
 
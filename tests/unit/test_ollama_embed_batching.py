@@ -0,0 +1,71 @@
+from unittest.mock import patch
+
+import pytest
+
+from pmagent.adapters import ollama
+from pmagent.adapters.ollama import OllamaAPIError, _rerank_embedding_only
+
+CFG = {"ollama_base_url": "http://127.0.0.1:11434", "embedding_model": "test-embedding"}
+
+
+def _vec(text: str) -> list[float]:
+    # "query" points along x; doc{i} leans further from x as i grows
+    if text == "query":
+        return [1.0, 0.0]
+    i = int(text.removeprefix("doc"))
+    return [1.0, float(i)]
+
+
+@pytest.fixture
+def embed_calls(monkeypatch):
+    calls = []
+
+    def fake_post_json(base_url, path, payload):
+        assert path == "/api/embed"
+        calls.append(list(payload["input"]))
+        return {"embeddings": [_vec(t) for t in payload["input"]]}
+
+    monkeypatch.setattr(ollama, "_post_json", fake_post_json)
+    return calls
+
+
+def test_rerank_50_docs_costs_two_batched_calls(embed_calls, monkeypatch):
+    monkeypatch.setattr(ollama, "OLLAMA_EMBED_BATCH_SIZE", 32)
+    docs = [f"doc{i}" for i in range(50)]
+
+    result = _rerank_embedding_only("query", docs, None, None, CFG)
+
+    assert len(embed_calls) == 2
+    assert sorted(len(c) for c in embed_calls) == [19, 32]
+    assert [doc for doc, _ in result] == docs  # most aligned with the query first
+    assert result[0][1] == pytest.approx(1.0)
+    assert all(0.0 <= score <= 1.0 for _, score in result)
+
+
+def test_rerank_ragged_embeddings_fall_back_to_equal_scores(monkeypatch):
+    monkeypatch.setattr(ollama, "_post_json", lambda *a: {"embeddings": [[1.0, 0.0], [1.0], [0.5, 0.5]]})
+    result = _rerank_embedding_only("query", ["a", "b"], None, None, CFG)
+    assert result == [("a", 0.5), ("b", 0.5)]
+
+
+def test_embed_falls_back_to_single_text_endpoint_on_404(monkeypatch):
+    paths = []
+
+    def fake_post_json(base_url, path, payload):
+        paths.append(path)
+        if path == "/api/embed":
+            raise OllamaAPIError("404 Not Found", status_code=404, error_type="http_error")
+        return {"embedding": _vec(payload["prompt"])}
+
+    monkeypatch.setattr(ollama, "_post_json", fake_post_json)
+    assert ollama._embed_texts("http://x", "m", ["query", "doc1"]) == [[1.0, 0.0], [1.0, 1.0]]
+    assert paths == ["/api/embed", "/api/embeddings", "/api/embeddings"]
+
+
+def test_embed_chunks_and_preserves_order(embed_calls, monkeypatch):
+    monkeypatch.setenv("EMBED_CACHE_ENABLED", "0")
+    monkeypatch.setattr(ollama, "OLLAMA_EMBED_BATCH_SIZE", 2)
+    with patch.object(ollama, "get_lm_model_config", return_value=CFG):
+        out = ollama.embed(["doc3", "doc1", "doc2"])
+    assert out == [[1.0, 3.0], [1.0, 1.0], [1.0, 2.0]]
+    assert sorted(map(len, embed_calls)) == [1, 2]
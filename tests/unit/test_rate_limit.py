@@ -0,0 +1,65 @@
+import threading
+import time
+
+import pytest
+
+from src.infra.rate_limit import ProviderLimiter, TokenBucket, get_limiter, reset_limiters, run_ordered
+
+
+def test_run_ordered_preserves_order_under_concurrency():
+    def work(i, delay):
+        time.sleep(delay)
+        return i
+
+    delays = [0.05, 0.0, 0.03, 0.01]
+    assert run_ordered(work, delays, max_workers=4) == [0, 1, 2, 3]
+
+
+def test_run_ordered_propagates_errors():
+    def work(i, item):
+        if item == "bad":
+            raise ValueError(item)
+        return item
+
+    with pytest.raises(ValueError):
+        run_ordered(work, ["ok", "bad", "ok"], max_workers=3)
+
+
+def test_limiter_caps_inflight():
+    limiter = ProviderLimiter(max_inflight=2, rate=0)
+    active, peak = 0, 0
+    lock = threading.Lock()
+
+    def work(i, _):
+        nonlocal active, peak
+        with limiter.slot():
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.02)
+            with lock:
+                active -= 1
+
+    run_ordered(work, range(8), max_workers=8)
+    assert peak == 2
+
+
+def test_token_bucket_waits_for_refill():
+    now = [0.0]
+    slept = []
+
+    def sleep(s):
+        slept.append(s)
+        now[0] += s
+
+    bucket = TokenBucket(rate=2.0, burst=2, clock=lambda: now[0], sleep=sleep)
+    for _ in range(4):
+        bucket.acquire()
+    # Two burst tokens are free, the next two each wait 1/rate seconds
+    assert slept == pytest.approx([0.5, 0.5])
+
+
+def test_get_limiter_is_shared_per_model():
+    reset_limiters()
+    assert get_limiter("lm", "a") is get_limiter("lm", "a")
+    assert get_limiter("lm", "a") is not get_limiter("lm", "b")
@@ -0,0 +1,26 @@
+from unittest.mock import patch
+
+import pytest
+
+from src.services import rerank_via_embeddings as rve
+
+
+def test_each_concept_embedded_once():
+    vectors = {"a": [1.0, 0.0], "b": [0.0, 2.0], "c": [1.0, 1.0], "": [0.0, 0.0]}
+    calls = []
+
+    def fake_embed(texts):
+        calls.append(list(texts))
+        return [vectors[t] for t in texts]
+
+    pairs = [(1, 2), (1, 3), (2, 3), (3, 1), (1, 4)]
+    names = {1: "a", 2: "b", 3: "c", 4: ""}
+    with patch.object(rve, "_embed", side_effect=fake_embed):
+        scores = rve.rerank_via_embeddings(pairs, names)
+
+    assert calls == [["a", "b", "c", ""]]
+    assert scores == pytest.approx([0.0, 2**-0.5, 2**-0.5, 2**-0.5, 0.0])
+
+
+def test_empty_pairs():
+    assert rve.rerank_via_embeddings([], {}) == []
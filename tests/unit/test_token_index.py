@@ -0,0 +1,77 @@
+from src.infra import token_index
+from src.infra.token_index import TokenIndex, get_token_index
+from src.nodes.ai_noun_discovery import AINounDiscovery
+
+WORDS = [
+    ("1:1", "בְּרֵאשִׁית"),
+    ("1:1", "אֱלֹהִים"),
+    ("1:1", "הָאָרֶץ"),
+    ("1:2", "וְהָאָרֶץ"),
+    ("1:3", "אֱלֹהִים"),
+    ("1:3", "אוֹר"),
+]
+
+
+def test_build_counts_normalized_tokens_with_first_verse_and_offsets():
+    index = TokenIndex.build("Gen", WORDS)
+    assert index.frequency("אלהים") == 2
+    assert index.frequency("אֱלֹהִים") == 2  # pointed surface normalizes to the same key
+    assert index.first_ref("אלהים") == "1:1"
+    assert index.offsets("אלהים") == [1, 4]
+    assert index.first_ref("אור") == "1:3"
+    # Containment, like the substring scan it replaces: prefixed forms count too
+    assert index.frequency("הארץ") == 2
+    assert index.frequency("ארץ") == 2
+    assert index.first_ref("ארץ") == "1:1"
+    assert index.offsets("ארץ") == [2, 3]
+    assert index.frequency("מים") == 0
+    assert index.first_ref("מים") is None
+
+
+def test_frequency_matches_substring_scan_of_normalized_text():
+    import re
+
+    from src.core.ids import normalize_hebrew
+
+    text = "ויאמר אלהים יהי רקיע בתוך המים ויהי מבדיל בין מים למים השמים ושמים"
+    index = TokenIndex.build("Gen", token_index.words_from_text(text))
+    normalized = normalize_hebrew(text)
+    for word in ("מים", "שמים", "רקיע", "אור"):
+        assert index.frequency(word) == len(re.findall(re.escape(word), normalized))
+
+
+def test_disk_cache_keyed_by_book_and_text_hash(tmp_path):
+    token_index.clear_token_indexes()
+    first = get_token_index("Gen", WORDS, cache_dir=tmp_path)
+    assert len(list(tmp_path.glob("Gen-*.json"))) == 1
+
+    token_index.clear_token_indexes()
+    reloaded = get_token_index("Gen", WORDS, cache_dir=tmp_path)
+    assert reloaded is not first
+    assert reloaded.entries == first.entries
+
+    # Different text for the same book gets its own entry
+    get_token_index("Gen", WORDS[:3], cache_dir=tmp_path)
+    assert len(list(tmp_path.glob("Gen-*.json"))) == 2
+    token_index.clear_token_indexes()
+
+
+def test_validation_uses_index_for_freq_and_primary_verse():
+    index = TokenIndex.build("Gen", WORDS)
+    nouns = [
+        {"surface": "אלהים", "letters": list("אלהים"), "gematria": 86, "class": "person"},
+        {"surface": "מים", "letters": list("מים"), "gematria": 90, "class": "thing"},
+    ]
+    out = AINounDiscovery()._validate_and_enhance_nouns(nouns, "", "Genesis", index)
+    assert [n["surface"] for n in out] == ["אלהים"]
+    assert out[0]["freq"] == 2
+    assert out[0]["primary_verse"] == "Genesis 1:1"
+    assert out[0]["sources"] == [{"ref": "Genesis 1:1", "offset": 1}]
+
+
+def test_validation_without_index_falls_back_to_text():
+    text = "אור טוב אור"
+    nouns = [{"surface": "אור", "letters": list("אור"), "gematria": 207, "class": "thing"}]
+    out = AINounDiscovery()._validate_and_enhance_nouns(nouns, text, "Genesis")
+    assert out[0]["freq"] == 2
+    assert out[0]["sources"][0]["ref"] == "Genesis unknown"
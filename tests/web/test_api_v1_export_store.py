@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Tests for the /api/v1 export endpoints backed by the in-memory export store.
+
+Covers mtime-based reload, the prebuilt indexes (adjacency, strength order,
+metric/unit/window lookups) and ETag / If-None-Match handling.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from src.services.api_server import app  # noqa: E402
+from src.services.export_store import ExportStore, clear_export_store  # noqa: E402
+
+client = TestClient(app)
+
+CORRELATIONS = {
+    "correlations": [
+        {"source": "a", "target": "b", "correlation": 0.5},
+        {"source": "c", "target": "a", "correlation": -0.9},
+        {"source": "a", "target": "b", "correlation": 0.1},
+        {"source": "b", "target": "c", "correlation": 0.7},
+        {"source": "a", "target": "a", "correlation": 1.0},
+    ],
+    "metadata": {"source": "test"},
+}
+
+PATTERNS = {
+    "patterns": [
+        {"id": 1, "metric": "jaccard", "pattern_strength": 0.2},
+        {"id": 2, "metric": "lift", "pattern_strength": 0.9},
+        {"id": 3, "metric": "jaccard", "pattern_strength": 0.6},
+    ]
+}
+
+
+def _write(path: Path, data: dict) -> None:
+    path.write_text(json.dumps(data), encoding="utf-8")
+
+
+@pytest.fixture
+def export_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("EXPORT_DIR", str(tmp_path))
+    clear_export_store()
+    _write(tmp_path / "graph_correlations.json", CORRELATIONS)
+    _write(tmp_path / "graph_patterns.json", PATTERNS)
+    yield tmp_path
+    clear_export_store()
+
+
+def test_network_uses_adjacency_index(export_dir):
+    data = client.get("/api/v1/network/a").json()
+    # First edge per neighbour, self-loops skipped, file order
+    assert [(c["concept_id"], c["correlation"]["correlation"]) for c in data["connections"]] == [
+        ("b", 0.5),
+        ("c", -0.9),
+    ]
+
+    data = client.get("/api/v1/network/a", params={"max_connections": 1}).json()
+    assert [c["concept_id"] for c in data["connections"]] == ["c"]
+    assert client.get("/api/v1/network/zzz").json()["connections"] == []
+
+
+def test_correlations_strongest_first_with_threshold(export_dir):
+    data = client.get("/api/v1/correlations", params={"min_strength": 0.5}).json()
+    assert [c["correlation"] for c in data["correlations"]] == [1.0, -0.9, 0.7, 0.5]
+    assert data["metadata"]["filtered_count"] == 4
+    assert data["metadata"]["source"] == "test"
+
+
+def test_patterns_grouped_by_metric(export_dir):
+    data = client.get("/api/v1/patterns", params={"metric": "jaccard"}).json()
+    assert [p["id"] for p in data["patterns"]] == [3, 1]
+    data = client.get("/api/v1/patterns", params={"min_strength": 0.5}).json()
+    assert [p["id"] for p in data["patterns"]] == [2, 3]
+    assert client.get("/api/v1/patterns", params={"metric": "nope"}).json()["patterns"] == []
+
+
+def test_etag_304_and_reload_on_change(export_dir):
+    first = client.get("/api/v1/patterns")
+    etag = first.headers["etag"]
+    assert client.get("/api/v1/patterns", headers={"If-None-Match": etag}).status_code == 304
+    # Different query -> different representation
+    assert client.get("/api/v1/patterns?limit=1").headers["etag"] != etag
+
+    path = export_dir / "graph_patterns.json"
+    _write(path, {"patterns": [{"id": 9, "metric": "lift", "pattern_strength": 0.1}]})
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    changed = client.get("/api/v1/patterns", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert [p["id"] for p in changed.json()["patterns"]] == [9]
+
+
+def test_missing_export_is_404(export_dir):
+    assert client.get("/api/v1/stats").status_code == 404
+    assert client.get("/api/v1/temporal").status_code == 404
+    assert client.get("/api/v1/forecast").status_code == 404
+
+
+def test_temporal_and_forecast_lookups(export_dir):
+    _write(
+        export_dir / "temporal_patterns.json",
+        {
+            "temporal_patterns": [
+                {"series_id": "s1", "unit": "chapter", "window": 5},
+                {"series_id": "s2", "unit": "chapter", "window": 5},
+                {"series_id": "s1", "unit": "verse", "window": 5},
+            ]
+        },
+    )
+    _write(export_dir / "pattern_forecast.json", {"forecasts": [{"series_id": "s1", "horizon": 10}]})
+
+    data = client.get("/api/v1/temporal", params={"series_id": "s1"}).json()
+    assert data["temporal_patterns"] == [{"series_id": "s1", "unit": "chapter", "window": 5}]
+    assert client.get("/api/v1/temporal", params={"unit": "verse"}).json()["result_count"] == 1
+    assert client.get("/api/v1/forecast").json()["result_count"] == 1
+    assert client.get("/api/v1/forecast", params={"horizon": 3}).json()["result_count"] == 0
+
+
+def test_store_reuses_parsed_export(tmp_path):
+    path = tmp_path / "graph_correlations.json"
+    _write(path, CORRELATIONS)
+    store = ExportStore()
+    assert store.get(path) is store.get(path)
+    assert store.get(tmp_path / "missing.json") is None
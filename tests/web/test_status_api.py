@@ -15,13 +15,23 @@ from unittest.mock import patch
 ROOT = Path(__file__).resolve().parents[2]
 sys.path.insert(0, str(ROOT))
 
+import pytest  # noqa: E402
 from fastapi.testclient import TestClient  # noqa: E402
 
+from pmagent.status.probes import clear_probe_cache  # noqa: E402
 from src.services.api_server import app  # noqa: E402
 
 client = TestClient(app)
 
 
+@pytest.fixture(autouse=True)
+def _fresh_status_cache():
+    # db/lm status is cached for SNAPSHOT_CACHE_TTL_S between requests
+    clear_probe_cache()
+    yield
+    clear_probe_cache()
+
+
 @patch("src.services.api_server.get_system_status")
 def test_status_api_returns_db_and_lm(mock_get_status):
     """Test that /api/status/system returns db and lm keys."""
@@ -116,8 +126,9 @@ def test_status_api_handles_exceptions(mock_get_status):
 def test_status_api_db_modes(mock_get_status):
     """Test that /api/status/system returns correct DB modes."""
     for mode in ["ready", "db_off", "partial"]:
-        # Reset mock for each iteration
+        # Reset mock and the status cache for each iteration
         mock_get_status.reset_mock()
+        clear_probe_cache()
         mock_get_status.return_value = {
             "db": {
                 "reachable": mode == "ready",
@@ -133,3 +144,17 @@ def test_status_api_db_modes(mock_get_status):
         data = response.json()
         assert data["db"]["mode"] == mode
         assert data["db"]["reachable"] == (mode == "ready")
+
+
+@patch("src.services.api_server.get_system_status")
+def test_status_api_serves_db_and_lm_from_cache(mock_get_status):
+    """Repeated requests within the TTL do not probe DB/LM again."""
+    mock_get_status.return_value = {
+        "db": {"reachable": True, "mode": "ready", "notes": "ok"},
+        "lm": {"slots": [], "notes": "No LM slots"},
+    }
+    for _ in range(3):
+        response = client.get("/api/status/system")
+        assert response.status_code == 200
+        assert response.json()["db"]["mode"] == "ready"
+    assert mock_get_status.call_count == 1